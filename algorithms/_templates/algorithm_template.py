@@ -19,9 +19,13 @@ class AlgorithmTemplate(StepTracker):
 
     Attributes:
         visualizer_type: Type of visualizer to use
+        registrations: API ids this class serves (name, category, entry method)
     """
 
     visualizer_type = VisualizerType.ARRAY  # Change as needed
+    registrations = {
+        "algorithm_template": {"name": "Algorithm Template", "category": "sorting", "entry": "execute"},
+    }
 
     def execute(self, input_data: Any) -> Generator[Step, None, None]:
         """Execute the algorithm and yield visualization steps.
@@ -50,7 +54,8 @@ class AlgorithmTemplate(StepTracker):
         )
 
         # TODO: Implement algorithm logic here
-        # Use self.emit_step() to yield visualization steps
+        # Use self.emit_step() to yield visualization steps. Pass state that
+        # copies data as a lambda (state=lambda: {...}) so headless runs skip it.
 
         # Final state
         yield self.emit_step(
@@ -1,6 +1,23 @@
 """Base classes and types for DSA visualizer algorithms."""
 
-from .step_tracker import Step, StepTracker
-from .types import VisualizerType
+from .delta import DeltaEncoder, apply_delta, decode_steps, diff_state
+from .step_tracker import Step, StepTracker, resolve_references
+from .tree_state import LEFT, RIGHT, NodeTable, build_tree, path_to
+from .types import StepLevel, VisualizerType
 
-__all__ = ["StepTracker", "Step", "VisualizerType"]
+__all__ = [
+    "StepTracker",
+    "Step",
+    "StepLevel",
+    "VisualizerType",
+    "DeltaEncoder",
+    "apply_delta",
+    "decode_steps",
+    "diff_state",
+    "resolve_references",
+    "NodeTable",
+    "build_tree",
+    "path_to",
+    "LEFT",
+    "RIGHT",
+]
@@ -0,0 +1,122 @@
+"""Coalescing of consecutive steps into summary steps.
+
+When a run would exceed its step budget, StepTracker merges neighbouring
+steps. A merged (summary) step shows the state, highlights and description
+of the last step built for it, takes the coarsest level of the steps it
+covers, and records what it covers in its metadata:
+
+    coalesced_steps       number of original steps merged into this one
+    coalesced_operations  {operation: count} over those steps
+"""
+
+import copy
+from collections.abc import Callable
+from typing import Any
+
+from .delta import apply_delta
+
+
+def coalesced_count(metadata: dict[str, Any]) -> int:
+    """Number of original steps a (possibly merged) step covers."""
+    return metadata.get("coalesced_steps", 1)
+
+
+def _merge_metadata(
+    first_op: str, first: dict[str, Any], second_op: str, second: dict[str, Any]
+) -> dict[str, Any]:
+    """Metadata of the summary step covering ``first`` followed by ``second``."""
+    operations = dict(first.get("coalesced_operations", {first_op: 1}))
+    for op, count in second.get("coalesced_operations", {second_op: 1}).items():
+        operations[op] = operations.get(op, 0) + count
+
+    merged = dict(second)
+    if "source_file" in first and "source_file" not in second:
+        merged["source_file"] = first["source_file"]
+    merged["coalesced_steps"] = coalesced_count(first) + coalesced_count(second)
+    merged["coalesced_operations"] = operations
+    return merged
+
+
+def merge_steps(first: Any, second: Any) -> Any:
+    """Merge two consecutive Step objects into one summary Step."""
+    return type(second)(
+        step_number=second.step_number,
+        operation=second.operation,
+        description=second.description,
+        state=second.state,
+        highlights=second.highlights,
+        metadata=_merge_metadata(
+            first.operation, first.metadata, second.operation, second.metadata
+        ),
+        level=min(first.level, second.level),
+    )
+
+
+def extend_step(summary: Any, step_number: int, operation: str, metadata, level: int) -> Any:
+    """Extend a summary Step over a following step that was not built.
+
+    The summary keeps its state, highlights and description; only what it
+    covers (metadata, last step number, level) changes.
+    """
+    return type(summary)(
+        step_number=step_number,
+        operation=summary.operation,
+        description=summary.description,
+        state=summary.state,
+        highlights=summary.highlights,
+        metadata=_merge_metadata(summary.operation, summary.metadata, operation, metadata),
+        level=min(summary.level, level),
+    )
+
+
+def merge_records(first: dict[str, Any], second: dict[str, Any]) -> dict[str, Any]:
+    """Merge two consecutive delta-encoded records into one summary record.
+
+    The result is a keyframe if either input is one; otherwise its delta is
+    the two patches applied in sequence.
+    """
+    merged = {k: v for k, v in second.items() if k not in ("state", "delta")}
+    merged["metadata"] = _merge_metadata(
+        first["operation"], first["metadata"], second["operation"], second["metadata"]
+    )
+    merged["level"] = min(first["level"], second["level"])
+
+    if "state" in second:
+        merged["state"] = second["state"]
+    elif "state" in first:
+        merged["state"] = apply_delta(copy.deepcopy(first["state"]), second["delta"])
+    else:
+        merged["delta"] = first["delta"] + second["delta"]
+    return merged
+
+
+def extend_record(
+    summary: dict[str, Any], step_number: int, operation: str, metadata, level: int
+) -> dict[str, Any]:
+    """Extend a summary record over a following step that was not built (see extend_step)."""
+    extended = dict(summary)
+    extended["step_number"] = step_number
+    extended["metadata"] = _merge_metadata(
+        summary["operation"], summary["metadata"], operation, metadata
+    )
+    extended["level"] = min(summary["level"], level)
+    return extended
+
+
+def compact(items: list[Any], merge: Callable[[Any, Any], Any], mergeable: Callable[[Any], bool]):
+    """Halve a run of retained steps by merging neighbouring pairs.
+
+    The first item is kept as is, and only pairs where both items are
+    ``mergeable`` are merged; other items pass through unchanged.
+    """
+    out = [items[0]]
+    i = 1
+    while i < len(items):
+        item = items[i]
+        if i + 1 < len(items) and mergeable(item) and mergeable(items[i + 1]):
+            out.append(merge(item, items[i + 1]))
+            i += 2
+        else:
+            out.append(item)
+            i += 1
+    return out
@@ -0,0 +1,199 @@
+"""Delta encoding for visualization step state.
+
+Most algorithms snapshot their whole data structure on every step
+(``arr.copy()``, ``[row[:] for row in dp]``), even though a single step
+usually changes one or two cells. A delta-encoded step stream sends the
+first state in full (the keyframe) and every later state as a list of
+patch operations against the previous one.
+
+Patch format (JSON friendly):
+    [path, value]   set the value at ``path``
+    [path]          delete the key at ``path``
+
+Setting the index one past the end of a list appends to it, so a growing
+list (e.g. a visit order) costs one operation per new element.
+
+``path`` is a list of dict keys / list indices from the root of the state.
+An empty path replaces the whole state.
+
+Example:
+    >>> prev = {"type": "array", "values": [3, 1, 2]}
+    >>> curr = {"type": "array", "values": [1, 3, 2]}
+    >>> diff_state(prev, curr)
+    [[['values', 0], 1], [['values', 1], 3]]
+    >>> apply_delta(prev, diff_state(prev, curr)) == curr
+    True
+"""
+
+import copy
+from collections.abc import Generator
+from typing import Any
+
+
+def diff_state(prev: Any, curr: Any) -> list[list[Any]]:
+    """Compute the patch operations that turn ``prev`` into ``curr``.
+
+    Args:
+        prev: Previous state
+        curr: Current state
+
+    Returns:
+        List of patch operations (empty when the states are equal)
+    """
+    ops: list[list[Any]] = []
+    _diff(prev, curr, [], ops)
+    return ops
+
+
+def _diff(prev: Any, curr: Any, path: list[Any], ops: list[list[Any]]) -> None:
+    """Append the operations for one (sub)value to ``ops``."""
+    if prev is curr:
+        return
+
+    if type(prev) is dict and type(curr) is dict:
+        for key, value in curr.items():
+            if key not in prev:
+                ops.append([[*path, key], value])
+            else:
+                _diff(prev[key], value, [*path, key], ops)
+        for key in prev:
+            if key not in curr:
+                ops.append([[*path, key]])
+        return
+
+    if type(prev) is list and type(curr) is list:
+        changed = [i for i, (a, b) in enumerate(zip(prev, curr, strict=False)) if a is not b and a != b]
+        resized = abs(len(curr) - len(prev))
+        # Patching more than half the list costs more than resending it
+        if (len(changed) + resized) * 2 > len(curr):
+            ops.append([path, curr])
+            return
+        for i in changed:
+            _diff(prev[i], curr[i], [*path, i], ops)
+        # Grown lists get their new tail appended, shrunk ones are cut from the end
+        for i in range(len(prev), len(curr)):
+            ops.append([[*path, i], curr[i]])
+        for i in range(len(prev) - 1, len(curr) - 1, -1):
+            ops.append([[*path, i]])
+        return
+
+    if prev != curr:
+        ops.append([path, curr])
+
+
+def apply_delta(state: Any, ops: list[list[Any]]) -> Any:
+    """Apply patch operations to ``state`` in place.
+
+    Values taken from ``ops`` are copied, so the patch can be applied again
+    later (e.g. when reconstructing the same step twice).
+
+    Args:
+        state: State to patch (mutated)
+        ops: Patch operations from diff_state()
+
+    Returns:
+        The patched state (a new object when an op replaces the root)
+    """
+    for op in ops:
+        path = op[0]
+        if not path:
+            state = copy.deepcopy(op[1])
+            continue
+
+        target = state
+        for key in path[:-1]:
+            target = target[key]
+
+        key = path[-1]
+        if len(op) == 1:
+            del target[key]
+        elif type(target) is list and key == len(target):
+            target.append(copy.deepcopy(op[1]))
+        else:
+            target[key] = copy.deepcopy(op[1])
+    return state
+
+
+# Default number of records between keyframes; seeking costs at most this many patches
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+
+class DeltaEncoder:
+    """Stateful encoder that turns full step dicts into keyframe + delta records.
+
+    Every ``keyframe_interval``-th step (starting with the first) keeps its
+    full ``state`` (a keyframe). Every other step replaces ``state`` with a
+    ``delta`` key holding the patch against the previous step's state.
+    """
+
+    def __init__(self, keyframe_interval: int | None = DEFAULT_KEYFRAME_INTERVAL):
+        """Create an encoder.
+
+        Args:
+            keyframe_interval: Steps between keyframes, or None for a single
+                keyframe at the start of the stream
+        """
+        if keyframe_interval is not None and keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.keyframe_interval = keyframe_interval
+        self._prev_state: Any = None
+        self._count = 0
+
+    def encode(self, step: dict[str, Any]) -> dict[str, Any]:
+        """Encode one serialized step.
+
+        Args:
+            step: Step dictionary (as produced by ``Step.model_dump()``)
+
+        Returns:
+            Step dictionary carrying either ``state`` (keyframe) or ``delta``
+        """
+        state = step["state"]
+        self._count += 1
+
+        interval = self.keyframe_interval
+        if self._count == 1 or (interval is not None and (self._count - 1) % interval == 0):
+            record = step
+        else:
+            record = {k: v for k, v in step.items() if k != "state"}
+            record["delta"] = diff_state(self._prev_state, state)
+
+        self._prev_state = state
+        return record
+
+
+def decode_steps(records: list[dict[str, Any]]) -> Generator[dict[str, Any], None, None]:
+    """Expand keyframe + delta records back into full step dictionaries.
+
+    Args:
+        records: Encoded steps, starting with a keyframe
+
+    Yields:
+        Step dictionaries with a full ``state``
+    """
+    state: Any = None
+    for record in records:
+        if "state" in record:
+            state = copy.deepcopy(record["state"])
+        else:
+            state = apply_delta(state, record["delta"])
+        step = {k: v for k, v in record.items() if k != "delta"}
+        step["state"] = copy.deepcopy(state)
+        yield step
+
+
+def seek_state(records: list[dict[str, Any]], keyframe: int, index: int) -> Any:
+    """Reconstruct the state of one record from the nearest keyframe.
+
+    Args:
+        records: Encoded steps
+        keyframe: Position of a keyframe at or before ``index``
+        index: Position of the record to reconstruct
+
+    Returns:
+        The full state at ``records[index]``
+    """
+    state = copy.deepcopy(records[keyframe]["state"])
+    for record in records[keyframe + 1 : index + 1]:
+        state = apply_delta(state, record["delta"])
+    return state
@@ -1,12 +1,29 @@
 """Base class for algorithms that emit visualization steps."""
 
-import inspect
-from typing import Any, Generator
+import copy
+import sys
+from bisect import bisect_right
+from collections.abc import Callable
+from typing import Any
+
 from pydantic import BaseModel
 
+from .coalesce import (
+    coalesced_count,
+    compact,
+    extend_record,
+    extend_step,
+    merge_records,
+    merge_steps,
+)
+from .delta import DEFAULT_KEYFRAME_INTERVAL, DeltaEncoder, apply_delta, decode_steps, seek_state
+from .types import StepLevel
+
+ENCODINGS = ("full", "delta")
+
 
-class Highlight(BaseModel):
-    """Represents a highlighted element in a visualization."""
+class HighlightModel(BaseModel):
+    """Validation schema for a highlight (see Highlight)."""
 
     indices: list[int] = []
     nodes: list[Any] = []
@@ -14,15 +31,139 @@ class Highlight(BaseModel):
     color: str = "primary"
 
 
-class Step(BaseModel):
-    """Represents a single step in an algorithm execution."""
+class StepModel(BaseModel):
+    """Validation schema for a step (see Step).
+
+    Steps are emitted as lightweight Step objects; this model is only used to
+    validate them in debug mode (``configure(validate=True)``).
+    """
 
     step_number: int
     operation: str
     description: str
     state: dict[str, Any]
-    highlights: list[Highlight] = []
+    highlights: list[HighlightModel] = []
     metadata: dict[str, Any] = {}
+    level: int = StepLevel.MICRO
+
+
+class Highlight:
+    """Represents a highlighted element in a visualization.
+
+    Unknown keys are ignored, as with HighlightModel.
+    """
+
+    __slots__ = ("indices", "nodes", "edges", "color")
+
+    def __init__(
+        self,
+        indices: list[int] | None = None,
+        nodes: list[Any] | None = None,
+        edges: list[tuple[Any, Any]] | None = None,
+        color: str = "primary",
+        **_ignored: Any,
+    ):
+        self.indices = indices if indices is not None else []
+        self.nodes = nodes if nodes is not None else []
+        self.edges = edges if edges is not None else []
+        self.color = color
+
+    def model_dump(self) -> dict[str, Any]:
+        """Convert to a plain dictionary."""
+        return {
+            "indices": self.indices,
+            "nodes": self.nodes,
+            "edges": self.edges,
+            "color": self.color,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Highlight):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def __repr__(self) -> str:
+        return f"Highlight({self.model_dump()!r})"
+
+
+class Step:
+    """Represents a single step in an algorithm execution.
+
+    A plain ``__slots__`` record: emitting millions of steps must not pay for
+    model validation. Use validate() (or debug mode) to check a step against
+    StepModel.
+    """
+
+    __slots__ = (
+        "step_number",
+        "operation",
+        "description",
+        "state",
+        "highlights",
+        "metadata",
+        "level",
+    )
+
+    def __init__(
+        self,
+        step_number: int,
+        operation: str,
+        description: str,
+        state: dict[str, Any],
+        highlights: list[Highlight | dict[str, Any]] | None = None,
+        metadata: dict[str, Any] | None = None,
+        level: int = StepLevel.MICRO,
+    ):
+        self.step_number = step_number
+        self.operation = operation
+        self.description = description
+        self.state = state
+        self.highlights = [
+            h if isinstance(h, Highlight) else Highlight(**h) for h in highlights or ()
+        ]
+        self.metadata = metadata if metadata is not None else {}
+        self.level = level
+
+    def model_dump(self) -> dict[str, Any]:
+        """Convert to a plain (JSON-serializable) dictionary."""
+        return {
+            "step_number": self.step_number,
+            "operation": self.operation,
+            "description": self.description,
+            "state": self.state,
+            "highlights": [h.model_dump() for h in self.highlights],
+            "metadata": self.metadata,
+            "level": self.level,
+        }
+
+    def validate(self) -> StepModel:
+        """Validate this step against StepModel.
+
+        Raises:
+            pydantic.ValidationError: If the step does not match the schema
+        """
+        return StepModel.model_validate(self.model_dump())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Step):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def __repr__(self) -> str:
+        return f"Step({self.step_number}, {self.operation!r}, {self.description!r})"
+
+
+def resolve_references(state: dict[str, Any], references: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of ``state`` with ``{"$ref": name}`` values replaced.
+
+    Args:
+        state: Step state, possibly holding placeholders from StepTracker.reference()
+        references: Stored values (StepTracker.get_references())
+    """
+    return {
+        key: references[value["$ref"]] if type(value) is dict and "$ref" in value else value
+        for key, value in state.items()
+    }
 
 
 class StepTracker:
@@ -39,8 +180,8 @@ class StepTracker:
                         yield self.emit_step(
                             operation="compare",
                             description=f"Comparing {arr[j]} with {arr[j+1]}",
-                            state={"type": "array", "values": arr.copy()},
-                            highlights=[{
+                            state=lambda: {"type": "array", "values": arr.copy()},
+                            highlights=lambda: [{
                                 "indices": [j, j+1],
                                 "color": "comparing"
                             }]
@@ -48,73 +189,543 @@ class StepTracker:
                         if arr[j] > arr[j + 1]:
                             arr[j], arr[j + 1] = arr[j + 1], arr[j]
                             yield self.emit_step(...)
+
+    Steps are retained as full snapshots by default. Call
+    ``configure(encoding="delta")`` before running to retain a keyframe plus
+    per-step patches instead (see ``algorithms.base.delta``). Keyframes are
+    repeated every ``keyframe_interval`` steps so ``step_at()`` can rebuild
+    any step without replaying the whole run.
+
+    Consumers that handle each step as it is yielded (e.g. the SSE route) can
+    call ``configure(retain=False)`` so steps are dropped once yielded and
+    memory stays constant in the number of steps.
+
+    ``configure(max_steps=N)`` bounds the retained trace to N steps: once it
+    would grow past N, neighbouring steps are merged into summary steps (see
+    ``algorithms.base.coalesce``) and later steps are grouped at the same
+    coarser resolution, so long runs stay evenly sampled within the budget.
+    N is an upper bound, not a target: each merge pass leaves a quarter of
+    the budget free, so a run that outgrows it ends with between about N / 2
+    and N steps (never fewer than 2; ``max_steps=3`` gives 2).
+    MICRO steps that merge into a summary step without completing it are
+    never built, so their (lazy) state costs nothing.
+
+    ``configure(headless=True)`` goes further: emit_step builds no Step at
+    all and only counts operations and remembers the last state and
+    metadata, which get_summary() reports (in every mode). Use it when only
+    the answer and counters matter (size sweeps, grading). Descriptions,
+    state, highlights and metadata may be passed as zero-argument callables (as above); they
+    are only called when a step is actually built, so a headless run never
+    copies its data structure. Code that prepares step data some other way
+    can check ``self.tracing`` first.
+
+    Every step has a nesting level (StepLevel): PASS steps form the coarse
+    outline of a run, PHASE steps mark its stages and MICRO steps are the
+    individual operations. Subclasses map their operations to levels in
+    ``step_levels`` (unmapped operations are MICRO) or pass ``level=`` to
+    emit_step. get_outline() returns the coarse steps and get_steps_between()
+    refines the span between two of them. Step budgets merge MICRO steps
+    first and only merge PHASE and then PASS steps when the outline alone
+    does not fit, so a merged step takes the coarsest level it covers.
+
+    Inputs that stay constant during a run (e.g. the graph of a graph search)
+    should not be repeated in every step's state: ``reference(name, value)``
+    stores the value once per run and returns a ``{"$ref": name}`` placeholder
+    to put in the state instead. get_references() returns the stored values
+    and resolve_references() substitutes them back.
     """
 
+    # Operation -> StepLevel; subclasses extend it with {**StepTracker.step_levels, ...}
+    step_levels: dict[str, int] = {"init": StepLevel.PASS, "complete": StepLevel.PASS}
+
+    # Algorithm id -> {"name", "category", "entry"} for the API's algorithm
+    # manifest; "entry" names the method that starts a run (see api/app/services/manifest.py).
+    # Without an "input" schema the entry method receives the request input as is;
+    # with one ({key: default}, in parameter order) it receives the input object's
+    # values, and "shorthand" names the key a non-object input stands for.
+    # "cost" estimates a run from its input before it starts: {"steps", "state_bytes"}
+    # are Python expressions for the number of steps and the encoded size of a step's
+    # state, over the input's keys (or "input", the input itself) and the helpers in
+    # app.services.registry.COST_HELPERS, e.g. "len(input) ** 2".
+    registrations: dict[str, dict[str, Any]] = {}
+
     def __init__(self):
         self._step_count = 0
         self._steps: list[Step] = []
+        self._encoding = "full"
+        self._keyframe_interval = DEFAULT_KEYFRAME_INTERVAL
+        self._encoder = DeltaEncoder(self._keyframe_interval)
+        self._records: list[dict[str, Any]] = []
+        self._keyframes: list[int] = []
+        self._retain = True
+        self._capture_source = True
+        self._last_source_file: str | None = None
+        self._validate_steps = False
+        self._headless = False
+        self._max_steps: int | None = None
+        self._group_size = 1
+        self._merge_level = StepLevel.MICRO
+        self._references: dict[str, Any] = {}
+        self._operation_counts: dict[str, int] = {}
+        self._last_emit: tuple[str, str, Any, Any] | None = None
+
+    def configure(
+        self,
+        *,
+        encoding: str | None = None,
+        keyframe_interval: int | None = None,
+        retain: bool | None = None,
+        capture_source: bool | None = None,
+        validate: bool | None = None,
+        headless: bool | None = None,
+        max_steps: int | None = None,
+    ) -> "StepTracker":
+        """Configure how emitted steps are retained.
+
+        Options left as None keep their current value.
+
+        Args:
+            encoding: "full" (a Step per emit) or "delta" (keyframe + patches)
+            keyframe_interval: Steps between keyframes in delta encoding
+            retain: False to only yield steps (streaming) without storing them
+            capture_source: False to skip recording the caller's source location
+            validate: True to validate every step against StepModel (debug mode)
+            headless: True to skip building steps and only keep counters
+            max_steps: Most steps to retain (an upper bound, at least 2); 0
+                removes the budget
+
+        Returns:
+            self, so calls can be chained
+        """
+        if encoding is not None:
+            if encoding not in ENCODINGS:
+                raise ValueError(f"Unknown step encoding: {encoding}")
+            self._encoding = encoding
+        if keyframe_interval is not None:
+            self._encoder = DeltaEncoder(keyframe_interval)
+            self._keyframe_interval = keyframe_interval
+        if retain is not None:
+            self._retain = retain
+        if capture_source is not None:
+            self._capture_source = capture_source
+        if validate is not None:
+            self._validate_steps = validate
+        if headless is not None:
+            self._headless = headless
+        if max_steps is not None:
+            if max_steps == 1 or max_steps < 0:
+                raise ValueError("max_steps must be at least 2 (or 0 for no budget)")
+            self._max_steps = max_steps or None
+        return self
+
+    @property
+    def coalesced(self) -> bool:
+        """Whether any retained steps were merged to stay within max_steps."""
+        return self._group_size > 1
+
+    @property
+    def tracing(self) -> bool:
+        """Whether emitted steps are built (False in headless mode)."""
+        return not self._headless
 
     def emit_step(
         self,
         operation: str,
-        description: str,
-        state: dict[str, Any],
-        highlights: list[dict[str, Any]] | None = None,
-        metadata: dict[str, Any] | None = None,
-    ) -> Step:
+        description: str | Callable[[], str],
+        state: dict[str, Any] | Callable[[], dict[str, Any]],
+        highlights: list[dict[str, Any]] | Callable[[], list[dict[str, Any]]] | None = None,
+        metadata: dict[str, Any] | Callable[[], dict[str, Any]] | None = None,
+        level: int | None = None,
+    ) -> Step | None:
         """Emit a visualization step.
 
+        ``description``, ``state``, ``highlights`` and ``metadata`` may each be
+        a zero-argument callable returning the value, so the work of building
+        it is skipped when no step is built (headless mode).
+
         Args:
             operation: Type of operation (e.g., "compare", "swap", "insert")
             description: Human-readable description of what's happening
             state: Current state of the data structure (e.g., {"type": "array", "values": [...]})
             highlights: List of elements to highlight (indices, nodes, edges)
             metadata: Additional metadata (e.g., comparisons_count, swaps_count)
+            level: StepLevel of this step, overriding ``step_levels``
 
         Returns:
-            Step object representing this visualization step
+            Step object representing this visualization step (None in headless
+            mode, or when the step was merged into a summary step unbuilt)
         """
         self._step_count += 1
+        counts = self._operation_counts
+        counts[operation] = counts.get(operation, 0) + 1
 
-        # Capture source location for code highlighting
-        caller_frame = inspect.currentframe()
-        if caller_frame and caller_frame.f_back:
-            source_line = caller_frame.f_back.f_lineno
-            source_file = caller_frame.f_back.f_code.co_filename
-        else:
-            source_line = None
-            source_file = None
+        if self._headless:
+            # Keep the callables; get_summary() only resolves the last step's
+            self._last_emit = (operation, description, state, metadata)
+            return None
+
+        if level is None:
+            level = self.step_levels.get(operation, StepLevel.MICRO)
+        # A MICRO step that merges into an open summary step without filling
+        # it is not shown on its own: skip building its state and highlights
+        building = not (
+            self._retain and level >= StepLevel.MICRO and self._absorbs_next(level, fills=False)
+        )
 
-        # Convert highlight dicts to Highlight objects
-        highlight_objects = []
-        if highlights:
-            for h in highlights:
-                highlight_objects.append(Highlight(**h))
+        if building:
+            if callable(description):
+                description = description()
+            if callable(state):
+                state = state()
+            if callable(highlights):
+                highlights = highlights()
+        if callable(metadata):
+            metadata = metadata()
+        self._last_emit = (operation, description, state, metadata)
 
-        # Merge source location into metadata
         step_metadata = metadata or {}
-        if source_line is not None:
-            step_metadata["source_line"] = source_line
-        if source_file is not None:
-            step_metadata["source_file"] = source_file
+
+        # Capture source location for code highlighting. The line goes on every
+        # step; the file only when it changes (always on the first step).
+        if self._capture_source:
+            caller = sys._getframe(1)
+            step_metadata["source_line"] = caller.f_lineno
+            source_file = caller.f_code.co_filename
+            if source_file != self._last_source_file:
+                step_metadata["source_file"] = source_file
+                self._last_source_file = source_file
+
+        if not building:
+            if self._encoding == "delta":
+                records = self._records
+                records[-1] = extend_record(
+                    records[-1], self._step_count, operation, step_metadata, level
+                )
+            else:
+                steps = self._steps
+                steps[-1] = extend_step(steps[-1], self._step_count, operation, step_metadata, level)
+            return None
 
         step = Step(
             step_number=self._step_count,
             operation=operation,
             description=description,
             state=state,
-            highlights=highlight_objects,
+            highlights=highlights,
             metadata=step_metadata,
+            level=level,
         )
+        if self._validate_steps:
+            step.validate()
 
-        self._steps.append(step)
+        if not self._retain:
+            return step
+
+        if self._encoding == "delta":
+            self._retain_record(self._encoder.encode(step.model_dump()))
+        else:
+            self._retain_step(step)
         return step
 
+    def reference(self, name: str, value: Any) -> dict[str, str]:
+        """Store a run-constant value once and return a placeholder for step state.
+
+        Args:
+            name: Reference name, unique within the run
+            value: Value to store. It may grow during the run (e.g. an
+                append-only NodeTable) but what earlier steps rely on must
+                not change.
+
+        Returns:
+            ``{"$ref": name}``, to be used in place of ``value`` in every step
+        """
+        self._references[name] = value
+        return {"$ref": name}
+
+    def get_references(self) -> dict[str, Any]:
+        """Get the values stored with reference() during the current run."""
+        return self._references
+
+    def _absorbs_next(self, level: int, fills: bool = True) -> bool:
+        """Whether the last retained step is an open group that takes the next step.
+
+        Steps are merged only at ``_merge_level`` or finer, and never into the
+        first step, so a run always starts on its init step.
+
+        Args:
+            level: StepLevel of the next step
+            fills: Whether to count a step that would fill the group
+        """
+        if self._group_size == 1:
+            return False
+        if self._encoding == "delta":
+            items = self._records
+            if len(items) < 2:
+                return False
+            last_level, metadata = items[-1]["level"], items[-1]["metadata"]
+        else:
+            items = self._steps
+            if len(items) < 2:
+                return False
+            last_level, metadata = items[-1].level, items[-1].metadata
+        return (
+            last_level >= self._merge_level
+            and level >= self._merge_level
+            and coalesced_count(metadata) + (0 if fills else 1) < self._group_size
+        )
+
+    def _compacted(self, items: list[Any], merge: Callable, level_of: Callable) -> list[Any]:
+        """Merge neighbouring retained steps until the trace is well within budget.
+
+        MICRO steps are merged first; while that is not enough, the merge
+        level drops to PHASE and then PASS steps, so max_steps is a hard
+        bound. Each pass frees at least a quarter of the budget, keeping
+        retention amortized O(1).
+        """
+        target = max(2, self._max_steps * 3 // 4)
+        while len(items) > target:
+            merge_level = self._merge_level
+            compacted = compact(items, merge, lambda item: level_of(item) >= merge_level)
+            if len(compacted) < len(items):
+                # Group future steps at the same coarser resolution
+                self._group_size *= 2
+            if len(compacted) > target and merge_level > StepLevel.PASS:
+                self._merge_level -= 1
+            items = compacted
+        return items
+
+    def _retain_step(self, step: Step):
+        """Store a full step, coalescing to stay within max_steps."""
+        steps = self._steps
+        if self._absorbs_next(step.level):
+            steps[-1] = merge_steps(steps[-1], step)
+            return
+
+        steps.append(step)
+        if self._max_steps is not None and len(steps) > self._max_steps:
+            self._steps = self._compacted(steps, merge_steps, lambda s: s.level)
+
+    def _retain_record(self, record: dict[str, Any]):
+        """Store a delta-encoded record, coalescing to stay within max_steps."""
+        records = self._records
+        if self._absorbs_next(record["level"]):
+            last = records[-1]
+            merged = merge_records(last, record)
+            if "state" in merged and "state" not in last:
+                self._keyframes.append(len(records) - 1)
+            records[-1] = merged
+            return
+
+        if "state" in record:
+            self._keyframes.append(len(records))
+        records.append(record)
+        if self._max_steps is not None and len(records) > self._max_steps:
+            self._records = self._compacted(records, merge_records, lambda r: r["level"])
+            self._keyframes = [i for i, r in enumerate(self._records) if "state" in r]
+
+    def convert_to_delta(self):
+        """Re-encode the retained steps as keyframes + patches.
+
+        A finished full-encoding run can be stored compactly this way (e.g.
+        in the API's run store) and still seeks in O(keyframe interval).
+
+        Raises:
+            RuntimeError: If the tracker is not retaining steps
+        """
+        self._require_retained()
+        if self._encoding == "delta":
+            return
+        encoder = DeltaEncoder(self._keyframe_interval)
+        self._records = [encoder.encode(step.model_dump()) for step in self._steps]
+        self._keyframes = [i for i, record in enumerate(self._records) if "state" in record]
+        self._steps = []
+        self._encoding = "delta"
+
+    @classmethod
+    def from_records(
+        cls, records: list[dict[str, Any]], references: dict[str, Any] | None = None
+    ) -> "StepTracker":
+        """Rebuild a finished run from its delta-encoded records.
+
+        Args:
+            records: Records from get_encoded_steps() of a delta-encoded run
+            references: The run's get_references()
+
+        Returns:
+            A tracker that serves the run's steps (step_at, get_steps_between, ...)
+        """
+        tracker = cls().configure(encoding="delta")
+        tracker._records = records
+        tracker._keyframes = [i for i, record in enumerate(records) if "state" in record]
+        tracker._references = references or {}
+        tracker._step_count = records[-1]["step_number"] if records else 0
+        return tracker
+
     def get_all_steps(self) -> list[Step]:
-        """Get all emitted steps."""
+        """Get all emitted steps.
+
+        In delta encoding the full steps are reconstructed from the records.
+
+        Raises:
+            RuntimeError: If the tracker is not retaining steps
+        """
+        self._require_retained()
+        if self._encoding == "delta":
+            return [Step(**record) for record in decode_steps(self._records)]
         return self._steps
 
+    def get_encoded_steps(self) -> list[dict[str, Any]]:
+        """Get all emitted steps as dictionaries in the configured encoding.
+
+        Raises:
+            RuntimeError: If the tracker is not retaining steps
+        """
+        self._require_retained()
+        if self._encoding == "delta":
+            return self._records
+        return [step.model_dump() for step in self._steps]
+
+    def count_steps(self) -> int:
+        """Get the number of retained steps.
+
+        Raises:
+            RuntimeError: If the tracker is not retaining steps
+        """
+        self._require_retained()
+        if self._encoding == "delta":
+            return len(self._records)
+        return len(self._steps)
+
+    def step_at(self, n: int) -> Step:
+        """Get the n-th retained step (1-based).
+
+        In delta encoding the step is rebuilt from the nearest preceding
+        keyframe, so the cost is bounded by the keyframe interval rather than
+        the length of the run.
+
+        Raises:
+            IndexError: If n is outside 1..count_steps()
+            RuntimeError: If the tracker is not retaining steps
+        """
+        if not 1 <= n <= self.count_steps():
+            raise IndexError(f"Step {n} out of range (1..{self.count_steps()})")
+
+        if self._encoding != "delta":
+            return self._steps[n - 1]
+
+        index = n - 1
+        keyframe = self._keyframes[bisect_right(self._keyframes, index) - 1]
+        record = {k: v for k, v in self._records[index].items() if k != "delta"}
+        record["state"] = seek_state(self._records, keyframe, index)
+        return Step(**record)
+
+    def get_outline(self, max_level: int = StepLevel.PASS) -> list[Step]:
+        """Get the coarse outline of a run: the steps at ``max_level`` or above.
+
+        Raises:
+            RuntimeError: If the tracker is not retaining steps
+        """
+        self._require_retained()
+        if self._encoding != "delta":
+            return [step for step in self._steps if step.level <= max_level]
+        return [
+            self.step_at(i + 1)
+            for i, record in enumerate(self._records)
+            if record["level"] <= max_level
+        ]
+
+    def get_steps_between(
+        self, first: int, last: int, max_level: int | None = None
+    ) -> list[Step]:
+        """Get the retained steps with step numbers in ``first..last``.
+
+        Used to refine an outline on demand: the steps between two outline
+        steps are fetched only when a client expands that span.
+
+        Args:
+            first: First step number (inclusive)
+            last: Last step number (inclusive)
+            max_level: Only include steps at this level or above
+
+        Raises:
+            RuntimeError: If the tracker is not retaining steps
+        """
+        self._require_retained()
+        if self._encoding != "delta":
+            items = self._steps
+            start = bisect_right(items, first - 1, key=lambda s: s.step_number)
+            stop = bisect_right(items, last, key=lambda s: s.step_number)
+            steps = items[start:stop]
+        else:
+            records = self._records
+            start = bisect_right(records, first - 1, key=lambda r: r["step_number"])
+            stop = bisect_right(records, last, key=lambda r: r["step_number"])
+            steps = []
+            if start < stop:
+                # Seek once, then patch forward through the span
+                state = self.step_at(start + 1).state
+                for record in records[start:stop]:
+                    if "state" in record:
+                        state = record["state"]
+                    elif steps:
+                        state = apply_delta(copy.deepcopy(state), record["delta"])
+                    step = {k: v for k, v in record.items() if k != "delta"}
+                    step["state"] = state
+                    steps.append(Step(**step))
+
+        if max_level is None:
+            return steps
+        return [step for step in steps if step.level <= max_level]
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get the outcome of a run without its steps.
+
+        Available in every mode; in headless mode it is the only output.
+        Counters are the numeric values in the final step's metadata (e.g.
+        comparisons, swaps).
+
+        Returns:
+            Dictionary with step_count, operation_counts, counters and the
+            final step's operation, description and state
+        """
+        operation, description, state, metadata = self._last_emit or (None, None, None, None)
+        if any(map(callable, (description, state, metadata))):
+            description = description() if callable(description) else description
+            state = state() if callable(state) else state
+            metadata = metadata() if callable(metadata) else metadata
+            self._last_emit = (operation, description, state, metadata)
+        return {
+            "step_count": self._step_count,
+            "operation_counts": dict(self._operation_counts),
+            "counters": {
+                k: v
+                for k, v in (metadata or {}).items()
+                if isinstance(v, int | float) and not isinstance(v, bool) and k != "source_line"
+            },
+            "final_operation": operation,
+            "final_description": description,
+            "final_state": state,
+        }
+
+    def _require_retained(self):
+        """Raise if steps are streamed without being stored."""
+        if self._headless:
+            raise RuntimeError("Steps are not built in headless mode; use get_summary()")
+        if not self._retain:
+            raise RuntimeError(
+                "Steps are not retained in streaming mode; configure(retain=True) to keep them"
+            )
+
     def reset(self):
         """Reset step counter and stored steps."""
         self._step_count = 0
         self._steps = []
+        self._encoder = DeltaEncoder(self._keyframe_interval)
+        self._records = []
+        self._keyframes = []
+        self._last_source_file = None
+        self._operation_counts = {}
+        self._last_emit = None
+        self._group_size = 1
+        self._merge_level = StepLevel.MICRO
+        self._references = {}
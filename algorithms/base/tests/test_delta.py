@@ -0,0 +1,155 @@
+"""Tests for delta-encoded step state."""
+
+import copy
+
+import pytest
+
+from algorithms.base import DeltaEncoder, apply_delta, diff_state
+from algorithms.dynamic_programming.edit_distance_viz import EditDistance
+from algorithms.sorting.bubble_sort import BubbleSort
+
+
+class TestDiffState:
+    """Test patch computation and application."""
+
+    @pytest.mark.parametrize(
+        "prev,curr",
+        [
+            ({"type": "array", "values": [3, 1, 2]}, {"type": "array", "values": [1, 3, 2]}),
+            ({"type": "array", "values": [1, 2]}, {"type": "array", "values": [1, 2, 3]}),
+            ({"type": "grid", "table": [[0, 0], [0, 0]]}, {"type": "grid", "table": [[0, 1], [0, 0]]}),
+            ({"a": 1, "b": 2}, {"a": 1, "c": 3}),
+            ({"type": "array"}, {"type": "graph"}),
+            ([1, 2], {"type": "array"}),
+            ({"visited": list(range(10))}, {"visited": list(range(11))}),
+            ({"stack": list(range(10))}, {"stack": list(range(8))}),
+        ],
+    )
+    def test_round_trip(self, prev, curr):
+        """Applying the diff to prev yields curr."""
+        assert apply_delta(copy.deepcopy(prev), diff_state(prev, curr)) == curr
+
+    def test_equal_states_have_empty_patch(self):
+        assert diff_state({"values": [1, 2, 3]}, {"values": [1, 2, 3]}) == []
+
+    def test_single_swap_patches_two_indices(self):
+        prev = {"type": "array", "values": list(range(100))}
+        curr = {"type": "array", "values": list(range(100))}
+        curr["values"][10], curr["values"][11] = 11, 10
+
+        assert diff_state(prev, curr) == [[["values", 10], 11], [["values", 11], 10]]
+
+    def test_grid_patches_single_cell(self):
+        prev = {"table": [[0] * 5 for _ in range(5)]}
+        curr = {"table": [[0] * 5 for _ in range(5)]}
+        curr["table"][2][3] = 7
+
+        assert diff_state(prev, curr) == [[["table", 2, 3], 7]]
+
+    def test_growing_list_appends_tail(self):
+        prev = {"visited": list(range(50))}
+        curr = {"visited": list(range(52))}
+
+        assert diff_state(prev, curr) == [[["visited", 50], 50], [["visited", 51], 51]]
+
+    def test_apply_does_not_alias_patch_values(self):
+        """Reapplying a patch after mutating its result must give the same answer."""
+        ops = [[["values"], [1, 2, 3]]]
+        first = apply_delta({"values": []}, ops)
+        first["values"][0] = 99
+
+        assert apply_delta({"values": []}, ops) == {"values": [1, 2, 3]}
+
+
+class TestDeltaEncoder:
+    """Test keyframe + delta encoding of step streams."""
+
+    def test_first_step_is_keyframe(self):
+        encoder = DeltaEncoder()
+        first = encoder.encode({"step_number": 1, "state": {"values": [1]}})
+        second = encoder.encode({"step_number": 2, "state": {"values": [2]}})
+
+        assert first["state"] == {"values": [1]}
+        assert "state" not in second
+        assert second["delta"] == [[["values"], [2]]]
+
+
+class TestDeltaTracker:
+    """Test StepTracker in delta encoding."""
+
+    @pytest.mark.parametrize(
+        "cls,method,input_data",
+        [
+            (BubbleSort, "sort", [5, 1, 4, 2, 8, 0, 3]),
+            (EditDistance, "run", {"word1": "horse", "word2": "ros"}),
+        ],
+    )
+    def test_matches_full_encoding(self, cls, method, input_data):
+        """Decoded delta steps equal the full-encoding steps."""
+        full_steps = [s.model_dump() for s in getattr(cls(), method)(copy.deepcopy(input_data))]
+
+        tracker = cls().configure(encoding="delta")
+        list(getattr(tracker, method)(copy.deepcopy(input_data)))
+
+        assert [s.model_dump() for s in tracker.get_all_steps()] == full_steps
+
+    def test_delta_payload_is_smaller(self):
+        arr = list(range(60, 0, -1))
+        full = BubbleSort()
+        list(full.sort(arr.copy()))
+        delta = BubbleSort().configure(encoding="delta")
+        list(delta.sort(arr.copy()))
+
+        full_size = sum(len(str(s["state"])) for s in full.get_encoded_steps())
+        delta_size = sum(len(str(s.get("state", s.get("delta")))) for s in delta.get_encoded_steps())
+        assert delta_size * 10 < full_size
+
+    def test_unknown_encoding_rejected(self):
+        with pytest.raises(ValueError):
+            BubbleSort().configure(encoding="zip")
+
+    def test_encoding_survives_reset(self):
+        sorter = BubbleSort().configure(encoding="delta")
+        list(sorter.sort([2, 1]))
+        list(sorter.sort([3, 2, 1]))
+
+        records = sorter.get_encoded_steps()
+        assert records[0]["state"]["values"] == [3, 2, 1]
+        assert all("delta" in r for r in records[1:])
+
+
+class TestKeyframeSeek:
+    """Test periodic keyframes and random access with step_at()."""
+
+    @pytest.mark.parametrize("encoding", ["full", "delta"])
+    def test_step_at_matches_sequential_steps(self, encoding):
+        expected = [s.model_dump() for s in BubbleSort().sort([9, 3, 7, 1, 8, 2, 6])]
+
+        sorter = BubbleSort().configure(encoding=encoding, keyframe_interval=5)
+        list(sorter.sort([9, 3, 7, 1, 8, 2, 6]))
+
+        assert sorter.count_steps() == len(expected)
+        for n in (1, 4, 5, 6, 11, len(expected)):
+            assert sorter.step_at(n).model_dump() == expected[n - 1]
+
+    def test_keyframes_repeat_at_interval(self):
+        sorter = BubbleSort().configure(encoding="delta", keyframe_interval=4)
+        list(sorter.sort([5, 4, 3, 2, 1]))
+
+        records = sorter.get_encoded_steps()
+        keyframes = [i for i, r in enumerate(records) if "state" in r]
+        assert keyframes == list(range(0, len(records), 4))
+
+    def test_step_at_out_of_range(self):
+        sorter = BubbleSort()
+        list(sorter.sort([2, 1]))
+
+        with pytest.raises(IndexError):
+            sorter.step_at(0)
+        with pytest.raises(IndexError):
+            sorter.step_at(sorter.count_steps() + 1)
+
+    def test_invalid_keyframe_interval(self):
+        with pytest.raises(ValueError):
+            BubbleSort().configure(keyframe_interval=0)
+
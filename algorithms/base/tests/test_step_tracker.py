@@ -0,0 +1,368 @@
+"""Tests for StepTracker retention modes."""
+
+import pytest
+from pydantic import ValidationError
+
+from algorithms.base import Step, StepLevel, resolve_references
+from algorithms.graphs.dijkstra import Dijkstra
+from algorithms.sorting.bubble_sort import BubbleSort
+
+
+class TestStreamingMode:
+    """Test the non-retaining (streaming) mode."""
+
+    @pytest.mark.parametrize("encoding", ["full", "delta"])
+    def test_steps_are_yielded_but_not_stored(self, encoding):
+        sorter = BubbleSort().configure(encoding=encoding, retain=False)
+        steps = list(sorter.sort([3, 1, 2]))
+
+        assert steps[-1].state["values"] == [1, 2, 3]
+        assert sorter._steps == [] and sorter._records == []
+
+    @pytest.mark.parametrize("accessor", ["get_all_steps", "get_encoded_steps", "count_steps"])
+    def test_retained_accessors_raise(self, accessor):
+        sorter = BubbleSort().configure(retain=False)
+        list(sorter.sort([2, 1]))
+
+        with pytest.raises(RuntimeError):
+            getattr(sorter, accessor)()
+        with pytest.raises(RuntimeError):
+            sorter.step_at(1)
+
+
+class TestSourceCapture:
+    """Test source location capture in emit_step."""
+
+    def test_line_on_every_step_file_once(self):
+        steps = list(BubbleSort().sort([3, 1, 2]))
+
+        assert all("source_line" in step.metadata for step in steps)
+        assert steps[0].metadata["source_file"].endswith("bubble_sort.py")
+        assert not any("source_file" in step.metadata for step in steps[1:])
+
+    def test_file_repeated_after_reset(self):
+        sorter = BubbleSort()
+        list(sorter.sort([2, 1]))
+        steps = list(sorter.sort([2, 1]))
+
+        assert "source_file" in steps[0].metadata
+
+    def test_capture_can_be_disabled(self):
+        steps = list(BubbleSort().configure(capture_source=False).sort([3, 1, 2]))
+
+        assert not any(
+            "source_line" in step.metadata or "source_file" in step.metadata for step in steps
+        )
+
+
+class TestStepRecord:
+    """Test the lightweight Step record and debug-mode validation."""
+
+    def test_model_dump_shape(self):
+        step = list(BubbleSort().sort([2, 1]))[1]
+
+        assert set(step.model_dump()) == {
+            "step_number",
+            "operation",
+            "description",
+            "state",
+            "highlights",
+            "metadata",
+            "level",
+        }
+        assert step.model_dump()["highlights"][0] == {
+            "indices": [0, 1],
+            "nodes": [],
+            "edges": [],
+            "color": "active",
+        }
+
+    def test_highlight_ignores_unknown_keys(self):
+        step = Step(1, "visit", "Visit", {"type": "tree"}, highlights=[{"nodes": [1], "type": "x"}])
+
+        assert step.highlights[0].nodes == [1]
+        assert "type" not in step.highlights[0].model_dump()
+
+    def test_validate_mode_accepts_valid_steps(self):
+        steps = list(BubbleSort().configure(validate=True).sort([3, 1, 2]))
+        assert steps[-1].state["values"] == [1, 2, 3]
+
+    def test_validate_rejects_bad_step(self):
+        step = Step(1, "init", "Start", state="not a dict")
+
+        with pytest.raises(ValidationError):
+            step.validate()
+
+
+class TestHeadlessMode:
+    """Test headless (result + counters only) runs."""
+
+    def test_summary_matches_traced_run(self):
+        traced = BubbleSort()
+        list(traced.sort([5, 1, 4, 2, 8]))
+        headless = BubbleSort().configure(headless=True)
+        list(headless.sort([5, 1, 4, 2, 8]))
+
+        assert headless.get_summary() == traced.get_summary()
+
+    def test_summary_contents(self):
+        sorter = BubbleSort().configure(headless=True)
+        yielded = list(sorter.sort([3, 2, 1]))
+        summary = sorter.get_summary()
+
+        assert all(step is None for step in yielded)
+        assert summary["step_count"] == len(yielded)
+        assert summary["final_state"]["values"] == [1, 2, 3]
+        assert summary["counters"] == {"comparisons": 3, "swaps": 3, "passes": 2}
+        assert summary["operation_counts"]["swap"] == 3
+
+    def test_lazy_step_data_not_built(self):
+        built = []
+
+        def state(n):
+            return lambda: built.append(n) or {"type": "array", "values": [n]}
+
+        tracker = BubbleSort().configure(headless=True)
+        for n in range(3):
+            tracker.emit_step("compare", lambda: "Comparing", state(n), highlights=state(n))
+
+        assert not tracker.tracing
+        assert tracker.get_summary()["final_state"]["values"] == [2]
+        assert built == [2]
+
+    def test_lazy_step_data_built_when_tracing(self):
+        tracker = BubbleSort()
+        step = tracker.emit_step(
+            "compare",
+            lambda: "Comparing",
+            lambda: {"type": "array", "values": [1]},
+            highlights=lambda: [{"indices": [0]}],
+            metadata=lambda: {"comparisons": 1},
+        )
+
+        assert tracker.tracing
+        assert step.description == "Comparing"
+        assert step.state["values"] == [1]
+        assert step.highlights[0].indices == [0]
+        assert step.metadata["comparisons"] == 1
+
+    def test_steps_unavailable(self):
+        sorter = BubbleSort().configure(headless=True)
+        list(sorter.sort([2, 1]))
+
+        with pytest.raises(RuntimeError):
+            sorter.get_all_steps()
+
+
+class TestStepBudget:
+    """Test max_steps coalescing."""
+
+    ARR = [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+
+    def test_count_within_budget(self):
+        sorter = BubbleSort().configure(max_steps=30)
+        list(sorter.sort(self.ARR.copy()))
+        steps = sorter.get_all_steps()
+
+        assert len(steps) <= 30
+        assert sum(s.metadata.get("coalesced_steps", 1) for s in steps) == sorter.get_summary()[
+            "step_count"
+        ]
+
+    def test_first_and_last_steps_kept(self):
+        full = BubbleSort()
+        list(full.sort(self.ARR.copy()))
+        budgeted = BubbleSort().configure(max_steps=10)
+        list(budgeted.sort(self.ARR.copy()))
+
+        expected, steps = full.get_all_steps(), budgeted.get_all_steps()
+        assert steps[0] == expected[0]
+        assert steps[-1].state == expected[-1].state
+        assert steps[-1].step_number == expected[-1].step_number
+
+    def test_operation_counts_preserved(self):
+        sorter = BubbleSort().configure(max_steps=8)
+        list(sorter.sort(self.ARR.copy()))
+
+        totals: dict[str, int] = {}
+        for step in sorter.get_all_steps():
+            ops = step.metadata.get("coalesced_operations", {step.operation: 1})
+            for op, count in ops.items():
+                totals[op] = totals.get(op, 0) + count
+        assert totals == sorter.get_summary()["operation_counts"]
+
+    @pytest.mark.parametrize("interval", [1, 3, 64])
+    def test_delta_matches_full(self, interval):
+        full = BubbleSort().configure(max_steps=12)
+        list(full.sort(self.ARR.copy()))
+        delta = BubbleSort().configure(encoding="delta", keyframe_interval=interval, max_steps=12)
+        list(delta.sort(self.ARR.copy()))
+
+        assert delta.get_all_steps() == full.get_all_steps()
+        assert delta.step_at(5) == full.step_at(5)
+
+    @pytest.mark.parametrize("encoding", ["full", "delta"])
+    @pytest.mark.parametrize("budget", [2, 5, 50])
+    def test_budget_is_hard_cap(self, encoding, budget):
+        # 100 elements: ~200 pass/phase steps, far more than the budget
+        values = list(range(100, 0, -1))
+        sorter = BubbleSort().configure(encoding=encoding, max_steps=budget)
+        list(sorter.sort(values.copy()))
+        steps = sorter.get_all_steps()
+
+        assert len(steps) <= budget
+        assert steps[0].operation == "init" and steps[0].level == StepLevel.PASS
+        assert steps[-1].state["values"] == sorted(values)
+        assert sum(s.metadata.get("coalesced_steps", 1) for s in steps) == sorter.get_summary()[
+            "step_count"
+        ]
+
+    @pytest.mark.parametrize("budget, fewest", [(2, 2), (3, 2), (4, 2), (8, 4)])
+    def test_small_budgets_are_upper_bounds(self, budget, fewest):
+        # Each merge pass leaves a quarter of the budget free, so the trace can
+        # end below it: max_steps=3 gives 2 steps
+        sorter = BubbleSort().configure(max_steps=budget)
+        list(sorter.sort(self.ARR.copy()))
+        steps = sorter.get_all_steps()
+
+        assert sorter.coalesced
+        assert fewest <= len(steps) <= budget
+        assert steps[0].operation == "init"
+        assert steps[-1].state["values"] == sorted(self.ARR)
+
+    def test_merged_steps_not_built(self):
+        built = []
+        tracker = BubbleSort().configure(max_steps=4)
+        for n in range(1000):
+            tracker.emit_step("compare", "Comparing", lambda n=n: built.append(n) or {"n": n})
+
+        assert tracker.count_steps() <= 4
+        assert len(built) < 100
+        assert tracker.get_all_steps()[-1].metadata["coalesced_steps"] >= 2
+
+    def test_no_coalescing_under_budget(self):
+        sorter = BubbleSort().configure(max_steps=1000)
+        list(sorter.sort([2, 1]))
+        assert not sorter.coalesced
+        assert all("coalesced_steps" not in s.metadata for s in sorter.get_all_steps())
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            BubbleSort().configure(max_steps=1)
+
+
+class TestStepLevels:
+    """Test step levels, outlines and on-demand refinement."""
+
+    ARR = [5, 4, 3, 2, 1]
+
+    def test_levels_from_operation_map(self):
+        steps = list(BubbleSort().sort(self.ARR.copy()))
+
+        assert steps[0].level == StepLevel.PASS
+        assert {s.level for s in steps if s.operation == "pass_start"} == {StepLevel.PASS}
+        assert {s.level for s in steps if s.operation == "compare"} == {StepLevel.MICRO}
+
+    def test_outline_is_coarse_steps(self):
+        sorter = BubbleSort()
+        steps = list(sorter.sort(self.ARR.copy()))
+        outline = sorter.get_outline()
+
+        assert outline == [s for s in steps if s.level == StepLevel.PASS]
+        assert outline[0].operation == "init"
+        assert outline[-1].operation == "complete"
+
+    @pytest.mark.parametrize("encoding", ["full", "delta"])
+    def test_refine_between_outline_steps(self, encoding):
+        full = BubbleSort()
+        steps = list(full.sort(self.ARR.copy()))
+        sorter = BubbleSort().configure(encoding=encoding, keyframe_interval=4)
+        list(sorter.sort(self.ARR.copy()))
+
+        first, second = sorter.get_outline()[1:3]
+        refined = sorter.get_steps_between(first.step_number + 1, second.step_number - 1)
+
+        assert refined == steps[first.step_number : second.step_number - 1]
+        assert all(s.level > StepLevel.PASS for s in refined)
+
+    def test_refine_with_level(self):
+        sorter = BubbleSort()
+        list(sorter.sort(self.ARR.copy()))
+
+        phases = sorter.get_steps_between(1, sorter.count_steps(), max_level=StepLevel.PHASE)
+        assert {s.operation for s in phases} >= {"pass_start", "pass_complete"}
+        assert "compare" not in {s.operation for s in phases}
+
+    def test_budget_keeps_outline(self):
+        full = BubbleSort()
+        list(full.sort(list(range(20, 0, -1))))
+        budgeted = BubbleSort().configure(max_steps=80)
+        list(budgeted.sort(list(range(20, 0, -1))))
+
+        assert budgeted.count_steps() <= 80 < full.count_steps()
+        assert budgeted.get_outline() == full.get_outline()
+
+    def test_level_override(self):
+        sorter = BubbleSort()
+        sorter.reset()
+        step = sorter.emit_step("compare", "x", {"type": "array"}, level=StepLevel.PHASE)
+        assert step.level == StepLevel.PHASE
+
+
+class TestReferences:
+    """Test run-constant state shared by reference."""
+
+    GRAPH = {0: [(1, 4), (2, 1)], 1: [(3, 1)], 2: [(1, 2), (3, 5)], 3: []}
+
+    def test_graph_sent_once(self):
+        finder = Dijkstra()
+        steps = list(finder.shortest_path(self.GRAPH, 0))
+
+        assert all(step.state["graph"] == {"$ref": "graph"} for step in steps)
+        assert finder.get_references() == {"graph": self.GRAPH}
+        assert resolve_references(steps[0].state, finder.get_references())["graph"] == self.GRAPH
+
+    def test_steps_carry_only_changes(self):
+        steps = list(Dijkstra().shortest_path(self.GRAPH, 0))
+        distances, visited = {}, []
+        for step in steps:
+            distances.update(step.state["updated"])
+            if step.state["newly_visited"] is not None:
+                visited.append(step.state["newly_visited"])
+
+        assert distances == steps[-1].state["distances"] == {0: 0, 1: 3, 2: 1, 3: 4}
+        assert visited == steps[-1].state["visited"] == [0, 2, 1, 3]
+        assert all("distances" not in step.state for step in steps[1:-1])
+
+    @pytest.mark.parametrize("target", [None, 1])
+    def test_frontier_changes_fold_to_frontier(self, target):
+        steps = list(Dijkstra().shortest_path(self.GRAPH, 0, target))
+
+        frontier = steps[0].state["frontier"]
+        assert frontier == [[0, 0]]
+        for step in steps[1:]:
+            assert "frontier" not in step.state or step is steps[-1]
+            for entry in step.state["popped"]:
+                frontier.remove(entry)
+            if step.state["pushed"] is not None:
+                frontier.append(step.state["pushed"])
+
+        assert sorted(frontier) == sorted(steps[-1].state["frontier"])
+        assert (frontier == []) == (target is None)
+
+    def test_delta_sends_only_changes(self):
+        finder = Dijkstra().configure(encoding="delta")
+        list(finder.shortest_path(self.GRAPH, 0))
+
+        # After the first step, until the summary in the last one
+        for record in finder.get_encoded_steps()[2:-1]:
+            assert all(
+                op[0][0] in ("newly_visited", "updated", "pushed", "popped")
+                for op in record["delta"]
+            )
+
+    def test_reset_clears_references(self):
+        finder = Dijkstra()
+        list(finder.shortest_path(self.GRAPH, 0))
+        finder.reset()
+        assert finder.get_references() == {}
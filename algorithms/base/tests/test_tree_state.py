@@ -0,0 +1,41 @@
+"""Tests for node-id based tree state."""
+
+from algorithms.base import LEFT, RIGHT, NodeTable, build_tree, path_to
+
+
+class TestNodeTable:
+    """Test rebuilding trees and paths from node tables."""
+
+    @staticmethod
+    def _chain(length: int) -> NodeTable:
+        """A degenerate (right-leaning) tree of ``length`` nodes."""
+        table = NodeTable()
+        table.add(0)
+        for i in range(1, length):
+            table.add(i, parent=i - 1, side=RIGHT)
+        return table
+
+    def test_prefix_of_rows(self):
+        table = NodeTable()
+        root = table.add(5)
+        table.add(3, parent=root, side=LEFT)
+        table.add(8, parent=root, side=RIGHT)
+
+        assert build_tree(table.rows, size=0) is None
+        assert build_tree(table.rows, size=2)["right"] is None
+        assert build_tree(table.rows)["right"] == {"val": 8, "left": None, "right": None}
+
+    def test_degenerate_tree_is_not_recursive(self):
+        node = build_tree(self._chain(5000).rows)
+        depth = 0
+        while node:
+            depth += 1
+            node = node["right"]
+        assert depth == 5000
+
+    def test_path_to(self):
+        rows = self._chain(4).rows
+
+        assert path_to(rows, 3) == [0, 1, 2, 3]
+        assert path_to(rows, 0) == [0]
+        assert path_to(rows, None) == []
@@ -0,0 +1,91 @@
+"""Node-id based state for tree visualizations.
+
+Rebuilding a nested ``{"val", "left", "right"}`` dict of the whole tree for
+every step costs O(n) per step and recurses once per level, so degenerate
+trees hit the recursion limit. Instead a run keeps one append-only
+NodeTable, shared once per run via StepTracker.reference(), and each step's
+state only records how many of its rows exist at that point:
+
+    state = {"type": "tree", "nodes": {"$ref": "nodes"}, "size": 3}
+
+Each row is ``[value, parent_id, side]`` (side LEFT or RIGHT; the root has
+neither) and a node's id is its row index. Rows never change once added, so
+the tree at a step is its first ``size`` rows; inserting a node is a one-row
+edit and highlights refer to nodes by id (``{"nodes": [id], "color": ...}``).
+A descent from the root is recorded as the id of its last node (``"path"``);
+path_to() recovers the whole path from the parent ids.
+
+Example:
+    >>> table = NodeTable()
+    >>> root = table.add(5)
+    >>> table.add(3, parent=root, side=LEFT)
+    1
+    >>> build_tree(table.rows)
+    {'val': 5, 'left': {'val': 3, 'left': None, 'right': None}, 'right': None}
+    >>> path_to(table.rows, 1)
+    [0, 1]
+"""
+
+from typing import Any
+
+LEFT = 0
+RIGHT = 1
+
+
+class NodeTable:
+    """Append-only table of tree nodes, in insertion order."""
+
+    def __init__(self):
+        self.rows: list[list[Any]] = []
+
+    def add(self, value: Any, parent: int | None = None, side: int | None = None) -> int:
+        """Add a node and return its id.
+
+        Args:
+            value: Node value
+            parent: Id of the parent node (None for the root)
+            side: LEFT or RIGHT child of ``parent``
+        """
+        self.rows.append([value, parent, side])
+        return len(self.rows) - 1
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+def build_tree(rows: list[list[Any]], size: int | None = None) -> dict[str, Any] | None:
+    """Rebuild the nested tree dict from the first ``size`` rows of a node table.
+
+    Iterative, so arbitrarily deep trees are fine.
+
+    Args:
+        rows: NodeTable rows (e.g. from a run's references)
+        size: Number of rows present at the step (default: all)
+
+    Returns:
+        Nested ``{"val", "left", "right"}`` dict, or None for an empty tree
+    """
+    count = len(rows) if size is None else size
+    if not count:
+        return None
+
+    nodes = [{"val": rows[i][0], "left": None, "right": None} for i in range(count)]
+    for i in range(1, count):
+        _, parent, side = rows[i]
+        nodes[parent]["left" if side == LEFT else "right"] = nodes[i]
+    return nodes[0]
+
+
+def path_to(rows: list[list[Any]], node: int | None) -> list[int]:
+    """Ids of the nodes on the path from the root down to ``node`` (inclusive).
+
+    Args:
+        rows: NodeTable rows
+        node: Id of the last node on the path (None for an empty path)
+    """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = rows[node][1]
+    path.reverse()
+    return path
@@ -1,6 +1,6 @@
 """Type definitions for DSA visualizer."""
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class VisualizerType(str, Enum):
@@ -17,3 +17,11 @@ class VisualizerType(str, Enum):
     TRIE = "trie"
     HASH_TABLE = "hash_table"
     COMPOSITE = "composite"
+
+
+class StepLevel(IntEnum):
+    """Nesting level of a step; lower levels form the coarse outline of a run."""
+
+    PASS = 0
+    PHASE = 1
+    MICRO = 2
@@ -35,6 +35,14 @@ class ClimbingStairs(StepTracker):
     """Climbing Stairs (bottom-up DP) with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "climbing_stairs": {
+            "name": "Climbing Stairs",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "2 * abs(input)", "state_bytes": "8 * abs(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -63,12 +71,12 @@ class ClimbingStairs(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Climbing a staircase with {n} steps. Each move is 1 or 2 steps. "
+                lambda: f"Climbing a staircase with {n} steps. Each move is 1 or 2 steps. "
                 f"ways[i] will hold the number of distinct ways to reach step i."
             ),
-            state={"type": "array", "values": ways.copy()},
+            state=lambda: {"type": "array", "values": ways.copy()},
             highlights=[],
-            metadata={"n": n, "additions": self.additions},
+            metadata=lambda: {"n": n, "additions": self.additions},
         )
 
         # Base case: 1 way to be at the ground (take no steps)
@@ -79,9 +87,9 @@ class ClimbingStairs(StepTracker):
                 "Base case: there is exactly 1 way to be at the ground (step 0) - "
                 "make no moves. Set ways[0] = 1."
             ),
-            state={"type": "array", "values": ways.copy()},
-            highlights=[{"indices": [0], "color": "sorted"}],
-            metadata={"n": n, "additions": self.additions},
+            state=lambda: {"type": "array", "values": ways.copy()},
+            highlights=lambda: [{"indices": [0], "color": "sorted"}],
+            metadata=lambda: {"n": n, "additions": self.additions},
         )
 
         # Base case: 1 way to reach step 1 (a single 1-step)
@@ -93,9 +101,9 @@ class ClimbingStairs(StepTracker):
                     "Base case: there is exactly 1 way to reach step 1 - a single "
                     "1-step. Set ways[1] = 1."
                 ),
-                state={"type": "array", "values": ways.copy()},
-                highlights=[{"indices": [1], "color": "sorted"}],
-                metadata={"n": n, "additions": self.additions},
+                state=lambda: {"type": "array", "values": ways.copy()},
+                highlights=lambda: [{"indices": [1], "color": "sorted"}],
+                metadata=lambda: {"n": n, "additions": self.additions},
             )
 
         # Fill the table bottom-up
@@ -104,16 +112,16 @@ class ClimbingStairs(StepTracker):
             yield self.emit_step(
                 operation="compare",
                 description=(
-                    f"To reach step {i} you either came from step {i - 1} (a 1-step) "
+                    lambda: f"To reach step {i} you either came from step {i - 1} (a 1-step) "
                     f"or from step {i - 2} (a 2-step). Add ways[{i - 1}]={ways[i - 1]} "
                     f"and ways[{i - 2}]={ways[i - 2]}."
                 ),
-                state={"type": "array", "values": ways.copy()},
-                highlights=[
+                state=lambda: {"type": "array", "values": ways.copy()},
+                highlights=lambda: [
                     {"indices": [i], "color": "active"},
                     {"indices": [i - 1, i - 2], "color": "comparing"},
                 ],
-                metadata={"n": n, "additions": self.additions, "i": i},
+                metadata=lambda: {"n": n, "additions": self.additions, "i": i},
             )
 
             ways[i] = ways[i - 1] + ways[i - 2]
@@ -122,16 +130,16 @@ class ClimbingStairs(StepTracker):
             yield self.emit_step(
                 operation="compute",
                 description=(
-                    f"ways[{i}] = ways[{i - 1}] + ways[{i - 2}] = "
+                    lambda: f"ways[{i}] = ways[{i - 1}] + ways[{i - 2}] = "
                     f"{ways[i - 1]} + {ways[i - 2]} = {ways[i]}. "
                     f"There are {ways[i]} distinct ways to reach step {i}."
                 ),
-                state={"type": "array", "values": ways.copy()},
-                highlights=[
+                state=lambda: {"type": "array", "values": ways.copy()},
+                highlights=lambda: [
                     {"indices": [i], "color": "swapped"},
                     {"indices": [i - 1, i - 2], "color": "comparing"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "n": n,
                     "additions": self.additions,
                     "i": i,
@@ -143,12 +151,12 @@ class ClimbingStairs(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done! There are {result} distinct ways to climb a staircase of "
+                lambda: f"Done! There are {result} distinct ways to climb a staircase of "
                 f"{n} steps ({self.additions} additions performed)."
             ),
-            state={"type": "array", "values": ways.copy()},
-            highlights=[{"indices": [n], "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "array", "values": ways.copy()},
+            highlights=lambda: [{"indices": [n], "color": "sorted"}],
+            metadata=lambda: {
                 "n": n,
                 "additions": self.additions,
                 "result": result,
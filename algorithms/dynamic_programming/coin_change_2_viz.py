@@ -38,6 +38,14 @@ class CoinChange2(StepTracker):
     """Coin Change II (Count Ways) solver with DP grid visualization."""
 
     visualizer_type = VisualizerType.GRID
+    registrations = {
+        "coin_change_2": {
+            "name": "Coin Change II (Count Ways)",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "len(coins) * abs(amount)", "state_bytes": "13 * abs(amount)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -66,12 +74,12 @@ class CoinChange2(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Building ({k + 1})×({amount + 1}) DP table to count ways to make "
+                lambda: f"Building ({k + 1})×({amount + 1}) DP table to count ways to make "
                 f"amount {amount} with coins {coins}"
             ),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "coins": coins,
                 "amount": amount,
                 "k": k,
@@ -90,11 +98,11 @@ class CoinChange2(StepTracker):
                 "Base case: dp[i][0]=1 for every row — exactly one way to make amount 0 "
                 "(use no coins)"
             ),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
-            highlights=[
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+            highlights=lambda: [
                 {"type": "cell", "row": i, "col": 0, "color": "visited"} for i in range(k + 1)
             ],
-            metadata={
+            metadata=lambda: {
                 "coins": coins,
                 "amount": amount,
                 "k": k,
@@ -162,7 +170,7 @@ class CoinChange2(StepTracker):
                 yield self.emit_step(
                     operation="count",
                     description=description,
-                    state={"type": "grid", "grid": [row[:] for row in dp]},
+                    state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
                     highlights=highlights,
                     metadata=metadata,
                 )
@@ -172,12 +180,12 @@ class CoinChange2(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"There are {ways} way(s) to make amount {amount} with coins {coins} "
+                lambda: f"There are {ways} way(s) to make amount {amount} with coins {coins} "
                 f"(bottom-right cell dp[{k}][{amount}])"
             ),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
-            highlights=[{"type": "cell", "row": k, "col": amount, "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+            highlights=lambda: [{"type": "cell", "row": k, "col": amount, "color": "sorted"}],
+            metadata=lambda: {
                 "coins": coins,
                 "amount": amount,
                 "k": k,
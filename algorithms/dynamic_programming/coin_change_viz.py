@@ -39,6 +39,14 @@ class CoinChange(StepTracker):
     """Coin Change (minimum coins) with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "coin_change": {
+            "name": "Coin Change",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "2 * len(coins) * abs(amount)", "state_bytes": "4 * abs(amount)"},
+        },
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -74,12 +82,12 @@ class CoinChange(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Initialize dp[0..{amount}]. dp[0] = 0 (zero coins make amount 0); "
+                lambda: f"Initialize dp[0..{amount}]. dp[0] = 0 (zero coins make amount 0); "
                 f"every other amount starts unreachable (-1). Coins: {coins}"
             ),
-            state={"type": "array", "values": self._display(dp)},
-            highlights=[{"indices": [0], "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "array", "values": self._display(dp)},
+            highlights=lambda: [{"indices": [0], "color": "sorted"}],
+            metadata=lambda: {
                 "coins": coins,
                 "amount": amount,
                 "coins_tried": self.coins_tried,
@@ -90,10 +98,10 @@ class CoinChange(StepTracker):
         for a in range(1, amount + 1):
             yield self.emit_step(
                 operation="consider_amount",
-                description=f"Compute dp[{a}]: the minimum coins to make amount {a}",
-                state={"type": "array", "values": self._display(dp)},
-                highlights=[{"indices": [a], "color": "active"}],
-                metadata={
+                description=lambda: f"Compute dp[{a}]: the minimum coins to make amount {a}",
+                state=lambda: {"type": "array", "values": self._display(dp)},
+                highlights=lambda: [{"indices": [a], "color": "active"}],
+                metadata=lambda: {
                     "coins": coins,
                     "amount": amount,
                     "current_amount": a,
@@ -115,15 +123,15 @@ class CoinChange(StepTracker):
                     yield self.emit_step(
                         operation="try_coin",
                         description=(
-                            f"Try coin {coin} for amount {a}: dp[{sub}] is unreachable, "
+                            lambda: f"Try coin {coin} for amount {a}: dp[{sub}] is unreachable, "
                             f"so coin {coin} cannot form amount {a} this way"
                         ),
-                        state={"type": "array", "values": self._display(dp)},
-                        highlights=[
+                        state=lambda: {"type": "array", "values": self._display(dp)},
+                        highlights=lambda: [
                             {"indices": [a], "color": "active"},
                             {"indices": [sub], "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "coins": coins,
                             "amount": amount,
                             "current_amount": a,
@@ -141,19 +149,19 @@ class CoinChange(StepTracker):
                 yield self.emit_step(
                     operation="try_coin",
                     description=(
-                        f"Try coin {coin} for amount {a}: dp[{sub}] + 1 = {int(candidate)} "
+                        lambda: f"Try coin {coin} for amount {a}: dp[{sub}] + 1 = {int(candidate)} "
                         + (
                             f"improves current dp[{a}] ({'-1' if dp[a] == INF else int(dp[a])})"
                             if improved
                             else f"does not beat current dp[{a}] ({int(dp[a])})"
                         )
                     ),
-                    state={"type": "array", "values": self._display(dp)},
-                    highlights=[
+                    state=lambda: {"type": "array", "values": self._display(dp)},
+                    highlights=lambda: [
                         {"indices": [a], "color": "active"},
                         {"indices": [sub], "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "coins": coins,
                         "amount": amount,
                         "current_amount": a,
@@ -173,15 +181,15 @@ class CoinChange(StepTracker):
                     yield self.emit_step(
                         operation="update",
                         description=(
-                            f"Update dp[{a}] = {int(candidate)} using coin {coin} "
+                            lambda: f"Update dp[{a}] = {int(candidate)} using coin {coin} "
                             f"(built on dp[{sub}])"
                         ),
-                        state={"type": "array", "values": self._display(dp)},
-                        highlights=[
+                        state=lambda: {"type": "array", "values": self._display(dp)},
+                        highlights=lambda: [
                             {"indices": [a], "color": "swapped"},
                             {"indices": [sub], "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "coins": coins,
                             "amount": amount,
                             "current_amount": a,
@@ -217,14 +225,14 @@ class CoinChange(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=description,
-            state={"type": "array", "values": self._display(dp)},
-            highlights=[
+            state=lambda: {"type": "array", "values": self._display(dp)},
+            highlights=lambda: [
                 {
                     "indices": [amount] if amount >= 0 else [],
                     "color": "sorted" if reachable else "comparing",
                 }
             ],
-            metadata={
+            metadata=lambda: {
                 "coins": coins,
                 "amount": amount,
                 "result": result,
@@ -28,6 +28,17 @@ class EditDistance(StepTracker):
     """Edit Distance (Levenshtein) solver with DP grid visualization."""
 
     visualizer_type = VisualizerType.GRID
+    registrations = {
+        "edit_distance": {
+            "name": "Edit Distance (Levenshtein)",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {
+                "steps": "len(word1) * len(word2)",
+                "state_bytes": "4 * len(word1) * len(word2)",
+            },
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -55,11 +66,11 @@ class EditDistance(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f'Building ({m + 1})×({n + 1}) DP table to transform "{word1}" into "{word2}"'
+                lambda: f'Building ({m + 1})×({n + 1}) DP table to transform "{word1}" into "{word2}"'
             ),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "word1": word1,
                 "word2": word2,
                 "m": m,
@@ -77,12 +88,12 @@ class EditDistance(StepTracker):
         yield self.emit_step(
             operation="base_case",
             description=("Base cases: dp[i][0]=i (delete i chars), dp[0][j]=j (insert j chars)"),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
-            highlights=[
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+            highlights=lambda: [
                 *[{"type": "cell", "row": i, "col": 0, "color": "visited"} for i in range(m + 1)],
                 *[{"type": "cell", "row": 0, "col": j, "color": "visited"} for j in range(n + 1)],
             ],
-            metadata={
+            metadata=lambda: {
                 "word1": word1,
                 "word2": word2,
                 "m": m,
@@ -105,15 +116,15 @@ class EditDistance(StepTracker):
                     yield self.emit_step(
                         operation="match",
                         description=(
-                            f"word1[{i - 1}]='{char1}' == word2[{j - 1}]='{char2}': "
+                            lambda: f"word1[{i - 1}]='{char1}' == word2[{j - 1}]='{char2}': "
                             f"free diagonal, dp[{i}][{j}]=dp[{i - 1}][{j - 1}]={dp[i][j]}"
                         ),
-                        state={"type": "grid", "grid": [row[:] for row in dp]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": i - 1, "col": j - 1, "color": "sorted"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "word1": word1,
                             "word2": word2,
                             "i": i,
@@ -148,19 +159,19 @@ class EditDistance(StepTracker):
                     yield self.emit_step(
                         operation="edit",
                         description=(
-                            f"word1[{i - 1}]='{char1}' != word2[{j - 1}]='{char2}': "
+                            lambda: f"word1[{i - 1}]='{char1}' != word2[{j - 1}]='{char2}': "
                             f"{won} (insert={insert}, delete={delete}, replace={replace}) "
                             f"→ dp[{i}][{j}]=1+{best}={dp[i][j]}"
                         ),
-                        state={"type": "grid", "grid": [row[:] for row in dp]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": won_row, "col": won_col, "color": "comparing"},
                             {"type": "cell", "row": i, "col": j - 1, "color": "visited"},
                             {"type": "cell", "row": i - 1, "col": j, "color": "visited"},
                             {"type": "cell", "row": i - 1, "col": j - 1, "color": "visited"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "word1": word1,
                             "word2": word2,
                             "i": i,
@@ -181,12 +192,12 @@ class EditDistance(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f'Edit distance between "{word1}" and "{word2}" is {distance} '
+                lambda: f'Edit distance between "{word1}" and "{word2}" is {distance} '
                 f"(bottom-right cell dp[{m}][{n}])"
             ),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
-            highlights=[{"type": "cell", "row": m, "col": n, "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+            highlights=lambda: [{"type": "cell", "row": m, "col": n, "color": "sorted"}],
+            metadata=lambda: {
                 "word1": word1,
                 "word2": word2,
                 "m": m,
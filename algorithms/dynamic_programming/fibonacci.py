@@ -25,6 +25,24 @@ class Fibonacci(StepTracker):
     """Fibonacci with memoization visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "fibonacci_memo": {
+            "name": "Fibonacci (Memoization)",
+            "category": "dynamic_programming",
+            "entry": "compute_memoization",
+            "input": {"n": 10},
+            "shorthand": "n",
+            "cost": {"steps": "3 * abs(n)", "state_bytes": "5 * abs(n)"},
+        },
+        "fibonacci_tab": {
+            "name": "Fibonacci (Tabulation)",
+            "category": "dynamic_programming",
+            "entry": "compute_tabulation",
+            "input": {"n": 10},
+            "shorthand": "n",
+            "cost": {"steps": "abs(n) + 1", "state_bytes": "10 * abs(n)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -46,10 +64,10 @@ class Fibonacci(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Computing Fibonacci({n}) using memoization",
-            state={"type": "array", "values": list(range(n + 1))},
+            description=lambda: f"Computing Fibonacci({n}) using memoization",
+            state=lambda: {"type": "array", "values": list(range(n + 1))},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "n": n,
                 "calls": self.calls,
                 "memo_size": len(self.memo),
@@ -61,10 +79,10 @@ class Fibonacci(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Fibonacci({n}) = {result}",
-            state={"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
-            highlights=[{"indices": [n], "color": "sorted"}],
-            metadata={
+            description=lambda: f"Fibonacci({n}) = {result}",
+            state=lambda: {"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
+            highlights=lambda: [{"indices": [n], "color": "sorted"}],
+            metadata=lambda: {
                 "n": n,
                 "result": result,
                 "calls": self.calls,
@@ -79,10 +97,10 @@ class Fibonacci(StepTracker):
         if n in self.memo:
             yield self.emit_step(
                 operation="memo_hit",
-                description=f"Memo hit: F({n}) = {self.memo[n]}",
-                state={"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
-                highlights=[{"indices": [n], "color": "sorted"}],
-                metadata={
+                description=lambda: f"Memo hit: F({n}) = {self.memo[n]}",
+                state=lambda: {"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
+                highlights=lambda: [{"indices": [n], "color": "sorted"}],
+                metadata=lambda: {
                     "n": n,
                     "calls": self.calls,
                     "memo_size": len(self.memo),
@@ -95,10 +113,10 @@ class Fibonacci(StepTracker):
             self.memo[n] = n
             yield self.emit_step(
                 operation="base_case",
-                description=f"Base case: F({n}) = {n}",
-                state={"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
-                highlights=[{"indices": [n], "color": "active"}],
-                metadata={
+                description=lambda: f"Base case: F({n}) = {n}",
+                state=lambda: {"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
+                highlights=lambda: [{"indices": [n], "color": "active"}],
+                metadata=lambda: {
                     "n": n,
                     "calls": self.calls,
                     "memo_size": len(self.memo),
@@ -108,10 +126,10 @@ class Fibonacci(StepTracker):
 
         yield self.emit_step(
             operation="compute",
-            description=f"Computing F({n}) = F({n-1}) + F({n-2})",
-            state={"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
-            highlights=[{"indices": [n], "color": "comparing"}],
-            metadata={
+            description=lambda: f"Computing F({n}) = F({n-1}) + F({n-2})",
+            state=lambda: {"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
+            highlights=lambda: [{"indices": [n], "color": "comparing"}],
+            metadata=lambda: {
                 "n": n,
                 "calls": self.calls,
                 "memo_size": len(self.memo),
@@ -125,10 +143,10 @@ class Fibonacci(StepTracker):
 
         yield self.emit_step(
             operation="memoize",
-            description=f"Memoized: F({n}) = {self.memo[n]}",
-            state={"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
-            highlights=[{"indices": [n], "color": "sorted"}],
-            metadata={
+            description=lambda: f"Memoized: F({n}) = {self.memo[n]}",
+            state=lambda: {"type": "array", "values": [self.memo.get(i, 0) for i in range(n + 1)]},
+            highlights=lambda: [{"indices": [n], "color": "sorted"}],
+            metadata=lambda: {
                 "n": n,
                 "calls": self.calls,
                 "memo_size": len(self.memo),
@@ -152,10 +170,10 @@ class Fibonacci(StepTracker):
         if n <= 1:
             yield self.emit_step(
                 operation="base_case",
-                description=f"Base case: F({n}) = {n}",
-                state={"type": "array", "values": [n]},
-                highlights=[{"indices": [0], "color": "sorted"}],
-                metadata={"n": n, "result": n},
+                description=lambda: f"Base case: F({n}) = {n}",
+                state=lambda: {"type": "array", "values": [n]},
+                highlights=lambda: [{"indices": [0], "color": "sorted"}],
+                metadata=lambda: {"n": n, "result": n},
             )
             return
 
@@ -166,12 +184,12 @@ class Fibonacci(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Initialize: F(0)=0, F(1)=1",
-            state={"type": "array", "values": dp.copy()},
-            highlights=[
+            description=lambda: f"Initialize: F(0)=0, F(1)=1",
+            state=lambda: {"type": "array", "values": dp.copy()},
+            highlights=lambda: [
                 {"indices": [0, 1], "color": "sorted"},
             ],
-            metadata={"n": n, "computed": 2},
+            metadata=lambda: {"n": n, "computed": 2},
         )
 
         # Build up from bottom
@@ -180,14 +198,14 @@ class Fibonacci(StepTracker):
 
             yield self.emit_step(
                 operation="compute",
-                description=f"F({i}) = F({i-1}) + F({i-2}) = {dp[i-1]} + {dp[i-2]} = {dp[i]}",
-                state={"type": "array", "values": dp.copy()},
-                highlights=[
+                description=lambda: f"F({i}) = F({i-1}) + F({i-2}) = {dp[i-1]} + {dp[i-2]} = {dp[i]}",
+                state=lambda: {"type": "array", "values": dp.copy()},
+                highlights=lambda: [
                     {"indices": [i], "color": "active"},
                     {"indices": [i - 1, i - 2], "color": "comparing"},
                     {"indices": list(range(i)), "color": "sorted"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "n": n,
                     "i": i,
                     "computed": i + 1,
@@ -196,10 +214,10 @@ class Fibonacci(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Fibonacci({n}) = {dp[n]}",
-            state={"type": "array", "values": dp.copy()},
-            highlights=[{"indices": [n], "color": "sorted"}],
-            metadata={
+            description=lambda: f"Fibonacci({n}) = {dp[n]}",
+            state=lambda: {"type": "array", "values": dp.copy()},
+            highlights=lambda: [{"indices": [n], "color": "sorted"}],
+            metadata=lambda: {
                 "n": n,
                 "result": dp[n],
                 "computed": n + 1,
@@ -45,6 +45,14 @@ class HouseRobber(StepTracker):
     """House Robber DP implementation with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "house_robber": {
+            "name": "House Robber",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "10 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -66,10 +74,10 @@ class HouseRobber(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Planning a heist on {n} house(s): {nums}. Goal: maximize loot without robbing two adjacent houses.",
-            state={"type": "array", "values": nums.copy()},
-            highlights=[{"indices": list(range(n)), "color": "default"}],
-            metadata={"nums": nums.copy(), "choices": self.choices, "n": n},
+            description=lambda: f"Planning a heist on {n} house(s): {nums}. Goal: maximize loot without robbing two adjacent houses.",
+            state=lambda: {"type": "array", "values": nums.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "default"}],
+            metadata=lambda: {"nums": nums.copy(), "choices": self.choices, "n": n},
         )
 
         # Edge case: no houses
@@ -77,9 +85,9 @@ class HouseRobber(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="No houses to rob. Maximum loot is 0.",
-                state={"type": "array", "values": []},
+                state=lambda: {"type": "array", "values": []},
                 highlights=[],
-                metadata={"nums": [], "choices": self.choices, "result": 0, "n": 0},
+                metadata=lambda: {"nums": [], "choices": self.choices, "result": 0, "n": 0},
             )
             return
 
@@ -89,10 +97,10 @@ class HouseRobber(StepTracker):
         dp[0] = nums[0]
         yield self.emit_step(
             operation="base_case",
-            description=f"Base case: only house 0 available, so dp[0] = nums[0] = {nums[0]}.",
-            state={"type": "array", "values": dp.copy()},
-            highlights=[{"indices": [0], "color": "swapped"}],
-            metadata={
+            description=lambda: f"Base case: only house 0 available, so dp[0] = nums[0] = {nums[0]}.",
+            state=lambda: {"type": "array", "values": dp.copy()},
+            highlights=lambda: [{"indices": [0], "color": "swapped"}],
+            metadata=lambda: {
                 "nums": nums.copy(),
                 "choices": self.choices,
                 "current_index": 0,
@@ -104,10 +112,10 @@ class HouseRobber(StepTracker):
         if n == 1:
             yield self.emit_step(
                 operation="complete",
-                description=f"Only one house. Maximum loot is dp[0] = {dp[0]}.",
-                state={"type": "array", "values": dp.copy()},
-                highlights=[{"indices": [0], "color": "sorted"}],
-                metadata={
+                description=lambda: f"Only one house. Maximum loot is dp[0] = {dp[0]}.",
+                state=lambda: {"type": "array", "values": dp.copy()},
+                highlights=lambda: [{"indices": [0], "color": "sorted"}],
+                metadata=lambda: {
                     "nums": nums.copy(),
                     "choices": self.choices,
                     "result": dp[-1],
@@ -125,15 +133,15 @@ class HouseRobber(StepTracker):
         yield self.emit_step(
             operation="base_case",
             description=(
-                f"Base case: dp[1] = max(nums[0], nums[1]) = max({rob_first}, {rob_second}) = {dp[1]} "
+                lambda: f"Base case: dp[1] = max(nums[0], nums[1]) = max({rob_first}, {rob_second}) = {dp[1]} "
                 f"(rob {winner})."
             ),
-            state={"type": "array", "values": dp.copy()},
-            highlights=[
+            state=lambda: {"type": "array", "values": dp.copy()},
+            highlights=lambda: [
                 {"indices": [0, 1], "color": "comparing"},
                 {"indices": [1], "color": "swapped"},
             ],
-            metadata={
+            metadata=lambda: {
                 "nums": nums.copy(),
                 "choices": self.choices,
                 "current_index": 1,
@@ -150,16 +158,16 @@ class HouseRobber(StepTracker):
             yield self.emit_step(
                 operation="compare",
                 description=(
-                    f"House {i}: choose the better of "
+                    lambda: f"House {i}: choose the better of "
                     f"SKIP = dp[{i - 1}] = {skip}  vs  "
                     f"ROB = dp[{i - 2}] + nums[{i}] = {dp[i - 2]} + {nums[i]} = {rob}."
                 ),
-                state={"type": "array", "values": dp.copy()},
-                highlights=[
+                state=lambda: {"type": "array", "values": dp.copy()},
+                highlights=lambda: [
                     {"indices": [i - 1], "color": "comparing"},
                     {"indices": [i - 2], "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "nums": nums.copy(),
                     "choices": self.choices,
                     "current_index": i,
@@ -175,9 +183,9 @@ class HouseRobber(StepTracker):
 
             yield self.emit_step(
                 operation="decide",
-                description=(f"dp[{i}] = max({skip}, {rob}) = {dp[i]}. Best move: {decision}."),
-                state={"type": "array", "values": dp.copy()},
-                highlights=[
+                description=(lambda: f"dp[{i}] = max({skip}, {rob}) = {dp[i]}. Best move: {decision}."),
+                state=lambda: {"type": "array", "values": dp.copy()},
+                highlights=lambda: [
                     {"indices": [i], "color": "swapped"},
                     (
                         {"indices": [i - 2], "color": "active"}
@@ -185,7 +193,7 @@ class HouseRobber(StepTracker):
                         else {"indices": [i - 1], "color": "comparing"}
                     ),
                 ],
-                metadata={
+                metadata=lambda: {
                     "nums": nums.copy(),
                     "choices": self.choices,
                     "current_index": i,
@@ -197,14 +205,14 @@ class HouseRobber(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done! Maximum loot = dp[{n - 1}] = {dp[-1]} (evaluated {self.choices} choices)."
+                lambda: f"Done! Maximum loot = dp[{n - 1}] = {dp[-1]} (evaluated {self.choices} choices)."
             ),
-            state={"type": "array", "values": dp.copy()},
-            highlights=[
+            state=lambda: {"type": "array", "values": dp.copy()},
+            highlights=lambda: [
                 {"indices": list(range(n)), "color": "sorted"},
                 {"indices": [n - 1], "color": "swapped"},
             ],
-            metadata={
+            metadata=lambda: {
                 "nums": nums.copy(),
                 "choices": self.choices,
                 "result": dp[-1],
@@ -35,6 +35,14 @@ class Kadane(StepTracker):
     """Kadane's maximum-subarray algorithm with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "kadane": {
+            "name": "Kadane's Maximum Subarray",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "7 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -67,9 +75,9 @@ class Kadane(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty array - no subarray exists.",
-                state={"type": "array", "values": []},
+                state=lambda: {"type": "array", "values": []},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "current_sum": 0,
                     "best_sum": 0,
                     "best_start": -1,
@@ -90,14 +98,14 @@ class Kadane(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Start Kadane's on {n} elements. current_sum = best_sum = nums[0] = {nums[0]}."
+                lambda: f"Start Kadane's on {n} elements. current_sum = best_sum = nums[0] = {nums[0]}."
             ),
-            state={"type": "array", "values": nums},
-            highlights=[
+            state=lambda: {"type": "array", "values": nums},
+            highlights=lambda: [
                 {"indices": [0], "color": "active"},
                 {"indices": [0], "color": "sorted"},
             ],
-            metadata={
+            metadata=lambda: {
                 "current_sum": current_sum,
                 "best_sum": best_sum,
                 "best_start": best_start,
@@ -120,13 +128,13 @@ class Kadane(StepTracker):
                 yield self.emit_step(
                     operation="reset",
                     description=(
-                        f"i={i}: running sum went negative "
+                        lambda: f"i={i}: running sum went negative "
                         f"({prev_sum} + {nums[i]} < {nums[i]}), "
                         f"reset window to start at index {i}. current_sum = {current_sum}."
                     ),
-                    state={"type": "array", "values": nums},
-                    highlights=self._build_highlights(i, start, best_start, best_end),
-                    metadata={
+                    state=lambda: {"type": "array", "values": nums},
+                    highlights=lambda: self._build_highlights(i, start, best_start, best_end),
+                    metadata=lambda: {
                         "current_sum": current_sum,
                         "best_sum": best_sum,
                         "best_start": best_start,
@@ -141,12 +149,12 @@ class Kadane(StepTracker):
                 yield self.emit_step(
                     operation="extend",
                     description=(
-                        f"i={i}: extend window with {nums[i]}. "
+                        lambda: f"i={i}: extend window with {nums[i]}. "
                         f"current_sum = {current_sum} (window [{start}..{i}])."
                     ),
-                    state={"type": "array", "values": nums},
-                    highlights=self._build_highlights(i, start, best_start, best_end),
-                    metadata={
+                    state=lambda: {"type": "array", "values": nums},
+                    highlights=lambda: self._build_highlights(i, start, best_start, best_end),
+                    metadata=lambda: {
                         "current_sum": current_sum,
                         "best_sum": best_sum,
                         "best_start": best_start,
@@ -164,11 +172,11 @@ class Kadane(StepTracker):
                 yield self.emit_step(
                     operation="new_best",
                     description=(
-                        f"New best! best_sum = {best_sum} for subarray [{best_start}..{best_end}]."
+                        lambda: f"New best! best_sum = {best_sum} for subarray [{best_start}..{best_end}]."
                     ),
-                    state={"type": "array", "values": nums},
-                    highlights=self._build_highlights(i, start, best_start, best_end),
-                    metadata={
+                    state=lambda: {"type": "array", "values": nums},
+                    highlights=lambda: self._build_highlights(i, start, best_start, best_end),
+                    metadata=lambda: {
                         "current_sum": current_sum,
                         "best_sum": best_sum,
                         "best_start": best_start,
@@ -183,17 +191,17 @@ class Kadane(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done! Maximum subarray sum is {best_sum} "
+                lambda: f"Done! Maximum subarray sum is {best_sum} "
                 f"from indices [{best_start}..{best_end}] = {best_subarray}."
             ),
-            state={"type": "array", "values": nums},
-            highlights=[
+            state=lambda: {"type": "array", "values": nums},
+            highlights=lambda: [
                 {
                     "indices": list(range(best_start, best_end + 1)),
                     "color": "swapped",
                 }
             ],
-            metadata={
+            metadata=lambda: {
                 "current_sum": current_sum,
                 "best_sum": best_sum,
                 "best_start": best_start,
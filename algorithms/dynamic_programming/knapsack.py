@@ -18,6 +18,18 @@ class Knapsack(StepTracker):
     """0/1 Knapsack problem solver with DP table visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "knapsack": {
+            "name": "0/1 Knapsack",
+            "category": "dynamic_programming",
+            "entry": "solve",
+            "input": {"items": [], "capacity": 10},
+            "cost": {
+                "steps": "len(items) * abs(capacity)",
+                "state_bytes": "10 * len(items)",
+            },
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -44,10 +56,10 @@ class Knapsack(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Solving knapsack: {n} items, capacity {capacity}",
-            state={"type": "array", "values": [0] * (capacity + 1)},
+            description=lambda: f"Solving knapsack: {n} items, capacity {capacity}",
+            state=lambda: {"type": "array", "values": [0] * (capacity + 1)},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "n": n,
                 "capacity": capacity,
                 "items": items,
@@ -66,10 +78,10 @@ class Knapsack(StepTracker):
 
                     yield self.emit_step(
                         operation="skip",
-                        description=f"Item {i} (w={weight}, v={value}) too heavy for capacity {w}",
-                        state={"type": "array", "values": dp[i].copy()},
-                        highlights=[{"indices": [w], "color": "visited"}],
-                        metadata={
+                        description=lambda: f"Item {i} (w={weight}, v={value}) too heavy for capacity {w}",
+                        state=lambda: {"type": "array", "values": dp[i].copy()},
+                        highlights=lambda: [{"indices": [w], "color": "visited"}],
+                        metadata=lambda: {
                             "item": i,
                             "weight": weight,
                             "value": value,
@@ -88,13 +100,13 @@ class Knapsack(StepTracker):
 
                     yield self.emit_step(
                         operation="decide",
-                        description=f"Item {i} (w={weight}, v={value}): {decision} (take={take}, skip={skip})",
-                        state={"type": "array", "values": dp[i].copy()},
-                        highlights=[
+                        description=lambda: f"Item {i} (w={weight}, v={value}): {decision} (take={take}, skip={skip})",
+                        state=lambda: {"type": "array", "values": dp[i].copy()},
+                        highlights=lambda: [
                             {"indices": [w], "color": "active"},
                             {"indices": list(range(w)), "color": "sorted"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "item": i,
                             "weight": weight,
                             "value": value,
@@ -122,10 +134,10 @@ class Knapsack(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Optimal value: {total_value} (items: {selected})",
-            state={"type": "array", "values": dp[n].copy()},
-            highlights=[{"indices": [capacity], "color": "sorted"}],
-            metadata={
+            description=lambda: f"Optimal value: {total_value} (items: {selected})",
+            state=lambda: {"type": "array", "values": dp[n].copy()},
+            highlights=lambda: [{"indices": [capacity], "color": "sorted"}],
+            metadata=lambda: {
                 "max_value": total_value,
                 "selected_items": selected,
                 "total_weight": total_weight,
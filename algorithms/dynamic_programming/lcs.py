@@ -20,6 +20,18 @@ class LCS(StepTracker):
     """Longest Common Subsequence with DP table visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "lcs": {
+            "name": "Longest Common Subsequence",
+            "category": "dynamic_programming",
+            "entry": "compute",
+            "input": {"str1": "", "str2": ""},
+            "cost": {
+                "steps": "len(str1) * len(str2)",
+                "state_bytes": "5 * (len(str1) + len(str2))",
+            },
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -44,10 +56,10 @@ class LCS(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Finding LCS of '{str1}' and '{str2}'",
-            state={"type": "array", "values": [0] * (n + 1)},
+            description=lambda: f"Finding LCS of '{str1}' and '{str2}'",
+            state=lambda: {"type": "array", "values": [0] * (n + 1)},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "str1": str1,
                 "str2": str2,
                 "m": m,
@@ -67,13 +79,13 @@ class LCS(StepTracker):
 
                     yield self.emit_step(
                         operation="match",
-                        description=f"Match: '{str1[i-1]}' == '{str2[j-1]}' → LCS length {dp[i][j]}",
-                        state={"type": "array", "values": dp[i].copy()},
-                        highlights=[
+                        description=lambda: f"Match: '{str1[i-1]}' == '{str2[j-1]}' → LCS length {dp[i][j]}",
+                        state=lambda: {"type": "array", "values": dp[i].copy()},
+                        highlights=lambda: [
                             {"indices": [j], "color": "active"},
                             {"indices": list(range(j)), "color": "sorted"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "str1": str1,
                             "str2": str2,
                             "i": i,
@@ -90,13 +102,13 @@ class LCS(StepTracker):
 
                     yield self.emit_step(
                         operation="no_match",
-                        description=f"No match: '{str1[i-1]}' != '{str2[j-1]}' → max({dp[i-1][j]}, {dp[i][j-1]}) = {dp[i][j]}",
-                        state={"type": "array", "values": dp[i].copy()},
-                        highlights=[
+                        description=lambda: f"No match: '{str1[i-1]}' != '{str2[j-1]}' → max({dp[i-1][j]}, {dp[i][j-1]}) = {dp[i][j]}",
+                        state=lambda: {"type": "array", "values": dp[i].copy()},
+                        highlights=lambda: [
                             {"indices": [j], "color": "comparing"},
                             {"indices": list(range(j)), "color": "visited"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "str1": str1,
                             "str2": str2,
                             "i": i,
@@ -126,10 +138,10 @@ class LCS(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"LCS: '{lcs_string}' (length: {dp[m][n]})",
-            state={"type": "array", "values": dp[m].copy()},
-            highlights=[{"indices": [n], "color": "sorted"}],
-            metadata={
+            description=lambda: f"LCS: '{lcs_string}' (length: {dp[m][n]})",
+            state=lambda: {"type": "array", "values": dp[m].copy()},
+            highlights=lambda: [{"indices": [n], "color": "sorted"}],
+            metadata=lambda: {
                 "str1": str1,
                 "str2": str2,
                 "lcs": lcs_string,
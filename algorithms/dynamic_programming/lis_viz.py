@@ -38,6 +38,14 @@ class LongestIncreasingSubsequence(StepTracker):
     """Longest Increasing Subsequence with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "lis": {
+            "name": "Longest Increasing Subsequence",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "len(input) ** 2 / 2 + len(input)", "state_bytes": "11 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -72,9 +80,9 @@ class LongestIncreasingSubsequence(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty array - the longest increasing subsequence has length 0.",
-                state={"type": "array", "values": []},
+                state=lambda: {"type": "array", "values": []},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "nums": [],
                     "dp": [],
                     "lis_length": 0,
@@ -92,12 +100,12 @@ class LongestIncreasingSubsequence(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Initialize dp = [1] * {n}. Every element is an increasing "
+                lambda: f"Initialize dp = [1] * {n}. Every element is an increasing "
                 f"subsequence of length 1 on its own."
             ),
-            state={"type": "array", "values": dp.copy()},
-            highlights=[{"indices": list(range(n)), "color": "comparing"}],
-            metadata={
+            state=lambda: {"type": "array", "values": dp.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "comparing"}],
+            metadata=lambda: {
                 "nums": nums.copy(),
                 "dp": dp.copy(),
                 "lis_length": 1,
@@ -120,13 +128,13 @@ class LongestIncreasingSubsequence(StepTracker):
                     yield self.emit_step(
                         operation="update",
                         description=(
-                            f"i={i} (nums[i]={nums[i]}), j={j} (nums[j]={nums[j]}): "
+                            lambda: f"i={i} (nums[i]={nums[i]}), j={j} (nums[j]={nums[j]}): "
                             f"{nums[j]} < {nums[i]} and dp[{j}]+1 = {dp[j] + 1} > dp[{i}]. "
                             f"Extend it -> dp[{i}] = {dp[i]}."
                         ),
-                        state={"type": "array", "values": dp.copy()},
-                        highlights=self._build_highlights(i, j, extends),
-                        metadata={
+                        state=lambda: {"type": "array", "values": dp.copy()},
+                        highlights=lambda: self._build_highlights(i, j, extends),
+                        metadata=lambda: {
                             "nums": nums.copy(),
                             "dp": dp.copy(),
                             "i": i,
@@ -150,12 +158,12 @@ class LongestIncreasingSubsequence(StepTracker):
                     yield self.emit_step(
                         operation="compare",
                         description=(
-                            f"i={i} (nums[i]={nums[i]}), j={j} (nums[j]={nums[j]}): "
+                            lambda: f"i={i} (nums[i]={nums[i]}), j={j} (nums[j]={nums[j]}): "
                             f"{reason}. Keep dp[{i}] = {dp[i]}."
                         ),
-                        state={"type": "array", "values": dp.copy()},
-                        highlights=self._build_highlights(i, j, extends),
-                        metadata={
+                        state=lambda: {"type": "array", "values": dp.copy()},
+                        highlights=lambda: self._build_highlights(i, j, extends),
+                        metadata=lambda: {
                             "nums": nums.copy(),
                             "dp": dp.copy(),
                             "i": i,
@@ -184,12 +192,12 @@ class LongestIncreasingSubsequence(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done! The longest increasing subsequence has length {lis_length}: "
+                lambda: f"Done! The longest increasing subsequence has length {lis_length}: "
                 f"{lis_values} (at indices {seq_indices})."
             ),
-            state={"type": "array", "values": dp.copy()},
-            highlights=[{"indices": seq_indices, "color": "swapped"}],
-            metadata={
+            state=lambda: {"type": "array", "values": dp.copy()},
+            highlights=lambda: [{"indices": seq_indices, "color": "swapped"}],
+            metadata=lambda: {
                 "nums": nums.copy(),
                 "dp": dp.copy(),
                 "lis_length": lis_length,
@@ -27,6 +27,14 @@ class LongestPalindromicSubsequence(StepTracker):
     """Longest Palindromic Subsequence solver with DP grid visualization."""
 
     visualizer_type = VisualizerType.GRID
+    registrations = {
+        "longest_palindromic_subsequence": {
+            "name": "Longest Palindromic Subsequence",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "len(s) ** 2", "state_bytes": "4 * len(s) ** 2"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -57,13 +65,13 @@ class LongestPalindromicSubsequence(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f'Building {n}×{n} DP table for the longest palindromic subsequence of "{s}"'
+                lambda: f'Building {n}×{n} DP table for the longest palindromic subsequence of "{s}"'
                 if n
                 else "Empty string: the longest palindromic subsequence has length 0"
             ),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "s": s,
                 "n": n,
                 "comparisons": self.comparisons,
@@ -74,9 +82,9 @@ class LongestPalindromicSubsequence(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Longest palindromic subsequence length is 0 (empty string)",
-                state={"type": "grid", "grid": [row[:] for row in dp]},
+                state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
                 highlights=[],
-                metadata={"s": s, "n": n, "lps_length": 0, "comparisons": self.comparisons},
+                metadata=lambda: {"s": s, "n": n, "lps_length": 0, "comparisons": self.comparisons},
             )
             return
 
@@ -87,9 +95,9 @@ class LongestPalindromicSubsequence(StepTracker):
         yield self.emit_step(
             operation="base_case",
             description="Base case: dp[i][i] = 1 — each single character is a palindrome of length 1",
-            state={"type": "grid", "grid": [row[:] for row in dp]},
-            highlights=[{"type": "cell", "row": i, "col": i, "color": "visited"} for i in range(n)],
-            metadata={
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+            highlights=lambda: [{"type": "cell", "row": i, "col": i, "color": "visited"} for i in range(n)],
+            metadata=lambda: {
                 "s": s,
                 "n": n,
                 "comparisons": self.comparisons,
@@ -111,15 +119,15 @@ class LongestPalindromicSubsequence(StepTracker):
                     yield self.emit_step(
                         operation="match",
                         description=(
-                            f"s[{i}]='{char_i}' == s[{j}]='{char_j}': wrap the inner palindrome, "
+                            lambda: f"s[{i}]='{char_i}' == s[{j}]='{char_j}': wrap the inner palindrome, "
                             f"dp[{i}][{j}]=2+dp[{i + 1}][{j - 1}]=2+{inner}={dp[i][j]}"
                         ),
-                        state={"type": "grid", "grid": [row[:] for row in dp]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": i + 1, "col": j - 1, "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "s": s,
                             "i": i,
                             "j": j,
@@ -145,18 +153,18 @@ class LongestPalindromicSubsequence(StepTracker):
                     yield self.emit_step(
                         operation="mismatch",
                         description=(
-                            f"s[{i}]='{char_i}' != s[{j}]='{char_j}': drop one end, "
+                            lambda: f"s[{i}]='{char_i}' != s[{j}]='{char_j}': drop one end, "
                             f"dp[{i}][{j}]=max(dp[{i + 1}][{j}]={skip_left}, "
                             f"dp[{i}][{j - 1}]={skip_right})={dp[i][j]}"
                         ),
-                        state={"type": "grid", "grid": [row[:] for row in dp]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": won_row, "col": won_col, "color": "comparing"},
                             {"type": "cell", "row": i + 1, "col": j, "color": "visited"},
                             {"type": "cell", "row": i, "col": j - 1, "color": "visited"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "s": s,
                             "i": i,
                             "j": j,
@@ -175,12 +183,12 @@ class LongestPalindromicSubsequence(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f'Longest palindromic subsequence of "{s}" has length {length} '
+                lambda: f'Longest palindromic subsequence of "{s}" has length {length} '
                 f"(top-right cell dp[0][{n - 1}])"
             ),
-            state={"type": "grid", "grid": [row[:] for row in dp]},
-            highlights=[{"type": "cell", "row": 0, "col": n - 1, "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "grid", "grid": [row[:] for row in dp]},
+            highlights=lambda: [{"type": "cell", "row": 0, "col": n - 1, "color": "sorted"}],
+            metadata=lambda: {
                 "s": s,
                 "n": n,
                 "lps_length": length,
@@ -39,6 +39,14 @@ class MaxProductSubarray(StepTracker):
     """Maximum product subarray with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "max_product_subarray": {
+            "name": "Maximum Product Subarray",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "4 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -71,9 +79,9 @@ class MaxProductSubarray(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty array - no subarray exists.",
-                state={"type": "array", "values": []},
+                state=lambda: {"type": "array", "values": []},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "cur_max": 0,
                     "cur_min": 0,
                     "best": 0,
@@ -97,16 +105,16 @@ class MaxProductSubarray(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Start on {n} elements. cur_max = cur_min = best = nums[0] = {nums[0]}. "
+                lambda: f"Start on {n} elements. cur_max = cur_min = best = nums[0] = {nums[0]}. "
                 "We track BOTH the max and min product ending here because a "
                 "future negative can flip the min into the new max."
             ),
-            state={"type": "array", "values": nums},
-            highlights=[
+            state=lambda: {"type": "array", "values": nums},
+            highlights=lambda: [
                 {"indices": [0], "color": "active"},
                 {"indices": [0], "color": "sorted"},
             ],
-            metadata={
+            metadata=lambda: {
                 "cur_max": cur_max,
                 "cur_min": cur_min,
                 "best": best,
@@ -129,13 +137,13 @@ class MaxProductSubarray(StepTracker):
                 yield self.emit_step(
                     operation="sign_flip",
                     description=(
-                        f"i={i}: nums[i] = {x} is negative. Multiplying flips signs, "
+                        lambda: f"i={i}: nums[i] = {x} is negative. Multiplying flips signs, "
                         f"so the old cur_min ({cur_min}) is the candidate for the new "
                         f"cur_max. This is why we must track the min."
                     ),
-                    state={"type": "array", "values": nums},
-                    highlights=self._build_highlights(i, start, best_start, best_end),
-                    metadata={
+                    state=lambda: {"type": "array", "values": nums},
+                    highlights=lambda: self._build_highlights(i, start, best_start, best_end),
+                    metadata=lambda: {
                         "cur_max": cur_max,
                         "cur_min": cur_min,
                         "best": best,
@@ -167,12 +175,12 @@ class MaxProductSubarray(StepTracker):
                 yield self.emit_step(
                     operation="reset",
                     description=(
-                        f"i={i}: nums[i] = 0 resets both products to 0. Any subarray "
+                        lambda: f"i={i}: nums[i] = 0 resets both products to 0. Any subarray "
                         f"crossing this zero has product 0, so the window restarts."
                     ),
-                    state={"type": "array", "values": nums},
-                    highlights=self._build_highlights(i, start, best_start, best_end),
-                    metadata={
+                    state=lambda: {"type": "array", "values": nums},
+                    highlights=lambda: self._build_highlights(i, start, best_start, best_end),
+                    metadata=lambda: {
                         "cur_max": cur_max,
                         "cur_min": cur_min,
                         "best": best,
@@ -186,12 +194,12 @@ class MaxProductSubarray(StepTracker):
                 yield self.emit_step(
                     operation="extend",
                     description=(
-                        f"i={i}: cur_max = max({x}, {cand_extend_max}, {cand_extend_min}) "
+                        lambda: f"i={i}: cur_max = max({x}, {cand_extend_max}, {cand_extend_min}) "
                         f"= {cur_max}; cur_min = {cur_min}. Window [{start}..{i}]."
                     ),
-                    state={"type": "array", "values": nums},
-                    highlights=self._build_highlights(i, start, best_start, best_end),
-                    metadata={
+                    state=lambda: {"type": "array", "values": nums},
+                    highlights=lambda: self._build_highlights(i, start, best_start, best_end),
+                    metadata=lambda: {
                         "cur_max": cur_max,
                         "cur_min": cur_min,
                         "best": best,
@@ -210,11 +218,11 @@ class MaxProductSubarray(StepTracker):
                 yield self.emit_step(
                     operation="new_best",
                     description=(
-                        f"New best! best = {best} for subarray [{best_start}..{best_end}]."
+                        lambda: f"New best! best = {best} for subarray [{best_start}..{best_end}]."
                     ),
-                    state={"type": "array", "values": nums},
-                    highlights=self._build_highlights(i, start, best_start, best_end),
-                    metadata={
+                    state=lambda: {"type": "array", "values": nums},
+                    highlights=lambda: self._build_highlights(i, start, best_start, best_end),
+                    metadata=lambda: {
                         "cur_max": cur_max,
                         "cur_min": cur_min,
                         "best": best,
@@ -230,17 +238,17 @@ class MaxProductSubarray(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done! Maximum product is {best} from indices "
+                lambda: f"Done! Maximum product is {best} from indices "
                 f"[{best_start}..{best_end}] = {best_subarray}."
             ),
-            state={"type": "array", "values": nums},
-            highlights=[
+            state=lambda: {"type": "array", "values": nums},
+            highlights=lambda: [
                 {
                     "indices": list(range(best_start, best_end + 1)),
                     "color": "swapped",
                 }
             ],
-            metadata={
+            metadata=lambda: {
                 "cur_max": cur_max,
                 "cur_min": cur_min,
                 "best": best,
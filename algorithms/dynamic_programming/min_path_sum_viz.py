@@ -27,6 +27,14 @@ class MinPathSum(StepTracker):
     """Minimum Path Sum solver with DP grid visualization."""
 
     visualizer_type = VisualizerType.GRID
+    registrations = {
+        "min_path_sum": {
+            "name": "Minimum Path Sum",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "cells(grid)", "state_bytes": "4 * cells(grid)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -53,9 +61,9 @@ class MinPathSum(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty grid: minimum path sum is 0 (no cells to traverse)",
-                state={"type": "grid", "grid": []},
+                state=lambda: {"type": "grid", "grid": []},
                 highlights=[],
-                metadata={"m": m, "n": n, "min_path_sum": 0, "cells_filled": 0},
+                metadata=lambda: {"m": m, "n": n, "min_path_sum": 0, "cells_filled": 0},
             )
             return
 
@@ -65,12 +73,12 @@ class MinPathSum(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Building {m}×{n} cost table. cost[i][j] = minimum sum to reach cell (i, j) "
+                lambda: f"Building {m}×{n} cost table. cost[i][j] = minimum sum to reach cell (i, j) "
                 f"moving only down or right"
             ),
-            state={"type": "grid", "grid": [row[:] for row in grid]},
+            state=lambda: {"type": "grid", "grid": [row[:] for row in grid]},
             highlights=[],
-            metadata={"m": m, "n": n, "cells_filled": self.cells_filled},
+            metadata=lambda: {"m": m, "n": n, "cells_filled": self.cells_filled},
         )
 
         # Fill the cost table row by row, left to right.
@@ -82,10 +90,10 @@ class MinPathSum(StepTracker):
                     self.cells_filled += 1
                     yield self.emit_step(
                         operation="start",
-                        description=(f"Start cell (0, 0): cost[0][0] = grid[0][0] = {cost[i][j]}"),
-                        state={"type": "grid", "grid": [row[:] for row in cost]},
-                        highlights=[{"type": "cell", "row": 0, "col": 0, "color": "active"}],
-                        metadata={
+                        description=(lambda: f"Start cell (0, 0): cost[0][0] = grid[0][0] = {cost[i][j]}"),
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in cost]},
+                        highlights=lambda: [{"type": "cell", "row": 0, "col": 0, "color": "active"}],
+                        metadata=lambda: {
                             "i": i,
                             "j": j,
                             "grid_value": grid[i][j],
@@ -101,15 +109,15 @@ class MinPathSum(StepTracker):
                     yield self.emit_step(
                         operation="prefix_row",
                         description=(
-                            f"First row cell (0, {j}): only 'right' moves reach here. "
+                            lambda: f"First row cell (0, {j}): only 'right' moves reach here. "
                             f"cost[0][{j}] = grid[0][{j}]({grid[i][j]}) + left({left}) = {cost[i][j]}"
                         ),
-                        state={"type": "grid", "grid": [row[:] for row in cost]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in cost]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": i, "col": j - 1, "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "i": i,
                             "j": j,
                             "grid_value": grid[i][j],
@@ -127,15 +135,15 @@ class MinPathSum(StepTracker):
                     yield self.emit_step(
                         operation="prefix_col",
                         description=(
-                            f"First column cell ({i}, 0): only 'down' moves reach here. "
+                            lambda: f"First column cell ({i}, 0): only 'down' moves reach here. "
                             f"cost[{i}][0] = grid[{i}][0]({grid[i][j]}) + up({up}) = {cost[i][j]}"
                         ),
-                        state={"type": "grid", "grid": [row[:] for row in cost]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in cost]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": i - 1, "col": j, "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "i": i,
                             "j": j,
                             "grid_value": grid[i][j],
@@ -163,12 +171,12 @@ class MinPathSum(StepTracker):
                     yield self.emit_step(
                         operation="fill",
                         description=(
-                            f"Cell ({i}, {j}): cost = grid[{i}][{j}]({grid[i][j]}) + "
+                            lambda: f"Cell ({i}, {j}): cost = grid[{i}][{j}]({grid[i][j]}) + "
                             f"min(up={up}, left={left}) = {grid[i][j]} + {best} = {cost[i][j]} "
                             f"(came from {won})"
                         ),
-                        state={"type": "grid", "grid": [row[:] for row in cost]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row[:] for row in cost]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": won_row, "col": won_col, "color": "comparing"},
                             {
@@ -178,7 +186,7 @@ class MinPathSum(StepTracker):
                                 "color": "visited",
                             },
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "i": i,
                             "j": j,
                             "grid_value": grid[i][j],
@@ -195,12 +203,12 @@ class MinPathSum(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Minimum path sum is {result} (bottom-right cell cost[{m - 1}][{n - 1}]). "
+                lambda: f"Minimum path sum is {result} (bottom-right cell cost[{m - 1}][{n - 1}]). "
                 f"Filled all {self.cells_filled} cells"
             ),
-            state={"type": "grid", "grid": [row[:] for row in cost]},
-            highlights=[{"type": "cell", "row": m - 1, "col": n - 1, "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "grid", "grid": [row[:] for row in cost]},
+            highlights=lambda: [{"type": "cell", "row": m - 1, "col": n - 1, "color": "sorted"}],
+            metadata=lambda: {
                 "m": m,
                 "n": n,
                 "min_path_sum": result,
@@ -26,6 +26,14 @@ class UniquePaths(StepTracker):
     """Unique Paths counter with grid DP visualization."""
 
     visualizer_type = VisualizerType.GRID
+    registrations = {
+        "unique_paths": {
+            "name": "Unique Paths",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "abs(rows) * abs(cols)", "state_bytes": "5 * abs(rows) * abs(cols)"},
+        },
+    }
 
     # Upper bound on visualized grid size (keeps the emitted step count sane).
     # Chosen well above the exhibit's UI inputs so normal use is never capped.
@@ -70,12 +78,12 @@ class UniquePaths(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Counting unique paths in a {rows}x{cols} grid "
+                lambda: f"Counting unique paths in a {rows}x{cols} grid "
                 f"(moving only right or down){cap_note}"
             ),
-            state={"type": "grid", "grid": [row.copy() for row in dp]},
+            state=lambda: {"type": "grid", "grid": [row.copy() for row in dp]},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "rows": rows,
                 "cols": cols,
                 "requested_rows": req_rows,
@@ -95,14 +103,14 @@ class UniquePaths(StepTracker):
                     yield self.emit_step(
                         operation="base",
                         description=(
-                            f"Cell ({i}, {j}) is on the top row / left column - "
+                            lambda: f"Cell ({i}, {j}) is on the top row / left column - "
                             f"exactly 1 path to reach it"
                         ),
-                        state={"type": "grid", "grid": [row.copy() for row in dp]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row.copy() for row in dp]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "rows": rows,
                             "cols": cols,
                             "current_cell": (i, j),
@@ -120,16 +128,16 @@ class UniquePaths(StepTracker):
                     yield self.emit_step(
                         operation="compute",
                         description=(
-                            f"Cell ({i}, {j}) = above ({from_above}) + "
+                            lambda: f"Cell ({i}, {j}) = above ({from_above}) + "
                             f"left ({from_left}) = {dp[i][j]} paths"
                         ),
-                        state={"type": "grid", "grid": [row.copy() for row in dp]},
-                        highlights=[
+                        state=lambda: {"type": "grid", "grid": [row.copy() for row in dp]},
+                        highlights=lambda: [
                             {"type": "cell", "row": i, "col": j, "color": "active"},
                             {"type": "cell", "row": i - 1, "col": j, "color": "comparing"},
                             {"type": "cell", "row": i, "col": j - 1, "color": "visited"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "rows": rows,
                             "cols": cols,
                             "current_cell": (i, j),
@@ -145,15 +153,15 @@ class UniquePaths(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done! There are {total_paths} unique path"
+                lambda: f"Done! There are {total_paths} unique path"
                 f"{'s' if total_paths != 1 else ''} "
                 f"from the top-left to the bottom-right of a {rows}x{cols} grid"
             ),
-            state={"type": "grid", "grid": [row.copy() for row in dp]},
-            highlights=[
+            state=lambda: {"type": "grid", "grid": [row.copy() for row in dp]},
+            highlights=lambda: [
                 {"type": "cell", "row": rows - 1, "col": cols - 1, "color": "sorted"},
             ],
-            metadata={
+            metadata=lambda: {
                 "rows": rows,
                 "cols": cols,
                 "total_paths": total_paths,
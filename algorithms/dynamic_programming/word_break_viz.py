@@ -42,6 +42,14 @@ class WordBreak(StepTracker):
     """Word Break boolean DP with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "word_break": {
+            "name": "Word Break",
+            "category": "dynamic_programming",
+            "entry": "run",
+            "cost": {"steps": "len(s) ** 2 / 2 + len(s)", "state_bytes": "5 * len(s)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -75,13 +83,13 @@ class WordBreak(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f'Initialize DP over "{s}" (length {n}). '
+                lambda: f'Initialize DP over "{s}" (length {n}). '
                 f"ok[0] = 1 because the empty prefix needs no words. "
                 f"Dictionary: {sorted(word_set)}."
             ),
-            state={"type": "array", "values": self._dp_values(ok)},
-            highlights=[{"indices": [0], "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "array", "values": self._dp_values(ok)},
+            highlights=lambda: [{"indices": [0], "color": "sorted"}],
+            metadata=lambda: {
                 "string": s,
                 "words": sorted(word_set),
                 "comparisons": self.comparisons,
@@ -93,9 +101,9 @@ class WordBreak(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty string is segmentable (vacuously true). Result: True.",
-                state={"type": "array", "values": self._dp_values(ok)},
-                highlights=[{"indices": [0], "color": "swapped"}],
-                metadata={
+                state=lambda: {"type": "array", "values": self._dp_values(ok)},
+                highlights=lambda: [{"indices": [0], "color": "swapped"}],
+                metadata=lambda: {
                     "string": s,
                     "words": sorted(word_set),
                     "result": True,
@@ -114,12 +122,12 @@ class WordBreak(StepTracker):
                     yield self.emit_step(
                         operation="skip",
                         description=(
-                            f"End i={i}, split j={j}: ok[{j}] = 0, so the prefix "
+                            lambda: f"End i={i}, split j={j}: ok[{j}] = 0, so the prefix "
                             f'"{s[:j]}" is not segmentable - skip "{substring}".'
                         ),
-                        state={"type": "array", "values": self._dp_values(ok)},
-                        highlights=self._build_highlights(i, j, ok, matched=False),
-                        metadata={
+                        state=lambda: {"type": "array", "values": self._dp_values(ok)},
+                        highlights=lambda: self._build_highlights(i, j, ok, matched=False),
+                        metadata=lambda: {
                             "string": s,
                             "end": i,
                             "split": j,
@@ -138,13 +146,13 @@ class WordBreak(StepTracker):
                 yield self.emit_step(
                     operation="check",
                     description=(
-                        f"End i={i}, split j={j}: ok[{j}] = 1, so check whether "
+                        lambda: f"End i={i}, split j={j}: ok[{j}] = 1, so check whether "
                         f'"{substring}" is in the dictionary -> '
                         f"{'yes' if in_dict else 'no'}."
                     ),
-                    state={"type": "array", "values": self._dp_values(ok)},
-                    highlights=self._build_highlights(i, j, ok, matched=in_dict),
-                    metadata={
+                    state=lambda: {"type": "array", "values": self._dp_values(ok)},
+                    highlights=lambda: self._build_highlights(i, j, ok, matched=in_dict),
+                    metadata=lambda: {
                         "string": s,
                         "end": i,
                         "split": j,
@@ -163,12 +171,12 @@ class WordBreak(StepTracker):
                     yield self.emit_step(
                         operation="mark",
                         description=(
-                            f'Match! "{s[:j]}" + "{substring}" segments "{s[:i]}". '
+                            lambda: f'Match! "{s[:j]}" + "{substring}" segments "{s[:i]}". '
                             f"Set ok[{i}] = 1 and move to the next end."
                         ),
-                        state={"type": "array", "values": self._dp_values(ok)},
-                        highlights=self._build_highlights(i, j, ok, matched=True),
-                        metadata={
+                        state=lambda: {"type": "array", "values": self._dp_values(ok)},
+                        highlights=lambda: self._build_highlights(i, j, ok, matched=True),
+                        metadata=lambda: {
                             "string": s,
                             "end": i,
                             "split": j,
@@ -185,15 +193,15 @@ class WordBreak(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f'Done! ok[{n}] = {int(result)}, so "{s}" '
+                lambda: f'Done! ok[{n}] = {int(result)}, so "{s}" '
                 f"{'CAN' if result else 'CANNOT'} be segmented into dictionary words. "
                 f"Result: {result}."
             ),
-            state={"type": "array", "values": self._dp_values(ok)},
-            highlights=[
+            state=lambda: {"type": "array", "values": self._dp_values(ok)},
+            highlights=lambda: [
                 {"indices": [n], "color": "swapped" if result else "comparing"},
             ],
-            metadata={
+            metadata=lambda: {
                 "string": s,
                 "words": sorted(word_set),
                 "result": result,
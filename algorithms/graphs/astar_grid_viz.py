@@ -41,6 +41,14 @@ class AStarGrid(StepTracker):
     """A* pathfinding on a 4-connected grid with grid visualization."""
 
     visualizer_type = VisualizerType.GRID
+    registrations = {
+        "astar_grid": {
+            "name": "A* Pathfinding (Grid)",
+            "category": "graphs",
+            "entry": "run",
+            "cost": {"steps": "2 * cells(grid)", "state_bytes": "40 * cells(grid)"},
+        },
+    }
 
     def run(self, input_data: dict[str, Any]) -> Generator[Step, None, None]:
         """Run A* search on a grid, emitting a step per expansion.
@@ -66,9 +74,9 @@ class AStarGrid(StepTracker):
             yield self.emit_step(
                 operation="init",
                 description="Empty grid or missing start/goal - nothing to search",
-                state={"type": "grid", "grid": grid},
+                state=lambda: {"type": "grid", "grid": grid},
                 highlights=[],
-                metadata={"open_size": 0, "steps": 0},
+                metadata=lambda: {"open_size": 0, "steps": 0},
             )
             return
 
@@ -88,12 +96,12 @@ class AStarGrid(StepTracker):
             yield self.emit_step(
                 operation="init",
                 description="Start or goal is out of bounds or on a wall - no path",
-                state={"type": "grid", "grid": grid},
-                highlights=[
+                state=lambda: {"type": "grid", "grid": grid},
+                highlights=lambda: [
                     {"type": "cell", "row": sr, "col": sc, "color": "active"},
                     {"type": "cell", "row": gr, "col": gc, "color": "active"},
                 ],
-                metadata={"open_size": 0, "steps": 0},
+                metadata=lambda: {"open_size": 0, "steps": 0},
             )
             return
 
@@ -101,15 +109,15 @@ class AStarGrid(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Searching {rows}x{cols} grid from ({sr}, {sc}) to ({gr}, {gc}) "
+                lambda: f"Searching {rows}x{cols} grid from ({sr}, {sc}) to ({gr}, {gc}) "
                 f"with Manhattan heuristic"
             ),
-            state={"type": "grid", "grid": grid},
-            highlights=[
+            state=lambda: {"type": "grid", "grid": grid},
+            highlights=lambda: [
                 {"type": "cell", "row": sr, "col": sc, "color": "active"},
                 {"type": "cell", "row": gr, "col": gc, "color": "active"},
             ],
-            metadata={
+            metadata=lambda: {
                 "g": 0,
                 "h": h0,
                 "f": h0,
@@ -158,15 +166,15 @@ class AStarGrid(StepTracker):
                 yield self.emit_step(
                     operation="path_found",
                     description=(
-                        f"Goal ({gr}, {gc}) reached! Shortest path has "
+                        lambda: f"Goal ({gr}, {gc}) reached! Shortest path has "
                         f"{len(path)} cells, total cost {g_cur}"
                     ),
-                    state={"type": "grid", "grid": grid},
-                    highlights=[
+                    state=lambda: {"type": "grid", "grid": grid},
+                    highlights=lambda: [
                         {"type": "cell", "row": pr, "col": pc, "color": "sorted"}
                         for pr, pc in path_sorted
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "g": g_cur,
                         "h": 0,
                         "f": g_cur,
@@ -211,13 +219,13 @@ class AStarGrid(StepTracker):
             yield self.emit_step(
                 operation="expand",
                 description=(
-                    f"Expand ({r}, {c}): g={g_cur}, h={h_cur}, f={f_cur}. "
+                    lambda: f"Expand ({r}, {c}): g={g_cur}, h={h_cur}, f={f_cur}. "
                     f"Frontier has {len(open_members)} cell"
                     f"{'s' if len(open_members) != 1 else ''}"
                 ),
-                state={"type": "grid", "grid": grid},
+                state=lambda: {"type": "grid", "grid": grid},
                 highlights=highlights,
-                metadata={
+                metadata=lambda: {
                     "g": g_cur,
                     "h": h_cur,
                     "f": f_cur,
@@ -232,15 +240,15 @@ class AStarGrid(StepTracker):
         yield self.emit_step(
             operation="no_path",
             description=(
-                f"No path exists from ({sr}, {sc}) to ({gr}, {gc}) - "
+                lambda: f"No path exists from ({sr}, {sc}) to ({gr}, {gc}) - "
                 f"goal is unreachable (walls block every route)"
             ),
-            state={"type": "grid", "grid": grid},
-            highlights=[
+            state=lambda: {"type": "grid", "grid": grid},
+            highlights=lambda: [
                 {"type": "cell", "row": cr, "col": cc, "color": "visited"} for (cr, cc) in closed
             ]
             + [{"type": "cell", "row": gr, "col": gc, "color": "active"}],
-            metadata={
+            metadata=lambda: {
                 "open_size": 0,
                 "steps": expansions,
                 "path_length": 0,
@@ -21,13 +21,30 @@ Key Insights:
 from collections.abc import Generator
 from typing import Any
 
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import Step, StepLevel, StepTracker, VisualizerType
 
 
 class BellmanFord(StepTracker):
     """Bellman-Ford single-source shortest path with visualization."""
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "bellman_ford": {
+            "name": "Bellman-Ford",
+            "category": "graphs",
+            "entry": "run",
+            "cost": {
+                "steps": "(len(graph) + edges(graph)) * log2(len(graph))",
+                "state_bytes": "50 * len(graph)",
+            },
+        },
+    }
+    step_levels = {
+        **StepTracker.step_levels,
+        "converged": StepLevel.PASS,
+        "negative_cycle": StepLevel.PASS,
+        "update": StepLevel.PHASE,
+    }
 
     def __init__(self):
         super().__init__()
@@ -76,12 +93,12 @@ class BellmanFord(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Initialize distances: source {start} = 0, all others = ∞. "
+                lambda: f"Initialize distances: source {start} = 0, all others = ∞. "
                 f"Will relax {len(edges)} edges up to {len(graph) - 1} times."
             ),
-            state={"type": "graph", "graph": graph},
-            highlights=[{"type": "node", "id": start, "color": "active"}],
-            metadata={
+            state=lambda: {"type": "graph", "graph": graph},
+            highlights=lambda: [{"type": "node", "id": start, "color": "active"}],
+            metadata=lambda: {
                 "start": start,
                 "distances": self._dist_snapshot(),
                 "iteration": 0,
@@ -96,7 +113,7 @@ class BellmanFord(StepTracker):
         for iteration in range(1, num_vertices):
             updated_this_pass = False
 
-            for u, v, w in edges:
+            for edge_index, (u, v, w) in enumerate(edges):
                 du = self.distances[u]
                 dv = self.distances[v]
                 candidate = du + w if du != float("inf") else float("inf")
@@ -105,20 +122,20 @@ class BellmanFord(StepTracker):
                 yield self.emit_step(
                     operation="relax",
                     description=(
-                        f"Pass {iteration}: relax edge {u} → {v} (weight {w}). "
+                        lambda: f"Pass {iteration}: relax edge {u} → {v} (weight {w}). "
                         + (
                             f"Improve dist[{v}]: {self._fmt(dv)} → {self._fmt(candidate)}"
                             if improved
                             else f"No improvement (dist[{v}] = {self._fmt(dv)})"
                         )
                     ),
-                    state={"type": "graph", "graph": graph},
-                    highlights=[
+                    state=lambda: {"type": "graph", "graph": graph},
+                    highlights=lambda: [
                         {"type": "node", "id": u, "color": "active"},
                         {"type": "node", "id": v, "color": "comparing"},
                         {"type": "edge", "id": f"{u}-{v}", "color": "active"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "iteration": iteration,
                         "edge": [u, v, w],
                         "from": u,
@@ -130,6 +147,8 @@ class BellmanFord(StepTracker):
                         "relaxations": relaxations,
                         "distances": self._dist_snapshot(),
                     },
+                    # The first relaxation of each pass opens it in the outline
+                    level=StepLevel.PASS if edge_index == 0 else None,
                 )
 
                 if improved:
@@ -140,13 +159,13 @@ class BellmanFord(StepTracker):
 
                     yield self.emit_step(
                         operation="update",
-                        description=(f"Updated dist[{v}] = {self._fmt(candidate)} via {u} → {v}"),
-                        state={"type": "graph", "graph": graph},
-                        highlights=[
+                        description=(lambda: f"Updated dist[{v}] = {self._fmt(candidate)} via {u} → {v}"),
+                        state=lambda: {"type": "graph", "graph": graph},
+                        highlights=lambda: [
                             {"type": "node", "id": v, "color": "found"},
                             {"type": "edge", "id": f"{u}-{v}", "color": "path"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "iteration": iteration,
                             "node": v,
                             "new_distance": candidate,
@@ -160,11 +179,11 @@ class BellmanFord(StepTracker):
                 yield self.emit_step(
                     operation="converged",
                     description=(
-                        f"Pass {iteration} made no updates — distances have converged early."
+                        lambda: f"Pass {iteration} made no updates — distances have converged early."
                     ),
-                    state={"type": "graph", "graph": graph},
+                    state=lambda: {"type": "graph", "graph": graph},
                     highlights=[],
-                    metadata={
+                    metadata=lambda: {
                         "iteration": iteration,
                         "relaxations": relaxations,
                         "distances": self._dist_snapshot(),
@@ -179,17 +198,17 @@ class BellmanFord(StepTracker):
                 yield self.emit_step(
                     operation="negative_cycle",
                     description=(
-                        f"Negative-weight cycle detected! Edge {u} → {v} "
+                        lambda: f"Negative-weight cycle detected! Edge {u} → {v} "
                         f"(weight {w}) still relaxes after {num_vertices - 1} "
                         f"passes — no shortest path is well-defined."
                     ),
-                    state={"type": "graph", "graph": graph},
-                    highlights=[
+                    state=lambda: {"type": "graph", "graph": graph},
+                    highlights=lambda: [
                         {"type": "node", "id": u, "color": "comparing"},
                         {"type": "node", "id": v, "color": "comparing"},
                         {"type": "edge", "id": f"{u}-{v}", "color": "active"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "negative_cycle": True,
                         "edge": [u, v, w],
                         "relaxations": relaxations,
@@ -203,12 +222,12 @@ class BellmanFord(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Complete — shortest distances from {start} computed for "
+                lambda: f"Complete — shortest distances from {start} computed for "
                 f"{len(reachable)} reachable node(s). No negative cycle found."
             ),
-            state={"type": "graph", "graph": graph},
-            highlights=[{"type": "node", "id": node, "color": "found"} for node in reachable],
-            metadata={
+            state=lambda: {"type": "graph", "graph": graph},
+            highlights=lambda: [{"type": "node", "id": node, "color": "found"} for node in reachable],
+            metadata=lambda: {
                 "negative_cycle": False,
                 "start": start,
                 "distances": reachable,
@@ -12,21 +12,40 @@ Key Insights:
 """
 
 from collections import deque
-from typing import Generator, Dict, List, Set
-from algorithms.base import StepTracker, Step, VisualizerType
+from collections.abc import Generator
+
+from algorithms.base import Step, StepTracker, VisualizerType
 
 
 class BFS(StepTracker):
-    """Breadth-First Search implementation with visualization."""
+    """Breadth-First Search implementation with visualization.
+
+    Step state holds only what the step changed: ``newly_visited`` and
+    ``dequeued`` (the node a visit step takes off the queue), and
+    ``enqueued`` (the node an enqueue step adds). Folding these over the
+    steps gives the visit order and queue at any step; the first and last
+    steps also carry them in full (``visited``, ``queue``). The graph itself
+    is referenced (see StepTracker.reference).
+    """
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "bfs": {
+            "name": "Breadth-First Search",
+            "category": "graphs",
+            "entry": "search",
+            "input": {"graph": {}, "start": 0, "target": None},
+            "cost": {"steps": "2 * len(graph) + edges(graph)", "state_bytes": "10 * len(graph)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
         self.nodes_visited = 0
         self.edges_explored = 0
+        self._graph_ref: dict = {}
 
-    def search(self, graph: Dict[int, List[int]], start: int, target: int = None) -> Generator[Step, None, None]:
+    def search(self, graph: dict[int, list[int]], start: int, target: int | None = None) -> Generator[Step, None, None]:
         """Perform BFS traversal on graph.
 
         Args:
@@ -40,19 +59,24 @@ class BFS(StepTracker):
         self.reset()
         self.nodes_visited = 0
         self.edges_explored = 0
+        # The graph is sent once per run; steps reference it
+        self._graph_ref = self.reference("graph", graph)
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting BFS from node {start}",
-            state={
+            description=lambda: f"Starting BFS from node {start}",
+            state=lambda: {
                 "type": "graph",
-                "graph": graph,
+                "graph": self._graph_ref,
                 "current": None,
+                "newly_visited": None,
+                "enqueued": None,
+                "dequeued": None,
                 "visited": [],
                 "queue": [start],
             },
-            highlights=[{"type": "node", "id": start, "color": "active"}],
-            metadata={
+            highlights=lambda: [{"nodes": [start], "color": "active"}],
+            metadata=lambda: {
                 "nodes_visited": self.nodes_visited,
                 "edges_explored": self.edges_explored,
                 "start": start,
@@ -60,9 +84,10 @@ class BFS(StepTracker):
             },
         )
 
-        visited: Set[int] = set()
+        visited: set[int] = set()
+        visit_order: list[int] = []
         queue = deque([start])
-        parent: Dict[int, int] = {start: None}
+        parent: dict[int, int] = {start: None}
 
         while queue:
             current = queue.popleft()
@@ -71,24 +96,22 @@ class BFS(StepTracker):
                 continue
 
             visited.add(current)
+            visit_order.append(current)
             self.nodes_visited += 1
 
             yield self.emit_step(
                 operation="visit",
-                description=f"Visiting node {current}",
-                state={
+                description=lambda: f"Visiting node {current}",
+                state=lambda: {
                     "type": "graph",
-                    "graph": graph,
+                    "graph": self._graph_ref,
                     "current": current,
-                    "visited": list(visited),
-                    "queue": list(queue),
+                    "newly_visited": current,
+                    "enqueued": None,
+                    "dequeued": current,
                 },
-                highlights=[
-                    {"type": "node", "id": current, "color": "visiting"},
-                    *[{"type": "node", "id": n, "color": "visited"} for n in visited if n != current],
-                    *[{"type": "node", "id": n, "color": "queued"} for n in queue],
-                ],
-                metadata={
+                highlights=lambda: [{"nodes": [current], "color": "visiting"}],
+                metadata=lambda: {
                     "nodes_visited": self.nodes_visited,
                     "edges_explored": self.edges_explored,
                     "current": current,
@@ -100,21 +123,26 @@ class BFS(StepTracker):
 
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found target {target}! Path length: {len(path) - 1}",
-                    state={
+                    description=lambda: f"Found target {target}! Path length: {len(path) - 1}",
+                    state=lambda: {
                         "type": "graph",
-                        "graph": graph,
+                        "graph": self._graph_ref,
                         "current": current,
-                        "visited": list(visited),
+                        "newly_visited": None,
+                        "enqueued": None,
+                        "dequeued": None,
+                        "visited": visit_order.copy(),
                         "queue": list(queue),
                         "path": path,
                     },
-                    highlights=[
-                        *[{"type": "node", "id": n, "color": "path"} for n in path],
-                        *[{"type": "edge", "from": path[i], "to": path[i+1], "color": "path"}
-                          for i in range(len(path) - 1)],
+                    highlights=lambda: [
+                        {
+                            "nodes": path,
+                            "edges": [[path[i], path[i + 1]] for i in range(len(path) - 1)],
+                            "color": "path",
+                        },
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "nodes_visited": self.nodes_visited,
                         "edges_explored": self.edges_explored,
                         "path": path,
@@ -130,20 +158,21 @@ class BFS(StepTracker):
                 if neighbor not in visited:
                     yield self.emit_step(
                         operation="explore",
-                        description=f"Exploring edge {current} → {neighbor}",
-                        state={
+                        description=lambda: f"Exploring edge {current} → {neighbor}",
+                        state=lambda: {
                             "type": "graph",
-                            "graph": graph,
+                            "graph": self._graph_ref,
                             "current": current,
-                            "visited": list(visited),
-                            "queue": list(queue),
+                            "newly_visited": None,
+                            "enqueued": None,
+                            "dequeued": None,
                         },
-                        highlights=[
-                            {"type": "node", "id": current, "color": "visiting"},
-                            {"type": "node", "id": neighbor, "color": "exploring"},
-                            {"type": "edge", "from": current, "to": neighbor, "color": "exploring"},
+                        highlights=lambda: [
+                            {"nodes": [current], "color": "visiting"},
+                            {"nodes": [neighbor], "color": "exploring"},
+                            {"edges": [[current, neighbor]], "color": "exploring"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "nodes_visited": self.nodes_visited,
                             "edges_explored": self.edges_explored,
                             "exploring_edge": f"{current}→{neighbor}",
@@ -156,19 +185,17 @@ class BFS(StepTracker):
 
                         yield self.emit_step(
                             operation="enqueue",
-                            description=f"Added node {neighbor} to queue",
-                            state={
+                            description=lambda: f"Added node {neighbor} to queue",
+                            state=lambda: {
                                 "type": "graph",
-                                "graph": graph,
+                                "graph": self._graph_ref,
                                 "current": current,
-                                "visited": list(visited),
-                                "queue": list(queue),
+                                "newly_visited": None,
+                                "enqueued": neighbor,
+                                "dequeued": None,
                             },
-                            highlights=[
-                                {"type": "node", "id": neighbor, "color": "queued"},
-                                *[{"type": "node", "id": n, "color": "queued"} for n in queue if n != neighbor],
-                            ],
-                            metadata={
+                            highlights=lambda: [{"nodes": [neighbor], "color": "queued"}],
+                            metadata=lambda: {
                                 "nodes_visited": self.nodes_visited,
                                 "edges_explored": self.edges_explored,
                             },
@@ -177,18 +204,18 @@ class BFS(StepTracker):
         if target:
             yield self.emit_step(
                 operation="not_found",
-                description=f"Target {target} not reachable from {start}",
-                state={
+                description=lambda: f"Target {target} not reachable from {start}",
+                state=lambda: {
                     "type": "graph",
-                    "graph": graph,
+                    "graph": self._graph_ref,
                     "current": None,
-                    "visited": list(visited),
+                    "newly_visited": None,
+                    "enqueued": None,
+                    "dequeued": None,
+                    "visited": visit_order.copy(),
                     "queue": [],
                 },
-                highlights=[
-                    *[{"type": "node", "id": n, "color": "visited"} for n in visited],
-                ],
-                metadata={
+                metadata=lambda: {
                     "nodes_visited": self.nodes_visited,
                     "edges_explored": self.edges_explored,
                     "found": False,
@@ -197,24 +224,24 @@ class BFS(StepTracker):
         else:
             yield self.emit_step(
                 operation="complete",
-                description=f"BFS complete. Visited {self.nodes_visited} nodes, explored {self.edges_explored} edges",
-                state={
+                description=lambda: f"BFS complete. Visited {self.nodes_visited} nodes, explored {self.edges_explored} edges",
+                state=lambda: {
                     "type": "graph",
-                    "graph": graph,
+                    "graph": self._graph_ref,
                     "current": None,
-                    "visited": list(visited),
+                    "newly_visited": None,
+                    "enqueued": None,
+                    "dequeued": None,
+                    "visited": visit_order.copy(),
                     "queue": [],
                 },
-                highlights=[
-                    *[{"type": "node", "id": n, "color": "visited"} for n in visited],
-                ],
-                metadata={
+                metadata=lambda: {
                     "nodes_visited": self.nodes_visited,
                     "edges_explored": self.edges_explored,
                 },
             )
 
-    def _reconstruct_path(self, parent: Dict[int, int], start: int, target: int) -> List[int]:
+    def _reconstruct_path(self, parent: dict[int, int], start: int, target: int) -> list[int]:
         """Reconstruct path from start to target using parent pointers."""
         path = []
         current = target
@@ -41,6 +41,14 @@ class ConnectedComponents(StepTracker):
     """Count connected components of an undirected graph via DFS, with steps."""
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "connected_components": {
+            "name": "Connected Components (DFS)",
+            "category": "graphs",
+            "entry": "run",
+            "cost": {"steps": "len(graph) + edges(graph)", "state_bytes": "90 * len(graph)"},
+        },
+    }
 
     # Distinct highlight colors cycled per component so adjacent components in
     # the visualization are easy to tell apart. Falls back by wrapping around.
@@ -138,10 +146,10 @@ class ConnectedComponents(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Scanning {len(nodes)} nodes to find connected components. Each unvisited "
+                lambda: f"Scanning {len(nodes)} nodes to find connected components. Each unvisited "
                 "node we hit starts a new component; DFS then floods its whole component."
             ),
-            state={
+            state=lambda: {
                 "type": "graph",
                 "graph": graph,
                 "current": None,
@@ -149,7 +157,7 @@ class ConnectedComponents(StepTracker):
                 "component_id": dict(component_id),
             },
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "component_count": 0,
                 "component_id": dict(component_id),
                 "nodes_visited": self.nodes_visited,
@@ -171,21 +179,21 @@ class ConnectedComponents(StepTracker):
             yield self.emit_step(
                 operation="new_component",
                 description=(
-                    f"Node {start} is unvisited - it opens component #{current_component + 1}. "
+                    lambda: f"Node {start} is unvisited - it opens component #{current_component + 1}. "
                     "Starting a depth-first search from here."
                 ),
-                state={
+                state=lambda: {
                     "type": "graph",
                     "graph": graph,
                     "current": start,
                     "component_count": component_count,
                     "component_id": dict(component_id),
                 },
-                highlights=[
+                highlights=lambda: [
                     *node_highlights(start),
                     {"type": "node", "id": start, "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "component_count": component_count,
                     "component_id": dict(component_id),
                     "current": start,
@@ -212,18 +220,18 @@ class ConnectedComponents(StepTracker):
                 yield self.emit_step(
                     operation="visit",
                     description=(
-                        f"Visit node {node}: label it component #{current_component + 1}. "
+                        lambda: f"Visit node {node}: label it component #{current_component + 1}. "
                         f"Component now holds {len(component_members)} node(s)."
                     ),
-                    state={
+                    state=lambda: {
                         "type": "graph",
                         "graph": graph,
                         "current": node,
                         "component_count": component_count,
                         "component_id": dict(component_id),
                     },
-                    highlights=node_highlights(node),
-                    metadata={
+                    highlights=lambda: node_highlights(node),
+                    metadata=lambda: {
                         "component_count": component_count,
                         "component_id": dict(component_id),
                         "current": node,
@@ -244,24 +252,24 @@ class ConnectedComponents(StepTracker):
             yield self.emit_step(
                 operation="component_done",
                 description=(
-                    f"Component #{current_component + 1} fully explored: nodes "
+                    lambda: f"Component #{current_component + 1} fully explored: nodes "
                     f"{sorted(component_members)} ({len(component_members)} total). "
                     f"{component_count} component(s) found so far."
                 ),
-                state={
+                state=lambda: {
                     "type": "graph",
                     "graph": graph,
                     "current": None,
                     "component_count": component_count,
                     "component_id": dict(component_id),
                 },
-                highlights=[{"type": "node", "id": n, "color": color} for n in component_members]
+                highlights=lambda: [{"type": "node", "id": n, "color": color} for n in component_members]
                 + [
                     {"type": "node", "id": n, "color": self._component_color(component_id[n])}
                     for n in nodes
                     if component_id[n] is not None and n not in component_members
                 ],
-                metadata={
+                metadata=lambda: {
                     "component_count": component_count,
                     "component_id": dict(component_id),
                     "component_members": sorted(component_members),
@@ -275,22 +283,22 @@ class ConnectedComponents(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done. The graph has {component_count} connected component(s) "
+                lambda: f"Done. The graph has {component_count} connected component(s) "
                 f"across {len(nodes)} node(s)."
             ),
-            state={
+            state=lambda: {
                 "type": "graph",
                 "graph": graph,
                 "current": None,
                 "component_count": component_count,
                 "component_id": dict(component_id),
             },
-            highlights=[
+            highlights=lambda: [
                 {"type": "node", "id": n, "color": self._component_color(component_id[n])}
                 for n in nodes
                 if component_id[n] is not None
             ],
-            metadata={
+            metadata=lambda: {
                 "component_count": component_count,
                 "component_id": dict(component_id),
                 "nodes_visited": self.nodes_visited,
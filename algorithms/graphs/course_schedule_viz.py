@@ -48,6 +48,14 @@ class CourseSchedule(StepTracker):
     """Course Schedule cycle detection via DFS coloring with visualization."""
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "course_schedule": {
+            "name": "Course Schedule (Cycle Detection)",
+            "category": "graphs",
+            "entry": "run",
+            "cost": {"steps": "2 * len(graph) + edges(graph)", "state_bytes": "110 * len(graph)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -120,11 +128,11 @@ class CourseSchedule(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Start cycle detection over {len(nodes)} courses. "
+                lambda: f"Start cycle detection over {len(nodes)} courses. "
                 "Every node begins WHITE (unvisited); DFS will color nodes GRAY "
                 "while on the current path and BLACK when fully explored."
             ),
-            state={
+            state=lambda: {
                 "type": "graph",
                 "graph": graph,
                 "current": None,
@@ -132,8 +140,8 @@ class CourseSchedule(StepTracker):
                 "order": [],
                 "colors": {n: self._color_name(color[n]) for n in nodes},
             },
-            highlights=[{"type": "node", "id": n, "color": "default"} for n in nodes],
-            metadata={
+            highlights=lambda: [{"type": "node", "id": n, "color": "default"} for n in nodes],
+            metadata=lambda: {
                 "nodes_processed": self.nodes_processed,
                 "total_nodes": len(nodes),
                 "edges_examined": self.edges_examined,
@@ -163,10 +171,10 @@ class CourseSchedule(StepTracker):
             yield self.emit_step(
                 operation="visit",
                 description=(
-                    f"Enter course {node}: mark it GRAY (in-progress) and push it "
+                    lambda: f"Enter course {node}: mark it GRAY (in-progress) and push it "
                     f"onto the current path {path}."
                 ),
-                state={
+                state=lambda: {
                     "type": "graph",
                     "graph": graph,
                     "current": node,
@@ -174,8 +182,8 @@ class CourseSchedule(StepTracker):
                     "order": post_order.copy(),
                     "colors": {n: self._color_name(color[n]) for n in nodes},
                 },
-                highlights=base_highlights(node),
-                metadata={
+                highlights=lambda: base_highlights(node),
+                metadata=lambda: {
                     "current": node,
                     "path": path.copy(),
                     "nodes_processed": self.nodes_processed,
@@ -195,12 +203,12 @@ class CourseSchedule(StepTracker):
                     yield self.emit_step(
                         operation="cycle",
                         description=(
-                            f"Edge {node} -> {neighbor} points to a GRAY node still on "
+                            lambda: f"Edge {node} -> {neighbor} points to a GRAY node still on "
                             f"the path - a back edge! Cycle found: "
                             f"{' -> '.join(str(c) for c in [*cycle, cycle[0]])}. "
                             "The schedule cannot be finished."
                         ),
-                        state={
+                        state=lambda: {
                             "type": "graph",
                             "graph": graph,
                             "current": node,
@@ -208,12 +216,12 @@ class CourseSchedule(StepTracker):
                             "order": post_order.copy(),
                             "colors": {n: self._color_name(color[n]) for n in nodes},
                         },
-                        highlights=[
+                        highlights=lambda: [
                             *[{"type": "node", "id": n, "color": "default"} for n in nodes],
                             *[{"type": "node", "id": c, "color": "comparing"} for c in cycle],
                             {"type": "edge", "from": node, "to": neighbor, "color": "active"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "current": node,
                             "neighbor": neighbor,
                             "cycle": cycle.copy(),
@@ -230,10 +238,10 @@ class CourseSchedule(StepTracker):
                     yield self.emit_step(
                         operation="skip",
                         description=(
-                            f"Edge {node} -> {neighbor}: {neighbor} is already BLACK "
+                            lambda: f"Edge {node} -> {neighbor}: {neighbor} is already BLACK "
                             "(fully explored, cycle-free) - nothing to do."
                         ),
-                        state={
+                        state=lambda: {
                             "type": "graph",
                             "graph": graph,
                             "current": node,
@@ -241,11 +249,11 @@ class CourseSchedule(StepTracker):
                             "order": post_order.copy(),
                             "colors": {n: self._color_name(color[n]) for n in nodes},
                         },
-                        highlights=[
+                        highlights=lambda: [
                             *base_highlights(node),
                             {"type": "edge", "from": node, "to": neighbor, "color": "visited"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "current": node,
                             "neighbor": neighbor,
                             "path": path.copy(),
@@ -261,10 +269,10 @@ class CourseSchedule(StepTracker):
                 yield self.emit_step(
                     operation="explore",
                     description=(
-                        f"Edge {node} -> {neighbor}: {neighbor} is WHITE (unvisited) - "
+                        lambda: f"Edge {node} -> {neighbor}: {neighbor} is WHITE (unvisited) - "
                         "recurse into it."
                     ),
-                    state={
+                    state=lambda: {
                         "type": "graph",
                         "graph": graph,
                         "current": node,
@@ -272,12 +280,12 @@ class CourseSchedule(StepTracker):
                         "order": post_order.copy(),
                         "colors": {n: self._color_name(color[n]) for n in nodes},
                     },
-                    highlights=[
+                    highlights=lambda: [
                         *base_highlights(node),
                         {"type": "node", "id": neighbor, "color": "active"},
                         {"type": "edge", "from": node, "to": neighbor, "color": "active"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "current": node,
                         "neighbor": neighbor,
                         "path": path.copy(),
@@ -301,10 +309,10 @@ class CourseSchedule(StepTracker):
             yield self.emit_step(
                 operation="finish",
                 description=(
-                    f"Course {node} is fully explored with no cycle below it: mark it "
+                    lambda: f"Course {node} is fully explored with no cycle below it: mark it "
                     f"BLACK (done) and record it. Post-order so far: {post_order}."
                 ),
-                state={
+                state=lambda: {
                     "type": "graph",
                     "graph": graph,
                     "current": node,
@@ -312,8 +320,8 @@ class CourseSchedule(StepTracker):
                     "order": post_order.copy(),
                     "colors": {n: self._color_name(color[n]) for n in nodes},
                 },
-                highlights=base_highlights(None),
-                metadata={
+                highlights=lambda: base_highlights(None),
+                metadata=lambda: {
                     "current": node,
                     "path": path.copy(),
                     "nodes_processed": self.nodes_processed,
@@ -336,11 +344,11 @@ class CourseSchedule(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description=(
-                    "Cannot finish all courses: the prerequisite graph contains a "
+                    lambda: "Cannot finish all courses: the prerequisite graph contains a "
                     f"cycle {' -> '.join(str(c) for c in [*cycle, cycle[0]])}. Those "
                     "courses mutually depend on each other, so none can be taken first."
                 ),
-                state={
+                state=lambda: {
                     "type": "graph",
                     "graph": graph,
                     "current": None,
@@ -348,11 +356,11 @@ class CourseSchedule(StepTracker):
                     "order": post_order.copy(),
                     "colors": {n: self._color_name(color[n]) for n in nodes},
                 },
-                highlights=[
+                highlights=lambda: [
                     *[{"type": "node", "id": n, "color": "default"} for n in nodes],
                     *[{"type": "node", "id": c, "color": "comparing"} for c in cycle],
                 ],
-                metadata={
+                metadata=lambda: {
                     "cycle": cycle.copy(),
                     "nodes_processed": self.nodes_processed,
                     "total_nodes": len(nodes),
@@ -367,11 +375,11 @@ class CourseSchedule(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                "Can finish all courses! No cycle exists, so the prerequisite graph "
+                lambda: "Can finish all courses! No cycle exists, so the prerequisite graph "
                 "is a DAG. A valid course order (reverse post-order): "
                 + " -> ".join(str(n) for n in order)
             ),
-            state={
+            state=lambda: {
                 "type": "graph",
                 "graph": graph,
                 "current": None,
@@ -379,8 +387,8 @@ class CourseSchedule(StepTracker):
                 "order": order,
                 "colors": {n: self._color_name(color[n]) for n in nodes},
             },
-            highlights=[{"type": "node", "id": n, "color": "found"} for n in order],
-            metadata={
+            highlights=lambda: [{"type": "node", "id": n, "color": "found"} for n in order],
+            metadata=lambda: {
                 "order": order,
                 "nodes_processed": self.nodes_processed,
                 "total_nodes": len(nodes),
@@ -11,23 +11,43 @@ Key Insights:
     - Better space complexity for wide graphs
 """
 
-from typing import Generator, Dict, List, Set
-from algorithms.base import StepTracker, Step, VisualizerType
+from collections.abc import Generator
+
+from algorithms.base import Step, StepTracker, VisualizerType
 
 
 class DFS(StepTracker):
-    """Depth-First Search implementation with visualization."""
+    """Depth-First Search implementation with visualization.
+
+    Step state holds only what the step changed: ``newly_visited`` and
+    ``pushed`` (the node a visit step puts on the stack), and ``popped`` (the
+    node a backtrack step takes off it). Folding these over the steps gives
+    the visit order and stack at any step; the first and last steps also
+    carry them in full (``visited``, ``stack``). The graph itself is
+    referenced (see StepTracker.reference).
+    """
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "dfs": {
+            "name": "Depth-First Search",
+            "category": "graphs",
+            "entry": "search",
+            "input": {"graph": {}, "start": 0, "target": None},
+            "cost": {"steps": "2 * len(graph) + edges(graph)", "state_bytes": "10 * len(graph)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
         self.nodes_visited = 0
         self.edges_explored = 0
-        self.visited: Set[int] = set()
-        self.path_stack: List[int] = []
+        self._graph_ref: dict = {}
+        self.visited: set[int] = set()
+        self.visit_order: list[int] = []
+        self.path_stack: list[int] = []
 
-    def search(self, graph: Dict[int, List[int]], start: int, target: int = None) -> Generator[Step, None, None]:
+    def search(self, graph: dict[int, list[int]], start: int, target: int | None = None) -> Generator[Step, None, None]:
         """Perform DFS traversal on graph.
 
         Args:
@@ -41,21 +61,27 @@ class DFS(StepTracker):
         self.reset()
         self.nodes_visited = 0
         self.edges_explored = 0
+        # The graph is sent once per run; steps reference it
+        self._graph_ref = self.reference("graph", graph)
         self.visited = set()
+        self.visit_order = []
         self.path_stack = []
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting DFS from node {start}",
-            state={
+            description=lambda: f"Starting DFS from node {start}",
+            state=lambda: {
                 "type": "graph",
-                "graph": graph,
+                "graph": self._graph_ref,
                 "current": None,
+                "newly_visited": None,
+                "pushed": None,
+                "popped": None,
                 "visited": [],
-                "stack": [start],
+                "stack": [],
             },
-            highlights=[{"type": "node", "id": start, "color": "active"}],
-            metadata={
+            highlights=lambda: [{"nodes": [start], "color": "active"}],
+            metadata=lambda: {
                 "nodes_visited": self.nodes_visited,
                 "edges_explored": self.edges_explored,
                 "start": start,
@@ -68,18 +94,18 @@ class DFS(StepTracker):
         if target and target not in self.visited:
             yield self.emit_step(
                 operation="not_found",
-                description=f"Target {target} not reachable from {start}",
-                state={
+                description=lambda: f"Target {target} not reachable from {start}",
+                state=lambda: {
                     "type": "graph",
-                    "graph": graph,
+                    "graph": self._graph_ref,
                     "current": None,
-                    "visited": list(self.visited),
+                    "newly_visited": None,
+                    "pushed": None,
+                    "popped": None,
+                    "visited": self.visit_order.copy(),
                     "stack": [],
                 },
-                highlights=[
-                    *[{"type": "node", "id": n, "color": "visited"} for n in self.visited],
-                ],
-                metadata={
+                metadata=lambda: {
                     "nodes_visited": self.nodes_visited,
                     "edges_explored": self.edges_explored,
                     "found": False,
@@ -88,24 +114,24 @@ class DFS(StepTracker):
         elif not target:
             yield self.emit_step(
                 operation="complete",
-                description=f"DFS complete. Visited {self.nodes_visited} nodes, explored {self.edges_explored} edges",
-                state={
+                description=lambda: f"DFS complete. Visited {self.nodes_visited} nodes, explored {self.edges_explored} edges",
+                state=lambda: {
                     "type": "graph",
-                    "graph": graph,
+                    "graph": self._graph_ref,
                     "current": None,
-                    "visited": list(self.visited),
+                    "newly_visited": None,
+                    "pushed": None,
+                    "popped": None,
+                    "visited": self.visit_order.copy(),
                     "stack": [],
                 },
-                highlights=[
-                    *[{"type": "node", "id": n, "color": "visited"} for n in self.visited],
-                ],
-                metadata={
+                metadata=lambda: {
                     "nodes_visited": self.nodes_visited,
                     "edges_explored": self.edges_explored,
                 },
             )
 
-    def _dfs_recursive(self, graph: Dict[int, List[int]], current: int, target: int = None) -> Generator[Step, None, None]:
+    def _dfs_recursive(self, graph: dict[int, list[int]], current: int, target: int | None = None) -> Generator[Step, None, None]:
         """Recursive DFS helper.
 
         Args:
@@ -120,25 +146,23 @@ class DFS(StepTracker):
             return
 
         self.visited.add(current)
+        self.visit_order.append(current)
         self.path_stack.append(current)
         self.nodes_visited += 1
 
         yield self.emit_step(
             operation="visit",
-            description=f"Visiting node {current}",
-            state={
+            description=lambda: f"Visiting node {current}",
+            state=lambda: {
                 "type": "graph",
-                "graph": graph,
+                "graph": self._graph_ref,
                 "current": current,
-                "visited": list(self.visited),
-                "stack": self.path_stack.copy(),
+                "newly_visited": current,
+                "pushed": current,
+                "popped": None,
             },
-            highlights=[
-                {"type": "node", "id": current, "color": "visiting"},
-                *[{"type": "node", "id": n, "color": "visited"} for n in self.visited if n != current],
-                *[{"type": "node", "id": n, "color": "stacked"} for n in self.path_stack if n != current],
-            ],
-            metadata={
+            highlights=lambda: [{"nodes": [current], "color": "visiting"}],
+            metadata=lambda: {
                 "nodes_visited": self.nodes_visited,
                 "edges_explored": self.edges_explored,
                 "current": current,
@@ -149,21 +173,29 @@ class DFS(StepTracker):
         if target and current == target:
             yield self.emit_step(
                 operation="found",
-                description=f"Found target {target}! Path length: {len(self.path_stack) - 1}",
-                state={
+                description=lambda: f"Found target {target}! Path length: {len(self.path_stack) - 1}",
+                state=lambda: {
                     "type": "graph",
-                    "graph": graph,
+                    "graph": self._graph_ref,
                     "current": current,
-                    "visited": list(self.visited),
+                    "newly_visited": None,
+                    "pushed": None,
+                    "popped": None,
+                    "visited": self.visit_order.copy(),
                     "stack": self.path_stack.copy(),
                     "path": self.path_stack.copy(),
                 },
-                highlights=[
-                    *[{"type": "node", "id": n, "color": "path"} for n in self.path_stack],
-                    *[{"type": "edge", "from": self.path_stack[i], "to": self.path_stack[i+1], "color": "path"}
-                      for i in range(len(self.path_stack) - 1)],
+                highlights=lambda: [
+                    {
+                        "nodes": self.path_stack.copy(),
+                        "edges": [
+                            [self.path_stack[i], self.path_stack[i + 1]]
+                            for i in range(len(self.path_stack) - 1)
+                        ],
+                        "color": "path",
+                    },
                 ],
-                metadata={
+                metadata=lambda: {
                     "nodes_visited": self.nodes_visited,
                     "edges_explored": self.edges_explored,
                     "path": self.path_stack.copy(),
@@ -179,20 +211,21 @@ class DFS(StepTracker):
             if neighbor not in self.visited:
                 yield self.emit_step(
                     operation="explore",
-                    description=f"Exploring edge {current} → {neighbor}",
-                    state={
+                    description=lambda: f"Exploring edge {current} → {neighbor}",
+                    state=lambda: {
                         "type": "graph",
-                        "graph": graph,
+                        "graph": self._graph_ref,
                         "current": current,
-                        "visited": list(self.visited),
-                        "stack": self.path_stack.copy(),
+                        "newly_visited": None,
+                        "pushed": None,
+                        "popped": None,
                     },
-                    highlights=[
-                        {"type": "node", "id": current, "color": "visiting"},
-                        {"type": "node", "id": neighbor, "color": "exploring"},
-                        {"type": "edge", "from": current, "to": neighbor, "color": "exploring"},
+                    highlights=lambda: [
+                        {"nodes": [current], "color": "visiting"},
+                        {"nodes": [neighbor], "color": "exploring"},
+                        {"edges": [[current, neighbor]], "color": "exploring"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "nodes_visited": self.nodes_visited,
                         "edges_explored": self.edges_explored,
                         "exploring_edge": f"{current}→{neighbor}",
@@ -213,19 +246,17 @@ class DFS(StepTracker):
             if self.path_stack:  # Don't show backtrack from start node
                 yield self.emit_step(
                     operation="backtrack",
-                    description=f"Backtracking from node {current}",
-                    state={
+                    description=lambda: f"Backtracking from node {current}",
+                    state=lambda: {
                         "type": "graph",
-                        "graph": graph,
+                        "graph": self._graph_ref,
                         "current": self.path_stack[-1] if self.path_stack else None,
-                        "visited": list(self.visited),
-                        "stack": self.path_stack.copy(),
+                        "newly_visited": None,
+                        "pushed": None,
+                        "popped": current,
                     },
-                    highlights=[
-                        {"type": "node", "id": current, "color": "backtracked"},
-                        *[{"type": "node", "id": n, "color": "stacked"} for n in self.path_stack],
-                    ],
-                    metadata={
+                    highlights=lambda: [{"nodes": [current], "color": "backtracked"}],
+                    metadata=lambda: {
                         "nodes_visited": self.nodes_visited,
                         "edges_explored": self.edges_explored,
                         "depth": len(self.path_stack),
@@ -11,25 +11,49 @@ Key Insights:
     - Used in: GPS navigation, network routing, game pathfinding
 """
 
-from typing import Generator, Dict, List, Tuple, Set
 import heapq
-from algorithms.base import StepTracker, Step, VisualizerType
+from collections.abc import Generator
+
+from algorithms.base import Step, StepTracker, VisualizerType
 
 
 class Dijkstra(StepTracker):
-    """Dijkstra's shortest path algorithm with visualization."""
+    """Dijkstra's shortest path algorithm with visualization.
+
+    Step state holds only what the step changed: ``newly_visited`` (the node
+    settled by a visit step), ``updated`` ({node: distance} set by an init or
+    relax step), ``pushed`` (the ``[distance, node]`` entry a relax step adds
+    to the priority queue) and ``popped`` (the entries taken off it since the
+    previous step, stale ones included). Folding these over the steps gives
+    the visited set, distance table and frontier at any step; the first and
+    last steps also carry them in full (``visited`` in visit order, finite
+    ``distances``, the ``frontier`` as heap entries). The graph itself is
+    referenced (see StepTracker.reference).
+    """
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "dijkstra": {
+            "name": "Dijkstra's Algorithm",
+            "category": "graphs",
+            "entry": "shortest_path",
+            "input": {"graph": {}, "start": 0, "target": None},
+            "cost": {
+                "steps": "(len(graph) + edges(graph)) * log2(len(graph))",
+                "state_bytes": "50 * len(graph)",
+            },
+        },
+    }
 
     def __init__(self):
         super().__init__()
-        self.distances: Dict[int, float] = {}
-        self.previous: Dict[int, int | None] = {}
-        self.visited: Set[int] = set()
+        self.distances: dict[int, float] = {}
+        self.previous: dict[int, int | None] = {}
+        self.visited: set[int] = set()
 
     def shortest_path(
         self,
-        graph: Dict[int, List[Tuple[int, int]]],
+        graph: dict[int, list[tuple[int, int]]],
         start: int,
         target: int | None = None,
     ) -> Generator[Step, None, None]:
@@ -46,66 +70,68 @@ class Dijkstra(StepTracker):
         self.reset()
         self.distances = {node: float("inf") for node in graph}
         self.distances[start] = 0
-        self.previous = {node: None for node in graph}
+        self.previous = dict.fromkeys(graph)
         self.visited = set()
 
         # Priority queue: (distance, node)
         pq = [(0, start)]
+        # Entries popped since the last step (stale ones are skipped without one)
+        popped: list[list] = []
+        visit_order: list[int] = []
+        graph_ref = self.reference("graph", graph)
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting Dijkstra from node {start}",
-            state={"type": "graph", "graph": graph},
-            highlights=[{"type": "node", "id": start, "color": "active"}],
-            metadata={
+            description=lambda: f"Starting Dijkstra from node {start}",
+            state=lambda: self._summary_state(graph_ref, pq, visit_order, updated={start: 0}),
+            highlights=lambda: [{"nodes": [start], "color": "active"}],
+            metadata=lambda: {
                 "start": start,
                 "target": target,
-                "distances": dict(self.distances),
                 "queue_size": len(pq),
             },
         )
 
         while pq:
             current_dist, current = heapq.heappop(pq)
+            popped.append([current_dist, current])
 
             # Skip if already visited
             if current in self.visited:
                 continue
 
             self.visited.add(current)
+            visit_order.append(current)
 
             yield self.emit_step(
                 operation="visit",
-                description=f"Visiting node {current} (distance: {current_dist})",
-                state={"type": "graph", "graph": graph},
-                highlights=[
-                    {"type": "node", "id": current, "color": "active"},
-                    *[{"type": "node", "id": v, "color": "visited"} for v in self.visited if v != current],
-                ],
-                metadata={
+                description=lambda: f"Visiting node {current} (distance: {current_dist})",
+                state=lambda: self._state(graph_ref, newly_visited=current, popped=popped),
+                highlights=lambda: [{"nodes": [current], "color": "active"}],
+                metadata=lambda: {
                     "current": current,
                     "current_distance": current_dist,
-                    "distances": dict(self.distances),
                     "queue_size": len(pq),
                     "visited_count": len(self.visited),
                 },
             )
+            popped = []
 
             # If target found, we can stop (shortest path guaranteed)
             if target is not None and current == target:
                 path = self._reconstruct_path(start, target)
                 yield self.emit_step(
                     operation="found",
-                    description=f"Shortest path to {target}: {' → '.join(map(str, path))} (distance: {self.distances[target]})",
-                    state={"type": "graph", "graph": graph},
-                    highlights=[
-                        *[{"type": "node", "id": node, "color": "path"} for node in path],
-                        *[
-                            {"type": "edge", "id": f"{path[i]}-{path[i+1]}", "color": "path"}
-                            for i in range(len(path) - 1)
-                        ],
+                    description=lambda: f"Shortest path to {target}: {' → '.join(map(str, path))} (distance: {self.distances[target]})",
+                    state=lambda: self._summary_state(graph_ref, pq, visit_order),
+                    highlights=lambda: [
+                        {
+                            "nodes": path,
+                            "edges": [[path[i], path[i + 1]] for i in range(len(path) - 1)],
+                            "color": "path",
+                        }
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "target": target,
                         "distance": self.distances[target],
                         "path": path,
@@ -124,14 +150,13 @@ class Dijkstra(StepTracker):
 
                 yield self.emit_step(
                     operation="consider",
-                    description=f"Consider edge {current} → {neighbor} (weight: {weight})",
-                    state={"type": "graph", "graph": graph},
-                    highlights=[
-                        {"type": "node", "id": current, "color": "active"},
-                        {"type": "node", "id": neighbor, "color": "comparing"},
-                        {"type": "edge", "id": f"{current}-{neighbor}", "color": "active"},
+                    description=lambda: f"Consider edge {current} → {neighbor} (weight: {weight})",
+                    state=lambda: self._state(graph_ref),
+                    highlights=lambda: [
+                        {"nodes": [current], "edges": [[current, neighbor]], "color": "active"},
+                        {"nodes": [neighbor], "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "current": current,
                         "neighbor": neighbor,
                         "weight": weight,
@@ -147,17 +172,17 @@ class Dijkstra(StepTracker):
 
                     yield self.emit_step(
                         operation="relax",
-                        description=f"Updated distance to {neighbor}: {old_dist} → {new_dist}",
-                        state={"type": "graph", "graph": graph},
-                        highlights=[
-                            {"type": "node", "id": neighbor, "color": "active"},
-                            {"type": "edge", "id": f"{current}-{neighbor}", "color": "active"},
+                        description=lambda: f"Updated distance to {neighbor}: {old_dist} → {new_dist}",
+                        state=lambda: self._state(
+                            graph_ref, updated={neighbor: new_dist}, pushed=[new_dist, neighbor]
+                        ),
+                        highlights=lambda: [
+                            {"nodes": [neighbor], "edges": [[current, neighbor]], "color": "active"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "neighbor": neighbor,
                             "new_distance": new_dist,
                             "old_distance": old_dist if old_dist != float("inf") else None,
-                            "distances": dict(self.distances),
                         },
                     )
 
@@ -165,12 +190,9 @@ class Dijkstra(StepTracker):
         if target is not None:
             yield self.emit_step(
                 operation="not_found",
-                description=f"No path to {target}",
-                state={"type": "graph", "graph": graph},
-                highlights=[
-                    *[{"type": "node", "id": v, "color": "visited"} for v in self.visited],
-                ],
-                metadata={
+                description=lambda: f"No path to {target}",
+                state=lambda: self._summary_state(graph_ref, pq, visit_order, popped=popped),
+                metadata=lambda: {
                     "target": target,
                     "found": False,
                     "visited_count": len(self.visited),
@@ -180,19 +202,51 @@ class Dijkstra(StepTracker):
             # Show all shortest paths
             yield self.emit_step(
                 operation="complete",
-                description=f"Computed shortest paths from {start} to all reachable nodes",
-                state={"type": "graph", "graph": graph},
-                highlights=[
-                    *[{"type": "node", "id": v, "color": "visited"} for v in self.visited],
-                ],
-                metadata={
+                description=lambda: f"Computed shortest paths from {start} to all reachable nodes",
+                state=lambda: self._summary_state(graph_ref, pq, visit_order, popped=popped),
+                metadata=lambda: {
                     "start": start,
                     "distances": {k: v for k, v in self.distances.items() if v != float("inf")},
                     "visited_count": len(self.visited),
                 },
             )
 
-    def _reconstruct_path(self, start: int, target: int) -> List[int]:
+    @staticmethod
+    def _state(
+        graph_ref: dict,
+        newly_visited: int | None = None,
+        updated: dict[int, float] | None = None,
+        pushed: list | None = None,
+        popped: list[list] | None = None,
+    ) -> dict:
+        """Step state: graph reference and this step's changes."""
+        return {
+            "type": "graph",
+            "graph": graph_ref,
+            "newly_visited": newly_visited,
+            "updated": updated or {},
+            "pushed": pushed,
+            "popped": popped or [],
+        }
+
+    def _summary_state(
+        self,
+        graph_ref: dict,
+        pq: list[tuple[float, int]],
+        visit_order: list[int],
+        updated: dict[int, float] | None = None,
+        pushed: list | None = None,
+        popped: list[list] | None = None,
+    ) -> dict:
+        """State of the first and last steps: the changes plus frontier, visited nodes and distances."""
+        return {
+            **self._state(graph_ref, updated=updated, pushed=pushed, popped=popped),
+            "frontier": [[dist, node] for dist, node in pq],
+            "visited": visit_order.copy(),
+            "distances": {k: v for k, v in self.distances.items() if v != float("inf")},
+        }
+
+    def _reconstruct_path(self, start: int, target: int) -> list[int]:
         """Reconstruct shortest path from start to target."""
         path = []
         current = target
@@ -20,6 +20,15 @@ class NumIslands(StepTracker):
     """Number of Islands with grid visualization."""
 
     visualizer_type = VisualizerType.GRID
+    registrations = {
+        "num_islands": {
+            "name": "Number of Islands",
+            "category": "graphs",
+            "entry": "count_islands",
+            "input": {"grid": []},
+            "cost": {"steps": "cells(grid)", "state_bytes": "9 * cells(grid)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -41,9 +50,9 @@ class NumIslands(StepTracker):
             yield self.emit_step(
                 operation="init",
                 description="Empty grid - no islands",
-                state={"type": "grid", "grid": []},
+                state=lambda: {"type": "grid", "grid": []},
                 highlights=[],
-                metadata={"island_count": 0, "rows": 0, "cols": 0},
+                metadata=lambda: {"island_count": 0, "rows": 0, "cols": 0},
             )
             return
 
@@ -52,10 +61,10 @@ class NumIslands(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Scanning {rows}×{cols} grid for islands",
-            state={"type": "grid", "grid": [[int(cell == "1") for cell in row] for row in grid]},
+            description=lambda: f"Scanning {rows}×{cols} grid for islands",
+            state=lambda: {"type": "grid", "grid": [[int(cell == "1") for cell in row] for row in grid]},
             highlights=[],
-            metadata={"island_count": self.island_count, "rows": rows, "cols": cols},
+            metadata=lambda: {"island_count": self.island_count, "rows": rows, "cols": cols},
         )
 
         for i in range(rows):
@@ -66,13 +75,13 @@ class NumIslands(StepTracker):
 
                     yield self.emit_step(
                         operation="new_island",
-                        description=f"Found island #{self.island_count} starting at ({i}, {j})",
-                        state={
+                        description=lambda: f"Found island #{self.island_count} starting at ({i}, {j})",
+                        state=lambda: {
                             "type": "grid",
                             "grid": [[int(cell == "1") for cell in row] for row in grid],
                         },
-                        highlights=[{"type": "cell", "row": i, "col": j, "color": "active"}],
-                        metadata={
+                        highlights=lambda: [{"type": "cell", "row": i, "col": j, "color": "active"}],
+                        metadata=lambda: {
                             "island_count": self.island_count,
                             "start_pos": (i, j),
                             "operation": "new_island",
@@ -89,12 +98,12 @@ class NumIslands(StepTracker):
 
                         yield self.emit_step(
                             operation="explore",
-                            description=f"Exploring cell ({r}, {c}) of island #{self.island_count}",
-                            state={
+                            description=lambda: f"Exploring cell ({r}, {c}) of island #{self.island_count}",
+                            state=lambda: {
                                 "type": "grid",
                                 "grid": [[int(cell == "1") for cell in row] for row in grid],
                             },
-                            highlights=[
+                            highlights=lambda: [
                                 {"type": "cell", "row": r, "col": c, "color": "active"},
                                 *[
                                     {"type": "cell", "row": cr, "col": cc, "color": "visited"}
@@ -102,7 +111,7 @@ class NumIslands(StepTracker):
                                     if (cr, cc) != (r, c)
                                 ],
                             ],
-                            metadata={
+                            metadata=lambda: {
                                 "island_count": self.island_count,
                                 "current_pos": (r, c),
                                 "island_size": len(island_cells),
@@ -125,16 +134,16 @@ class NumIslands(StepTracker):
 
                     yield self.emit_step(
                         operation="island_complete",
-                        description=f"Island #{self.island_count} complete - {len(island_cells)} cells",
-                        state={
+                        description=lambda: f"Island #{self.island_count} complete - {len(island_cells)} cells",
+                        state=lambda: {
                             "type": "grid",
                             "grid": [[int(cell == "1") for cell in row] for row in grid],
                         },
-                        highlights=[
+                        highlights=lambda: [
                             {"type": "cell", "row": r, "col": c, "color": "sorted"}
                             for r, c in island_cells
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "island_count": self.island_count,
                             "island_size": len(island_cells),
                             "island_cells": island_cells,
@@ -143,10 +152,10 @@ class NumIslands(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Found {self.island_count} island{'s' if self.island_count != 1 else ''}",
-            state={"type": "grid", "grid": [[int(cell == "1") for cell in row] for row in grid]},
+            description=lambda: f"Found {self.island_count} island{'s' if self.island_count != 1 else ''}",
+            state=lambda: {"type": "grid", "grid": [[int(cell == "1") for cell in row] for row in grid]},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "island_count": self.island_count,
                 "total_cells": rows * cols,
                 "land_cells": sum(row.count("1") for row in grid),
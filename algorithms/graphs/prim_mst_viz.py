@@ -44,6 +44,14 @@ class PrimMST(StepTracker):
     """Build a minimum spanning tree with Prim's algorithm, emitting steps."""
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "prim_mst": {
+            "name": "Prim's Minimum Spanning Tree",
+            "category": "graphs",
+            "entry": "run",
+            "cost": {"steps": "len(graph) + edges(graph)", "state_bytes": "220 * len(graph)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -124,9 +132,9 @@ class PrimMST(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty graph - no minimum spanning tree to build.",
-                state={"type": "graph", "graph": graph, "current": None},
+                state=lambda: {"type": "graph", "graph": graph, "current": None},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "mst_weight": 0,
                     "edges_in_mst": 0,
                     "tree_nodes": [],
@@ -178,12 +186,12 @@ class PrimMST(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Start Prim's from node {start}. The tree holds just {{{start}}}; "
+                lambda: f"Start Prim's from node {start}. The tree holds just {{{start}}}; "
                 "grow it by repeatedly pulling in the cheapest edge that crosses "
                 "the cut between the tree and the rest of the graph."
             ),
-            state={"type": "graph", "graph": graph, "current": start},
-            highlights=[
+            state=lambda: {"type": "graph", "graph": graph, "current": start},
+            highlights=lambda: [
                 {"type": "node", "id": start, "color": "active"},
                 *[
                     {"type": "edge", "id": f"{u}-{v}", "color": "active"}
@@ -191,7 +199,7 @@ class PrimMST(StepTracker):
                 ],
                 *[{"type": "node", "id": v, "color": "comparing"} for v in frontier_nodes()],
             ],
-            metadata={
+            metadata=lambda: {
                 "start": start,
                 "current": start,
                 "mst_weight": 0,
@@ -214,11 +222,11 @@ class PrimMST(StepTracker):
                 yield self.emit_step(
                     operation="skip",
                     description=(
-                        f"Cheapest crossing edge {u}-{v} (weight {weight}) is stale - "
+                        lambda: f"Cheapest crossing edge {u}-{v} (weight {weight}) is stale - "
                         f"node {v} is already in the tree. Discard it and pop the next."
                     ),
-                    state={"type": "graph", "graph": graph, "current": u},
-                    highlights=[
+                    state=lambda: {"type": "graph", "graph": graph, "current": u},
+                    highlights=lambda: [
                         *[{"type": "node", "id": n, "color": "visited"} for n in in_tree],
                         *[
                             {"type": "edge", "id": f"{a}-{b}", "color": "path"}
@@ -233,7 +241,7 @@ class PrimMST(StepTracker):
                             for c in frontier_nodes()
                         ],
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "skipped_edge": [u, v, weight],
                         "current": u,
                         "mst_weight": self.mst_weight,
@@ -256,12 +264,12 @@ class PrimMST(StepTracker):
             yield self.emit_step(
                 operation="add_edge",
                 description=(
-                    f"Add cheapest crossing edge {u}-{v} (weight {weight}) to the MST "
+                    lambda: f"Add cheapest crossing edge {u}-{v} (weight {weight}) to the MST "
                     f"and absorb node {v}. Tree now spans {len(in_tree)} node(s); "
                     f"total weight {self.mst_weight}."
                 ),
-                state={"type": "graph", "graph": graph, "current": v},
-                highlights=[
+                state=lambda: {"type": "graph", "graph": graph, "current": v},
+                highlights=lambda: [
                     *[{"type": "node", "id": n, "color": "visited"} for n in in_tree if n != v],
                     {"type": "node", "id": v, "color": "active"},
                     *[{"type": "edge", "id": f"{a}-{b}", "color": "path"} for a, b, _ in mst_edges],
@@ -271,7 +279,7 @@ class PrimMST(StepTracker):
                     ],
                     *[{"type": "node", "id": c, "color": "comparing"} for c in frontier_nodes()],
                 ],
-                metadata={
+                metadata=lambda: {
                     "chosen_edge": [u, v, weight],
                     "current": v,
                     "mst_weight": self.mst_weight,
@@ -301,12 +309,12 @@ class PrimMST(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=description,
-            state={"type": "graph", "graph": graph, "current": None},
-            highlights=[
+            state=lambda: {"type": "graph", "graph": graph, "current": None},
+            highlights=lambda: [
                 *[{"type": "node", "id": n, "color": "visited"} for n in in_tree],
                 *[{"type": "edge", "id": f"{a}-{b}", "color": "path"} for a, b, _ in mst_edges],
             ],
-            metadata={
+            metadata=lambda: {
                 "mst_weight": self.mst_weight,
                 "edges_in_mst": len(mst_edges),
                 "tree_nodes": sorted(in_tree),
@@ -158,6 +158,21 @@ class TestBFSStepGeneration:
         assert set(visit_order[1:3]) == {1, 2}  # Level 1
         assert set(visit_order[3:5]) == {3, 4}  # Level 2
 
+    def test_queue_changes_fold_to_queue(self, searcher):
+        """Test that per-step enqueues and dequeues rebuild the queue."""
+        graph = {0: [1, 2], 1: [3, 4], 2: [4], 3: [], 4: []}
+        steps = list(searcher.search(graph, start=0, target=3))
+
+        queue = steps[0].state["queue"]
+        for step in steps[1:-1]:
+            assert "queue" not in step.state
+            if step.state["dequeued"] is not None:
+                assert queue.pop(0) == step.state["dequeued"]
+            if step.state["enqueued"] is not None:
+                queue.append(step.state["enqueued"])
+
+        assert queue == steps[-1].state["queue"] == [4]
+
 
 class TestBFSMetadata:
     """Test metadata tracking."""
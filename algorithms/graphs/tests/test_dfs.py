@@ -128,7 +128,7 @@ class TestDFSStepGeneration:
 
         init_step = steps[0]
         assert init_step.operation == "init"
-        assert init_step.state["stack"] == [0]
+        assert init_step.state["stack"] == []  # the start node is pushed by its visit
         assert init_step.state["visited"] == []
 
     def test_visit_order_is_depth_first(self, searcher):
@@ -331,6 +331,21 @@ class TestDFSBacktracking:
         found_step = [s for s in steps if s.operation == "found"][0]
         assert found_step.state["stack"] == [0, 1, 2]
 
+    def test_stack_changes_fold_to_stack(self, searcher):
+        """Test that per-step pushes and pops rebuild the stack."""
+        graph = {0: [1, 3], 1: [2], 2: [], 3: [4], 4: []}
+        steps = list(searcher.search(graph, start=0, target=4))
+
+        stack = steps[0].state["stack"]
+        for step in steps[1:-1]:
+            assert "stack" not in step.state
+            if step.state["pushed"] is not None:
+                stack.append(step.state["pushed"])
+            if step.state["popped"] is not None:
+                assert stack.pop() == step.state["popped"]
+
+        assert stack == steps[-1].state["stack"] == [0, 3, 4]
+
 
 class TestDFSPathReconstruction:
     """Test path reconstruction."""
@@ -36,6 +36,14 @@ class TopologicalSort(StepTracker):
     """Topological Sort via Kahn's algorithm with step-by-step visualization."""
 
     visualizer_type = VisualizerType.GRAPH
+    registrations = {
+        "topological_sort": {
+            "name": "Topological Sort (Kahn's)",
+            "category": "graphs",
+            "entry": "run",
+            "cost": {"steps": "len(graph) + edges(graph)", "state_bytes": "75 * len(graph)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -107,10 +115,10 @@ class TopologicalSort(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                "Computed in-degrees for all "
+                lambda: "Computed in-degrees for all "
                 f"{len(nodes)} nodes. Nodes with in-degree 0 are ready to place."
             ),
-            state={
+            state=lambda: {
                 "type": "graph",
                 "graph": graph,
                 "current": None,
@@ -118,10 +126,10 @@ class TopologicalSort(StepTracker):
                 "in_degree": dict(in_degree),
                 "queue": [n for n in nodes if in_degree[n] == 0],
             },
-            highlights=[
+            highlights=lambda: [
                 {"type": "node", "id": n, "color": "exploring"} for n in nodes if in_degree[n] == 0
             ],
-            metadata={
+            metadata=lambda: {
                 "in_degree": dict(in_degree),
                 "order": [],
                 "nodes_placed": self.nodes_placed,
@@ -141,10 +149,10 @@ class TopologicalSort(StepTracker):
             yield self.emit_step(
                 operation="place",
                 description=(
-                    f"Node {current} has in-degree 0 - remove it and append to the "
+                    lambda: f"Node {current} has in-degree 0 - remove it and append to the "
                     f"order (position {len(order)})."
                 ),
-                state={
+                state=lambda: {
                     "type": "graph",
                     "graph": graph,
                     "current": current,
@@ -152,12 +160,12 @@ class TopologicalSort(StepTracker):
                     "in_degree": dict(in_degree),
                     "queue": list(queue),
                 },
-                highlights=[
+                highlights=lambda: [
                     {"type": "node", "id": current, "color": "active"},
                     *[{"type": "node", "id": n, "color": "visited"} for n in order if n != current],
                     *[{"type": "node", "id": n, "color": "exploring"} for n in queue],
                 ],
-                metadata={
+                metadata=lambda: {
                     "current": current,
                     "in_degree": dict(in_degree),
                     "order": order.copy(),
@@ -180,11 +188,11 @@ class TopologicalSort(StepTracker):
                 yield self.emit_step(
                     operation="relax",
                     description=(
-                        f"Edge {current} -> {neighbor}: decrement in-degree of "
+                        lambda: f"Edge {current} -> {neighbor}: decrement in-degree of "
                         f"{neighbor} to {in_degree[neighbor]}"
                         + (" (now ready to place)." if became_ready else ".")
                     ),
-                    state={
+                    state=lambda: {
                         "type": "graph",
                         "graph": graph,
                         "current": current,
@@ -192,7 +200,7 @@ class TopologicalSort(StepTracker):
                         "in_degree": dict(in_degree),
                         "queue": list(queue),
                     },
-                    highlights=[
+                    highlights=lambda: [
                         {"type": "node", "id": current, "color": "active"},
                         {"type": "node", "id": neighbor, "color": "exploring"},
                         {"type": "edge", "from": current, "to": neighbor, "color": "active"},
@@ -202,7 +210,7 @@ class TopologicalSort(StepTracker):
                             if n != current
                         ],
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "current": current,
                         "neighbor": neighbor,
                         "in_degree": dict(in_degree),
@@ -221,10 +229,10 @@ class TopologicalSort(StepTracker):
             yield self.emit_step(
                 operation="cycle",
                 description=(
-                    f"Cycle detected! Only placed {len(order)} of {len(nodes)} nodes. "
+                    lambda: f"Cycle detected! Only placed {len(order)} of {len(nodes)} nodes. "
                     f"Nodes {remaining} are stuck with non-zero in-degree - a DAG is required."
                 ),
-                state={
+                state=lambda: {
                     "type": "graph",
                     "graph": graph,
                     "current": None,
@@ -232,11 +240,11 @@ class TopologicalSort(StepTracker):
                     "in_degree": dict(in_degree),
                     "queue": [],
                 },
-                highlights=[
+                highlights=lambda: [
                     *[{"type": "node", "id": n, "color": "visited"} for n in order],
                     *[{"type": "node", "id": n, "color": "comparing"} for n in remaining],
                 ],
-                metadata={
+                metadata=lambda: {
                     "order": order.copy(),
                     "remaining": remaining,
                     "nodes_placed": self.nodes_placed,
@@ -250,9 +258,9 @@ class TopologicalSort(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                "Topological sort complete. A valid ordering: " + " -> ".join(str(n) for n in order)
+                lambda: "Topological sort complete. A valid ordering: " + " -> ".join(str(n) for n in order)
             ),
-            state={
+            state=lambda: {
                 "type": "graph",
                 "graph": graph,
                 "current": None,
@@ -260,8 +268,8 @@ class TopologicalSort(StepTracker):
                 "in_degree": dict(in_degree),
                 "queue": [],
             },
-            highlights=[{"type": "node", "id": n, "color": "found"} for n in order],
-            metadata={
+            highlights=lambda: [{"type": "node", "id": n, "color": "found"} for n in order],
+            metadata=lambda: {
                 "order": order.copy(),
                 "nodes_placed": self.nodes_placed,
                 "total_nodes": len(nodes),
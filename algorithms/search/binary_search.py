@@ -19,6 +19,15 @@ class BinarySearch(StepTracker):
     """Binary Search implementation with visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "binary_search": {
+            "name": "Binary Search",
+            "category": "search",
+            "entry": "search",
+            "input": {"array": [], "target": 0},
+            "cost": {"steps": "2 * log2(len(array)) + 2", "state_bytes": "6 * len(array)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -40,10 +49,10 @@ class BinarySearch(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Searching for {target} in sorted array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Searching for {target} in sorted array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
             },
@@ -58,13 +67,13 @@ class BinarySearch(StepTracker):
 
             yield self.emit_step(
                 operation="check_mid",
-                description=f"Checking middle element arr[{mid}] = {arr[mid]}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Checking middle element arr[{mid}] = {arr[mid]}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": [mid], "color": "active"},
                     {"indices": list(range(left, right + 1)), "color": "comparing"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "target": target,
                     "left": left,
@@ -77,12 +86,12 @@ class BinarySearch(StepTracker):
             if arr[mid] == target:
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found {target} at index {mid}!",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Found {target} at index {mid}!",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [mid], "color": "sorted"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "found_index": mid,
@@ -93,12 +102,12 @@ class BinarySearch(StepTracker):
             elif arr[mid] < target:
                 yield self.emit_step(
                     operation="search_right",
-                    description=f"{arr[mid]} < {target}, search right half",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"{arr[mid]} < {target}, search right half",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": list(range(mid + 1, right + 1)), "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "eliminated": f"[{left}..{mid}]",
@@ -109,12 +118,12 @@ class BinarySearch(StepTracker):
             else:
                 yield self.emit_step(
                     operation="search_left",
-                    description=f"{arr[mid]} > {target}, search left half",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"{arr[mid]} > {target}, search left half",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": list(range(left, mid)), "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "eliminated": f"[{mid}..{right}]",
@@ -124,10 +133,10 @@ class BinarySearch(StepTracker):
 
         yield self.emit_step(
             operation="not_found",
-            description=f"{target} not found in array",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"{target} not found in array",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
                 "found": False,
@@ -35,6 +35,14 @@ class ExponentialSearch(StepTracker):
     """Exponential Search with step-by-step visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "exponential_search": {
+            "name": "Exponential Search",
+            "category": "searching",
+            "entry": "run",
+            "cost": {"steps": "2 * log2(len(array)) + 2", "state_bytes": "6 * len(array)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -62,12 +70,12 @@ class ExponentialSearch(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Searching for {target} in a sorted array of {n} "
+                lambda: f"Searching for {target} in a sorted array of {n} "
                 f"element{'s' if n != 1 else ''} using exponential search"
             ),
-            state={"type": "array", "values": arr.copy()},
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "phase": "expand",
                 "comparisons": self.comparisons,
                 "target": target,
@@ -79,10 +87,10 @@ class ExponentialSearch(StepTracker):
         if n == 0:
             yield self.emit_step(
                 operation="not_found",
-                description=f"Array is empty, {target} cannot be found (result is -1)",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"Array is empty, {target} cannot be found (result is -1)",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "phase": "expand",
                     "comparisons": self.comparisons,
                     "target": target,
@@ -97,10 +105,10 @@ class ExponentialSearch(StepTracker):
         self.comparisons += 1
         yield self.emit_step(
             operation="probe",
-            description=f"Check arr[0] = {arr[0]} against target {target}",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": [0], "color": "active"}],
-            metadata={
+            description=lambda: f"Check arr[0] = {arr[0]} against target {target}",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": [0], "color": "active"}],
+            metadata=lambda: {
                 "phase": "expand",
                 "comparisons": self.comparisons,
                 "target": target,
@@ -112,10 +120,10 @@ class ExponentialSearch(StepTracker):
             found_index = 0
             yield self.emit_step(
                 operation="found",
-                description=f"Found {target} at index 0!",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[{"indices": [0], "color": "sorted"}],
-                metadata={
+                description=lambda: f"Found {target} at index 0!",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [{"indices": [0], "color": "sorted"}],
+                metadata=lambda: {
                     "phase": "expand",
                     "comparisons": self.comparisons,
                     "target": target,
@@ -133,14 +141,14 @@ class ExponentialSearch(StepTracker):
             yield self.emit_step(
                 operation="probe",
                 description=(
-                    f"arr[{bound}] = {arr[bound]} < {target}; double the bound to {bound * 2}"
+                    lambda: f"arr[{bound}] = {arr[bound]} < {target}; double the bound to {bound * 2}"
                 ),
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": list(range(0, bound + 1)), "color": "comparing"},
                     {"indices": [bound], "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "phase": "expand",
                     "comparisons": self.comparisons,
                     "target": target,
@@ -160,15 +168,15 @@ class ExponentialSearch(StepTracker):
         yield self.emit_step(
             operation="range_found",
             description=(
-                f"Range located: target must lie in window [{lo}..{hi}] "
+                lambda: f"Range located: target must lie in window [{lo}..{hi}] "
                 f"(values {arr[lo]}..{arr[hi]}); binary search here"
             ),
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {"indices": list(range(lo, hi + 1)), "color": "comparing"},
                 {"indices": [hi], "color": "active"},
             ],
-            metadata={
+            metadata=lambda: {
                 "phase": "binary",
                 "comparisons": self.comparisons,
                 "target": target,
@@ -186,15 +194,15 @@ class ExponentialSearch(StepTracker):
             yield self.emit_step(
                 operation="check_mid",
                 description=(
-                    f"Binary search: check middle arr[{mid}] = {arr[mid]} "
+                    lambda: f"Binary search: check middle arr[{mid}] = {arr[mid]} "
                     f"within window [{lo}..{hi}]"
                 ),
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": list(range(lo, hi + 1)), "color": "comparing"},
                     {"indices": [mid], "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "phase": "binary",
                     "comparisons": self.comparisons,
                     "target": target,
@@ -209,10 +217,10 @@ class ExponentialSearch(StepTracker):
                 found_index = mid
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found {target} at index {mid}!",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[{"indices": [mid], "color": "sorted"}],
-                    metadata={
+                    description=lambda: f"Found {target} at index {mid}!",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [{"indices": [mid], "color": "sorted"}],
+                    metadata=lambda: {
                         "phase": "binary",
                         "comparisons": self.comparisons,
                         "target": target,
@@ -224,12 +232,12 @@ class ExponentialSearch(StepTracker):
             if arr[mid] < target:
                 yield self.emit_step(
                     operation="search_right",
-                    description=f"{arr[mid]} < {target}, search right half",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"{arr[mid]} < {target}, search right half",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": list(range(mid + 1, hi + 1)), "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "phase": "binary",
                         "comparisons": self.comparisons,
                         "target": target,
@@ -242,12 +250,12 @@ class ExponentialSearch(StepTracker):
             else:
                 yield self.emit_step(
                     operation="search_left",
-                    description=f"{arr[mid]} > {target}, search left half",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"{arr[mid]} > {target}, search left half",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": list(range(lo, mid)), "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "phase": "binary",
                         "comparisons": self.comparisons,
                         "target": target,
@@ -261,10 +269,10 @@ class ExponentialSearch(StepTracker):
         if found_index == -1:
             yield self.emit_step(
                 operation="not_found",
-                description=f"{target} is not present in the array (returned -1)",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"{target} is not present in the array (returned -1)",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "phase": "binary",
                     "comparisons": self.comparisons,
                     "target": target,
@@ -279,15 +287,15 @@ class ExponentialSearch(StepTracker):
         return self.emit_step(
             operation="complete",
             description=(
-                f"Search complete: {target} found at index {found_index}"
+                lambda: f"Search complete: {target} found at index {found_index}"
                 if found_index != -1
                 else f"Search complete: {target} not found, result is -1"
             ),
-            state={"type": "array", "values": arr.copy()},
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=(
-                [{"indices": [found_index], "color": "sorted"}] if found_index != -1 else []
+                lambda: [{"indices": [found_index], "color": "sorted"}] if found_index != -1 else []
             ),
-            metadata={
+            metadata=lambda: {
                 "phase": "binary",
                 "comparisons": self.comparisons,
                 "target": target,
@@ -19,6 +19,15 @@ class LinearSearch(StepTracker):
     """Linear Search implementation with visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "linear_search": {
+            "name": "Linear Search",
+            "category": "search",
+            "entry": "search",
+            "input": {"array": [], "target": 0},
+            "cost": {"steps": "len(array) + 2", "state_bytes": "7 * len(array)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -40,10 +49,10 @@ class LinearSearch(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Searching for {target} in array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Searching for {target} in array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
             },
@@ -54,13 +63,13 @@ class LinearSearch(StepTracker):
 
             yield self.emit_step(
                 operation="compare",
-                description=f"Checking arr[{i}] = {arr[i]}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Checking arr[{i}] = {arr[i]}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": [i], "color": "comparing"},
                     {"indices": list(range(i)), "color": "visited"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "target": target,
                     "current_index": i,
@@ -71,12 +80,12 @@ class LinearSearch(StepTracker):
             if arr[i] == target:
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found {target} at index {i}!",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Found {target} at index {i}!",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [i], "color": "sorted"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "found_index": i,
@@ -86,12 +95,12 @@ class LinearSearch(StepTracker):
 
         yield self.emit_step(
             operation="not_found",
-            description=f"{target} not found in array",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            description=lambda: f"{target} not found in array",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {"indices": list(range(n)), "color": "visited"},
             ],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
                 "found": False,
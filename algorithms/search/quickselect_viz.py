@@ -41,6 +41,14 @@ class QuickSelect(StepTracker):
     """Quickselect (k-th smallest) with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "quickselect": {
+            "name": "Quickselect (Kth Smallest)",
+            "category": "searching",
+            "entry": "run",
+            "cost": {"steps": "6 * len(array)", "state_bytes": "6 * len(array)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -76,9 +84,9 @@ class QuickSelect(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty array - there is no k-th smallest element.",
-                state={"type": "array", "values": []},
+                state=lambda: {"type": "array", "values": []},
                 highlights=[],
-                metadata={"k": k, "pivot": None, "comparisons": self.comparisons},
+                metadata=lambda: {"k": k, "pivot": None, "comparisons": self.comparisons},
             )
             return
 
@@ -86,12 +94,12 @@ class QuickSelect(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description=(
-                    f"k = {k} is out of range for an array of {n} elements "
+                    lambda: f"k = {k} is out of range for an array of {n} elements "
                     f"(k must satisfy 1 <= k <= {n})."
                 ),
-                state={"type": "array", "values": arr.copy()},
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=[],
-                metadata={"k": k, "pivot": None, "comparisons": self.comparisons},
+                metadata=lambda: {"k": k, "pivot": None, "comparisons": self.comparisons},
             )
             return
 
@@ -100,12 +108,12 @@ class QuickSelect(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Find the {self._ordinal(k)} smallest of {n} elements "
+                lambda: f"Find the {self._ordinal(k)} smallest of {n} elements "
                 f"(target rank {target} once the array is partially ordered)."
             ),
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": list(range(n)), "color": "comparing"}],
-            metadata={
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "comparing"}],
+            metadata=lambda: {
                 "k": k,
                 "target_rank": target,
                 "pivot": None,
@@ -124,12 +132,12 @@ class QuickSelect(StepTracker):
                 yield self.emit_step(
                     operation="found",
                     description=(
-                        f"Search window narrowed to one element: "
+                        lambda: f"Search window narrowed to one element: "
                         f"the {self._ordinal(k)} smallest is {arr[lo]} (index {lo})."
                     ),
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[{"indices": [lo], "color": "swapped"}],
-                    metadata={
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [{"indices": [lo], "color": "swapped"}],
+                    metadata=lambda: {
                         "k": k,
                         "target_rank": target,
                         "pivot": arr[lo],
@@ -151,12 +159,12 @@ class QuickSelect(StepTracker):
                 yield self.emit_step(
                     operation="found",
                     description=(
-                        f"Pivot {arr[p]} landed on target rank {target} - "
+                        lambda: f"Pivot {arr[p]} landed on target rank {target} - "
                         f"the {self._ordinal(k)} smallest element is {arr[p]}."
                     ),
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[{"indices": [p], "color": "swapped"}],
-                    metadata={
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [{"indices": [p], "color": "swapped"}],
+                    metadata=lambda: {
                         "k": k,
                         "target_rank": target,
                         "pivot": arr[p],
@@ -175,16 +183,16 @@ class QuickSelect(StepTracker):
                 yield self.emit_step(
                     operation="recurse_left",
                     description=(
-                        f"Pivot at index {p} > target {target}: the "
+                        lambda: f"Pivot at index {p} > target {target}: the "
                         f"{self._ordinal(k)} smallest is to the LEFT. "
                         f"Discard indices [{p}..{hi}], search [{lo}..{new_hi}]."
                     ),
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [p], "color": "active"},
                         {"indices": list(range(lo, new_hi + 1)), "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "k": k,
                         "target_rank": target,
                         "pivot": arr[p],
@@ -201,16 +209,16 @@ class QuickSelect(StepTracker):
                 yield self.emit_step(
                     operation="recurse_right",
                     description=(
-                        f"Pivot at index {p} < target {target}: the "
+                        lambda: f"Pivot at index {p} < target {target}: the "
                         f"{self._ordinal(k)} smallest is to the RIGHT. "
                         f"Discard indices [{lo}..{p}], search [{new_lo}..{hi}]."
                     ),
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [p], "color": "active"},
                         {"indices": list(range(new_lo, hi + 1)), "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "k": k,
                         "target_rank": target,
                         "pivot": arr[p],
@@ -226,13 +234,13 @@ class QuickSelect(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done! The {self._ordinal(k)} smallest element is {result} "
+                lambda: f"Done! The {self._ordinal(k)} smallest element is {result} "
                 f"({self.comparisons} comparisons, {self.swaps} swaps). "
                 f"The array is only partially ordered around rank {target}."
             ),
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": [target], "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": [target], "color": "sorted"}],
+            metadata=lambda: {
                 "k": k,
                 "target_rank": target,
                 "pivot": result,
@@ -269,15 +277,15 @@ class QuickSelect(StepTracker):
         yield self.emit_step(
             operation="select_pivot",
             description=(
-                f"Partition window [{low}..{high}]: choose pivot {pivot} "
+                lambda: f"Partition window [{low}..{high}]: choose pivot {pivot} "
                 f"(index {high}, the last element of the window)."
             ),
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {"indices": [high], "color": "active"},
                 {"indices": list(range(low, high + 1)), "color": "comparing"},
             ],
-            metadata={
+            metadata=lambda: {
                 "k": k,
                 "target_rank": target,
                 "pivot": pivot,
@@ -303,10 +311,10 @@ class QuickSelect(StepTracker):
 
             yield self.emit_step(
                 operation="compare",
-                description=f"Comparing {arr[j]} with pivot {pivot}.",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"Comparing {arr[j]} with pivot {pivot}.",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=highlights_list,
-                metadata={
+                metadata=lambda: {
                     "k": k,
                     "target_rank": target,
                     "pivot": pivot,
@@ -325,15 +333,15 @@ class QuickSelect(StepTracker):
                     yield self.emit_step(
                         operation="swap",
                         description=(
-                            f"{arr[i]} <= pivot {pivot}: swap it into the left "
+                            lambda: f"{arr[i]} <= pivot {pivot}: swap it into the left "
                             f"region (indices {i} and {j})."
                         ),
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {"indices": [i, j], "color": "swapped"},
                             {"indices": [high], "color": "active"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "k": k,
                             "target_rank": target,
                             "pivot": pivot,
@@ -353,13 +361,13 @@ class QuickSelect(StepTracker):
         yield self.emit_step(
             operation="pivot_placed",
             description=(
-                f"Pivot {pivot} settles at index {pivot_final} - its FINAL "
+                lambda: f"Pivot {pivot} settles at index {pivot_final} - its FINAL "
                 f"sorted position, so it is the {self._ordinal(pivot_final + 1)} "
                 f"smallest overall."
             ),
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": [pivot_final], "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": [pivot_final], "color": "sorted"}],
+            metadata=lambda: {
                 "k": k,
                 "target_rank": target,
                 "pivot": pivot,
@@ -29,6 +29,14 @@ class RotatedArraySearch(StepTracker):
     """Search in Rotated Sorted Array with step-by-step visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "rotated_search": {
+            "name": "Search in Rotated Sorted Array",
+            "category": "searching",
+            "entry": "run",
+            "cost": {"steps": "2 * log2(len(array)) + 2", "state_bytes": "6 * len(array)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -56,12 +64,12 @@ class RotatedArraySearch(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Searching for {target} in a rotated sorted array of {n} "
+                lambda: f"Searching for {target} in a rotated sorted array of {n} "
                 f"element{'s' if n != 1 else ''}"
             ),
-            state={"type": "array", "values": arr.copy()},
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
             },
@@ -77,14 +85,14 @@ class RotatedArraySearch(StepTracker):
 
             yield self.emit_step(
                 operation="check_mid",
-                description=(f"Inspect middle arr[{mid}] = {arr[mid]} within window [{lo}..{hi}]"),
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=(lambda: f"Inspect middle arr[{mid}] = {arr[mid]} within window [{lo}..{hi}]"),
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": [lo], "color": "comparing"},
                     {"indices": [mid], "color": "active"},
                     {"indices": [hi], "color": "comparing"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "target": target,
                     "lo": lo,
@@ -100,12 +108,12 @@ class RotatedArraySearch(StepTracker):
                 found_index = mid
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found {target} at index {mid}!",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Found {target} at index {mid}!",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [mid], "color": "sorted"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "found_index": mid,
@@ -120,14 +128,14 @@ class RotatedArraySearch(StepTracker):
                     yield self.emit_step(
                         operation="search_left",
                         description=(
-                            f"Left half [{lo}..{mid}] is sorted and "
+                            lambda: f"Left half [{lo}..{mid}] is sorted and "
                             f"{arr[lo]} <= {target} < {arr[mid]}; search left"
                         ),
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {"indices": list(range(lo, mid)), "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "target": target,
                             "sorted_half": "left",
@@ -139,14 +147,14 @@ class RotatedArraySearch(StepTracker):
                     yield self.emit_step(
                         operation="search_right",
                         description=(
-                            f"Left half [{lo}..{mid}] is sorted but {target} "
+                            lambda: f"Left half [{lo}..{mid}] is sorted but {target} "
                             f"is outside [{arr[lo]}, {arr[mid]}); search right"
                         ),
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {"indices": list(range(mid + 1, hi + 1)), "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "target": target,
                             "sorted_half": "left",
@@ -160,14 +168,14 @@ class RotatedArraySearch(StepTracker):
                     yield self.emit_step(
                         operation="search_right",
                         description=(
-                            f"Right half [{mid}..{hi}] is sorted and "
+                            lambda: f"Right half [{mid}..{hi}] is sorted and "
                             f"{arr[mid]} < {target} <= {arr[hi]}; search right"
                         ),
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {"indices": list(range(mid + 1, hi + 1)), "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "target": target,
                             "sorted_half": "right",
@@ -179,14 +187,14 @@ class RotatedArraySearch(StepTracker):
                     yield self.emit_step(
                         operation="search_left",
                         description=(
-                            f"Right half [{mid}..{hi}] is sorted but {target} "
+                            lambda: f"Right half [{mid}..{hi}] is sorted but {target} "
                             f"is outside ({arr[mid]}, {arr[hi]}]; search left"
                         ),
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {"indices": list(range(lo, mid)), "color": "comparing"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "target": target,
                             "sorted_half": "right",
@@ -198,10 +206,10 @@ class RotatedArraySearch(StepTracker):
         if found_index == -1:
             yield self.emit_step(
                 operation="not_found",
-                description=f"{target} is not present in the array (returned -1)",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"{target} is not present in the array (returned -1)",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "target": target,
                     "found": False,
@@ -211,15 +219,15 @@ class RotatedArraySearch(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Search complete: {target} found at index {found_index}"
+                lambda: f"Search complete: {target} found at index {found_index}"
                 if found_index != -1
                 else f"Search complete: {target} not found, result is -1"
             ),
-            state={"type": "array", "values": arr.copy()},
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=(
-                [{"indices": [found_index], "color": "sorted"}] if found_index != -1 else []
+                lambda: [{"indices": [found_index], "color": "sorted"}] if found_index != -1 else []
             ),
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
                 "result_index": found_index,
@@ -34,6 +34,14 @@ class TernarySearch(StepTracker):
     """Ternary Search on a sorted array with step-by-step visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "ternary_search": {
+            "name": "Ternary Search",
+            "category": "searching",
+            "entry": "run",
+            "cost": {"steps": "2 * log2(len(array)) + 2", "state_bytes": "6 * len(array)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -61,12 +69,12 @@ class TernarySearch(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Searching for {target} in a sorted array of {n} "
+                lambda: f"Searching for {target} in a sorted array of {n} "
                 f"element{'s' if n != 1 else ''} by splitting into thirds"
             ),
-            state={"type": "array", "values": arr.copy()},
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
             },
@@ -86,16 +94,16 @@ class TernarySearch(StepTracker):
             yield self.emit_step(
                 operation="check_thirds",
                 description=(
-                    f"Split window [{lo}..{hi}] into thirds: "
+                    lambda: f"Split window [{lo}..{hi}] into thirds: "
                     f"arr[{mid1}] = {arr[mid1]}, arr[{mid2}] = {arr[mid2]}"
                 ),
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": list(range(lo, hi + 1)), "color": "comparing"},
                     {"indices": [mid1], "color": "active"},
                     {"indices": [mid2], "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "target": target,
                     "lo": lo,
@@ -111,12 +119,12 @@ class TernarySearch(StepTracker):
                 found_index = mid1
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found {target} at index {mid1} (first split point)!",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Found {target} at index {mid1} (first split point)!",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [mid1], "color": "sorted"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "found_index": mid1,
@@ -128,12 +136,12 @@ class TernarySearch(StepTracker):
                 found_index = mid2
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found {target} at index {mid2} (second split point)!",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Found {target} at index {mid2} (second split point)!",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [mid2], "color": "sorted"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "found_index": mid2,
@@ -147,16 +155,16 @@ class TernarySearch(StepTracker):
                 yield self.emit_step(
                     operation="search_first_third",
                     description=(
-                        f"{target} < {arr[mid1]}: keep the first third "
+                        lambda: f"{target} < {arr[mid1]}: keep the first third "
                         f"[{new_lo}..{new_hi}], discard the rest"
                     ),
-                    state={"type": "array", "values": arr.copy()},
+                    state=lambda: {"type": "array", "values": arr.copy()},
                     highlights=(
-                        [{"indices": list(range(new_lo, new_hi + 1)), "color": "comparing"}]
+                        lambda: [{"indices": list(range(new_lo, new_hi + 1)), "color": "comparing"}]
                         if new_lo <= new_hi
                         else []
                     ),
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "surviving_third": "first",
@@ -170,16 +178,16 @@ class TernarySearch(StepTracker):
                 yield self.emit_step(
                     operation="search_last_third",
                     description=(
-                        f"{target} > {arr[mid2]}: keep the last third "
+                        lambda: f"{target} > {arr[mid2]}: keep the last third "
                         f"[{new_lo}..{new_hi}], discard the rest"
                     ),
-                    state={"type": "array", "values": arr.copy()},
+                    state=lambda: {"type": "array", "values": arr.copy()},
                     highlights=(
-                        [{"indices": list(range(new_lo, new_hi + 1)), "color": "comparing"}]
+                        lambda: [{"indices": list(range(new_lo, new_hi + 1)), "color": "comparing"}]
                         if new_lo <= new_hi
                         else []
                     ),
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "surviving_third": "last",
@@ -193,16 +201,16 @@ class TernarySearch(StepTracker):
                 yield self.emit_step(
                     operation="search_middle_third",
                     description=(
-                        f"{arr[mid1]} < {target} < {arr[mid2]}: keep the middle "
+                        lambda: f"{arr[mid1]} < {target} < {arr[mid2]}: keep the middle "
                         f"third [{new_lo}..{new_hi}], discard both ends"
                     ),
-                    state={"type": "array", "values": arr.copy()},
+                    state=lambda: {"type": "array", "values": arr.copy()},
                     highlights=(
-                        [{"indices": list(range(new_lo, new_hi + 1)), "color": "comparing"}]
+                        lambda: [{"indices": list(range(new_lo, new_hi + 1)), "color": "comparing"}]
                         if new_lo <= new_hi
                         else []
                     ),
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "surviving_third": "middle",
@@ -214,10 +222,10 @@ class TernarySearch(StepTracker):
         if found_index == -1:
             yield self.emit_step(
                 operation="not_found",
-                description=f"{target} is not present in the array (returned -1)",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"{target} is not present in the array (returned -1)",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "target": target,
                     "found": False,
@@ -227,15 +235,15 @@ class TernarySearch(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Search complete: {target} found at index {found_index}"
+                lambda: f"Search complete: {target} found at index {found_index}"
                 if found_index != -1
                 else f"Search complete: {target} not found, result is -1"
             ),
-            state={"type": "array", "values": arr.copy()},
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=(
-                [{"indices": [found_index], "color": "sorted"}] if found_index != -1 else []
+                lambda: [{"indices": [found_index], "color": "sorted"}] if found_index != -1 else []
             ),
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
                 "result_index": found_index,
@@ -23,7 +23,7 @@ Characteristics:
 """
 
 from typing import Generator
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import Step, StepLevel, StepTracker, VisualizerType
 
 
 class BubbleSort(StepTracker):
@@ -38,6 +38,20 @@ class BubbleSort(StepTracker):
     """
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "bubble_sort": {
+            "name": "Bubble Sort",
+            "category": "sorting",
+            "entry": "sort",
+            "cost": {"steps": "len(input) ** 2", "state_bytes": "6 * len(input)"},
+        },
+    }
+    step_levels = {
+        **StepTracker.step_levels,
+        "pass_start": StepLevel.PASS,
+        "early_exit": StepLevel.PASS,
+        "pass_complete": StepLevel.PHASE,
+    }
 
     def sort(self, arr: list[int]) -> Generator[Step, None, None]:
         """Sort an array using bubble sort algorithm.
@@ -57,9 +71,9 @@ class BubbleSort(StepTracker):
         # Initial state
         yield self.emit_step(
             operation="init",
-            description=f"Starting bubble sort on array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
-            metadata={
+            description=lambda: f"Starting bubble sort on array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            metadata=lambda: {
                 "comparisons": 0,
                 "swaps": 0,
                 "passes": 0,
@@ -76,15 +90,15 @@ class BubbleSort(StepTracker):
             # Show start of pass
             yield self.emit_step(
                 operation="pass_start",
-                description=f"Pass {i + 1}: Comparing elements 0 to {n - i - 2}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Pass {i + 1}: Comparing elements 0 to {n - i - 2}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {
                         "indices": list(range(n - i)),
                         "color": "active",
                     }
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": comparisons,
                     "swaps": swaps,
                     "passes": i + 1,
@@ -98,15 +112,15 @@ class BubbleSort(StepTracker):
 
                 yield self.emit_step(
                     operation="compare",
-                    description=f"Comparing {arr[j]} and {arr[j+1]}",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Comparing {arr[j]} and {arr[j+1]}",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {
                             "indices": [j, j + 1],
                             "color": "comparing",
                         }
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": comparisons,
                         "swaps": swaps,
                         "passes": i + 1,
@@ -122,15 +136,15 @@ class BubbleSort(StepTracker):
 
                     yield self.emit_step(
                         operation="swap",
-                        description=f"Swapped {arr[j+1]} and {arr[j]} (now at positions {j} and {j+1})",
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        description=lambda: f"Swapped {arr[j+1]} and {arr[j]} (now at positions {j} and {j+1})",
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {
                                 "indices": [j, j + 1],
                                 "color": "swapped",
                             }
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": comparisons,
                             "swaps": swaps,
                             "passes": i + 1,
@@ -141,15 +155,15 @@ class BubbleSort(StepTracker):
             # Mark the last element of this pass as sorted
             yield self.emit_step(
                 operation="pass_complete",
-                description=f"Pass {i + 1} complete. Element at position {n - i - 1} is now in final position",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Pass {i + 1} complete. Element at position {n - i - 1} is now in final position",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {
                         "indices": [n - i - 1],
                         "color": "sorted",
                     }
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": comparisons,
                     "swaps": swaps,
                     "passes": i + 1,
@@ -162,14 +176,14 @@ class BubbleSort(StepTracker):
                 yield self.emit_step(
                     operation="early_exit",
                     description="No swaps made in this pass - array is sorted!",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {
                             "indices": list(range(n)),
                             "color": "sorted",
                         }
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": comparisons,
                         "swaps": swaps,
                         "passes": i + 1,
@@ -181,15 +195,15 @@ class BubbleSort(StepTracker):
         # Final state
         yield self.emit_step(
             operation="complete",
-            description=f"Sorting complete! Made {comparisons} comparisons and {swaps} swaps",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            description=lambda: f"Sorting complete! Made {comparisons} comparisons and {swaps} swaps",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {
                     "indices": list(range(n)),
                     "color": "sorted",
                 }
             ],
-            metadata={
+            metadata=lambda: {
                 "comparisons": comparisons,
                 "swaps": swaps,
                 "passes": i + 1 if "i" in locals() else 0,
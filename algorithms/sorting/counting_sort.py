@@ -36,6 +36,17 @@ class CountingSort(StepTracker):
     """Counting Sort implementation with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "counting_sort": {
+            "name": "Counting Sort",
+            "category": "sorting",
+            "entry": "run",
+            "cost": {
+                "steps": "2 * len(input) + max(input, default=0) - min(input, default=0)",
+                "state_bytes": "4 * (len(input) + max(input, default=0) - min(input, default=0))",
+            },
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -60,10 +71,10 @@ class CountingSort(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting counting sort on array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Starting counting sort on array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "count_writes": self.count_writes,
                 "placements": self.placements,
                 "counts": [],
@@ -75,9 +86,9 @@ class CountingSort(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Array has 0 or 1 elements - already sorted!",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[{"indices": list(range(n)), "color": "sorted"}],
-                metadata={
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+                metadata=lambda: {
                     "count_writes": self.count_writes,
                     "placements": self.placements,
                     "counts": [],
@@ -92,10 +103,10 @@ class CountingSort(StepTracker):
 
         yield self.emit_step(
             operation="setup",
-            description=f"Max value is {max_val}, so allocate a count array of size k = {k} (indices 0..{max_val})",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": [arr.index(max_val)], "color": "active"}],
-            metadata={
+            description=lambda: f"Max value is {max_val}, so allocate a count array of size k = {k} (indices 0..{max_val})",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": [arr.index(max_val)], "color": "active"}],
+            metadata=lambda: {
                 "count_writes": self.count_writes,
                 "placements": self.placements,
                 "counts": counts.copy(),
@@ -113,10 +124,10 @@ class CountingSort(StepTracker):
 
             yield self.emit_step(
                 operation="count",
-                description=f"Counting element {value} at index {i} -> counts[{value}] is now {counts[value]}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[{"indices": [i], "color": "comparing"}],
-                metadata={
+                description=lambda: f"Counting element {value} at index {i} -> counts[{value}] is now {counts[value]}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [{"indices": [i], "color": "comparing"}],
+                metadata=lambda: {
                     "count_writes": self.count_writes,
                     "placements": self.placements,
                     "counts": counts.copy(),
@@ -128,10 +139,10 @@ class CountingSort(StepTracker):
 
         yield self.emit_step(
             operation="counts_done",
-            description=f"Count array complete: each index holds how many times that value appears. counts = {counts}",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Count array complete: each index holds how many times that value appears. counts = {counts}",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "count_writes": self.count_writes,
                 "placements": self.placements,
                 "counts": counts.copy(),
@@ -146,10 +157,10 @@ class CountingSort(StepTracker):
 
             yield self.emit_step(
                 operation="prefix_sum",
-                description=f"Prefix sum: counts[{v}] += counts[{v - 1}] -> {counts[v]} (running total of elements <= {v})",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"Prefix sum: counts[{v}] += counts[{v - 1}] -> {counts[v]} (running total of elements <= {v})",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "count_writes": self.count_writes,
                     "placements": self.placements,
                     "counts": counts.copy(),
@@ -160,10 +171,10 @@ class CountingSort(StepTracker):
 
         yield self.emit_step(
             operation="prefix_done",
-            description=f"Prefix sums done: counts[v] now gives the end position for value v. counts = {counts}",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Prefix sums done: counts[v] now gives the end position for value v. counts = {counts}",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "count_writes": self.count_writes,
                 "placements": self.placements,
                 "counts": counts.copy(),
@@ -186,13 +197,13 @@ class CountingSort(StepTracker):
             placed_indices = [j for j in range(n) if output[j] != 0 or j == pos]
             yield self.emit_step(
                 operation="place",
-                description=f"Place {value} (from input index {i}) at output index {pos}, then decrement counts[{value}] to {counts[value]}",
-                state={"type": "array", "values": output.copy()},
-                highlights=[
+                description=lambda: f"Place {value} (from input index {i}) at output index {pos}, then decrement counts[{value}] to {counts[value]}",
+                state=lambda: {"type": "array", "values": output.copy()},
+                highlights=lambda: [
                     {"indices": [pos], "color": "swapped"},
                     {"indices": [j for j in placed_indices if j != pos], "color": "sorted"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "count_writes": self.count_writes,
                     "placements": self.placements,
                     "counts": counts.copy(),
@@ -208,12 +219,12 @@ class CountingSort(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Array sorted! ({self.count_writes} count writes, {self.placements} placements) "
+                lambda: f"Array sorted! ({self.count_writes} count writes, {self.placements} placements) "
                 f"[verified sorted: {is_sorted}]"
             ),
-            state={"type": "array", "values": output.copy()},
-            highlights=[{"indices": list(range(n)), "color": "sorted"}],
-            metadata={
+            state=lambda: {"type": "array", "values": output.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+            metadata=lambda: {
                 "count_writes": self.count_writes,
                 "placements": self.placements,
                 "counts": counts.copy(),
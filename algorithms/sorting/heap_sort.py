@@ -25,6 +25,14 @@ class HeapSort(StepTracker):
     """Heap Sort implementation with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "heap_sort": {
+            "name": "Heap Sort",
+            "category": "sorting",
+            "entry": "sort",
+            "cost": {"steps": "2 * len(input) * log2(len(input))", "state_bytes": "6 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -49,10 +57,10 @@ class HeapSort(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting heap sort on array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Starting heap sort on array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "heapify_calls": self.heapify_calls,
@@ -63,9 +71,9 @@ class HeapSort(StepTracker):
         yield self.emit_step(
             operation="build_heap_start",
             description="Building max heap from array",
-            state={"type": "array", "values": arr.copy()},
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "heapify_calls": self.heapify_calls,
@@ -79,9 +87,9 @@ class HeapSort(StepTracker):
         yield self.emit_step(
             operation="build_heap_complete",
             description="Max heap built! Largest element is at root",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": [0], "color": "active"}],
-            metadata={
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": [0], "color": "active"}],
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "heapify_calls": self.heapify_calls,
@@ -96,13 +104,13 @@ class HeapSort(StepTracker):
 
             yield self.emit_step(
                 operation="extract_max",
-                description=f"Extracting max {arr[i]} to position {i}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Extracting max {arr[i]} to position {i}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": [0, i], "color": "swapped"},
                     {"indices": list(range(i + 1, n)), "color": "sorted"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "swaps": self.swaps,
                     "heapify_calls": self.heapify_calls,
@@ -115,10 +123,10 @@ class HeapSort(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Array sorted! ({self.comparisons} comparisons, {self.swaps} swaps, {self.heapify_calls} heapify calls)",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": list(range(n)), "color": "sorted"}],
-            metadata={
+            description=lambda: f"Array sorted! ({self.comparisons} comparisons, {self.swaps} swaps, {self.heapify_calls} heapify calls)",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "heapify_calls": self.heapify_calls,
@@ -143,12 +151,12 @@ class HeapSort(StepTracker):
 
         yield self.emit_step(
             operation="heapify_start",
-            description=f"Heapifying subtree rooted at index {root_idx}",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            description=lambda: f"Heapifying subtree rooted at index {root_idx}",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {"indices": [root_idx], "color": "active"},
             ],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "heapify_calls": self.heapify_calls,
@@ -176,12 +184,12 @@ class HeapSort(StepTracker):
 
             yield self.emit_step(
                 operation="heapify_swap",
-                description=f"Swapping {arr[largest]} ↔ {arr[root_idx]} to maintain heap property",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Swapping {arr[largest]} ↔ {arr[root_idx]} to maintain heap property",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": [root_idx, largest], "color": "swapped"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "swaps": self.swaps,
                     "heapify_calls": self.heapify_calls,
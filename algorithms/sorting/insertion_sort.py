@@ -26,6 +26,14 @@ class InsertionSort(StepTracker):
     """Insertion Sort algorithm with step-by-step visualization."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "insertion_sort": {
+            "name": "Insertion Sort",
+            "category": "sorting",
+            "entry": "sort",
+            "cost": {"steps": "len(input) ** 2 / 2 + len(input)", "state_bytes": "8 * len(input)"},
+        },
+    }
 
     def sort(self, arr: list[int]) -> Generator[Step, None, None]:
         """Sort an array using insertion sort algorithm.
@@ -49,9 +57,9 @@ class InsertionSort(StepTracker):
         # Initial state
         yield self.emit_step(
             operation="init",
-            description=f"Starting insertion sort on array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            description=lambda: f"Starting insertion sort on array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {
                     "indices": [0],
                     "color": "sorted",
@@ -59,7 +67,7 @@ class InsertionSort(StepTracker):
             ]
             if n > 0
             else [],
-            metadata={
+            metadata=lambda: {
                 "comparisons": comparisons,
                 "shifts": shifts,
                 "inserts": inserts,
@@ -73,9 +81,9 @@ class InsertionSort(StepTracker):
             # Show current key and sorted/unsorted split
             yield self.emit_step(
                 operation="select_key",
-                description=f"Selecting {key} at index {i} for insertion",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Selecting {key} at index {i} for insertion",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {
                         "indices": list(range(i)),
                         "color": "sorted",
@@ -85,7 +93,7 @@ class InsertionSort(StepTracker):
                         "color": "active",
                     },
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": comparisons,
                     "shifts": shifts,
                     "inserts": inserts,
@@ -101,9 +109,9 @@ class InsertionSort(StepTracker):
 
                 yield self.emit_step(
                     operation="compare",
-                    description=f"Comparing key {key} with {arr[j]} at index {j}",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Comparing key {key} with {arr[j]} at index {j}",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {
                             "indices": list(range(i)),
                             "color": "sorted",
@@ -117,7 +125,7 @@ class InsertionSort(StepTracker):
                             "color": "active",
                         },
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": comparisons,
                         "shifts": shifts,
                         "inserts": inserts,
@@ -134,9 +142,9 @@ class InsertionSort(StepTracker):
 
                     yield self.emit_step(
                         operation="shift",
-                        description=f"Shifting {arr[j]} from index {j} to {j + 1}",
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        description=lambda: f"Shifting {arr[j]} from index {j} to {j + 1}",
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {
                                 "indices": list(range(i + 1)),
                                 "color": "active",
@@ -146,7 +154,7 @@ class InsertionSort(StepTracker):
                                 "color": "swapped",
                             },
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": comparisons,
                             "shifts": shifts,
                             "inserts": inserts,
@@ -166,9 +174,9 @@ class InsertionSort(StepTracker):
 
             yield self.emit_step(
                 operation="insert",
-                description=f"Inserted {key} at index {j + 1}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Inserted {key} at index {j + 1}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {
                         "indices": list(range(i + 1)),
                         "color": "sorted",
@@ -178,7 +186,7 @@ class InsertionSort(StepTracker):
                         "color": "swapped",
                     },
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": comparisons,
                     "shifts": shifts,
                     "inserts": inserts,
@@ -193,17 +201,17 @@ class InsertionSort(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                "Sorting complete! "
+                lambda: "Sorting complete! "
                 f"Made {comparisons} comparisons, {shifts} shifts, and {inserts} inserts"
             ),
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {
                     "indices": list(range(n)),
                     "color": "sorted",
                 }
             ],
-            metadata={
+            metadata=lambda: {
                 "comparisons": comparisons,
                 "shifts": shifts,
                 "inserts": inserts,
@@ -20,13 +20,30 @@ Key Insights:
 """
 
 from typing import Generator
-from algorithms.base import StepTracker, Step, VisualizerType
+from algorithms.base import StepTracker, Step, StepLevel, VisualizerType
 
 
 class MergeSort(StepTracker):
     """Merge Sort implementation with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "merge_sort": {
+            "name": "Merge Sort",
+            "category": "sorting",
+            "entry": "sort",
+            "cost": {
+                "steps": "2 * len(input) * log2(len(input)) + len(input)",
+                "state_bytes": "6 * len(input)",
+            },
+        },
+    }
+    step_levels = {
+        **StepTracker.step_levels,
+        "merge_complete": StepLevel.PASS,
+        "split": StepLevel.PHASE,
+        "merge_start": StepLevel.PHASE,
+    }
 
     def __init__(self):
         super().__init__()
@@ -51,10 +68,10 @@ class MergeSort(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting merge sort on array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Starting merge sort on array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "merges": self.merges,
                 "array_accesses": self.array_accesses,
@@ -66,10 +83,10 @@ class MergeSort(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Array sorted! ({self.comparisons} comparisons, {self.merges} merges, {self.array_accesses} array accesses)",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": list(range(n)), "color": "sorted"}],
-            metadata={
+            description=lambda: f"Array sorted! ({self.comparisons} comparisons, {self.merges} merges, {self.array_accesses} array accesses)",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "merges": self.merges,
                 "array_accesses": self.array_accesses,
@@ -94,13 +111,13 @@ class MergeSort(StepTracker):
 
             yield self.emit_step(
                 operation="split",
-                description=f"Splitting array at index {mid}: [{left}..{mid}] and [{mid+1}..{right}]",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Splitting array at index {mid}: [{left}..{mid}] and [{mid+1}..{right}]",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": list(range(left, mid + 1)), "color": "comparing"},
                     {"indices": list(range(mid + 1, right + 1)), "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "merges": self.merges,
                     "array_accesses": self.array_accesses,
@@ -139,13 +156,13 @@ class MergeSort(StepTracker):
 
         yield self.emit_step(
             operation="merge_start",
-            description=f"Merging sorted subarrays [{left}..{mid}] and [{mid+1}..{right}]",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            description=lambda: f"Merging sorted subarrays [{left}..{mid}] and [{mid+1}..{right}]",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {"indices": list(range(left, mid + 1)), "color": "comparing"},
                 {"indices": list(range(mid + 1, right + 1)), "color": "active"},
             ],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "merges": self.merges,
                 "array_accesses": self.array_accesses,
@@ -168,13 +185,13 @@ class MergeSort(StepTracker):
 
             yield self.emit_step(
                 operation="compare",
-                description=f"Comparing {left_val} (left) with {right_val} (right)",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Comparing {left_val} (left) with {right_val} (right)",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": [left + i], "color": "comparing"},
                     {"indices": [mid + 1 + j], "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "merges": self.merges,
                     "array_accesses": self.array_accesses,
@@ -187,10 +204,10 @@ class MergeSort(StepTracker):
 
                 yield self.emit_step(
                     operation="place",
-                    description=f"Placing {left_val} from left subarray at position {k}",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[{"indices": [k], "color": "swapped"}],
-                    metadata={
+                    description=lambda: f"Placing {left_val} from left subarray at position {k}",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [{"indices": [k], "color": "swapped"}],
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "merges": self.merges,
                         "array_accesses": self.array_accesses,
@@ -204,10 +221,10 @@ class MergeSort(StepTracker):
 
                 yield self.emit_step(
                     operation="place",
-                    description=f"Placing {right_val} from right subarray at position {k}",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[{"indices": [k], "color": "swapped"}],
-                    metadata={
+                    description=lambda: f"Placing {right_val} from right subarray at position {k}",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [{"indices": [k], "color": "swapped"}],
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "merges": self.merges,
                         "array_accesses": self.array_accesses,
@@ -225,10 +242,10 @@ class MergeSort(StepTracker):
 
             yield self.emit_step(
                 operation="place_remaining",
-                description=f"Placing remaining {left_arr[i]} from left subarray at position {k}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[{"indices": [k], "color": "swapped"}],
-                metadata={
+                description=lambda: f"Placing remaining {left_arr[i]} from left subarray at position {k}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [{"indices": [k], "color": "swapped"}],
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "merges": self.merges,
                     "array_accesses": self.array_accesses,
@@ -245,10 +262,10 @@ class MergeSort(StepTracker):
 
             yield self.emit_step(
                 operation="place_remaining",
-                description=f"Placing remaining {right_arr[j]} from right subarray at position {k}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[{"indices": [k], "color": "swapped"}],
-                metadata={
+                description=lambda: f"Placing remaining {right_arr[j]} from right subarray at position {k}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [{"indices": [k], "color": "swapped"}],
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "merges": self.merges,
                     "array_accesses": self.array_accesses,
@@ -261,10 +278,10 @@ class MergeSort(StepTracker):
         # Merge complete
         yield self.emit_step(
             operation="merge_complete",
-            description=f"Merge complete for range [{left}..{right}]",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": list(range(left, right + 1)), "color": "sorted"}],
-            metadata={
+            description=lambda: f"Merge complete for range [{left}..{right}]",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": list(range(left, right + 1)), "color": "sorted"}],
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "merges": self.merges,
                 "array_accesses": self.array_accesses,
@@ -27,6 +27,18 @@ class QuickSort(StepTracker):
     """Quick Sort implementation with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "quick_sort": {
+            "name": "Quick Sort",
+            "category": "sorting",
+            "entry": "sort",
+            "cost": {
+                # Presorted input makes every partition lopsided: quadratic
+                "steps": "2 * len(input) * log2(len(input)) + sorted_run(input) ** 2 / 2",
+                "state_bytes": "6 * len(input)",
+            },
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -51,10 +63,10 @@ class QuickSort(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting quick sort on array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Starting quick sort on array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "partitions": self.partitions,
@@ -66,10 +78,10 @@ class QuickSort(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Array sorted! ({self.comparisons} comparisons, {self.swaps} swaps, {self.partitions} partitions)",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": list(range(n)), "color": "sorted"}],
-            metadata={
+            description=lambda: f"Array sorted! ({self.comparisons} comparisons, {self.swaps} swaps, {self.partitions} partitions)",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "partitions": self.partitions,
@@ -119,13 +131,13 @@ class QuickSort(StepTracker):
 
         yield self.emit_step(
             operation="select_pivot",
-            description=f"Selected pivot: {pivot} (index {high})",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[
+            description=lambda: f"Selected pivot: {pivot} (index {high})",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [
                 {"indices": [high], "color": "active"},
                 {"indices": list(range(low, high + 1)), "color": "comparing"},
             ],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "partitions": self.partitions,
@@ -150,10 +162,10 @@ class QuickSort(StepTracker):
 
             yield self.emit_step(
                 operation="compare",
-                description=f"Comparing {arr[j]} with pivot {pivot}",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"Comparing {arr[j]} with pivot {pivot}",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=highlights_list,
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "swaps": self.swaps,
                     "partitions": self.partitions,
@@ -170,13 +182,13 @@ class QuickSort(StepTracker):
 
                     yield self.emit_step(
                         operation="swap",
-                        description=f"Swapped {arr[j]} ↔ {arr[i]} (moving ≤ pivot to left)",
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        description=lambda: f"Swapped {arr[j]} ↔ {arr[i]} (moving ≤ pivot to left)",
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {"indices": [i, j], "color": "swapped"},
                             {"indices": [high], "color": "active"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "swaps": self.swaps,
                             "partitions": self.partitions,
@@ -202,10 +214,10 @@ class QuickSort(StepTracker):
 
         yield self.emit_step(
             operation="pivot_placed",
-            description=f"Placed pivot {pivot} at final position {pivot_final_idx}",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Placed pivot {pivot} at final position {pivot_final_idx}",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=highlights_list,
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
                 "partitions": self.partitions,
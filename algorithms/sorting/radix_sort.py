@@ -40,6 +40,17 @@ class RadixSort(StepTracker):
     """LSD Radix Sort implementation with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "radix_sort": {
+            "name": "Radix Sort",
+            "category": "sorting",
+            "entry": "run",
+            "cost": {
+                "steps": "digits(max(input, default=0)) * (len(input) + 10)",
+                "state_bytes": "8 * (len(input) + 10)",
+            },
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -64,10 +75,10 @@ class RadixSort(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting LSD radix sort on {n} element(s). We sort by one digit at a time, from the ones place up to the highest place value.",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Starting LSD radix sort on {n} element(s). We sort by one digit at a time, from the ones place up to the highest place value.",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "passes": self.passes,
                 "placements": self.placements,
                 "current_digit_place": None,
@@ -80,9 +91,9 @@ class RadixSort(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Array has 0 or 1 element(s) - already sorted!",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[{"indices": list(range(n)), "color": "sorted"}],
-                metadata={
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+                metadata=lambda: {
                     "passes": self.passes,
                     "placements": self.placements,
                     "current_digit_place": None,
@@ -105,10 +116,10 @@ class RadixSort(StepTracker):
 
             yield self.emit_step(
                 operation="select_digit",
-                description=f"Pass {self.passes}: sorting by the {digit_name} digit (place value {place}). Highlighted elements are grouped by their {digit_name} digit.",
-                state={"type": "array", "values": arr.copy()},
+                description=lambda: f"Pass {self.passes}: sorting by the {digit_name} digit (place value {place}). Highlighted elements are grouped by their {digit_name} digit.",
+                state=lambda: {"type": "array", "values": arr.copy()},
                 highlights=active_highlights,
-                metadata={
+                metadata=lambda: {
                     "passes": self.passes,
                     "placements": self.placements,
                     "current_digit_place": place,
@@ -127,16 +138,16 @@ class RadixSort(StepTracker):
 
                 yield self.emit_step(
                     operation="bucket",
-                    description=f"Value {value} has {digit_name} digit {digit} - placing it into bucket {digit}.",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Value {value} has {digit_name} digit {digit} - placing it into bucket {digit}.",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [idx], "color": "active"},
                         {
                             "indices": self._indices_with_digit(arr, place, digit),
                             "color": "comparing",
                         },
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "passes": self.passes,
                         "placements": self.placements,
                         "current_digit_place": place,
@@ -153,10 +164,10 @@ class RadixSort(StepTracker):
 
             yield self.emit_step(
                 operation="reassemble",
-                description=f"Concatenated buckets 0-9 back into the array. It is now stably sorted by the {digit_name} digit.",
-                state={"type": "array", "values": arr.copy()},
-                highlights=self._digit_highlights(arr, place),
-                metadata={
+                description=lambda: f"Concatenated buckets 0-9 back into the array. It is now stably sorted by the {digit_name} digit.",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: self._digit_highlights(arr, place),
+                metadata=lambda: {
                     "passes": self.passes,
                     "placements": self.placements,
                     "current_digit_place": place,
@@ -170,10 +181,10 @@ class RadixSort(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Array fully sorted after {self.passes} digit pass(es) and {self.placements} bucket placement(s)!",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": list(range(n)), "color": "sorted"}],
-            metadata={
+            description=lambda: f"Array fully sorted after {self.passes} digit pass(es) and {self.placements} bucket placement(s)!",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+            metadata=lambda: {
                 "passes": self.passes,
                 "placements": self.placements,
                 "current_digit_place": None,
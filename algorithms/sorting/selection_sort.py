@@ -25,6 +25,14 @@ class SelectionSort(StepTracker):
     """Selection Sort implementation with visualization step tracking."""
 
     visualizer_type = VisualizerType.ARRAY
+    registrations = {
+        "selection_sort": {
+            "name": "Selection Sort",
+            "category": "sorting",
+            "entry": "sort",
+            "cost": {"steps": "len(input) ** 2 / 2 + len(input)", "state_bytes": "7 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -47,10 +55,10 @@ class SelectionSort(StepTracker):
 
         yield self.emit_step(
             operation="init",
-            description=f"Starting selection sort on array of {n} elements",
-            state={"type": "array", "values": arr.copy()},
+            description=lambda: f"Starting selection sort on array of {n} elements",
+            state=lambda: {"type": "array", "values": arr.copy()},
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
             },
@@ -61,13 +69,13 @@ class SelectionSort(StepTracker):
 
             yield self.emit_step(
                 operation="new_pass",
-                description=f"Finding minimum element in unsorted portion (starting at {i})",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Finding minimum element in unsorted portion (starting at {i})",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": list(range(i)), "color": "sorted"},
                     {"indices": [i], "color": "active"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "swaps": self.swaps,
                     "current_min": arr[min_idx],
@@ -81,14 +89,14 @@ class SelectionSort(StepTracker):
 
                 yield self.emit_step(
                     operation="compare",
-                    description=f"Comparing {arr[j]} with current min {arr[min_idx]}",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Comparing {arr[j]} with current min {arr[min_idx]}",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": list(range(i)), "color": "sorted"},
                         {"indices": [min_idx], "color": "active"},
                         {"indices": [j], "color": "comparing"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "swaps": self.swaps,
                         "current_min": arr[min_idx],
@@ -101,13 +109,13 @@ class SelectionSort(StepTracker):
 
                     yield self.emit_step(
                         operation="update_min",
-                        description=f"Found new minimum: {arr[min_idx]} at index {min_idx}",
-                        state={"type": "array", "values": arr.copy()},
-                        highlights=[
+                        description=lambda: f"Found new minimum: {arr[min_idx]} at index {min_idx}",
+                        state=lambda: {"type": "array", "values": arr.copy()},
+                        highlights=lambda: [
                             {"indices": list(range(i)), "color": "sorted"},
                             {"indices": [min_idx], "color": "active"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "swaps": self.swaps,
                             "current_min": arr[min_idx],
@@ -122,12 +130,12 @@ class SelectionSort(StepTracker):
 
                 yield self.emit_step(
                     operation="swap",
-                    description=f"Swapping {arr[min_idx]} ↔ {arr[i]} (placing min at position {i})",
-                    state={"type": "array", "values": arr.copy()},
-                    highlights=[
+                    description=lambda: f"Swapping {arr[min_idx]} ↔ {arr[i]} (placing min at position {i})",
+                    state=lambda: {"type": "array", "values": arr.copy()},
+                    highlights=lambda: [
                         {"indices": [i, min_idx], "color": "swapped"},
                     ],
-                    metadata={
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "swaps": self.swaps,
                     },
@@ -135,12 +143,12 @@ class SelectionSort(StepTracker):
 
             yield self.emit_step(
                 operation="pass_complete",
-                description=f"Position {i} now sorted with value {arr[i]}",
-                state={"type": "array", "values": arr.copy()},
-                highlights=[
+                description=lambda: f"Position {i} now sorted with value {arr[i]}",
+                state=lambda: {"type": "array", "values": arr.copy()},
+                highlights=lambda: [
                     {"indices": list(range(i + 1)), "color": "sorted"},
                 ],
-                metadata={
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "swaps": self.swaps,
                 },
@@ -148,10 +156,10 @@ class SelectionSort(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"Array sorted! ({self.comparisons} comparisons, {self.swaps} swaps)",
-            state={"type": "array", "values": arr.copy()},
-            highlights=[{"indices": list(range(n)), "color": "sorted"}],
-            metadata={
+            description=lambda: f"Array sorted! ({self.comparisons} comparisons, {self.swaps} swaps)",
+            state=lambda: {"type": "array", "values": arr.copy()},
+            highlights=lambda: [{"indices": list(range(n)), "color": "sorted"}],
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "swaps": self.swaps,
             },
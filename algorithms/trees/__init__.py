@@ -1 +1,27 @@
 """Tree algorithms module."""
+
+import importlib.util
+import sys
+from functools import cache
+from pathlib import Path
+from types import ModuleType
+
+
+@cache
+def load_bst_module() -> ModuleType:
+    """Load the BST visualizer module (``trees/bst.py``).
+
+    ``trees/`` has both bst.py and a bst/ package, so a normal
+    ``from algorithms.trees.bst import BST`` resolves to the package. Load the
+    file by path instead (once, and under the name the API registry uses, so
+    its classes keep a stable identity).
+    """
+    if "algorithms.trees.bst_viz" in sys.modules:
+        return sys.modules["algorithms.trees.bst_viz"]
+    spec = importlib.util.spec_from_file_location(
+        "algorithms.trees.bst_viz", Path(__file__).resolve().parent / "bst.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
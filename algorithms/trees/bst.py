@@ -13,15 +13,16 @@ Key Insights:
     - Used in: databases, file systems, expression trees
 """
 
-from typing import Generator, Optional, Dict, Any
-from algorithms.base import StepTracker, Step, VisualizerType
+from typing import Generator, Optional, Any
+from algorithms.base import LEFT, RIGHT, NodeTable, StepTracker, Step, VisualizerType
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: Optional[TreeNode] = None
         self.right: Optional[TreeNode] = None
 
@@ -30,11 +31,34 @@ class BST(StepTracker):
     """Binary Search Tree implementation with visualization."""
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "bst_insert": {
+            "name": "BST Insert",
+            "category": "trees",
+            "entry": "insert",
+            "input": {"values": []},
+            "shorthand": "values",
+            "cost": {
+                # A sorted stretch of values builds a chain: quadratic in its length
+                "steps": "len(values) * log2(len(values)) + sorted_run(values) ** 2 / 2",
+                "state_bytes": "2 * len(values)",
+            },
+        },
+        "bst_search": {
+            "name": "BST Search",
+            "category": "trees",
+            "entry": "search",
+            "input": {"values": [], "target": 0},
+            "cost": {"steps": "2 * log2(len(values)) + 2", "state_bytes": "2 * len(values)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
         self.root: Optional[TreeNode] = None
         self.comparisons = 0
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
 
     def insert(self, values: list[int]) -> Generator[Step, None, None]:
         """Insert values into BST one by one.
@@ -45,16 +69,14 @@ class BST(StepTracker):
         Yields:
             Step objects for visualization
         """
-        self.reset()
-        self.comparisons = 0
-        self.root = None
+        self._start_tree()
 
         yield self.emit_step(
             operation="init",
-            description=f"Building BST from {len(values)} values",
-            state={"type": "tree", "tree": self._tree_to_dict()},
+            description=lambda: f"Building BST from {len(values)} values",
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "size": 0,
             },
@@ -65,10 +87,10 @@ class BST(StepTracker):
 
         yield self.emit_step(
             operation="complete",
-            description=f"BST built with {len(values)} nodes",
-            state={"type": "tree", "tree": self._tree_to_dict()},
+            description=lambda: f"BST built with {len(values)} nodes",
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "size": len(values),
             },
@@ -84,14 +106,14 @@ class BST(StepTracker):
             Step objects for visualization
         """
         if self.root is None:
-            self.root = TreeNode(value)
+            self.root = self._new_node(value)
 
             yield self.emit_step(
                 operation="insert_root",
-                description=f"Inserted {value} as root",
-                state={"type": "tree", "tree": self._tree_to_dict()},
-                highlights=[{"type": "node", "id": value, "color": "active"}],
-                metadata={
+                description=lambda: f"Inserted {value} as root",
+                state=lambda: self._tree_state(),
+                highlights=lambda: [{"nodes": [self.root.node_id], "color": "active"}],
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "inserted_value": value,
                 },
@@ -99,21 +121,16 @@ class BST(StepTracker):
             return
 
         current = self.root
-        path = []
 
         while True:
             self.comparisons += 1
-            path.append(current.val)
 
             yield self.emit_step(
                 operation="compare",
-                description=f"Comparing {value} with {current.val}",
-                state={"type": "tree", "tree": self._tree_to_dict()},
-                highlights=[
-                    {"type": "node", "id": current.val, "color": "comparing"},
-                    *[{"type": "node", "id": p, "color": "visited"} for p in path[:-1]],
-                ],
-                metadata={
+                description=lambda: f"Comparing {value} with {current.val}",
+                state=lambda: self._tree_state(path=current),
+                highlights=lambda: [{"nodes": [current.node_id], "color": "comparing"}],
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "comparing_with": current.val,
                 },
@@ -121,17 +138,17 @@ class BST(StepTracker):
 
             if value < current.val:
                 if current.left is None:
-                    current.left = TreeNode(value)
+                    current.left = self._new_node(value, current, LEFT)
 
                     yield self.emit_step(
                         operation="insert_left",
-                        description=f"Inserted {value} as left child of {current.val}",
-                        state={"type": "tree", "tree": self._tree_to_dict()},
-                        highlights=[
-                            {"type": "node", "id": value, "color": "active"},
-                            {"type": "node", "id": current.val, "color": "sorted"},
+                        description=lambda: f"Inserted {value} as left child of {current.val}",
+                        state=lambda: self._tree_state(),
+                        highlights=lambda: [
+                            {"nodes": [current.left.node_id], "color": "active"},
+                            {"nodes": [current.node_id], "color": "sorted"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "inserted_value": value,
                             "parent": current.val,
@@ -143,17 +160,17 @@ class BST(StepTracker):
 
             else:
                 if current.right is None:
-                    current.right = TreeNode(value)
+                    current.right = self._new_node(value, current, RIGHT)
 
                     yield self.emit_step(
                         operation="insert_right",
-                        description=f"Inserted {value} as right child of {current.val}",
-                        state={"type": "tree", "tree": self._tree_to_dict()},
-                        highlights=[
-                            {"type": "node", "id": value, "color": "active"},
-                            {"type": "node", "id": current.val, "color": "sorted"},
+                        description=lambda: f"Inserted {value} as right child of {current.val}",
+                        state=lambda: self._tree_state(),
+                        highlights=lambda: [
+                            {"nodes": [current.right.node_id], "color": "active"},
+                            {"nodes": [current.node_id], "color": "sorted"},
                         ],
-                        metadata={
+                        metadata=lambda: {
                             "comparisons": self.comparisons,
                             "inserted_value": value,
                             "parent": current.val,
@@ -174,39 +191,36 @@ class BST(StepTracker):
             Step objects for visualization
         """
         # Build tree first (without yielding steps)
-        self.reset()
-        self.comparisons = 0
-        self.root = None
+        self._start_tree()
         for val in tree_values:
             self._insert_silent(val)
 
         yield self.emit_step(
             operation="init",
-            description=f"Searching for {target} in BST",
-            state={"type": "tree", "tree": self._tree_to_dict()},
+            description=lambda: f"Searching for {target} in BST",
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
             },
         )
 
         current = self.root
+        last = None
         path = []
 
         while current:
             self.comparisons += 1
             path.append(current.val)
+            last = current
 
             yield self.emit_step(
                 operation="compare",
-                description=f"Comparing {target} with {current.val}",
-                state={"type": "tree", "tree": self._tree_to_dict()},
-                highlights=[
-                    {"type": "node", "id": current.val, "color": "comparing"},
-                    *[{"type": "node", "id": p, "color": "visited"} for p in path[:-1]],
-                ],
-                metadata={
+                description=lambda: f"Comparing {target} with {current.val}",
+                state=lambda: self._tree_state(path=current),
+                highlights=lambda: [{"nodes": [current.node_id], "color": "comparing"}],
+                metadata=lambda: {
                     "comparisons": self.comparisons,
                     "target": target,
                     "current": current.val,
@@ -216,13 +230,10 @@ class BST(StepTracker):
             if current.val == target:
                 yield self.emit_step(
                     operation="found",
-                    description=f"Found {target}!",
-                    state={"type": "tree", "tree": self._tree_to_dict()},
-                    highlights=[
-                        {"type": "node", "id": target, "color": "sorted"},
-                        *[{"type": "node", "id": p, "color": "visited"} for p in path[:-1]],
-                    ],
-                    metadata={
+                    description=lambda: f"Found {target}!",
+                    state=lambda: self._tree_state(path=current),
+                    highlights=lambda: [{"nodes": [current.node_id], "color": "sorted"}],
+                    metadata=lambda: {
                         "comparisons": self.comparisons,
                         "target": target,
                         "path": path,
@@ -237,12 +248,10 @@ class BST(StepTracker):
 
         yield self.emit_step(
             operation="not_found",
-            description=f"{target} not found in BST",
-            state={"type": "tree", "tree": self._tree_to_dict()},
-            highlights=[
-                *[{"type": "node", "id": p, "color": "visited"} for p in path],
-            ],
-            metadata={
+            description=lambda: f"{target} not found in BST",
+            state=lambda: self._tree_state(path=last),
+            highlights=[],
+            metadata=lambda: {
                 "comparisons": self.comparisons,
                 "target": target,
                 "found": False,
@@ -252,34 +261,48 @@ class BST(StepTracker):
     def _insert_silent(self, value: int):
         """Insert without yielding steps (for setup)."""
         if self.root is None:
-            self.root = TreeNode(value)
+            self.root = self._new_node(value)
             return
 
         current = self.root
         while True:
             if value < current.val:
                 if current.left is None:
-                    current.left = TreeNode(value)
+                    current.left = self._new_node(value, current, LEFT)
                     break
                 current = current.left
             else:
                 if current.right is None:
-                    current.right = TreeNode(value)
+                    current.right = self._new_node(value, current, RIGHT)
                     break
                 current = current.right
 
-    def _tree_to_dict(self) -> Dict[str, Any]:
-        """Convert tree to dictionary for visualization."""
-        if not self.root:
-            return {}
-
-        def node_to_dict(node: Optional[TreeNode]) -> Optional[Dict[str, Any]]:
-            if not node:
-                return None
-            return {
-                "val": node.val,
-                "left": node_to_dict(node.left),
-                "right": node_to_dict(node.right),
-            }
-
-        return node_to_dict(self.root)
+    def _start_tree(self):
+        """Reset the run and start an empty tree with a fresh node table."""
+        self.reset()
+        self.comparisons = 0
+        self.root = None
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
+
+    def _new_node(
+        self, value: int, parent: Optional[TreeNode] = None, side: int | None = None
+    ) -> TreeNode:
+        """Create a node and record it in the node table."""
+        parent_id = parent.node_id if parent else None
+        return TreeNode(value, self.nodes.add(value, parent_id, side))
+
+    def _tree_state(self, path: Optional[TreeNode] = None) -> dict[str, Any]:
+        """Tree state for a step: the shared node table and its current size.
+
+        ``path`` is the last node on the current root path (None outside a
+        descent). Only its id is recorded; the rest of the path is its
+        ancestors in the node table (see path_to), so a step costs O(1)
+        however deep the tree is.
+        """
+        return {
+            "type": "tree",
+            "nodes": self._nodes_ref,
+            "size": len(self.nodes),
+            "path": path.node_id if path else None,
+        }
@@ -31,16 +31,31 @@ from algorithms.base import Step, StepTracker, VisualizerType
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: TreeNode | None = None
         self.right: TreeNode | None = None
 
 
 class InvertBinaryTree(StepTracker):
-    """Invert (mirror) a binary tree with step-by-step visualization."""
+    """Invert (mirror) a binary tree with step-by-step visualization.
+
+    Unlike the other tree visualizers this one cannot share an append-only
+    node table (see algorithms.base.tree_state): every swap moves nodes, so
+    each step carries a snapshot of the tree. Snapshot nodes carry their id
+    (their position in the input's level order), which highlights refer to.
+    """
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "invert_binary_tree": {
+            "name": "Invert Binary Tree",
+            "category": "trees",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "50 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
@@ -48,40 +63,47 @@ class InvertBinaryTree(StepTracker):
         self.nodes_visited = 0
 
     def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
-        """Build binary tree from level-order list (None = missing node)."""
+        """Build binary tree from level-order list (None = missing node); ids count from 0."""
         if not values or values[0] is None:
             return None
 
         root = TreeNode(values[0])
         queue = deque([root])
         i = 1
+        count = 1
 
         while queue and i < len(values):
             node = queue.popleft()
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = TreeNode(values[i], count)
+                count += 1
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = TreeNode(values[i], count)
+                count += 1
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: TreeNode | None) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
+    def _tree_to_dict(self, root: TreeNode | None) -> dict | None:
+        """Snapshot the tree as a nested dict (iterative, so deep trees are fine)."""
+        if not root:
             return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+        snapshot = {"id": root.node_id, "val": root.val, "left": None, "right": None}
+        stack = [(root, snapshot)]
+        while stack:
+            node, out = stack.pop()
+            for side, child in (("left", node.left), ("right", node.right)):
+                if child:
+                    out[side] = {"id": child.node_id, "val": child.val, "left": None, "right": None}
+                    stack.append((child, out[side]))
+        return snapshot
 
     def run(self, input_data) -> Generator[Step, None, None]:
         """Invert a binary tree given level-order values.
@@ -105,18 +127,18 @@ class InvertBinaryTree(StepTracker):
         yield self.emit_step(
             operation="init",
             description="Invert the binary tree: swap the two children of every node, top to bottom.",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
+            state=lambda: {"type": "tree", "tree": self._tree_to_dict(root)},
             highlights=[],
-            metadata={"swaps": 0, "nodes_visited": 0},
+            metadata=lambda: {"swaps": 0, "nodes_visited": 0},
         )
 
         if root is None:
             yield self.emit_step(
                 operation="complete",
                 description="Tree is empty - nothing to invert.",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
+                state=lambda: {"type": "tree", "tree": self._tree_to_dict(root)},
                 highlights=[],
-                metadata={"swaps": 0, "nodes_visited": 0},
+                metadata=lambda: {"swaps": 0, "nodes_visited": 0},
             )
             return
 
@@ -125,12 +147,12 @@ class InvertBinaryTree(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Inversion complete: {self.swaps} swap(s) across "
+                lambda: f"Inversion complete: {self.swaps} swap(s) across "
                 f"{self.nodes_visited} node(s). The tree is now mirrored."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
+            state=lambda: {"type": "tree", "tree": self._tree_to_dict(root)},
             highlights=[],
-            metadata={"swaps": self.swaps, "nodes_visited": self.nodes_visited},
+            metadata=lambda: {"swaps": self.swaps, "nodes_visited": self.nodes_visited},
         )
 
     def _invert_helper(self, node: TreeNode | None, root: TreeNode) -> Generator[Step, None, None]:
@@ -146,26 +168,22 @@ class InvertBinaryTree(StepTracker):
         # Only nodes that actually have a child produce a visible swap.
         if node.left is not None or node.right is not None:
             # BEFORE: highlight the node about to swap and its two children.
-            before_highlights = [{"type": "node", "id": node.val, "color": "active"}]
-            if node.left is not None:
-                before_highlights.append(
-                    {"type": "node", "id": node.left.val, "color": "comparing"}
-                )
-            if node.right is not None:
-                before_highlights.append(
-                    {"type": "node", "id": node.right.val, "color": "comparing"}
-                )
+            children = [c.node_id for c in (node.left, node.right) if c is not None]
+            before_highlights = [
+                {"nodes": [node.node_id], "color": "active"},
+                {"nodes": children, "color": "comparing"},
+            ]
 
             yield self.emit_step(
                 operation="swap_children",
                 description=(
-                    f"At node {node.val}: about to swap left child "
+                    lambda: f"At node {node.val}: about to swap left child "
                     f"({left_val if left_val is not None else '∅'}) with right child "
                     f"({right_val if right_val is not None else '∅'})."
                 ),
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
+                state=lambda: {"type": "tree", "tree": self._tree_to_dict(root)},
                 highlights=before_highlights,
-                metadata={
+                metadata=lambda: {
                     "current": node.val,
                     "swaps": self.swaps,
                     "nodes_visited": self.nodes_visited,
@@ -177,21 +195,17 @@ class InvertBinaryTree(StepTracker):
             self.swaps += 1
 
             # AFTER: same nodes highlighted, tree state now reflects the mirror.
-            after_highlights = [{"type": "node", "id": node.val, "color": "sorted"}]
-            if node.left is not None:
-                after_highlights.append({"type": "node", "id": node.left.val, "color": "sorted"})
-            if node.right is not None:
-                after_highlights.append({"type": "node", "id": node.right.val, "color": "sorted"})
+            after_highlights = [{"nodes": [node.node_id, *children], "color": "sorted"}]
 
             yield self.emit_step(
                 operation="swapped",
                 description=(
-                    f"Swapped at node {node.val}: children are now mirrored "
+                    lambda: f"Swapped at node {node.val}: children are now mirrored "
                     f"(left ↔ right). Recurse into each subtree next."
                 ),
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
+                state=lambda: {"type": "tree", "tree": self._tree_to_dict(root)},
                 highlights=after_highlights,
-                metadata={
+                metadata=lambda: {
                     "current": node.val,
                     "swaps": self.swaps,
                     "nodes_visited": self.nodes_visited,
@@ -201,10 +215,10 @@ class InvertBinaryTree(StepTracker):
             # Leaf node: nothing to swap, just mark it as done.
             yield self.emit_step(
                 operation="leaf",
-                description=f"Node {node.val} is a leaf - no children to swap.",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=[{"type": "node", "id": node.val, "color": "sorted"}],
-                metadata={
+                description=lambda: f"Node {node.val} is a leaf - no children to swap.",
+                state=lambda: {"type": "tree", "tree": self._tree_to_dict(root)},
+                highlights=lambda: [{"nodes": [node.node_id], "color": "sorted"}],
+                metadata=lambda: {
                     "current": node.val,
                     "swaps": self.swaps,
                     "nodes_visited": self.nodes_visited,
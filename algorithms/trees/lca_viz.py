@@ -33,14 +33,15 @@ Key Insights:
 from collections import deque
 from collections.abc import Generator
 
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import LEFT, RIGHT, NodeTable, Step, StepTracker, VisualizerType
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: TreeNode | None = None
         self.right: TreeNode | None = None
 
@@ -49,17 +50,35 @@ class LowestCommonAncestor(StepTracker):
     """Find the lowest common ancestor of two nodes in a BST via top-down descent."""
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "lca": {
+            "name": "Lowest Common Ancestor (BST)",
+            "category": "trees",
+            "entry": "run",
+            "cost": {"steps": "2 * log2(len(values)) + 2", "state_bytes": "2 * len(values)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
-        self.path: list[int] = []
+        self.path: list[TreeNode] = []
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
+        self._ids: dict[int, int] = {}
 
     def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
-        """Build binary tree from level-order list (None = missing node)."""
+        """Build binary tree from level-order list (None = missing node).
+
+        Nodes are recorded in a fresh node table, shared with every step by
+        reference (see algorithms.base.tree_state); the tree does not change.
+        """
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
+        self._ids = {}
         if not values or values[0] is None:
             return None
 
-        root = TreeNode(values[0])
+        root = self._add(values[0])
         queue = deque([root])
         i = 1
 
@@ -68,38 +87,41 @@ class LowestCommonAncestor(StepTracker):
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = self._add(values[i], node, LEFT)
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = self._add(values[i], node, RIGHT)
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: TreeNode | None) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
-            return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+    def _add(self, val: int, parent: TreeNode | None = None, side: int | None = None) -> TreeNode:
+        """Create a node and record it in the node table (the first node per value is its id)."""
+        node_id = self.nodes.add(val, parent.node_id if parent else None, side)
+        self._ids.setdefault(val, node_id)
+        return TreeNode(val, node_id)
+
+    def _tree_state(self) -> dict:
+        """Tree state for a step: the shared node table and its size."""
+        return {"type": "tree", "nodes": self._nodes_ref, "size": len(self.nodes)}
+
+    def _target_highlights(self, targets: list[int]) -> list[dict]:
+        """Highlight the target values that are in the tree (values absent from it have no id)."""
+        ids = [self._ids[t] for t in targets if t in self._ids]
+        return [{"nodes": ids, "color": "comparing"}] if ids else []
 
-    def _descent_highlights(self, current: int, p: int, q: int) -> list[dict]:
+    def _descent_highlights(self, current: TreeNode, p: int, q: int) -> list[dict]:
         """Green for the path already walked, blue for the current node, yellow for targets."""
-        highlights: list[dict] = [
-            {"type": "node", "id": v, "color": "sorted"} for v in self.path if v != current
-        ]
-        highlights.append({"type": "node", "id": current, "color": "active"})
+        walked = [n.node_id for n in self.path if n is not current]
+        highlights: list[dict] = [{"nodes": walked, "color": "sorted"}] if walked else []
+        highlights.append({"nodes": [current.node_id], "color": "active"})
         # Mark the two targets so learners can see where we are heading.
-        for target in (p, q):
-            if target != current and target not in self.path:
-                highlights.append({"type": "node", "id": target, "color": "comparing"})
+        on_path = {n.val for n in self.path}
+        highlights += self._target_highlights([t for t in (p, q) if t not in on_path])
         return highlights
 
     def run(self, input_data) -> Generator[Step, None, None]:
@@ -118,51 +140,47 @@ class LowestCommonAncestor(StepTracker):
         p = input_data["p"]
         q = input_data["q"]
         root = self._build_tree_from_list(values)
-        tree_dict = self._tree_to_dict(root)
 
         yield self.emit_step(
             operation="init",
             description=(
-                f"Find the Lowest Common Ancestor of {p} and {q}. Start at the root "
+                lambda: f"Find the Lowest Common Ancestor of {p} and {q}. Start at the root "
                 "and use the BST ordering to walk down: if both targets are smaller "
                 "go left, if both are larger go right, otherwise we have found it."
             ),
-            state={"type": "tree", "tree": tree_dict},
-            highlights=[
-                {"type": "node", "id": p, "color": "comparing"},
-                {"type": "node", "id": q, "color": "comparing"},
-            ],
-            metadata={"p": p, "q": q, "current": None},
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._target_highlights([p, q]),
+            metadata=lambda: {"p": p, "q": q, "current": None},
         )
 
         node = root
         lca: TreeNode | None = None
 
         while node is not None:
-            self.path.append(node.val)
+            self.path.append(node)
 
             if p < node.val and q < node.val:
                 yield self.emit_step(
                     operation="go_left",
                     description=(
-                        f"Both {p} and {q} are less than {node.val}, so the LCA must be "
+                        lambda: f"Both {p} and {q} are less than {node.val}, so the LCA must be "
                         f"in the left subtree. Move left from {node.val}."
                     ),
-                    state={"type": "tree", "tree": tree_dict},
-                    highlights=self._descent_highlights(node.val, p, q),
-                    metadata={"p": p, "q": q, "current": node.val, "direction": "left"},
+                    state=lambda: self._tree_state(),
+                    highlights=lambda: self._descent_highlights(node, p, q),
+                    metadata=lambda: {"p": p, "q": q, "current": node.val, "direction": "left"},
                 )
                 node = node.left
             elif p > node.val and q > node.val:
                 yield self.emit_step(
                     operation="go_right",
                     description=(
-                        f"Both {p} and {q} are greater than {node.val}, so the LCA must "
+                        lambda: f"Both {p} and {q} are greater than {node.val}, so the LCA must "
                         f"be in the right subtree. Move right from {node.val}."
                     ),
-                    state={"type": "tree", "tree": tree_dict},
-                    highlights=self._descent_highlights(node.val, p, q),
-                    metadata={"p": p, "q": q, "current": node.val, "direction": "right"},
+                    state=lambda: self._tree_state(),
+                    highlights=lambda: self._descent_highlights(node, p, q),
+                    metadata=lambda: {"p": p, "q": q, "current": node.val, "direction": "right"},
                 )
                 node = node.right
             else:
@@ -171,36 +189,31 @@ class LowestCommonAncestor(StepTracker):
                 yield self.emit_step(
                     operation="found",
                     description=(
-                        f"{p} and {q} split at {node.val} (one is <= it, the other >= it), "
+                        lambda: f"{p} and {q} split at {node.val} (one is <= it, the other >= it), "
                         f"so {node.val} is their lowest common ancestor - the highest node "
                         "whose subtrees still contain both targets."
                     ),
-                    state={"type": "tree", "tree": tree_dict},
-                    highlights=self._descent_highlights(node.val, p, q),
-                    metadata={"p": p, "q": q, "current": node.val, "direction": "split"},
+                    state=lambda: self._tree_state(),
+                    highlights=lambda: self._descent_highlights(node, p, q),
+                    metadata=lambda: {"p": p, "q": q, "current": node.val, "direction": "split"},
                 )
                 break
 
         lca_val = lca.val if lca is not None else None
-        complete_highlights: list[dict] = [
-            {"type": "node", "id": v, "color": "sorted"}
-            for v in self.path
-            if v != lca_val and v != p and v != q
-        ]
-        for target in (p, q):
-            if target != lca_val:
-                complete_highlights.append({"type": "node", "id": target, "color": "comparing"})
-        if lca_val is not None:
-            complete_highlights.append({"type": "node", "id": lca_val, "color": "active"})
+        walked = [n.node_id for n in self.path if n.val not in (lca_val, p, q)]
+        complete_highlights: list[dict] = [{"nodes": walked, "color": "sorted"}] if walked else []
+        complete_highlights += self._target_highlights([t for t in (p, q) if t != lca_val])
+        if lca is not None:
+            complete_highlights.append({"nodes": [lca.node_id], "color": "active"})
 
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Done. The lowest common ancestor of {p} and {q} is {lca_val}. "
+                lambda: f"Done. The lowest common ancestor of {p} and {q} is {lca_val}. "
                 f"We reached it in {len(self.path)} step(s) by following the BST "
                 "ordering straight down - no backtracking needed."
             ),
-            state={"type": "tree", "tree": tree_dict},
+            state=lambda: self._tree_state(),
             highlights=complete_highlights,
-            metadata={"p": p, "q": q, "current": lca_val, "lca": lca_val},
+            metadata=lambda: {"p": p, "q": q, "current": lca_val, "lca": lca_val},
         )
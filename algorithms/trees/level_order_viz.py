@@ -30,14 +30,15 @@ Key Insights:
 from collections import deque
 from collections.abc import Generator
 
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import LEFT, RIGHT, NodeTable, Step, StepTracker, VisualizerType
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: TreeNode | None = None
         self.right: TreeNode | None = None
 
@@ -46,18 +47,35 @@ class LevelOrder(StepTracker):
     """Level-order (BFS) traversal of a binary tree with per-level grouping."""
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "level_order": {
+            "name": "Binary Tree Level-Order Traversal (BFS)",
+            "category": "trees",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "10 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
         self.visited: list[int] = []
         self.levels: list[list[int]] = []
+        self._visited_ids: list[int] = []
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
 
     def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
-        """Build binary tree from level-order list (None = missing node)."""
+        """Build binary tree from level-order list (None = missing node).
+
+        Nodes are recorded in a fresh node table, shared with every step by
+        reference (see algorithms.base.tree_state); the tree does not change.
+        """
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
         if not values or values[0] is None:
             return None
 
-        root = TreeNode(values[0])
+        root = TreeNode(values[0], self.nodes.add(values[0]))
         queue = deque([root])
         i = 1
 
@@ -66,35 +84,27 @@ class LevelOrder(StepTracker):
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = TreeNode(values[i], self.nodes.add(values[i], node.node_id, LEFT))
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = TreeNode(values[i], self.nodes.add(values[i], node.node_id, RIGHT))
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: TreeNode | None) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
-            return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+    def _tree_state(self) -> dict:
+        """Tree state for a step: the shared node table and its size."""
+        return {"type": "tree", "nodes": self._nodes_ref, "size": len(self.nodes)}
 
-    def _highlights(self, current: int | None) -> list[dict]:
+    def _highlights(self, current: TreeNode | None) -> list[dict]:
         """Green for already-visited nodes, blue for the node being visited."""
-        highlights: list[dict] = [
-            {"type": "node", "id": v, "color": "sorted"} for v in self.visited
-        ]
+        highlights: list[dict] = [{"nodes": self._visited_ids.copy(), "color": "sorted"}]
         if current is not None:
-            highlights.append({"type": "node", "id": current, "color": "active"})
+            highlights.append({"nodes": [current.node_id], "color": "active"})
         return highlights
 
     def run(self, input_data) -> Generator[Step, None, None]:
@@ -107,10 +117,10 @@ class LevelOrder(StepTracker):
         self.reset()
         self.visited = []
         self.levels = []
+        self._visited_ids = []
 
         values = input_data["values"] if isinstance(input_data, dict) else input_data
         root = self._build_tree_from_list(values)
-        tree_dict = self._tree_to_dict(root)
 
         yield self.emit_step(
             operation="init",
@@ -119,9 +129,9 @@ class LevelOrder(StepTracker):
                 "FIFO queue. Seed the queue with the root, then repeatedly dequeue a "
                 "node, record it, and enqueue its children."
             ),
-            state={"type": "tree", "tree": tree_dict},
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "current": None,
                 "current_level": None,
                 "level_values": [],
@@ -135,9 +145,9 @@ class LevelOrder(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty tree - nothing to traverse. Result: []",
-                state={"type": "tree", "tree": tree_dict},
+                state=lambda: self._tree_state(),
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "current": None,
                     "current_level": None,
                     "level_values": [],
@@ -158,13 +168,13 @@ class LevelOrder(StepTracker):
             yield self.emit_step(
                 operation="level_start",
                 description=(
-                    f"Start level {level_index}: the queue currently holds "
+                    lambda: f"Start level {level_index}: the queue currently holds "
                     f"{level_size} node(s). Snapshot that count - those are exactly "
                     f"the nodes on this level."
                 ),
-                state={"type": "tree", "tree": tree_dict},
-                highlights=self._highlights(None),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(None),
+                metadata=lambda: {
                     "current": None,
                     "current_level": level_index,
                     "level_values": [],
@@ -177,6 +187,7 @@ class LevelOrder(StepTracker):
             for _ in range(level_size):
                 node = queue.popleft()
                 self.visited.append(node.val)
+                self._visited_ids.append(node.node_id)
                 level_values.append(node.val)
 
                 if node.left:
@@ -194,11 +205,11 @@ class LevelOrder(StepTracker):
                 yield self.emit_step(
                     operation="visit",
                     description=(
-                        f"Dequeue {node.val} (level {level_index}) and record it, then {child_str}."
+                        lambda: f"Dequeue {node.val} (level {level_index}) and record it, then {child_str}."
                     ),
-                    state={"type": "tree", "tree": tree_dict},
-                    highlights=self._highlights(node.val),
-                    metadata={
+                    state=lambda: self._tree_state(),
+                    highlights=lambda: self._highlights(node),
+                    metadata=lambda: {
                         "current": node.val,
                         "current_level": level_index,
                         "level_values": level_values.copy(),
@@ -213,12 +224,12 @@ class LevelOrder(StepTracker):
             yield self.emit_step(
                 operation="level_end",
                 description=(
-                    f"Finished level {level_index}: {level_values}. Every node on this "
+                    lambda: f"Finished level {level_index}: {level_values}. Every node on this "
                     f"depth has been visited left-to-right."
                 ),
-                state={"type": "tree", "tree": tree_dict},
-                highlights=self._highlights(None),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(None),
+                metadata=lambda: {
                     "current": None,
                     "current_level": level_index,
                     "level_values": level_values.copy(),
@@ -233,12 +244,12 @@ class LevelOrder(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Level-order traversal complete. Result (grouped by level): "
+                lambda: f"Level-order traversal complete. Result (grouped by level): "
                 f"{self.levels}. Flat visit order: {self.visited}."
             ),
-            state={"type": "tree", "tree": tree_dict},
-            highlights=self._highlights(None),
-            metadata={
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._highlights(None),
+            metadata=lambda: {
                 "current": None,
                 "current_level": None,
                 "level_values": [],
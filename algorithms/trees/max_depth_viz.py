@@ -29,14 +29,15 @@ Key Insights:
 from collections import deque
 from collections.abc import Generator
 
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import LEFT, RIGHT, NodeTable, Step, StepTracker, VisualizerType
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: TreeNode | None = None
         self.right: TreeNode | None = None
 
@@ -45,19 +46,35 @@ class MaxDepth(StepTracker):
     """Compute the maximum depth of a binary tree with post-order DFS steps."""
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "tree_max_depth": {
+            "name": "Maximum Depth of Binary Tree",
+            "category": "trees",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "4 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
-        self.resolved: list[int] = []
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
+        self.resolved: list[int] = []  # node ids
         self.depths: dict[int, int] = {}
         self.max_depth: int = 0
 
     def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
-        """Build binary tree from level-order list (None = missing node)."""
+        """Build binary tree from level-order list (None = missing node).
+
+        Nodes are recorded in a fresh node table, shared with every step by
+        reference (see algorithms.base.tree_state); the tree does not change.
+        """
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
         if not values or values[0] is None:
             return None
 
-        root = TreeNode(values[0])
+        root = TreeNode(values[0], self.nodes.add(values[0]))
         queue = deque([root])
         i = 1
 
@@ -66,33 +83,27 @@ class MaxDepth(StepTracker):
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = TreeNode(values[i], self.nodes.add(values[i], node.node_id, LEFT))
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = TreeNode(values[i], self.nodes.add(values[i], node.node_id, RIGHT))
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: TreeNode | None) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
-            return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+    def _tree_state(self) -> dict:
+        """Tree state for a step: the shared node table and its size."""
+        return {"type": "tree", "nodes": self._nodes_ref, "size": len(self.nodes)}
 
-    def _deepest_path(self, node: TreeNode | None) -> list[int]:
+    def _deepest_path(self, node: TreeNode | None) -> list[TreeNode]:
         """Follow the taller child from root to a farthest leaf."""
-        path: list[int] = []
+        path: list[TreeNode] = []
         while node is not None:
-            path.append(node.val)
+            path.append(node)
             left_h = self._height(node.left)
             right_h = self._height(node.right)
             node = node.left if left_h >= right_h else node.right
@@ -106,8 +117,8 @@ class MaxDepth(StepTracker):
 
     def _highlights(
         self,
-        current: int | None,
-        path: list[int] | None = None,
+        current: TreeNode | None,
+        path: list[TreeNode] | None = None,
     ) -> list[dict]:
         """Green for resolved subtrees, blue for the current node, path override.
 
@@ -115,13 +126,11 @@ class MaxDepth(StepTracker):
         everything else defaults, to spotlight the longest root-to-leaf chain.
         """
         if path is not None:
-            return [{"type": "node", "id": v, "color": "sorted"} for v in path]
+            return [{"nodes": [n.node_id for n in path], "color": "sorted"}]
 
-        highlights: list[dict] = [
-            {"type": "node", "id": v, "color": "sorted"} for v in self.resolved
-        ]
+        highlights: list[dict] = [{"nodes": self.resolved.copy(), "color": "sorted"}]
         if current is not None:
-            highlights.append({"type": "node", "id": current, "color": "active"})
+            highlights.append({"nodes": [current.node_id], "color": "active"})
         return highlights
 
     def run(self, input_data) -> Generator[Step, None, None]:
@@ -146,26 +155,25 @@ class MaxDepth(StepTracker):
                 "We recurse: each node's depth is 1 + max(left depth, right depth), "
                 "and an empty child contributes depth 0."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={"current": None, "max_depth": 0, "node_depth": None},
+            metadata=lambda: {"current": None, "max_depth": 0, "node_depth": None},
         )
 
         _ = yield from self._depth(root, root, 1)
 
-        tree_dict = self._tree_to_dict(root)
-        deepest = self._deepest_path(root)
+        deepest = [n.val for n in self._deepest_path(root)]
 
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Maximum depth is {self.max_depth}. The highlighted chain "
+                lambda: f"Maximum depth is {self.max_depth}. The highlighted chain "
                 f"{' -> '.join(str(v) for v in deepest) if deepest else '(empty)'} "
                 "is a longest root-to-leaf path, and its length equals the answer."
             ),
-            state={"type": "tree", "tree": tree_dict},
-            highlights=self._highlights(None, path=deepest),
-            metadata={
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._highlights(None, path=self._deepest_path(root)),
+            metadata=lambda: {
                 "current": None,
                 "max_depth": self.max_depth,
                 "node_depth": self.max_depth,
@@ -187,12 +195,12 @@ class MaxDepth(StepTracker):
         yield self.emit_step(
             operation="descend",
             description=(
-                f"Visit node {node.val} (level {level}). Before we can size its "
+                lambda: f"Visit node {node.val} (level {level}). Before we can size its "
                 "subtree we must recurse into its children and ask how tall they are."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=self._highlights(node.val),
-            metadata={"current": node.val, "level": level, "max_depth": self.max_depth},
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._highlights(node),
+            metadata=lambda: {"current": node.val, "level": level, "max_depth": self.max_depth},
         )
 
         left_h = yield from self._depth(node.left, root, level + 1)
@@ -200,7 +208,7 @@ class MaxDepth(StepTracker):
 
         depth = 1 + max(left_h, right_h)
         self.depths[node.val] = depth
-        self.resolved.append(node.val)
+        self.resolved.append(node.node_id)
         self.max_depth = max(self.max_depth, depth)
 
         # Return: children resolved, finalize this node's height on the way up.
@@ -208,13 +216,13 @@ class MaxDepth(StepTracker):
         yield self.emit_step(
             operation="return",
             description=(
-                f"Node {node.val}: left subtree height {left_h}, right subtree "
+                lambda: f"Node {node.val}: left subtree height {left_h}, right subtree "
                 f"height {right_h}. Take the taller ({taller}) and add 1 -> depth "
                 f"{depth} bubbles up to its parent."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=self._highlights(node.val),
-            metadata={
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._highlights(node),
+            metadata=lambda: {
                 "current": node.val,
                 "level": level,
                 "node_depth": depth,
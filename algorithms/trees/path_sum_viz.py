@@ -34,14 +34,23 @@ Key Insights:
 from collections import deque
 from collections.abc import Generator
 
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import (
+    LEFT,
+    RIGHT,
+    NodeTable,
+    Step,
+    StepTracker,
+    VisualizerType,
+    path_to,
+)
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: TreeNode | None = None
         self.right: TreeNode | None = None
 
@@ -50,19 +59,36 @@ class PathSum(StepTracker):
     """Find a root-to-leaf path summing to a target, with running-sum steps."""
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "tree_path_sum": {
+            "name": "Path Sum (Root-to-Leaf)",
+            "category": "trees",
+            "entry": "run",
+            "cost": {"steps": "2 * len(values)", "state_bytes": "2 * len(values)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
         self.target: int = 0
         self.found: bool = False
         self.match_path: list[int] = []
+        self.match_node: TreeNode | None = None
 
     def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
-        """Build binary tree from level-order list (None = missing node)."""
+        """Build binary tree from level-order list (None = missing node).
+
+        Nodes are recorded in a fresh node table, shared with every step by
+        reference (see algorithms.base.tree_state); the tree does not change.
+        """
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
         if not values or values[0] is None:
             return None
 
-        root = TreeNode(values[0])
+        root = TreeNode(values[0], self.nodes.add(values[0]))
         queue = deque([root])
         i = 1
 
@@ -71,31 +97,25 @@ class PathSum(StepTracker):
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = TreeNode(values[i], self.nodes.add(values[i], node.node_id, LEFT))
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = TreeNode(values[i], self.nodes.add(values[i], node.node_id, RIGHT))
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: TreeNode | None) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
-            return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+    def _tree_state(self) -> dict:
+        """Tree state for a step: the shared node table and its size."""
+        return {"type": "tree", "nodes": self._nodes_ref, "size": len(self.nodes)}
 
-    def _highlights(self, path: list[int], color: str) -> list[dict]:
-        """Highlight every node currently on the active path with ``color``."""
-        return [{"type": "node", "id": val, "color": color} for val in path]
+    def _highlights(self, node: TreeNode, color: str) -> list[dict]:
+        """Highlight every node on the active path (the root down to ``node``) with ``color``."""
+        return [{"nodes": path_to(self.nodes.rows, node.node_id), "color": color}]
 
     def run(self, input_data) -> Generator[Step, None, None]:
         """Search for a root-to-leaf path summing to a target.
@@ -108,6 +128,7 @@ class PathSum(StepTracker):
         self.reset()
         self.found = False
         self.match_path = []
+        self.match_node = None
 
         if isinstance(input_data, dict):
             values = input_data.get("values", [])
@@ -121,13 +142,13 @@ class PathSum(StepTracker):
         yield self.emit_step(
             operation="init",
             description=(
-                f"Path Sum: is there a root-to-leaf path summing to {self.target}? "
+                lambda: f"Path Sum: is there a root-to-leaf path summing to {self.target}? "
                 "DFS from the root, carrying a running sum down each branch and "
                 "checking it only at the leaves."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "current": None,
                 "running_sum": 0,
                 "target": self.target,
@@ -138,19 +159,17 @@ class PathSum(StepTracker):
 
         yield from self._dfs(root, 0, [], root)
 
-        tree_dict = self._tree_to_dict(root)
-
         if self.found:
             path_str = " + ".join(str(v) for v in self.match_path)
             yield self.emit_step(
                 operation="complete",
                 description=(
-                    f"Found it! The path {path_str} = {self.target} reaches a leaf "
+                    lambda: f"Found it! The path {path_str} = {self.target} reaches a leaf "
                     "and matches the target. A valid root-to-leaf path exists."
                 ),
-                state={"type": "tree", "tree": tree_dict},
-                highlights=self._highlights(self.match_path, "sorted"),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(self.match_node, "sorted"),
+                metadata=lambda: {
                     "current": None,
                     "running_sum": self.target,
                     "target": self.target,
@@ -162,12 +181,12 @@ class PathSum(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description=(
-                    f"No root-to-leaf path sums to {self.target}. Every leaf was "
+                    lambda: f"No root-to-leaf path sums to {self.target}. Every leaf was "
                     "reached and none of the accumulated sums matched the target."
                 ),
-                state={"type": "tree", "tree": tree_dict},
+                state=lambda: self._tree_state(),
                 highlights=[],
-                metadata={
+                metadata=lambda: {
                     "current": None,
                     "running_sum": 0,
                     "target": self.target,
@@ -197,15 +216,16 @@ class PathSum(StepTracker):
             if running_sum == self.target:
                 self.found = True
                 self.match_path = path.copy()
+                self.match_node = node
                 yield self.emit_step(
                     operation="match",
                     description=(
-                        f"Leaf {node.val} reached with running sum {running_sum} == "
+                        lambda: f"Leaf {node.val} reached with running sum {running_sum} == "
                         f"target {self.target}. This root-to-leaf path matches - stop."
                     ),
-                    state={"type": "tree", "tree": self._tree_to_dict(root)},
-                    highlights=self._highlights(path, "sorted"),
-                    metadata={
+                    state=lambda: self._tree_state(),
+                    highlights=lambda: self._highlights(node, "sorted"),
+                    metadata=lambda: {
                         "current": node.val,
                         "running_sum": running_sum,
                         "target": self.target,
@@ -218,12 +238,12 @@ class PathSum(StepTracker):
             yield self.emit_step(
                 operation="leaf",
                 description=(
-                    f"Leaf {node.val} reached with running sum {running_sum} != "
+                    lambda: f"Leaf {node.val} reached with running sum {running_sum} != "
                     f"target {self.target}. This path fails - backtrack and try another."
                 ),
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=self._highlights(path, "comparing"),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(node, "comparing"),
+                metadata=lambda: {
                     "current": node.val,
                     "running_sum": running_sum,
                     "target": self.target,
@@ -237,12 +257,12 @@ class PathSum(StepTracker):
         yield self.emit_step(
             operation="visit",
             description=(
-                f"Visit node {node.val}. Running sum is now {running_sum}; "
+                lambda: f"Visit node {node.val}. Running sum is now {running_sum}; "
                 f"{remaining} left to reach {self.target}. Descend into its children."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=self._highlights(path, "active"),
-            metadata={
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._highlights(node, "active"),
+            metadata=lambda: {
                 "current": node.val,
                 "running_sum": running_sum,
                 "target": self.target,
@@ -0,0 +1,52 @@
+"""Tests for the BST visualizer."""
+
+import pytest
+
+from algorithms.base import build_tree, path_to
+from algorithms.trees import load_bst_module
+
+BST = load_bst_module().BST
+
+
+class TestBSTSteps:
+    """Test BST steps sharing one node table."""
+
+    @pytest.fixture
+    def bst(self):
+        """Create a fresh BST instance."""
+        return BST()
+
+    def test_insert_shares_one_table(self, bst):
+        steps = list(bst.insert([50, 30, 70, 20]))
+        rows = bst.get_references()["nodes"]
+
+        assert all(step.state["nodes"] == {"$ref": "nodes"} for step in steps)
+        assert [steps[0].state["size"], steps[-1].state["size"]] == [0, 4]
+        assert build_tree(rows)["left"]["left"]["val"] == 20
+
+    def test_compare_highlights_only_current_node(self, bst):
+        steps = list(bst.insert([50, 30, 20]))
+        compare = [step for step in steps if step.operation == "compare"][-1]
+
+        assert compare.highlights[0].nodes == [1]
+        assert path_to(bst.get_references()["nodes"], compare.state["path"]) == [0, 1]
+
+    def test_search_found(self, bst):
+        steps = list(bst.search([50, 30, 70], 70))
+
+        assert steps[-1].operation == "found"
+        assert steps[-1].highlights[0].nodes == [2]
+        assert steps[-1].metadata["path"] == [50, 70]
+
+    def test_search_not_found_keeps_path(self, bst):
+        steps = list(bst.search([50, 30, 70], 40))
+
+        assert steps[-1].operation == "not_found"
+        assert path_to(bst.get_references()["nodes"], steps[-1].state["path"]) == [0, 1]
+
+    def test_degenerate_tree_past_recursion_limit(self):
+        bst = BST().configure(retain=False)
+        *_, last = bst.search(list(range(1200)), 1199)
+
+        assert last.operation == "found"
+        assert len(path_to(bst.get_references()["nodes"], last.state["path"])) == 1200
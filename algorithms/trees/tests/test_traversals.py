@@ -0,0 +1,55 @@
+"""Tests for binary tree traversals."""
+
+import pytest
+
+from algorithms.base import build_tree
+from algorithms.trees.traversals import TreeTraversals
+
+
+class TestTraversals:
+    """Test traversal order and tree state."""
+
+    VALUES = [4, 2, 6, 1, 3, 5, 7]
+
+    @pytest.mark.parametrize(
+        "method,expected",
+        [
+            ("inorder", [1, 2, 3, 4, 5, 6, 7]),
+            ("preorder", [4, 2, 1, 3, 6, 5, 7]),
+            ("postorder", [1, 3, 2, 5, 7, 6, 4]),
+        ],
+    )
+    def test_order(self, method, expected):
+        steps = list(getattr(TreeTraversals(), method)(self.VALUES))
+        assert steps[-1].metadata["order"] == expected
+
+    def test_tree_is_shared_and_constant(self):
+        traversals = TreeTraversals()
+        steps = list(traversals.inorder([2, 1, 3]))
+
+        assert {step.state["size"] for step in steps} == {3}
+        assert build_tree(traversals.get_references()["nodes"])["left"]["val"] == 1
+
+    def test_highlights_use_node_ids(self):
+        steps = list(TreeTraversals().preorder([2, 1, 3]))
+        visits = [step for step in steps if step.operation == "visit"]
+
+        assert [step.highlights[0].nodes for step in visits] == [[0], [1], [2]]
+
+    def test_visits_carry_only_the_appended_value(self):
+        steps = list(TreeTraversals().postorder(self.VALUES))
+        order = [step.metadata["visited"] for step in steps if step.operation == "visit"]
+
+        assert order == steps[-1].metadata["order"]
+        assert all("order" not in step.metadata for step in steps[1:-1])
+
+    @pytest.mark.parametrize("method", ["inorder", "preorder", "postorder"])
+    def test_deep_tree(self, method):
+        # A right-leaning chain of 2000 nodes in level order
+        values = [0]
+        for i in range(1, 2000):
+            values += [None, i]
+        steps = list(getattr(TreeTraversals(), method)(values))
+
+        expected = list(range(2000))
+        assert steps[-1].metadata["order"] == (expected[::-1] if method == "postorder" else expected)
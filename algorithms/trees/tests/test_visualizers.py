@@ -0,0 +1,61 @@
+"""Tests for the tree visualizers' shared node table and id highlights."""
+
+import pytest
+
+from algorithms.base import build_tree
+from algorithms.trees.invert_binary_tree_viz import InvertBinaryTree
+from algorithms.trees.lca_viz import LowestCommonAncestor
+from algorithms.trees.level_order_viz import LevelOrder
+from algorithms.trees.max_depth_viz import MaxDepth
+from algorithms.trees.path_sum_viz import PathSum
+from algorithms.trees.tree_diameter_viz import TreeDiameter
+from algorithms.trees.validate_bst_viz import ValidateBST
+
+VALUES = [6, 2, 8, 0, 4, 7, 9]
+
+
+@pytest.mark.parametrize(
+    "cls, input_data",
+    [
+        (LevelOrder, VALUES),
+        (LowestCommonAncestor, {"values": VALUES, "p": 0, "q": 4}),
+        (MaxDepth, VALUES),
+        (PathSum, {"values": VALUES, "target": 12}),
+        (TreeDiameter, VALUES),
+        (ValidateBST, VALUES),
+    ],
+    ids=lambda value: value.__name__ if isinstance(value, type) else "",
+)
+def test_tree_is_shared_and_highlights_use_ids(cls, input_data):
+    visualizer = cls()
+    steps = list(visualizer.run(input_data))
+    rows = visualizer.get_references()["nodes"]
+
+    state = {"type": "tree", "nodes": {"$ref": "nodes"}, "size": 7}
+    assert all(step.state == state for step in steps)
+    assert build_tree(rows)["right"]["left"]["val"] == 7
+    ids = {node for step in steps for h in step.highlights for node in h.nodes}
+    assert ids and ids <= set(range(len(rows)))
+
+
+def test_invert_snapshots_carry_ids():
+    steps = list(InvertBinaryTree().run(VALUES))
+
+    tree = steps[-1].state["tree"]
+    assert (tree["left"]["id"], tree["left"]["val"]) == (2, 8)
+    swap = next(step for step in steps if step.operation == "swap_children")
+    assert [h.nodes for h in swap.highlights] == [[0], [1, 2]]
+
+
+def test_deep_invert_snapshot():
+    # A right-leaning chain deeper than the recursion limit
+    values = [0]
+    for i in range(1, 1500):
+        values += [None, i]
+    visualizer = InvertBinaryTree()
+    root = visualizer._build_tree_from_list(values)
+
+    snapshot = visualizer._tree_to_dict(root)
+    for _ in range(1499):
+        snapshot = snapshot["right"]
+    assert snapshot["val"] == 1499
@@ -1,7 +1,7 @@
 """Binary Tree Traversals - In-order, Pre-order, Post-order, Level-order.
 
 Time Complexity: O(n) where n = number of nodes
-Space Complexity: O(h) for recursion stack where h = height
+Space Complexity: O(h) for the stack where h = height
 
 Key Insights:
     - In-order (Left-Root-Right): Gives sorted sequence for BST
@@ -11,35 +11,78 @@ Key Insights:
     - All visit each node exactly once - O(n) time
 """
 
-from typing import Generator, Optional
 from collections import deque
-from algorithms.base import StepTracker, Step, VisualizerType
+from collections.abc import Generator
+
+from algorithms.base import LEFT, RIGHT, NodeTable, Step, StepTracker, VisualizerType
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
-        self.left: Optional[TreeNode] = None
-        self.right: Optional[TreeNode] = None
+        self.node_id = node_id
+        self.left: TreeNode | None = None
+        self.right: TreeNode | None = None
 
 
 class TreeTraversals(StepTracker):
-    """Binary tree traversals with visualization."""
+    """Binary tree traversals with visualization.
+
+    The tree is shared by reference (see algorithms.base.tree_state). Each
+    visit step's metadata carries the value it appends to the traversal
+    order (``visited``); the init and complete steps carry the whole
+    ``order``. The traversals use an explicit stack, so degenerate trees of
+    any depth are fine.
+    """
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "tree_inorder": {
+            "name": "Tree In-order Traversal",
+            "category": "trees",
+            "entry": "inorder",
+            "input": {"values": []},
+            "shorthand": "values",
+            "cost": {"steps": "2 * len(values) + 1", "state_bytes": "2 * len(values)"},
+        },
+        "tree_preorder": {
+            "name": "Tree Pre-order Traversal",
+            "category": "trees",
+            "entry": "preorder",
+            "input": {"values": []},
+            "shorthand": "values",
+            "cost": {"steps": "2 * len(values) + 1", "state_bytes": "2 * len(values)"},
+        },
+        "tree_postorder": {
+            "name": "Tree Post-order Traversal",
+            "category": "trees",
+            "entry": "postorder",
+            "input": {"values": []},
+            "shorthand": "values",
+            "cost": {"steps": "2 * len(values) + 1", "state_bytes": "2 * len(values)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
-        self.traversal_order = []
-
-    def _build_tree_from_list(self, values: list[int | None]) -> Optional[TreeNode]:
-        """Build binary tree from level-order list (None = missing node)."""
+        self.traversal_order: list[int] = []
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
+
+    def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
+        """Build binary tree from level-order list (None = missing node).
+
+        Nodes are recorded in a fresh node table, shared with every step by
+        reference; the tree does not change during a traversal.
+        """
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
         if not values or values[0] is None:
             return None
 
-        root = TreeNode(values[0])
+        root = TreeNode(values[0], self.nodes.add(values[0]))
         queue = deque([root])
         i = 1
 
@@ -48,231 +91,149 @@ class TreeTraversals(StepTracker):
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = TreeNode(values[i], self.nodes.add(values[i], node.node_id, LEFT))
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = TreeNode(values[i], self.nodes.add(values[i], node.node_id, RIGHT))
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: Optional[TreeNode]) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
-            return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+    def _tree_state(self) -> dict:
+        """Tree state for a step: the shared node table and its size."""
+        return {"type": "tree", "nodes": self._nodes_ref, "size": len(self.nodes)}
 
     def inorder(self, values: list[int | None]) -> Generator[Step, None, None]:
         """In-order traversal (Left-Root-Right)."""
-        self.reset()
-        self.traversal_order = []
-        root = self._build_tree_from_list(values)
-
-        yield self.emit_step(
-            operation="init",
-            description="In-order traversal: Left → Root → Right",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=[],
-            metadata={"traversal_type": "inorder", "order": []},
-        )
+        yield from self._traverse(values, "inorder", "In-order traversal: Left → Root → Right")
 
-        yield from self._inorder_helper(root, root)
+    def preorder(self, values: list[int | None]) -> Generator[Step, None, None]:
+        """Pre-order traversal (Root-Left-Right)."""
+        yield from self._traverse(values, "preorder", "Pre-order traversal: Root → Left → Right")
 
-        yield self.emit_step(
-            operation="complete",
-            description=f"In-order complete: {self.traversal_order}",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=[],
-            metadata={"traversal_type": "inorder", "order": self.traversal_order},
-        )
+    def postorder(self, values: list[int | None]) -> Generator[Step, None, None]:
+        """Post-order traversal (Left-Right-Root)."""
+        yield from self._traverse(values, "postorder", "Post-order traversal: Left → Right → Root")
 
-    def _inorder_helper(
-        self, node: Optional[TreeNode], root: TreeNode
+    def _traverse(
+        self, values: list[int | None], traversal_type: str, title: str
     ) -> Generator[Step, None, None]:
-        """Recursive in-order helper."""
-        if not node:
-            return
-
-        # Visit left subtree
-        if node.left:
-            yield self.emit_step(
-                operation="traverse_left",
-                description=f"Going left from {node.val} to {node.left.val}",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=[
-                    {"type": "node", "id": node.val, "color": "active"},
-                    {"type": "node", "id": node.left.val, "color": "comparing"},
-                ],
-                metadata={"current": node.val, "order": self.traversal_order.copy()},
-            )
-            yield from self._inorder_helper(node.left, root)
-
-        # Visit root
-        self.traversal_order.append(node.val)
-        yield self.emit_step(
-            operation="visit",
-            description=f"Visit {node.val}",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=[{"type": "node", "id": node.val, "color": "sorted"}],
-            metadata={"current": node.val, "order": self.traversal_order.copy()},
-        )
-
-        # Visit right subtree
-        if node.right:
-            yield self.emit_step(
-                operation="traverse_right",
-                description=f"Going right from {node.val} to {node.right.val}",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=[
-                    {"type": "node", "id": node.val, "color": "sorted"},
-                    {"type": "node", "id": node.right.val, "color": "comparing"},
-                ],
-                metadata={"current": node.val, "order": self.traversal_order.copy()},
-            )
-            yield from self._inorder_helper(node.right, root)
-
-    def preorder(self, values: list[int | None]) -> Generator[Step, None, None]:
-        """Pre-order traversal (Root-Left-Right)."""
+        """Build the tree, then run one traversal between an init and a complete step."""
         self.reset()
         self.traversal_order = []
         root = self._build_tree_from_list(values)
 
         yield self.emit_step(
             operation="init",
-            description="Pre-order traversal: Root → Left → Right",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
+            description=title,
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={"traversal_type": "preorder", "order": []},
+            metadata=lambda: {"traversal_type": traversal_type, "order": []},
         )
 
-        yield from self._preorder_helper(root, root)
+        helper = getattr(self, f"_{traversal_type}_helper")
+        yield from helper(root)
 
         yield self.emit_step(
             operation="complete",
-            description=f"Pre-order complete: {self.traversal_order}",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
+            description=lambda: f"{title.split(' traversal')[0]} complete: {self.traversal_order}",
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={"traversal_type": "preorder", "order": self.traversal_order},
+            metadata=lambda: {"traversal_type": traversal_type, "order": self.traversal_order},
         )
 
-    def _preorder_helper(
-        self, node: Optional[TreeNode], root: TreeNode
-    ) -> Generator[Step, None, None]:
-        """Recursive pre-order helper."""
-        if not node:
-            return
-
-        # Visit root first
+    def _visit(self, node: TreeNode) -> Step:
+        """Append a node to the traversal order and emit its visit step."""
         self.traversal_order.append(node.val)
-        yield self.emit_step(
+        return self.emit_step(
             operation="visit",
-            description=f"Visit {node.val}",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=[{"type": "node", "id": node.val, "color": "sorted"}],
-            metadata={"current": node.val, "order": self.traversal_order.copy()},
+            description=lambda: f"Visit {node.val}",
+            state=lambda: self._tree_state(),
+            highlights=lambda: [{"nodes": [node.node_id], "color": "sorted"}],
+            metadata=lambda: {"current": node.val, "visited": node.val},
         )
 
-        # Visit left subtree
-        if node.left:
-            yield self.emit_step(
-                operation="traverse_left",
-                description=f"Going left from {node.val} to {node.left.val}",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=[
-                    {"type": "node", "id": node.val, "color": "sorted"},
-                    {"type": "node", "id": node.left.val, "color": "comparing"},
-                ],
-                metadata={"current": node.val, "order": self.traversal_order.copy()},
-            )
-            yield from self._preorder_helper(node.left, root)
-
-        # Visit right subtree
-        if node.right:
-            yield self.emit_step(
-                operation="traverse_right",
-                description=f"Going right from {node.val} to {node.right.val}",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=[
-                    {"type": "node", "id": node.val, "color": "sorted"},
-                    {"type": "node", "id": node.right.val, "color": "comparing"},
-                ],
-                metadata={"current": node.val, "order": self.traversal_order.copy()},
-            )
-            yield from self._preorder_helper(node.right, root)
-
-    def postorder(self, values: list[int | None]) -> Generator[Step, None, None]:
-        """Post-order traversal (Left-Right-Root)."""
-        self.reset()
-        self.traversal_order = []
-        root = self._build_tree_from_list(values)
-
-        yield self.emit_step(
-            operation="init",
-            description="Post-order traversal: Left → Right → Root",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=[],
-            metadata={"traversal_type": "postorder", "order": []},
+    def _go_left(self, node: TreeNode, color: str) -> Step:
+        """Emit the step descending from node to its left child."""
+        return self.emit_step(
+            operation="traverse_left",
+            description=lambda: f"Going left from {node.val} to {node.left.val}",
+            state=lambda: self._tree_state(),
+            highlights=lambda: [
+                {"nodes": [node.node_id], "color": color},
+                {"nodes": [node.left.node_id], "color": "comparing"},
+            ],
+            metadata=lambda: {"current": node.val},
         )
 
-        yield from self._postorder_helper(root, root)
-
-        yield self.emit_step(
-            operation="complete",
-            description=f"Post-order complete: {self.traversal_order}",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=[],
-            metadata={"traversal_type": "postorder", "order": self.traversal_order},
+    def _go_right(self, node: TreeNode, color: str) -> Step:
+        """Emit the step descending from node to its right child."""
+        return self.emit_step(
+            operation="traverse_right",
+            description=lambda: f"Going right from {node.val} to {node.right.val}",
+            state=lambda: self._tree_state(),
+            highlights=lambda: [
+                {"nodes": [node.node_id], "color": color},
+                {"nodes": [node.right.node_id], "color": "comparing"},
+            ],
+            metadata=lambda: {"current": node.val},
         )
 
-    def _postorder_helper(
-        self, node: Optional[TreeNode], root: TreeNode
-    ) -> Generator[Step, None, None]:
-        """Recursive post-order helper."""
-        if not node:
-            return
-
-        # Visit left subtree
-        if node.left:
-            yield self.emit_step(
-                operation="traverse_left",
-                description=f"Going left from {node.val} to {node.left.val}",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=[
-                    {"type": "node", "id": node.val, "color": "active"},
-                    {"type": "node", "id": node.left.val, "color": "comparing"},
-                ],
-                metadata={"current": node.val, "order": self.traversal_order.copy()},
-            )
-            yield from self._postorder_helper(node.left, root)
-
-        # Visit right subtree
-        if node.right:
-            yield self.emit_step(
-                operation="traverse_right",
-                description=f"Going right from {node.val} to {node.right.val}",
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=[
-                    {"type": "node", "id": node.val, "color": "active"},
-                    {"type": "node", "id": node.right.val, "color": "comparing"},
-                ],
-                metadata={"current": node.val, "order": self.traversal_order.copy()},
-            )
-            yield from self._postorder_helper(node.right, root)
-
-        # Visit root last
-        self.traversal_order.append(node.val)
-        yield self.emit_step(
-            operation="visit",
-            description=f"Visit {node.val}",
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=[{"type": "node", "id": node.val, "color": "sorted"}],
-            metadata={"current": node.val, "order": self.traversal_order.copy()},
-        )
+    def _inorder_helper(self, root: TreeNode | None) -> Generator[Step, None, None]:
+        """Iterative in-order: descend left pushing nodes, then visit and go right."""
+        stack: list[TreeNode] = []
+        node = root
+        while node or stack:
+            if node:
+                stack.append(node)
+                if node.left:
+                    yield self._go_left(node, "active")
+                node = node.left
+            else:
+                node = stack.pop()
+                yield self._visit(node)
+                if node.right:
+                    yield self._go_right(node, "sorted")
+                node = node.right
+
+    def _preorder_helper(self, root: TreeNode | None) -> Generator[Step, None, None]:
+        """Iterative pre-order: visit and go left; the stack holds nodes still to go right from."""
+        stack: list[TreeNode] = []
+        node = root
+        while node or stack:
+            if node:
+                yield self._visit(node)
+                if node.right:
+                    stack.append(node)
+                if node.left:
+                    yield self._go_left(node, "sorted")
+                node = node.left
+            else:
+                node = stack.pop()
+                yield self._go_right(node, "sorted")
+                node = node.right
+
+    def _postorder_helper(self, root: TreeNode | None) -> Generator[Step, None, None]:
+        """Iterative post-order: a node is visited once its right subtree is done."""
+        stack: list[TreeNode] = []
+        node = root
+        last_visited = None
+        while node or stack:
+            if node:
+                stack.append(node)
+                if node.left:
+                    yield self._go_left(node, "active")
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right and top.right is not last_visited:
+                    yield self._go_right(top, "active")
+                    node = top.right
+                else:
+                    stack.pop()
+                    yield self._visit(top)
+                    last_visited = top
@@ -32,14 +32,15 @@ Key Insights:
 from collections import deque
 from collections.abc import Generator
 
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import LEFT, RIGHT, NodeTable, Step, StepTracker, VisualizerType
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: TreeNode | None = None
         self.right: TreeNode | None = None
 
@@ -48,19 +49,37 @@ class TreeDiameter(StepTracker):
     """Compute a binary tree's diameter with a post-order height visualization."""
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "tree_diameter": {
+            "name": "Binary Tree Diameter",
+            "category": "trees",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "10 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
         self.heights: dict[int, int] = {}
         self.best_diameter: int = 0
         self.best_path: list[int] = []
+        self._measured: list[int] = []  # ids of nodes whose height is known
+        self._best_nodes: list[TreeNode] = []
 
     def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
-        """Build binary tree from level-order list (None = missing node)."""
+        """Build binary tree from level-order list (None = missing node).
+
+        Nodes are recorded in a fresh node table, shared with every step by
+        reference (see algorithms.base.tree_state); the tree does not change.
+        """
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
         if not values or values[0] is None:
             return None
 
-        root = TreeNode(values[0])
+        root = TreeNode(values[0], self.nodes.add(values[0]))
         queue = deque([root])
         i = 1
 
@@ -69,38 +88,33 @@ class TreeDiameter(StepTracker):
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = TreeNode(values[i], self.nodes.add(values[i], node.node_id, LEFT))
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = TreeNode(values[i], self.nodes.add(values[i], node.node_id, RIGHT))
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: TreeNode | None) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
-            return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+    def _tree_state(self) -> dict:
+        """Tree state for a step: the shared node table and its size."""
+        return {"type": "tree", "nodes": self._nodes_ref, "size": len(self.nodes)}
 
-    def _highlights(self, current: int | None, path: list[int] | None) -> list[dict]:
+    def _highlights(self, current: TreeNode | None) -> list[dict]:
         """Color map: green = height known, blue = current node, yellow = best path."""
-        colors: dict[int, str] = {}
-        for v in self.heights:
-            colors[v] = "sorted"
+        colors: dict[int, str] = dict.fromkeys(self._measured, "sorted")
         if current is not None:
-            colors[current] = "active"
-        for v in path or []:
-            colors[v] = "comparing"
-        return [{"type": "node", "id": v, "color": c} for v, c in colors.items()]
+            colors[current.node_id] = "active"
+        for n in self._best_nodes:
+            colors[n.node_id] = "comparing"
+        by_color: dict[str, list[int]] = {}
+        for node_id, color in colors.items():
+            by_color.setdefault(color, []).append(node_id)
+        return [{"nodes": ids, "color": color} for color, ids in by_color.items()]
 
     def run(self, input_data) -> Generator[Step, None, None]:
         """Compute the diameter from level-order input, emitting a step per node.
@@ -113,10 +127,11 @@ class TreeDiameter(StepTracker):
         self.heights = {}
         self.best_diameter = 0
         self.best_path = []
+        self._measured = []
+        self._best_nodes = []
 
         values = input_data["values"] if isinstance(input_data, dict) else input_data
         root = self._build_tree_from_list(values)
-        tree_dict = self._tree_to_dict(root)
 
         yield self.emit_step(
             operation="init",
@@ -125,9 +140,9 @@ class TreeDiameter(StepTracker):
                 "Post-order DFS: return each node's height, and at every node "
                 "track the best height(left) + height(right)."
             ),
-            state={"type": "tree", "tree": tree_dict},
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={
+            metadata=lambda: {
                 "current": None,
                 "best_diameter": 0,
                 "heights": {},
@@ -138,9 +153,9 @@ class TreeDiameter(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description="Empty tree - the diameter is 0 (no edges).",
-                state={"type": "tree", "tree": tree_dict},
+                state=lambda: self._tree_state(),
                 highlights=[],
-                metadata={"current": None, "best_diameter": 0, "heights": {}},
+                metadata=lambda: {"current": None, "best_diameter": 0, "heights": {}},
             )
             return
 
@@ -150,13 +165,13 @@ class TreeDiameter(StepTracker):
         yield self.emit_step(
             operation="complete",
             description=(
-                f"Diameter = {self.best_diameter} edge(s). Longest path: "
+                lambda: f"Diameter = {self.best_diameter} edge(s). Longest path: "
                 + (" → ".join(str(v) for v in self.best_path) if self.best_path else "single node")
                 + "."
             ),
-            state={"type": "tree", "tree": tree_dict},
-            highlights=self._highlights(None, self.best_path),
-            metadata={
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._highlights(None),
+            metadata=lambda: {
                 "current": None,
                 "best_diameter": self.best_diameter,
                 "heights": dict(self.heights),
@@ -166,7 +181,7 @@ class TreeDiameter(StepTracker):
 
     def _diameter(
         self, node: TreeNode | None, root: TreeNode
-    ) -> Generator[Step, None, tuple[int, list[int]]]:
+    ) -> Generator[Step, None, tuple[int, list[TreeNode]]]:
         """Post-order: return (height in edges, downward path to deepest leaf).
 
         Height convention: a leaf has height 0, a missing child has height -1
@@ -181,23 +196,25 @@ class TreeDiameter(StepTracker):
         height = 1 + max(left_h, right_h)
         # Through-path length in edges: an absent child (height -1) adds nothing.
         through = left_h + right_h + 2
-        down_path = [node.val] + (left_path if left_h >= right_h else right_path)
+        down_path = [node] + (left_path if left_h >= right_h else right_path)
 
         self.heights[node.val] = height
+        self._measured.append(node.node_id)
 
         if through > self.best_diameter:
             self.best_diameter = through
-            self.best_path = list(reversed(left_path)) + [node.val] + right_path
+            self._best_nodes = list(reversed(left_path)) + [node] + right_path
+            self.best_path = [n.val for n in self._best_nodes]
             yield self.emit_step(
                 operation="update",
                 description=(
-                    f"Node {node.val}: {left_h + 1} edge(s) down-left, "
+                    lambda: f"Node {node.val}: {left_h + 1} edge(s) down-left, "
                     f"{right_h + 1} down-right → through-path = {through} edge(s). "
                     f"New best diameter = {self.best_diameter}."
                 ),
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=self._highlights(node.val, self.best_path),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(node),
+                metadata=lambda: {
                     "current": node.val,
                     "height": height,
                     "through": through,
@@ -210,13 +227,13 @@ class TreeDiameter(StepTracker):
             yield self.emit_step(
                 operation="visit",
                 description=(
-                    f"Node {node.val}: height = {height} edge(s). Through-path here "
+                    lambda: f"Node {node.val}: height = {height} edge(s). Through-path here "
                     f"= {through} edge(s), which does not beat the best "
                     f"({self.best_diameter})."
                 ),
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=self._highlights(node.val, self.best_path),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(node),
+                metadata=lambda: {
                     "current": node.val,
                     "height": height,
                     "through": through,
@@ -30,14 +30,15 @@ Key Insights:
 from collections import deque
 from collections.abc import Generator
 
-from algorithms.base import Step, StepTracker, VisualizerType
+from algorithms.base import LEFT, RIGHT, NodeTable, Step, StepTracker, VisualizerType
 
 
 class TreeNode:
     """Binary tree node."""
 
-    def __init__(self, val: int):
+    def __init__(self, val: int, node_id: int = 0):
         self.val = val
+        self.node_id = node_id
         self.left: TreeNode | None = None
         self.right: TreeNode | None = None
 
@@ -46,18 +47,36 @@ class ValidateBST(StepTracker):
     """Validate a binary search tree with (low, high) bound visualization."""
 
     visualizer_type = VisualizerType.TREE
+    registrations = {
+        "validate_bst": {
+            "name": "Validate BST",
+            "category": "trees",
+            "entry": "run",
+            "cost": {"steps": "2 * len(input)", "state_bytes": "4 * len(input)"},
+        },
+    }
 
     def __init__(self):
         super().__init__()
+        self.nodes = NodeTable()
+        self._nodes_ref: dict[str, str] = {}
         self.valid_nodes: list[int] = []
         self.violation: int | None = None
+        self._valid_ids: list[int] = []
+        self._violation_node: TreeNode | None = None
 
     def _build_tree_from_list(self, values: list[int | None]) -> TreeNode | None:
-        """Build binary tree from level-order list (None = missing node)."""
+        """Build binary tree from level-order list (None = missing node).
+
+        Nodes are recorded in a fresh node table, shared with every step by
+        reference (see algorithms.base.tree_state); the tree does not change.
+        """
+        self.nodes = NodeTable()
+        self._nodes_ref = self.reference("nodes", self.nodes.rows)
         if not values or values[0] is None:
             return None
 
-        root = TreeNode(values[0])
+        root = TreeNode(values[0], self.nodes.add(values[0]))
         queue = deque([root])
         i = 1
 
@@ -66,27 +85,21 @@ class ValidateBST(StepTracker):
 
             # Left child
             if i < len(values) and values[i] is not None:
-                node.left = TreeNode(values[i])
+                node.left = TreeNode(values[i], self.nodes.add(values[i], node.node_id, LEFT))
                 queue.append(node.left)
             i += 1
 
             # Right child
             if i < len(values) and values[i] is not None:
-                node.right = TreeNode(values[i])
+                node.right = TreeNode(values[i], self.nodes.add(values[i], node.node_id, RIGHT))
                 queue.append(node.right)
             i += 1
 
         return root
 
-    def _tree_to_dict(self, node: TreeNode | None) -> dict | None:
-        """Convert tree to dict for visualization."""
-        if not node:
-            return None
-        return {
-            "val": node.val,
-            "left": self._tree_to_dict(node.left),
-            "right": self._tree_to_dict(node.right),
-        }
+    def _tree_state(self) -> dict:
+        """Tree state for a step: the shared node table and its size."""
+        return {"type": "tree", "nodes": self._nodes_ref, "size": len(self.nodes)}
 
     @staticmethod
     def _bound_str(lo: int | None, hi: int | None) -> str:
@@ -95,15 +108,13 @@ class ValidateBST(StepTracker):
         hi_str = "+∞" if hi is None else str(hi)
         return f"({lo_str}, {hi_str})"
 
-    def _highlights(self, current: int | None, violation: int | None) -> list[dict]:
+    def _highlights(self, current: TreeNode | None, violation: TreeNode | None) -> list[dict]:
         """Green for already-valid nodes, blue for current, yellow for a violation."""
-        highlights: list[dict] = [
-            {"type": "node", "id": v, "color": "sorted"} for v in self.valid_nodes
-        ]
+        highlights: list[dict] = [{"nodes": self._valid_ids.copy(), "color": "sorted"}]
         if violation is not None:
-            highlights.append({"type": "node", "id": violation, "color": "comparing"})
+            highlights.append({"nodes": [violation.node_id], "color": "comparing"})
         elif current is not None:
-            highlights.append({"type": "node", "id": current, "color": "active"})
+            highlights.append({"nodes": [current.node_id], "color": "active"})
         return highlights
 
     def run(self, input_data) -> Generator[Step, None, None]:
@@ -116,6 +127,8 @@ class ValidateBST(StepTracker):
         self.reset()
         self.valid_nodes = []
         self.violation = None
+        self._valid_ids = []
+        self._violation_node = None
 
         values = input_data["values"] if isinstance(input_data, dict) else input_data
         root = self._build_tree_from_list(values)
@@ -126,15 +139,13 @@ class ValidateBST(StepTracker):
                 "Validate BST: every node must fall strictly within an allowed "
                 "(low, high) range. The root starts with the full range (-∞, +∞)."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
+            state=lambda: self._tree_state(),
             highlights=[],
-            metadata={"current": None, "range": self._bound_str(None, None), "is_valid": None},
+            metadata=lambda: {"current": None, "range": self._bound_str(None, None), "is_valid": None},
         )
 
         yield from self._validate(root, None, None, root)
 
-        tree_dict = self._tree_to_dict(root)
-
         if self.violation is None:
             yield self.emit_step(
                 operation="complete",
@@ -142,9 +153,9 @@ class ValidateBST(StepTracker):
                     "Valid BST! Every node satisfied its (low, high) bounds - "
                     "the tree respects the binary-search-tree ordering globally."
                 ),
-                state={"type": "tree", "tree": tree_dict},
-                highlights=self._highlights(None, None),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(None, None),
+                metadata=lambda: {
                     "current": None,
                     "is_valid": True,
                     "checked": self.valid_nodes.copy(),
@@ -154,12 +165,12 @@ class ValidateBST(StepTracker):
             yield self.emit_step(
                 operation="complete",
                 description=(
-                    f"Not a valid BST. Node {self.violation} fell outside its allowed "
+                    lambda: f"Not a valid BST. Node {self.violation} fell outside its allowed "
                     "range, so the search-tree ordering is broken."
                 ),
-                state={"type": "tree", "tree": tree_dict},
-                highlights=self._highlights(None, self.violation),
-                metadata={
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(None, self._violation_node),
+                metadata=lambda: {
                     "current": self.violation,
                     "is_valid": False,
                     "checked": self.valid_nodes.copy(),
@@ -184,29 +195,31 @@ class ValidateBST(StepTracker):
 
         if not within:
             self.violation = node.val
+            self._violation_node = node
             yield self.emit_step(
                 operation="violation",
                 description=(
-                    f"Node {node.val} is OUTSIDE its allowed range {range_str} - "
+                    lambda: f"Node {node.val} is OUTSIDE its allowed range {range_str} - "
                     "the BST property is violated here. Stop."
                 ),
-                state={"type": "tree", "tree": self._tree_to_dict(root)},
-                highlights=self._highlights(node.val, node.val),
-                metadata={"current": node.val, "range": range_str, "is_valid": False},
+                state=lambda: self._tree_state(),
+                highlights=lambda: self._highlights(node, node),
+                metadata=lambda: {"current": node.val, "range": range_str, "is_valid": False},
             )
             return False
 
         yield self.emit_step(
             operation="check",
             description=(
-                f"Node {node.val} is within {range_str} - OK. Its left subtree must "
+                lambda: f"Node {node.val} is within {range_str} - OK. Its left subtree must "
                 f"stay below {node.val}, its right subtree above {node.val}."
             ),
-            state={"type": "tree", "tree": self._tree_to_dict(root)},
-            highlights=self._highlights(node.val, None),
-            metadata={"current": node.val, "range": range_str, "is_valid": True},
+            state=lambda: self._tree_state(),
+            highlights=lambda: self._highlights(node, None),
+            metadata=lambda: {"current": node.val, "range": range_str, "is_valid": True},
         )
         self.valid_nodes.append(node.val)
+        self._valid_ids.append(node.node_id)
 
         # Left subtree: upper bound tightens to node.val
         left_ok = yield from self._validate(node.left, lo, node.val, root)
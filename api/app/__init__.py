@@ -21,4 +21,11 @@ def create_app():
         """Health check endpoint."""
         return {"status": "ok"}
 
+    from app.services import metrics as execution_metrics
+
+    @app.route("/metrics")
+    def metrics():
+        """Per-algorithm execution metrics in the Prometheus text format."""
+        return execution_metrics.metrics.render(), {"Content-Type": execution_metrics.CONTENT_TYPE}
+
     return app
@@ -1,8 +1,13 @@
 """Main entry point for Flask application."""
 
 from app import create_app
+from app.services.workers import workers
 
 app = create_app()
 
+# Fork the execution workers when the server starts, not when the first
+# request needs one (elsewhere, e.g. in tests and tools, they start on first use)
+workers.start()
+
 if __name__ == "__main__":
     app.run(debug=True, port=5000)
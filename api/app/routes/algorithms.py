@@ -1,12 +1,98 @@
 """Algorithm execution API routes."""
 
+import gzip
+import itertools
 import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from algorithms.base.step_tracker import ENCODINGS, StepTracker
+from flask import (
+    Blueprint,
+    Response,
+    after_this_request,
+    current_app,
+    jsonify,
+    request,
+    send_file,
+)
+
+from app.services.admission import OverBudget, QueueFull, admission
+from app.services.bundles import bundles
+from app.services.cache import cache_key, results
+from app.services.disk_cache import DiskEntry, disk_results
+from app.services.examples import EXAMPLES
+from app.services.frames import DEFAULT_FRAME_MS, DEFAULT_FRAME_STEPS
+from app.services.metrics import metrics
+from app.services.profiling import is_admin, profile_job
+from app.services.registry import InputError, registry
+from app.services.runs import runs
+from app.services.singleflight import flights
+from app.services.slow_log import slow_log
+from app.services.workers import LimitExceeded, execute_job, stream_job, workers
+
+MODES = ("trace", "headless")
+
+# Largest number of inputs accepted by one batch request
+MAX_BATCH_INPUTS = 1000
+
+# Query options of the execute routes: name -> (type, default, is_valid, error)
+QUERY_OPTIONS: dict[str, tuple[type, Any, Callable[[Any], bool], str]] = {
+    "mode": (str, "trace", lambda mode: mode in MODES, "Unknown mode: {}"),
+    "encoding": (str, "full", lambda encoding: encoding in ENCODINGS, "Unknown encoding: {}"),
+    "keyframe_interval": (
+        int,
+        None,
+        lambda interval: interval >= 1,
+        "keyframe_interval must be a positive integer",
+    ),
+    "max_steps": (int, None, lambda steps: steps >= 2, "max_steps must be at least 2"),
+    "level": (int, None, lambda level: level >= 0, "level must be a non-negative integer"),
+    "frame_steps": (
+        int,
+        DEFAULT_FRAME_STEPS,
+        lambda steps: steps >= 1,
+        "frame_steps must be a positive integer",
+    ),
+    "frame_ms": (float, DEFAULT_FRAME_MS, lambda ms: ms >= 0, "frame_ms must not be negative"),
+}
 
-from flask import Blueprint, Response, jsonify, request
+bp = Blueprint("algorithms", __name__, url_prefix="/api/algorithms")
 
-from app.services.registry import registry
 
-bp = Blueprint("algorithms", __name__, url_prefix="/api/algorithms")
+@bp.after_request
+def count_response(response: Response) -> Response:
+    """Count execute responses by algorithm and cache layer (see app.services.metrics)."""
+    cache = response.headers.get("X-Cache")
+    if cache is not None and request.view_args:
+        metrics.observe_response(request.view_args["algorithm_id"], cache)
+    return response
+
+
+def _query_options(*names: str) -> tuple[dict[str, Any], tuple[Response, int] | None]:
+    """Read and validate the named QUERY_OPTIONS from the query string.
+
+    Returns:
+        The options by name (defaults for those not given), and None; or,
+        if one is malformed or invalid, no options and a 400 response
+    """
+    options = {}
+    for name in names:
+        kind, default, is_valid, error = QUERY_OPTIONS[name]
+        raw = request.args.get(name)
+        if raw is None:
+            options[name] = default
+            continue
+        try:
+            value = kind(raw)
+        except ValueError:
+            value = None
+        if value is None or not is_valid(value):
+            return {}, (jsonify({"error": error.format(raw)}), 400)
+        options[name] = value
+    return options, None
 
 
 @bp.route("", methods=["GET"])
@@ -53,77 +139,460 @@ def execute_algorithm(algorithm_id: str):
             "input": <input_data>
         }
 
+    Query params:
+        mode: "trace" (default) or "headless" (result and counters only, no steps)
+        encoding: "full" (default) or "delta" (keyframes + per-step state patches)
+        keyframe_interval: Steps between keyframes in delta encoding
+        max_steps: Step budget (an upper bound, at least 2); longer runs are
+            coalesced into summary steps. Without it every step is returned
+            unless admission control downgrades the run
+        level: Only return the outline at this StepLevel or coarser (0 = passes);
+            the steps in between are fetched later from the run (see get_run_step)
+        profile: "1" to run under the profiler (admin only: needs the
+            DSA_ADMIN_TOKEN value in X-Admin-Token)
+
     Returns:
-        JSON array of visualization steps
+        JSON array of visualization steps ("coalesced" says whether any were
+        merged into summary steps), the run-constant values their
+        states reference by ``{"$ref": name}`` (e.g. the input graph), plus a
+        run_id that can be used to seek into the run later (see get_run_step;
+        None if the run is too large to store).
+        In headless mode, the run summary instead (result, counters,
+        operation counts, final state).
+        Responses are cached by algorithm source, input and query params;
+        the X-Cache header says whether this one was (HIT), was read from
+        the on-disk cache shared by the workers (DISK), was precomputed
+        at build time (BUNDLE, see get_example_run), was not (MISS), or
+        shared the run of an identical request already in progress
+        (COALESCED).
+        Runs happen in a worker process under CPU-time, wall-clock and
+        memory limits; a run over a limit is answered with 422.
+        Runs slower than DSA_SLOW_SECONDS are logged (see app.services.slow_log).
+        Before anything runs, the run's cost is estimated from the input: a
+        run estimated over the step limit is rejected (422), one whose steps
+        would not fit the response size limit gets a lower max_steps
+        (X-Admission: DOWNGRADED), and a large one waits for a free slot
+        (503 if none frees up in time).
+        A profiled run bypasses the caches and is not kept for seeks; its
+        response adds "profile", the time and top frames spent in the
+        algorithm, in emit_step and in serialization, and the path of the
+        profiler output file (see app.services.profiling).
     """
-    try:
-        data = request.get_json()
-        if not data or "input" not in data:
-            return jsonify({"error": "Missing 'input' in request body"}), 400
+    options, error = _query_options("mode", "encoding", "keyframe_interval", "max_steps", "level")
+    if error is not None:
+        return error
+    profile = request.args.get("profile") == "1"
+    if profile and not is_admin(request.headers.get("X-Admin-Token")):
+        return jsonify({"error": "Profiling requires an admin token"}), 403
+
+    data = request.get_json(silent=True)
+    if not data or "input" not in data:
+        return jsonify({"error": "Missing 'input' in request body"}), 400
+
+    return _execute(algorithm_id, data["input"], **options, profile=profile)
 
-        input_data = data["input"]
 
-        # Execute algorithm
-        steps = registry.execute_algorithm(algorithm_id, input_data)
+@bp.route("/<algorithm_id>/examples/<int:index>", methods=["GET"])
+def get_example_run(algorithm_id: str, index: int):
+    """Execute an algorithm on one of its exhibit's example inputs.
 
-        return jsonify({"steps": steps, "count": len(steps)})
+    Answers like execute_algorithm with default query params, normally from
+    the precomputed bundle; being a GET, a client can revalidate it with
+    If-None-Match and get 304 Not Modified.
 
+    Args:
+        algorithm_id: ID of the algorithm
+        index: Position of the example in EXAMPLES[algorithm_id]
+
+    Returns:
+        JSON steps, as returned by execute_algorithm
+    """
+    examples = EXAMPLES.get(algorithm_id, [])
+    if not registry.get_algorithm(algorithm_id) or index >= len(examples):
+        return jsonify({"error": "Example not found"}), 404
+    # Serialized as a client would send it (e.g. graph keys become strings)
+    return _execute(algorithm_id, json.loads(json.dumps(examples[index])))
+
+
+def _execute(
+    algorithm_id: str,
+    input_data: Any,
+    mode: str = "trace",
+    encoding: str = "full",
+    keyframe_interval: int | None = None,
+    max_steps: int | None = None,
+    level: int | None = None,
+    profile: bool = False,
+):
+    """Answer an execute request from a bundle or a cache, or by running it.
+
+    Sources are tried cheapest first: precomputed bundle, in-memory cache,
+    on-disk cache, an identical run already in flight, and finally a new run.
+    Before any of them, admission control may reject the request, lower its
+    step budget or make its run wait for a heavy-run slot (see AdmissionControl).
+    Profiled requests always run (see profile_job).
+    """
+    try:
+        admitted = admission.admit(registry.estimate(algorithm_id, input_data), mode, max_steps)
+        if admitted.downgraded:
+            max_steps = admitted.max_steps
+
+            @after_this_request
+            def tag_downgraded(response: Response) -> Response:
+                response.headers["X-Admission"] = "DOWNGRADED"
+                return response
+
+        if profile:
+            with admission.slot(admitted.heavy):
+                return jsonify(
+                    workers.submit(
+                        profile_job,
+                        algorithm_id,
+                        input_data,
+                        mode=mode,
+                        encoding=encoding,
+                        keyframe_interval=keyframe_interval,
+                        max_steps=max_steps,
+                        level=level,
+                    ).result()
+                )
+
+        # Identical requests (same code, input and options) are served from the cache
+        key = cache_key(
+            algorithm_id,
+            registry.source_hash(algorithm_id),
+            input_data,
+            mode=mode,
+            encoding=encoding,
+            keyframe_interval=keyframe_interval,
+            max_steps=max_steps,
+            level=level,
+        )
+        bundle = bundles.get(key)
+        if bundle is not None:
+            return _bundle_body(*bundle)
+        cached = results.get(key)
+        if cached is not None:
+            body, run_id = cached
+            if run_id is None or runs.has(algorithm_id, run_id):
+                return _json_body(body, cache="HIT")
+            results.discard(key)
+        if disk_results is not None:
+            entry = disk_results.open(key)
+            if entry is not None:
+                if entry.run_id is None or runs.has(algorithm_id, entry.run_id):
+                    return _disk_body(entry)
+                entry.close()
+                disk_results.discard(key)
+
+        def execute() -> tuple[bytes, str | None]:
+            """Run the algorithm in a worker and cache the encoded response (and its run id)."""
+            start = time.perf_counter()
+            with admission.slot(admitted.heavy):
+                response = workers.submit(
+                    execute_job,
+                    algorithm_id,
+                    input_data,
+                    mode=mode,
+                    encoding=encoding,
+                    keyframe_interval=keyframe_interval,
+                    max_steps=max_steps,
+                    level=level,
+                    keep_run=True,
+                ).result()
+            usage = response.pop("usage")
+            if mode == "headless":
+                run_id = None
+                steps = response["step_count"]
+                encoding_start = time.perf_counter()
+                body = current_app.json.dumps(response).encode()
+            else:
+                # Keep the run for later seeks
+                records = response.pop("records")
+                run_id = runs.save(
+                    algorithm_id, StepTracker.from_records(records, response["references"])
+                )
+                steps = response["total_steps"]
+                encoding_start = time.perf_counter()
+                body = current_app.json.dumps({**response, "run_id": run_id}).encode()
+            end = time.perf_counter()
+            serialization = usage["serialization"] + end - encoding_start
+            metrics.observe_run(algorithm_id, usage["execution"], serialization, steps, len(body))
+            slow_log.record(
+                algorithm_id,
+                input_data,
+                {
+                    "execution": usage["execution"],
+                    "serialization": serialization,
+                    "total": end - start,
+                },
+                steps,
+                usage["peak_memory"],
+                mode=mode,
+                encoding=encoding,
+                keyframe_interval=keyframe_interval,
+                max_steps=max_steps,
+                level=level,
+            )
+            # A run that could not be stored may still be cached; its run_id is None
+            _cache(key, body, run_id)
+            return body, run_id
+
+        # Identical requests that arrive while this one runs wait for it
+        (body, _), ran = flights.do(key, execute)
+        return _json_body(body, cache="MISS" if ran else "COALESCED")
+
+    except InputError as e:
+        return jsonify({"error": str(e)}), 400
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
+    except (OverBudget, LimitExceeded) as e:
+        return jsonify({"error": str(e)}), 422
+    except QueueFull as e:
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "5"}
     except Exception as e:
         return jsonify({"error": f"Execution failed: {str(e)}"}), 500
 
 
+def _bundle_body(path: Path, etag: str) -> Response:
+    """Serve a precomputed bundle, still gzipped if the client accepts it."""
+    if "gzip" in request.accept_encodings:
+        response = send_file(path, mimetype="application/json", etag=etag, conditional=True)
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(gzip.decompress(path.read_bytes()), mimetype="application/json")
+        response.set_etag(etag)
+        response.make_conditional(request)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["X-Cache"] = "BUNDLE"
+    return response
+
+
+def _cache(key: str, body: bytes, run_id: str | None = None):
+    """Store an encoded response in the in-memory and on-disk caches."""
+    results.put(key, body, run_id)
+    if disk_results is not None:
+        disk_results.put(key, body, run_id)
+
+
+def _disk_body(entry: DiskEntry) -> Response:
+    """Stream a body from the on-disk cache, still gzipped if the client accepts it."""
+    if "gzip" in request.accept_encodings:
+        response = Response(entry.gzip_chunks(), mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Content-Length"] = str(entry.stored_size)
+    else:
+        response = Response(entry.chunks(), mimetype="application/json")
+        response.headers["Content-Length"] = str(entry.size)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["X-Cache"] = "DISK"
+    return response
+
+
+def _json_body(body: bytes, cache: str) -> Response:
+    """A JSON response from an encoded body, tagged with whether it was cached."""
+    response = Response(body, mimetype="application/json")
+    response.headers["X-Cache"] = cache
+    return response
+
+
+@bp.route("/cache", methods=["GET"])
+def cache_stats():
+    """Get the result cache's hit/miss counters and size.
+
+    Returns:
+        JSON with hits, misses, evictions, entries, bytes and max_bytes, plus
+        coalesced (requests that shared another request's run), in_flight
+        and the on-disk cache's entries and size (None when it is disabled)
+    """
+    return jsonify(
+        {
+            **results.stats(),
+            "coalesced": flights.coalesced,
+            "in_flight": flights.in_flight(),
+            "disk": disk_results.stats() if disk_results is not None else None,
+        }
+    )
+
+
 @bp.route("/<algorithm_id>/execute/stream", methods=["POST"])
 def execute_algorithm_stream(algorithm_id: str):
-    """Execute an algorithm and stream steps via Server-Sent Events.
+    """Execute an algorithm and stream its steps via Server-Sent Events.
+
+    Steps are sent in frames: each event's data is a JSON array of
+    consecutive steps. A frame is sent once it holds frame_steps steps or
+    frame_ms have passed; the first frames are smaller, so the first step
+    arrives without waiting for a full frame (see iter_frames). The run
+    happens in a worker process under the pool's limits, and produces each
+    event only once the previous one has been sent (see WorkerPool.stream);
+    nothing is retained, so memory does not grow with the length of the run.
 
     Request body:
         {
             "input": <input_data>
         }
 
+    Query params:
+        encoding: "full" (default) or "delta" (the first step is a keyframe,
+            later steps carry state patches)
+        keyframe_interval: Steps between keyframes in delta encoding
+        frame_steps: Largest number of steps per event
+        frame_ms: Longest time in milliseconds to hold steps back
+
     Returns:
-        SSE stream of visualization steps
+        SSE stream of step frames, ending with a "done" event carrying the
+        number of steps sent (or an event with an "error" if the run fails).
+        Values that steps reference by ``{"$ref": name}`` are sent in a
+        "references" event before the first frame that needs them:
+        ``{"set": {name: value}, "extend": {name: [appended items]}}``, the
+        latter for append-only tables that grew since the previous frame.
     """
+    options, error = _query_options("encoding", "keyframe_interval", "frame_steps", "frame_ms")
+    if error is not None:
+        return error
+
+    data = request.get_json(silent=True)
+    if not data or "input" not in data:
+        return jsonify({"error": "Missing 'input' in request body"}), 400
+    try:
+        # Streamed steps are not kept, so of the admission checks only the step limit applies
+        admission.admit(registry.estimate(algorithm_id, data["input"]), mode="headless")
+        events = workers.stream(stream_job, algorithm_id, data["input"], **options)
+        # The run starts here, so unknown algorithms and bad input get a status code
+        first = next(events)
+    except InputError as e:
+        return jsonify({"error": str(e)}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except (OverBudget, LimitExceeded) as e:
+        return jsonify({"error": str(e)}), 422
 
     def generate():
         try:
-            data = request.get_json()
-            if not data or "input" not in data:
-                yield f"data: {json.dumps({'error': 'Missing input'})}\n\n"
-                return
-
-            input_data = data["input"]
-
-            # Get algorithm
-            algo_info = registry.get_algorithm(algorithm_id)
-            if not algo_info:
-                yield f"data: {json.dumps({'error': 'Algorithm not found'})}\n\n"
-                return
-
-            # Execute and stream steps
-            algo_class = algo_info["class"]
-            instance = algo_class()
-
-            # Execute based on algorithm type
-            if algorithm_id == "bubble_sort":
-                steps_generator = instance.sort(input_data)
-            else:
-                yield f"data: {json.dumps({'error': 'Unknown algorithm'})}\n\n"
-                return
-
-            # Stream each step
-            for step in steps_generator:
-                step_data = step.model_dump()
-                yield f"data: {json.dumps(step_data)}\n\n"
-
+            for event, body in itertools.chain([first], events):
+                yield f"event: {event}\ndata: {body}\n\n" if event else f"data: {body}\n\n"
         except Exception as e:
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        finally:
+            # Stops the run if the client went away
+            events.close()
 
     return Response(generate(), mimetype="text/event-stream")
 
 
+@bp.route("/<algorithm_id>/execute/batch", methods=["POST"])
+def execute_algorithm_batch(algorithm_id: str):
+    """Execute an algorithm on many inputs in parallel worker processes.
+
+    The inputs are fanned out over the worker pool (one process per core by
+    default), so throughput grows with the number of cores rather than being
+    bound to this web worker. Each result is streamed back as soon as it is
+    done, so results arrive in completion order, not input order.
+
+    Request body:
+        {
+            "inputs": [<input_data>, ...]
+        }
+
+    Query params:
+        mode, encoding, keyframe_interval, max_steps: As for execute_algorithm
+
+    Returns:
+        Newline-delimited JSON, one line per input as it completes:
+        ``{"index": i, "result": {...}}`` with the response execute_algorithm
+        would give (without a run_id; batch runs are not stored), or
+        ``{"index": i, "error": "..."}`` if that input failed. One failed input
+        does not affect the others. Inputs over the admission budget fail
+        without being run, first.
+    """
+    options, error = _query_options("mode", "encoding", "keyframe_interval", "max_steps")
+    if error is not None:
+        return error
+    mode = options["mode"]
+
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data.get("inputs"), list):
+        return jsonify({"error": "Missing 'inputs' list in request body"}), 400
+    if len(data["inputs"]) > MAX_BATCH_INPUTS:
+        return jsonify({"error": f"At most {MAX_BATCH_INPUTS} inputs per batch"}), 400
+    if not registry.get_algorithm(algorithm_id):
+        return jsonify({"error": "Algorithm not found"}), 404
+
+    if mode == "headless":
+        options = {"mode": mode}
+
+    admitted = {}
+    rejected = []
+    for index, input_data in enumerate(data["inputs"]):
+        try:
+            admission.admit(registry.estimate(algorithm_id, input_data), mode)
+            admitted[index] = input_data
+        except OverBudget as e:
+            rejected.append({"index": index, "error": str(e)})
+
+    def generate():
+        for line in rejected:
+            yield json.dumps(line) + "\n"
+        for index, body, error in workers.map_unordered(algorithm_id, admitted, **options):
+            if error is not None:
+                yield json.dumps({"index": index, "error": error}) + "\n"
+            else:
+                # The worker's JSON is spliced in as is, not parsed and re-encoded
+                yield f'{{"index": {index}, "result": {body}}}\n'
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
+
+@bp.route("/<algorithm_id>/runs/<run_id>/steps", methods=["GET"])
+def get_run_step(algorithm_id: str, run_id: str):
+    """Get one step, or a span of steps, of a previously executed run.
+
+    Delta-encoded runs rebuild the step from the nearest keyframe, so the
+    cost is bounded by the keyframe interval, not the length of the run.
+    A span refines an outline (see execute_algorithm's ``level``): pass the
+    step numbers between two outline steps to fetch the steps they skip.
+
+    Args:
+        algorithm_id: ID of the algorithm
+        run_id: Run ID returned by the execute endpoint
+
+    Query params:
+        at: 1-based step position
+        from, to: Step number span (inclusive), instead of ``at``
+        level: With a span, only steps at this StepLevel or coarser
+
+    Returns:
+        JSON with the full step (or the span's full steps) and the run's step count
+    """
+    instance = runs.get(algorithm_id, run_id)
+    if instance is None:
+        return jsonify({"error": "Run not found"}), 404
+
+    first = request.args.get("from", type=int)
+    last = request.args.get("to", type=int)
+    if first is not None and last is not None:
+        level = request.args.get("level", type=int)
+        steps = instance.get_steps_between(first, last, max_level=level)
+        return jsonify(
+            {
+                "run_id": run_id,
+                "steps": [step.model_dump() for step in steps],
+                "count": instance.count_steps(),
+            }
+        )
+
+    at = request.args.get("at", type=int)
+    if at is None:
+        return jsonify({"error": "Missing or invalid 'at' (or 'from'/'to') query parameter"}), 400
+
+    try:
+        step = instance.step_at(at)
+    except IndexError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"run_id": run_id, "step": step.model_dump(), "count": instance.count_steps()})
+
+
 @bp.route("/<algorithm_id>/source", methods=["GET"])
 def get_algorithm_source(algorithm_id: str):
     """Get the Python source code for an algorithm.
@@ -141,7 +610,7 @@ def get_algorithm_source(algorithm_id: str):
         return jsonify({"error": "Algorithm not found"}), 404
 
     try:
-        source = inspect.getsource(algo["class"])
+        source = inspect.getsource(registry.get_class(algorithm_id))
         return jsonify({"source": source})
     except Exception as e:
         return jsonify({"error": f"Failed to get source: {str(e)}"}), 500
@@ -0,0 +1,126 @@
+"""Admission control: act on a run's estimated cost before doing any work."""
+
+import os
+from contextlib import contextmanager
+from threading import BoundedSemaphore
+from typing import NamedTuple
+
+from app.services.registry import DEFAULT_MAX_STEPS, Estimate
+
+
+class OverBudget(Exception):
+    """A run's estimated cost is over the admission budget."""
+
+
+class QueueFull(Exception):
+    """A heavy run waited too long for a slot."""
+
+
+class Admission(NamedTuple):
+    """How to run an admitted request."""
+
+    # Step budget to run with (lowered when downgraded)
+    max_steps: int | None
+    # The step budget was lowered so the response fits max_bytes
+    downgraded: bool
+    # The run must hold a heavy-run slot (see AdmissionControl.slot)
+    heavy: bool
+
+
+class AdmissionControl:
+    """Reject, downgrade or queue runs by their estimated cost.
+
+    Decisions use the estimate computed from the input alone (see
+    AlgorithmRegistry.estimate), so they cost microseconds and are made
+    before a worker spends anything on the run:
+
+    - Runs estimated at more than max_steps steps are rejected outright.
+    - Traces whose response would exceed max_bytes are downgraded: their
+      step budget is lowered so that coalesced steps fit it.
+    - Runs estimated at more than heavy_steps steps are heavy: at most
+      heavy_slots of them run at once, and others queue for up to
+      queue_seconds, so large runs cannot take every worker from small ones.
+
+    Runs without an estimate are admitted as they are; the worker limits
+    still apply to them.
+    """
+
+    def __init__(
+        self,
+        max_steps: int = 10_000_000,
+        max_bytes: int = 16 * 1024 * 1024,
+        heavy_steps: int = 1_000_000,
+        heavy_slots: int = 1,
+        queue_seconds: float = 10.0,
+    ):
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self.heavy_steps = heavy_steps
+        self.queue_seconds = queue_seconds
+        self._heavy = BoundedSemaphore(heavy_slots)
+
+    def admit(
+        self, estimate: Estimate | None, mode: str = "trace", max_steps: int | None = None
+    ) -> Admission:
+        """Decide how (and whether) to run a request.
+
+        Args:
+            estimate: The run's estimate, or None if it has none
+            mode: "trace" or "headless" (which returns no steps to downgrade)
+            max_steps: The step budget the client asked for (None for the default)
+
+        Returns:
+            The step budget to run with and whether the run is heavy
+
+        Raises:
+            OverBudget: If the run is estimated to exceed max_steps steps
+        """
+        if estimate is None:
+            return Admission(max_steps, downgraded=False, heavy=False)
+        if self.max_steps and estimate.steps > self.max_steps:
+            raise OverBudget(
+                f"Input too large: about {estimate.steps:,} steps estimated "
+                f"(limit {self.max_steps:,})"
+            )
+
+        downgraded = False
+        if mode == "trace" and self.max_bytes:
+            budget = DEFAULT_MAX_STEPS if max_steps is None else max_steps
+            if estimate.output_bytes(budget) > self.max_bytes:
+                max_steps = max(2, self.max_bytes // estimate.step_bytes)
+                downgraded = True
+        heavy = bool(self.heavy_steps) and estimate.steps > self.heavy_steps
+        return Admission(max_steps, downgraded, heavy)
+
+    @contextmanager
+    def slot(self, heavy: bool):
+        """Hold a heavy-run slot for the duration of a heavy run (no-op otherwise).
+
+        Raises:
+            QueueFull: If no slot frees up within queue_seconds
+        """
+        if not heavy:
+            yield
+            return
+        if not self._heavy.acquire(timeout=self.queue_seconds):
+            raise QueueFull("Too many large runs in progress; try again later")
+        try:
+            yield
+        finally:
+            self._heavy.release()
+
+
+def _default_heavy_slots() -> int:
+    """Half the execution workers by default, so small runs always have some."""
+    workers = int(os.environ.get("DSA_WORKERS", "0")) or os.cpu_count() or 1
+    return int(os.environ.get("DSA_ADMIT_HEAVY_SLOTS", "0")) or max(1, workers // 2)
+
+
+# Global admission control (a budget of 0 disables that check)
+admission = AdmissionControl(
+    max_steps=int(os.environ.get("DSA_ADMIT_MAX_STEPS", "10000000")),
+    max_bytes=int(os.environ.get("DSA_ADMIT_MAX_BYTES", str(16 * 1024 * 1024))),
+    heavy_steps=int(os.environ.get("DSA_ADMIT_HEAVY_STEPS", "1000000")),
+    heavy_slots=_default_heavy_slots(),
+    queue_seconds=float(os.environ.get("DSA_ADMIT_QUEUE_SECONDS", "10")),
+)
@@ -0,0 +1,263 @@
+"""Benchmark every registered algorithm over input-size sweeps.
+
+Each algorithm runs in trace and headless mode on inputs of geometrically
+growing size (see app.services.sweeps) built from each value distribution
+it supports. Each run records:
+- its time (the best of a few repeats), covering the run, building the
+  response and encoding it as JSON;
+- steps per second;
+- response bytes per step;
+- peak memory (traced with tracemalloc, in a separate run so the timing
+  is not affected; --no-memory skips it, as tracing is slow).
+
+A sweep stops at the first size whose estimated step count (see
+AlgorithmRegistry.estimate) is over the step budget, or that fails.
+
+    cd api && python -m app.services.benchmark --output baseline.json
+    cd api && python -m app.services.benchmark --compare baseline.json
+
+Comparing flags every case that got slower, bigger or hungrier than the
+baseline by more than the threshold, and exits with status 1 if any did.
+"""
+
+import argparse
+import copy
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from app.services.registry import registry
+from app.services.sweeps import DISTRIBUTIONS, SWEEPS, sized_input
+from app.services.workers import execute_job
+
+MODES = ("trace", "headless")
+
+DEFAULT_SIZES = (16, 64, 256, 1024, 4096, 16384)
+
+# Sweeps stop before inputs estimated to take more steps than this
+DEFAULT_STEP_BUDGET = 100_000
+
+# Relative increase over the baseline that counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# Timings below this are too noisy to compare
+MIN_COMPARED_SECONDS = 0.001
+
+# Metrics compared with the baseline (higher is worse)
+COMPARED = ("seconds", "steps", "bytes_per_step", "peak_memory_bytes")
+
+# Fields identifying a case across runs
+KEY = ("algorithm", "mode", "distribution", "size")
+
+
+def _run(algorithm_id: str, input_data: Any, mode: str) -> tuple[dict[str, Any], bytes]:
+    """One run as the execute route does it: the response and its JSON."""
+    response = execute_job(algorithm_id, input_data, mode=mode)
+    del response["usage"]
+    return response, json.dumps(response, default=str).encode()
+
+
+def measure(
+    algorithm_id: str, input_data: Any, mode: str = "trace", repeat: int = 3, memory: bool = True
+):
+    """Time one algorithm on one input.
+
+    Returns:
+        seconds (best of repeat), steps, steps_per_second, bytes (of the
+        JSON response), bytes_per_step (per returned step; None headless)
+        and peak_memory_bytes (None unless memory; tracing it is slow)
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        run_input = copy.deepcopy(input_data)  # sorts and partitions work in place
+        start = time.perf_counter()
+        response, body = _run(algorithm_id, run_input, mode)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    peak_memory = None
+    if memory:
+        run_input = copy.deepcopy(input_data)
+        tracemalloc.start()
+        try:
+            _run(algorithm_id, run_input, mode)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    steps = response["step_count"] if mode == "headless" else response["total_steps"]
+    return {
+        "seconds": seconds,
+        "steps": steps,
+        "steps_per_second": steps / seconds if seconds else None,
+        "bytes": len(body),
+        "bytes_per_step": len(body) / response["count"] if mode == "trace" else None,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmarks(
+    algorithm_ids: Iterable[str] | None = None,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    modes: Iterable[str] = MODES,
+    distributions: Iterable[str] = DISTRIBUTIONS,
+    repeat: int = 3,
+    step_budget: int = DEFAULT_STEP_BUDGET,
+    memory: bool = True,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Run the sweeps of the given algorithms (default: every registered one).
+
+    Returns:
+        One result per case: its KEY fields plus the measure() fields, or
+        "error" for the (last) size of a sweep that failed
+    """
+    if algorithm_ids is None:
+        algorithm_ids = [algorithm["id"] for algorithm in registry.list_algorithms()]
+    sizes = sorted(sizes)
+    results = []
+    for algorithm_id in algorithm_ids:
+        sweep = SWEEPS[algorithm_id]
+        for distribution in (d for d in distributions if d in sweep.distributions):
+            for mode in modes:
+                for n in sizes:
+                    if sweep.max_size is not None and n > sweep.max_size:
+                        break
+                    input_data = sized_input(algorithm_id, n, distribution)
+                    estimate = registry.estimate(algorithm_id, input_data)
+                    if estimate is not None and estimate.steps > step_budget:
+                        break
+                    result = {
+                        "algorithm": algorithm_id,
+                        "mode": mode,
+                        "distribution": distribution,
+                        "size": n,
+                    }
+                    try:
+                        result.update(measure(algorithm_id, input_data, mode, repeat, memory))
+                    except Exception as e:  # e.g. RecursionError on a degenerate input
+                        result["error"] = f"{type(e).__name__}: {e}"
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+                    if "error" in result:
+                        break
+    return results
+
+
+def compare(
+    baseline: list[dict[str, Any]],
+    current: list[dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Cases of current that regressed from baseline by more than threshold.
+
+    A case regresses on a COMPARED metric that grew by more than the
+    threshold (timings only when either is at least MIN_COMPARED_SECONDS),
+    or by failing where the baseline did not. Cases missing from either
+    side are not compared.
+
+    Returns:
+        The case's KEY fields, the metric, and its baseline and current values
+    """
+    previous = {tuple(result[field] for field in KEY): result for result in baseline}
+    regressions = []
+    for result in current:
+        key = tuple(result[field] for field in KEY)
+        before = previous.get(key)
+        if before is None:
+            continue
+        case = dict(zip(KEY, key, strict=True))
+        if "error" in result:
+            if "error" not in before:
+                regressions.append(
+                    {**case, "metric": "error", "baseline": None, "current": result["error"]}
+                )
+            continue
+        if "error" in before:
+            continue
+        for metric in COMPARED:
+            old, new = before.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if metric == "seconds" and max(old, new) < MIN_COMPARED_SECONDS:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append({**case, "metric": metric, "baseline": old, "current": new})
+    return regressions
+
+
+def _describe(result: dict[str, Any]) -> str:
+    case = f"{result['algorithm']} {result['mode']} {result['distribution']} n={result['size']}"
+    if "error" in result:
+        return f"{case}: {result['error']}"
+    per_step = result["bytes_per_step"]
+    return (
+        f"{case}: {result['seconds'] * 1000:.2f} ms, {result['steps']} steps"
+        f" ({result['steps_per_second']:,.0f}/s)"
+        + (f", {per_step:.0f} B/step" if per_step is not None else "")
+        + (f", peak {peak / 1024:.0f} KiB" if (peak := result["peak_memory_bytes"]) else "")
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.services.benchmark", description=__doc__)
+    parser.add_argument("--algorithms", help="Comma-separated algorithm ids (default: all)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--distributions", default=",".join(DISTRIBUTIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best kept)")
+    parser.add_argument("--step-budget", type=int, default=DEFAULT_STEP_BUDGET)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip tracing peak memory (much faster)"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare with a results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.algorithms.split(",") if args.algorithms else None,
+        sizes=[int(size) for size in args.sizes.split(",")],
+        modes=args.modes.split(","),
+        distributions=args.distributions.split(","),
+        repeat=args.repeat,
+        step_budget=args.step_budget,
+        memory=not args.no_memory,
+        progress=lambda result: print(_describe(result), file=sys.stderr),
+    )
+    report = {
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Wrote {len(results)} results to {args.output}")
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    if (baseline["python"], baseline["machine"]) != (report["python"], report["machine"]):
+        print("Warning: the baseline was recorded on a different Python or machine")
+    regressions = compare(baseline["results"], results, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['algorithm']} {regression['mode']}"
+            f" {regression['distribution']} n={regression['size']}"
+            f" {regression['metric']}: {regression['baseline']} -> {regression['current']}"
+        )
+    print(f"{len(regressions)} regressions past {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
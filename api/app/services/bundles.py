@@ -0,0 +1,124 @@
+"""Precomputed /execute responses for the exhibits' example inputs.
+
+Built once per deploy, after the algorithms are in place:
+
+    cd api && python -m app.services.bundles
+
+The build runs every registered algorithm on its example inputs (see
+app.services.examples) through the execute route and writes each response,
+gzipped, under its cache key, plus an index of ETags. The API serves a
+bundle whenever a request's cache key matches one, so the first visitor of
+an exhibit after a deploy gets a file read instead of a run. Keys include
+the algorithm's source hash, so bundles built from other code never match.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+BUNDLE_DIR = Path(__file__).resolve().parent.parent / "bundles"
+INDEX_NAME = "index.json"
+
+
+class BundleStore:
+    """Read-only view of a bundle directory, keyed by cache_key.
+
+    Without a directory, or before the bundles are built, it is empty.
+    """
+
+    def __init__(self, directory: str | Path | None):
+        self.directory = Path(directory) if directory else None
+        self._index: dict[str, dict[str, Any]] = {}
+        if self.directory is not None:
+            try:
+                self._index = json.loads((self.directory / INDEX_NAME).read_text())
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> tuple[Path, str] | None:
+        """Path of the gzipped response body for a key, and its ETag."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        return self.directory / f"{key}.json.gz", entry["etag"]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def build_bundles(directory: str | Path = BUNDLE_DIR) -> int:
+    """Precompute the example runs into a bundle directory.
+
+    Responses are produced by the execute route itself (with default query
+    parameters, as the exhibits send them), so a bundle is byte-for-byte
+    what a live run would return, except that it has no stored run to seek
+    into (run_id is None).
+
+    Args:
+        directory: Where to write the bundles and their index
+
+    Returns:
+        The number of bundles written
+    """
+    from app import create_app
+    from app.services.cache import cache_key
+    from app.services.examples import EXAMPLES
+    from app.services.registry import registry
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    app = create_app()
+    client = app.test_client()
+
+    index = {}
+    for algorithm_id, examples in EXAMPLES.items():
+        for example in examples:
+            input_data = json.loads(json.dumps(example))  # as a client sends it
+            response = client.post(
+                f"/api/algorithms/{algorithm_id}/execute", json={"input": input_data}
+            )
+            if response.status_code != 200:
+                raise RuntimeError(f"{algorithm_id}: {response.get_json()['error']}")
+            payload = response.get_json()
+            payload["run_id"] = None
+            body = app.json.dumps(payload).encode()
+
+            key = cache_key(
+                algorithm_id,
+                registry.source_hash(algorithm_id),
+                input_data,
+                mode="trace",
+                encoding="full",
+            )
+            (directory / f"{key}.json.gz").write_bytes(gzip.compress(body, mtime=0))
+            index[key] = {
+                "algorithm_id": algorithm_id,
+                "etag": hashlib.sha256(body).hexdigest()[:32],
+                "size": len(body),
+            }
+
+    for path in directory.glob("*.json.gz"):
+        if path.name.removesuffix(".json.gz") not in index:
+            path.unlink()
+    (directory / INDEX_NAME).write_text(json.dumps(index, indent=2, sort_keys=True) + "\n")
+    return len(index)
+
+
+def _default_directory() -> str | None:
+    """Bundle directory to serve ("" disables bundles)."""
+    return os.environ.get("DSA_BUNDLE_DIR", str(BUNDLE_DIR)) or None
+
+
+# Global bundle store
+bundles = BundleStore(_default_directory())
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else BUNDLE_DIR
+    # Build from live runs only: no old bundles, cached responses or stored runs
+    os.environ.update(DSA_BUNDLE_DIR="", DSA_DISK_CACHE="", DSA_RUN_DIR="")
+    print(f"Wrote {build_bundles(target)} bundles to {target}")
@@ -0,0 +1,105 @@
+"""Cache of encoded /execute responses, keyed by algorithm, source and input."""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+
+def cache_key(algorithm_id: str, source_hash: str, input_data: Any, **options: Any) -> str:
+    """Content address of a run: the same algorithm code, input and options.
+
+    The input is canonicalized (sorted keys, no whitespace), so requests that
+    differ only in JSON formatting share an entry. Options left as None are
+    dropped, so an explicit default and an omitted option differ, which only
+    costs an extra entry.
+    """
+    canonical = json.dumps(
+        [
+            algorithm_id,
+            source_hash,
+            input_data,
+            {k: v for k, v in options.items() if v is not None},
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """Bounded LRU cache of encoded response bodies, keyed by cache_key().
+
+    Entries are the exact bytes sent to the client, so a hit skips running
+    the algorithm, building its steps and serializing them. An entry also
+    records the id of the stored run its body refers to (if any), so the
+    caller can check the run can still be seeked before serving it. The cache is
+    bounded by the total size of the stored bodies; a body larger than the
+    whole budget is not stored. Because keys include a hash of the
+    algorithm's source, editing an algorithm makes its old entries
+    unreachable, and they age out of the LRU.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[bytes, str | None]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> tuple[bytes, str | None] | None:
+        """Get a cached body and its run id (counting a hit or a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, body: bytes, run_id: str | None = None):
+        """Store a body and evict least recently used entries down to the budget."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (body, run_id)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def discard(self, key: str):
+        """Drop an entry that can no longer be served (e.g. its run was evicted)."""
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Global result cache instance (0 bytes disables it)
+results = ResultCache(
+    max_bytes=int(os.environ.get("DSA_RESULT_CACHE_BYTES", str(32 * 1024 * 1024)))
+)
@@ -0,0 +1,408 @@
+"""Check algorithms' documented time complexity against measured growth.
+
+Each algorithm's docstring states its time complexity (e.g. bubble sort's
+"Average: O(n²)", Dijkstra's "O((V + E) log V)"). This runs the benchmark
+sweeps on random inputs (see app.services.benchmark), fits how step counts
+and run times grow with the sweep's size n, and reports each algorithm whose
+growth deviates from the documented bound:
+
+    cd api && python -m app.services.complexity
+    cd api && python -m app.services.complexity --results baseline.json
+
+A fit is the least-squares slope of log(measurement) over log(n) across the
+largest sizes measured, compared with the same slope of the documented
+bound over those sizes. Step counts are exact, so their tolerance is tight;
+timings include fixed overheads and noise, so theirs is loose, and they
+are expected to grow at least linearly (every run is handed its whole
+input). Trace-mode time also covers building each step's state, so it
+catches visualizers whose per-step snapshots make a linear algorithm
+quadratic.
+
+Exits with status 1 if any measurement grows faster than documented.
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from app.services.benchmark import DEFAULT_SIZES, DEFAULT_STEP_BUDGET, MODES, run_benchmarks
+from app.services.registry import registry
+
+
+class Growth(NamedTuple):
+    """A growth function n^power * (log n)^log_power, times 2^n if exponential."""
+
+    power: float = 0
+    log_power: float = 0
+    exponential: bool = False
+
+    def times(self, other: "Growth") -> "Growth":
+        return Growth(
+            self.power + other.power,
+            self.log_power + other.log_power,
+            self.exponential or other.exponential,
+        )
+
+    def log(self, n: int) -> float:
+        """Natural log of the function at n."""
+        value = self.power * math.log(n) + self.log_power * math.log(max(math.log2(n), 1))
+        return value + n * math.log(2) if self.exponential else value
+
+    @property
+    def order(self) -> tuple:
+        """Sort key ordering growths by how fast they grow."""
+        return self.exponential, self.power, self.log_power
+
+    @property
+    def label(self) -> str:
+        parts = ["2^n"] if self.exponential else []
+        if self.power:
+            parts.append("n" if self.power == 1 else f"n^{self.power:g}")
+        if self.log_power:
+            parts.append("log n" if self.log_power == 1 else f"log^{self.log_power:g} n")
+        return " ".join(parts) or "1"
+
+
+ONE = Growth()
+LOG = Growth(log_power=1)
+SQRT = Growth(power=0.5)
+N = Growth(power=1)
+
+# Growth classes a fit is named after (the nearest one)
+CANDIDATES = (ONE, LOG, N, Growth(1, 1), Growth(2), Growth(3), Growth(exponential=True))
+
+# How the docstrings' variables grow with the sweep size n (see app.services.sweeps):
+# graphs have n nodes and up to 3n edges, strings length n, DP targets n;
+# coin sets, the radix base and dictionary word lengths are fixed
+VARIABLES = {
+    "n": N,
+    "i": N,
+    "V": N,
+    "E": N,
+    "W": N,
+    "m": N,
+    "amount": N,
+    "rows": SQRT,
+    "cols": SQRT,
+    "R": SQRT,
+    "C": SQRT,
+    "h": LOG,
+    "d": LOG,
+    "k": ONE,
+    "len(coins)": ONE,
+}
+
+# Algorithms whose docstrings use a variable differently
+VARIABLE_OVERRIDES = {
+    "num_islands": {"m": SQRT, "n": SQRT},  # grid dimensions
+    "min_path_sum": {"m": SQRT, "n": SQRT},
+    "counting_sort": {"k": N},  # the value range, up to 4n
+}
+
+# Measurements fitted: step counts, and run time per mode
+METRICS = ("steps", "trace_seconds", "headless_seconds")
+
+# Largest allowed difference between fitted and documented slopes, per metric.
+# Lower-order terms still bend step counts at the sizes quadratic sweeps reach
+# (n²/2 + n fits a slope of about 1.9 over 16..256)
+TOLERANCES = {"steps": 0.15, "trace_seconds": 0.3, "headless_seconds": 0.3}
+
+# Sizes fitted (the largest measured); smaller ones are dominated by fixed costs
+DEFAULT_POINTS = 3
+
+# Labels of a docstring's per-case bounds, in order of preference
+_CASE_LABELS = ("average", "worst")
+
+_TOKEN = re.compile(r"\s*(len\(\w+\)|\d+(?:\.\d+)?|log(?:_\d+)?|\w+|\S)")
+
+
+class _Parser:
+    """Recursive-descent parser of a Big-O expression into its Growth.
+
+    Sums keep their dominant term and products (explicit or by
+    juxtaposition, "n log n") multiply.
+    """
+
+    def __init__(self, expression: str, variables: dict[str, Growth]):
+        normalized = expression.replace("²", "^2").replace("³", "^3").replace("×", "*")
+        self.tokens = _TOKEN.findall(normalized)
+        self.variables = variables
+        self.position = 0
+
+    def parse(self) -> Growth:
+        growth = self._sum()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected {self._peek()!r}")
+        return growth
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _take(self, expected: str | None = None) -> str:
+        token = self._peek()
+        if token is None or (expected is not None and token != expected):
+            raise ValueError(f"Expected {expected or 'a term'}, got {token!r}")
+        self.position += 1
+        return token
+
+    def _sum(self) -> Growth:
+        growth = self._product()
+        while self._peek() == "+":
+            self._take()
+            growth = max(growth, self._product(), key=lambda g: g.order)
+        return growth
+
+    def _product(self) -> Growth:
+        growth = self._factor()
+        while self._peek() is not None and self._peek() not in {"+", ")"}:
+            if self._peek() == "*":
+                self._take()
+            growth = growth.times(self._factor())
+        return growth
+
+    def _factor(self) -> Growth:
+        if (self._peek() or "").startswith("log"):
+            self._take()
+            argument = self._atom()
+            return N if argument.exponential else LOG if argument != ONE else ONE
+        base = self._atom()
+        if self._peek() != "^":
+            return base
+        self._take()
+        exponent = self._take()
+        if not exponent.replace(".", "", 1).isdigit():  # 2^n
+            return Growth(exponential=True) if base == ONE else base
+        return Growth(base.power * float(exponent), base.log_power * float(exponent))
+
+    def _atom(self) -> Growth:
+        token = self._take()
+        if token == "(":
+            growth = self._sum()
+            self._take(")")
+            return growth
+        if token.replace(".", "", 1).isdigit():
+            return ONE
+        if token not in self.variables:
+            raise ValueError(f"Unknown variable {token!r}")
+        return self.variables[token]
+
+
+def parse_growth(expression: str, variables: dict[str, Growth] = VARIABLES) -> Growth:
+    """Growth of a Big-O expression's body (e.g. "(V + E) log V") in terms of n.
+
+    Raises:
+        ValueError: If the expression cannot be parsed or uses an unknown variable
+    """
+    return _Parser(expression, variables).parse()
+
+
+def _big_o(text: str) -> str | None:
+    """Body of the first O(...) in text, matching nested parentheses."""
+    start = text.find("O(")
+    if start == -1:
+        return None
+    depth = 0
+    for end in range(start + 1, len(text)):
+        depth += {"(": 1, ")": -1}.get(text[end], 0)
+        if depth == 0:
+            return text[start + 2 : end]
+    return None
+
+
+def documented_complexity(algorithm_id: str) -> str:
+    """The time complexity an algorithm's docstring gives for the registered entry.
+
+    The "Time Complexity:" section of the class docstring, else the module's.
+    Of its labeled lines, the one naming the entry (fibonacci's "Memoization:"
+    for "Fibonacci (Memoization)") is used, else "Average:", else "Worst:",
+    else the first bound in the section.
+
+    Raises:
+        ValueError: If the docstring states no time complexity
+    """
+    cls = registry.get_class(algorithm_id)
+    docstrings = (cls.__doc__, sys.modules[cls.__module__].__doc__)
+    doc = next((doc for doc in docstrings if doc and "Time Complexity:" in doc), None)
+    if doc is None:
+        raise ValueError(f"{algorithm_id} does not document its time complexity")
+
+    section = doc.split("Time Complexity:", 1)[1].split("Space Complexity", 1)[0]
+    name_words = set(re.findall(r"\w+", registry.get_algorithm(algorithm_id)["name"].lower()))
+    labeled = {}
+    for line in section.splitlines()[1:]:
+        label, _, rest = line.strip().partition(":")
+        if rest and _big_o(rest) is not None:
+            labeled.setdefault(label.lower(), _big_o(rest))
+    for label, bound in labeled.items():
+        if name_words & set(re.findall(r"\w+", label)):
+            return bound
+    for label in _CASE_LABELS:
+        if label in labeled:
+            return labeled[label]
+    bound = _big_o(section)
+    if bound is None:
+        raise ValueError(f"{algorithm_id} does not document its time complexity")
+    return bound
+
+
+def expected_growth(algorithm_id: str) -> Growth:
+    """The documented time complexity's growth with the sweep size n."""
+    variables = {**VARIABLES, **VARIABLE_OVERRIDES.get(algorithm_id, {})}
+    return parse_growth(documented_complexity(algorithm_id), variables)
+
+
+def slope(sizes: list[int], logs: list[float]) -> float:
+    """Least-squares slope of logs over log(sizes)."""
+    xs = [math.log(n) for n in sizes]
+    mean_x, mean_y = sum(xs) / len(xs), sum(logs) / len(logs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, logs, strict=True))
+    return covariance / sum((x - mean_x) ** 2 for x in xs)
+
+
+def fit(sizes: list[int], measurements: list[float], expected: Growth, tolerance: float):
+    """Fit measurements' growth over sizes and compare it with the expected growth.
+
+    Returns:
+        slope (fitted), expected_slope (of expected over the same sizes),
+        growth (label of the nearest CANDIDATES class) and deviation
+        ("above" or "below" expected past the tolerance, else None)
+    """
+    fitted = slope(sizes, [math.log(max(value, 1e-12)) for value in measurements])
+    expected_slope = slope(sizes, [expected.log(n) for n in sizes])
+    nearest = min(
+        CANDIDATES, key=lambda growth: abs(slope(sizes, [growth.log(n) for n in sizes]) - fitted)
+    )
+    deviation = None
+    if fitted > expected_slope + tolerance:
+        deviation = "above"
+    elif fitted < expected_slope - tolerance:
+        deviation = "below"
+    return {
+        "slope": round(fitted, 3),
+        "expected_slope": round(expected_slope, 3),
+        "growth": nearest.label,
+        "deviation": deviation,
+    }
+
+
+def _series(results: list[dict[str, Any]], algorithm_id: str) -> dict[str, dict[int, float]]:
+    """An algorithm's measurements by METRICS name and size (random inputs only)."""
+    series: dict[str, dict[int, float]] = {metric: {} for metric in METRICS}
+    for result in results:
+        if (
+            result["algorithm"] != algorithm_id
+            or result["distribution"] != "random"
+            or "error" in result
+        ):
+            continue
+        series["steps"][result["size"]] = result["steps"]
+        series[f"{result['mode']}_seconds"][result["size"]] = result["seconds"]
+    return series
+
+
+def check(
+    results: list[dict[str, Any]],
+    points: int = DEFAULT_POINTS,
+    tolerances: dict[str, float] = TOLERANCES,
+) -> list[dict[str, Any]]:
+    """Compare benchmark results (see run_benchmarks) with documented complexities.
+
+    Returns:
+        One report per algorithm: its documented bound, the growth that
+        implies for the sweep size, and a fit() per metric measured at at
+        least two sizes (over the largest `points` of them)
+    """
+    reports = []
+    for algorithm_id in dict.fromkeys(result["algorithm"] for result in results):
+        report: dict[str, Any] = {"algorithm": algorithm_id, "fits": {}}
+        try:
+            report["documented"] = f"O({documented_complexity(algorithm_id)})"
+            expected = expected_growth(algorithm_id)
+        except ValueError as e:
+            report["error"] = str(e)
+            reports.append(report)
+            continue
+        report["expected"] = expected.label
+        for metric, measured in _series(results, algorithm_id).items():
+            sizes = sorted(measured)[-points:]
+            if len(sizes) < 2:
+                continue
+            # A run is handed (and validates) its whole input, so time grows at least linearly
+            bound = expected if metric == "steps" else max(expected, N, key=lambda g: g.order)
+            report["fits"][metric] = {
+                "sizes": sizes,
+                **fit(sizes, [measured[n] for n in sizes], bound, tolerances[metric]),
+            }
+        reports.append(report)
+    return reports
+
+
+def _describe(report: dict[str, Any]) -> str:
+    if "error" in report:
+        return f"{report['algorithm']}: {report['error']}"
+    fits = ", ".join(
+        f"{metric} {result['growth']} ({result['slope']:.2f} vs {result['expected_slope']:.2f})"
+        + (f" {result['deviation'].upper()}" if result["deviation"] else "")
+        for metric, result in report["fits"].items()
+    )
+    return f"{report['algorithm']} {report['documented']} ~ {report['expected']}: {fits}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.services.complexity", description=__doc__)
+    parser.add_argument("--results", help="Fit a benchmark results file instead of running")
+    parser.add_argument("--algorithms", help="Comma-separated algorithm ids (default: all)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best kept)")
+    parser.add_argument("--step-budget", type=int, default=DEFAULT_STEP_BUDGET)
+    parser.add_argument("--points", type=int, default=DEFAULT_POINTS, help="Largest sizes fitted")
+    parser.add_argument("--output", help="Write the reports to this JSON file")
+    args = parser.parse_args(argv)
+
+    algorithm_ids = args.algorithms.split(",") if args.algorithms else None
+    if args.results:
+        with open(args.results) as f:
+            results = json.load(f)["results"]
+        if algorithm_ids is not None:
+            results = [result for result in results if result["algorithm"] in algorithm_ids]
+    else:
+        results = run_benchmarks(
+            algorithm_ids,
+            sizes=[int(size) for size in args.sizes.split(",")],
+            modes=args.modes.split(","),
+            distributions=["random"],
+            repeat=args.repeat,
+            step_budget=args.step_budget,
+            memory=False,
+        )
+
+    reports = check(results, args.points)
+    for report in reports:
+        print(_describe(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(reports, f, indent=2)
+            f.write("\n")
+
+    above = _deviating(reports, "above")
+    print(f"{len(above)} algorithms grow faster than documented: {', '.join(above) or 'none'}")
+    below = _deviating(reports, "below")
+    print(f"{len(below)} algorithms grow slower than documented: {', '.join(below) or 'none'}")
+    return 1 if above else 0
+
+
+def _deviating(reports: Iterable[dict[str, Any]], direction: str) -> list[str]:
+    return [
+        report["algorithm"]
+        for report in reports
+        if any(result["deviation"] == direction for result in report["fits"].values())
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""On-disk cache of encoded /execute responses, shared by the workers on a host."""
+
+import gzip
+import os
+import sqlite3
+import tempfile
+import time
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from threading import local
+
+# Bytes read from a stored body per chunk when streaming it
+CHUNK_SIZE = 64 * 1024
+
+
+class DiskEntry:
+    """A cached body opened for streaming, pinned by a read transaction.
+
+    The entry's connection holds a snapshot of the database until the body
+    has been read (or close() is called), so a concurrent eviction by another
+    worker cannot pull the body out from under the response.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, blob, run_id: str | None, size: int):
+        self._connection = connection
+        self._blob = blob
+        self.run_id = run_id
+        # Size of the body, and of the stored (gzipped) body
+        self.size = size
+        self.stored_size = len(blob)
+
+    def gzip_chunks(self) -> Iterator[bytes]:
+        """The stored (gzip-compressed) body, read from disk in chunks."""
+        try:
+            while chunk := self._blob.read(CHUNK_SIZE):
+                yield chunk
+        finally:
+            self.close()
+
+    def chunks(self) -> Iterator[bytes]:
+        """The body decompressed chunk by chunk, for clients without gzip."""
+        decompressor = zlib.decompressobj(wbits=31)  # gzip container
+        for chunk in self.gzip_chunks():
+            yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    def close(self):
+        self._blob.close()
+        self._connection.rollback()
+        self._connection.close()
+
+
+class DiskCache:
+    """Size-bounded cache of gzipped response bodies in a SQLite database.
+
+    Keyed like ResultCache (see cache_key), so entries survive restarts and
+    every worker on the host that opens the same file shares them. SQLite's
+    WAL mode lets workers read while another writes. Bodies are stored
+    compressed and streamed back as stored (or decompressed on the fly), so
+    a hit never parses the body. When the stored bodies outgrow max_bytes
+    (compressed), the least recently read entries are deleted.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 256 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._local = local()
+        connection = self._connect()
+        with connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " body BLOB NOT NULL,"
+                " stored_size INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " run_id TEXT,"
+                " accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection for writes and bookkeeping."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def open(self, key: str) -> DiskEntry | None:
+        """Open a cached body for streaming, or None if it is not stored."""
+        connection = self._connect()
+        connection.execute("BEGIN")  # snapshot until the entry is closed
+        row = connection.execute(
+            "SELECT rowid, run_id, size FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            connection.rollback()
+            connection.close()
+            return None
+
+        rowid, run_id, size = row
+        entry = DiskEntry(
+            connection, connection.blobopen("entries", "body", rowid, readonly=True), run_id, size
+        )
+        with self._connection as writer:
+            writer.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return entry
+
+    def put(self, key: str, body: bytes, run_id: str | None = None):
+        """Store a body (gzipped) and prune the database to the budget."""
+        stored = gzip.compress(body, compresslevel=6)
+        if len(stored) > self.max_bytes:
+            return
+        with self._connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, stored, len(stored), len(body), run_id, time.time()),
+            )
+            self._prune(connection)
+
+    def discard(self, key: str):
+        """Drop an entry that can no longer be served (e.g. its run was evicted)."""
+        with self._connection as connection:
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def _prune(self, connection: sqlite3.Connection):
+        """Delete the least recently read entries beyond max_bytes."""
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(stored_size), 0) FROM entries"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, stored_size in connection.execute(
+            "SELECT key, stored_size FROM entries ORDER BY accessed"
+        ):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= stored_size
+        connection.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def stats(self) -> dict[str, int]:
+        """Number of entries and their stored (compressed) size."""
+        entries, stored = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(stored_size), 0) FROM entries"
+        ).fetchone()
+        return {"entries": entries, "bytes": stored, "max_bytes": self.max_bytes}
+
+
+def _default_path() -> str | None:
+    """Cache database shared by the workers on this host ("" disables it)."""
+    return (
+        os.environ.get("DSA_DISK_CACHE", os.path.join(tempfile.gettempdir(), "dsa-cache.sqlite3"))
+        or None
+    )
+
+
+# Global on-disk cache instance (None when disabled)
+_path = _default_path()
+disk_results = (
+    DiskCache(_path, max_bytes=int(os.environ.get("DSA_DISK_CACHE_BYTES", str(256 * 1024 * 1024))))
+    if _path
+    else None
+)
@@ -0,0 +1,75 @@
+"""Canonical example inputs: the default input of each algorithm's exhibit.
+
+The exhibit pages send these when a visitor presses run without editing the
+input, so they are what build-time bundles are precomputed for (see
+app.services.bundles). The first example of each algorithm also serves as
+its sample input in the API tests. Keep them in step with the defaults in
+``web/app/algorithms/**/page.tsx``.
+"""
+
+from typing import Any
+
+EXAMPLES: dict[str, list[Any]] = {
+    "bubble_sort": [[5, 2, 8, 1, 9]],
+    "quick_sort": [[5, 2, 8, 1, 9]],
+    "merge_sort": [[5, 2, 8, 1, 9]],
+    "insertion_sort": [[5, 2, 8, 1, 9]],
+    "selection_sort": [[5, 2, 8, 1, 9]],
+    "heap_sort": [[5, 2, 8, 1, 9]],
+    "bfs": [
+        {"graph": {0: [1, 2], 1: [3, 4], 2: [5], 3: [], 4: [], 5: []}, "start": 0, "target": 5}
+    ],
+    "dfs": [
+        {"graph": {0: [1, 2], 1: [3, 4], 2: [5], 3: [], 4: [], 5: []}, "start": 0, "target": 5}
+    ],
+    "dijkstra": [
+        {
+            "graph": {0: [[1, 4], [2, 1]], 1: [[3, 1]], 2: [[1, 2], [3, 5]], 3: []},
+            "start": 0,
+            "target": 3,
+        }
+    ],
+    "binary_search": [{"array": [1, 3, 5, 7, 9, 11], "target": 7}],
+    "linear_search": [{"array": [4, 2, 7, 1, 9], "target": 7}],
+    "bst_insert": [[50, 30, 70, 20, 40, 60, 80]],
+    "bst_search": [{"values": [50, 30, 70, 20, 40, 60, 80], "target": 60}],
+    "fibonacci_memo": [{"n": 6}],
+    "fibonacci_tab": [{"n": 6}],
+    "knapsack": [{"items": [[2, 10], [3, 15], [5, 30]], "capacity": 7}],
+    "lcs": [{"str1": "ABCBDAB", "str2": "BDCABA"}],
+    "num_islands": [{"grid": [["1", "1", "0"], ["1", "0", "0"], ["0", "0", "1"]]}],
+    "tree_inorder": [[4, 2, 6, 1, 3, 5, 7]],
+    "tree_preorder": [[4, 2, 6, 1, 3, 5, 7]],
+    "tree_postorder": [[4, 2, 6, 1, 3, 5, 7]],
+    "kadane": [[-2, 1, -3, 4, -1, 2, 1, -5, 4]],
+    "coin_change": [{"coins": [1, 2, 5], "amount": 11}],
+    "climbing_stairs": [5],
+    "house_robber": [[2, 7, 9, 3, 1]],
+    "edit_distance": [{"word1": "horse", "word2": "ros"}],
+    "unique_paths": [{"rows": 3, "cols": 4}],
+    "counting_sort": [[4, 2, 8, 3, 1, 4, 7, 2]],
+    "radix_sort": [[170, 45, 75, 90, 2, 802, 24, 66]],
+    "validate_bst": [[5, 3, 8, 1, 4, 7, 9]],
+    "invert_binary_tree": [[4, 2, 7, 1, 3, 6, 9]],
+    "topological_sort": [{"graph": {"0": [1, 2], "1": [3], "2": [3], "3": []}}],
+    "quickselect": [{"array": [7, 2, 1, 6, 8, 5, 3, 4], "k": 4}],
+    "rotated_search": [{"array": [4, 5, 6, 7, 0, 1, 2], "target": 0}],
+    "lis": [[10, 9, 2, 5, 3, 7, 101, 18]],
+    "word_break": [{"s": "leetcode", "words": ["leet", "code"]}],
+    "min_path_sum": [{"grid": [[1, 3, 1], [1, 5, 1], [4, 2, 1]]}],
+    "lca": [{"values": [6, 2, 8, 0, 4, 7, 9, None, None, 3, 5], "p": 2, "q": 8}],
+    "tree_max_depth": [[3, 9, 20, None, None, 15, 7]],
+    "level_order": [[3, 9, 20, None, None, 15, 7]],
+    "course_schedule": [{"graph": {"0": [1], "1": [2], "2": []}}],
+    "connected_components": [{"graph": {"0": [1], "1": [0], "2": [3], "3": [2], "4": []}}],
+    "bellman_ford": [{"graph": {"0": [[1, 4], [2, 5]], "1": [[3, 3]], "2": [[1, -2]], "3": []}}],
+    "prim_mst": [{"graph": {"0": [[1, 2], [2, 6]], "1": [[0, 2], [2, 3]], "2": [[0, 6], [1, 3]]}}],
+    "astar_grid": [{"grid": [[0, 0, 0], [1, 1, 0], [0, 0, 0]], "start": [0, 0], "goal": [2, 0]}],
+    "exponential_search": [{"array": [1, 3, 5, 7, 9, 11, 13, 17], "target": 13}],
+    "ternary_search": [{"array": [1, 3, 5, 7, 9, 11, 13, 15], "target": 13}],
+    "coin_change_2": [{"coins": [1, 2, 5], "amount": 5}],
+    "longest_palindromic_subsequence": [{"s": "bbbab"}],
+    "max_product_subarray": [[2, 3, -2, 4, -1]],
+    "tree_diameter": [[1, 2, 3, 4, 5]],
+    "tree_path_sum": [{"values": [5, 4, 8, 11, None, 13, 4, 7, 2], "target": 22}],
+}
@@ -0,0 +1,41 @@
+"""Grouping of streamed steps into frames (one SSE event per frame)."""
+
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Default frame bounds for the SSE route
+DEFAULT_FRAME_STEPS = 64
+DEFAULT_FRAME_MS = 50
+
+
+def iter_frames(
+    items: Iterable[Any], max_steps: int = DEFAULT_FRAME_STEPS, max_ms: float = DEFAULT_FRAME_MS
+) -> Iterator[list[Any]]:
+    """Group items into frames of at most max_steps items or max_ms milliseconds.
+
+    A frame is sent as soon as it holds max_steps items or max_ms have passed
+    since the previous frame, whichever comes first. The size limit starts
+    at one and doubles with every frame, so the first step is sent on its own
+    (low time-to-first-step) and long runs quickly reach full-size frames.
+
+    Args:
+        items: Steps (or encoded step records), typically produced lazily
+        max_steps: Largest number of items per frame
+        max_ms: Longest time to hold items back, in milliseconds
+
+    Yields:
+        Non-empty lists of items, in order
+    """
+    limit = 1
+    frame = []
+    deadline = time.monotonic() + max_ms / 1000
+    for item in items:
+        frame.append(item)
+        if len(frame) >= limit or time.monotonic() >= deadline:
+            yield frame
+            frame = []
+            limit = min(limit * 2, max_steps)
+            deadline = time.monotonic() + max_ms / 1000
+    if frame:
+        yield frame
@@ -0,0 +1,118 @@
+"""Manifest of registered algorithms, generated from their ``registrations``.
+
+The registry reads the manifest instead of importing every algorithm module,
+so listing algorithms imports no algorithm code and each module is loaded on
+first use. Regenerate it after adding or renaming an algorithm:
+
+    cd api && python -m app.services.manifest
+"""
+
+import importlib
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+ALGORITHMS_ROOT = Path(__file__).resolve().parent.parent.parent.parent / "algorithms"
+MANIFEST_PATH = Path(__file__).resolve().parent / "algorithms.json"
+
+# Directories that hold no registered algorithms
+_SKIPPED_DIRS = {"tests", "_templates", "__pycache__"}
+
+
+def build_manifest() -> list[dict[str, Any]]:
+    """Import the algorithm modules and collect each class's registrations.
+
+    Returns:
+        One entry per algorithm id: id, name, category, visualizer_type,
+        module, class and entry (the method that starts a run), plus the
+        entry's input schema, shorthand key and cost expressions when it has
+        them. Modules that a package of the same name shadows
+        (``trees/bst.py``) also record their ``path``, relative to the
+        algorithms package.
+    """
+    from algorithms.base import StepTracker
+
+    manifest = []
+    for path in sorted(ALGORITHMS_ROOT.rglob("*.py")):
+        relative = path.relative_to(ALGORITHMS_ROOT)
+        if (
+            _SKIPPED_DIRS.intersection(relative.parts)
+            or "registrations = {" not in path.read_text()
+        ):
+            continue
+
+        module_name = ".".join(("algorithms", *relative.with_suffix("").parts))
+        entry_path = None
+        spec = importlib.util.find_spec(module_name)
+        if spec is None or Path(spec.origin).resolve() != path:
+            module_name += "_viz"
+            entry_path = relative.as_posix()
+        module = load_module(module_name, entry_path)
+
+        for cls in vars(module).values():
+            if not (
+                isinstance(cls, type)
+                and issubclass(cls, StepTracker)
+                and cls.__module__ == module_name
+            ):
+                continue
+            for algorithm_id, registration in cls.registrations.items():
+                entry = {
+                    "id": algorithm_id,
+                    "name": registration["name"],
+                    "category": registration["category"],
+                    "visualizer_type": cls.visualizer_type.value,
+                    "module": module_name,
+                    "class": cls.__name__,
+                    "entry": registration["entry"],
+                }
+                for key in ("input", "shorthand", "cost"):
+                    if key in registration:
+                        entry[key] = registration[key]
+                if entry_path:
+                    entry["path"] = entry_path
+                manifest.append(entry)
+    return manifest
+
+
+def load_manifest() -> list[dict[str, Any]]:
+    """Read the generated manifest, building it in-process if it is missing."""
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except FileNotFoundError:
+        return build_manifest()
+
+
+def source_file(entry: dict[str, Any]) -> Path:
+    """Path of the file that defines a manifest entry's class (without importing it)."""
+    if "path" in entry:
+        return ALGORITHMS_ROOT / entry["path"]
+    return ALGORITHMS_ROOT.joinpath(*entry["module"].split(".")[1:]).with_suffix(".py")
+
+
+def load_module(module_name: str, path: str | None = None):
+    """Import an algorithm module, by file path for shadowed modules.
+
+    Path-loaded modules are kept in sys.modules under ``module_name``, so
+    every caller gets the same module (and the same classes).
+    """
+    if path is None:
+        return importlib.import_module(module_name)
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, ALGORITHMS_ROOT / path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return sys.modules[module_name]
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(ALGORITHMS_ROOT.parent))
+    MANIFEST_PATH.write_text(json.dumps(build_manifest(), indent=2) + "\n")
+    print(f"Wrote {MANIFEST_PATH}")
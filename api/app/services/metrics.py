@@ -0,0 +1,123 @@
+"""Per-algorithm execution metrics in the Prometheus text exposition format.
+
+Observing is a bisect and a few additions under a lock, so the metrics stay
+on in production; rendering walks them only when /metrics is scraped.
+Metrics are kept per web process.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterator
+
+# Content type of the text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+STEPS_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+BYTES_BUCKETS = tuple(1024 * 4**i for i in range(10))  # 1 KiB to 256 MiB
+
+
+def _label(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    """Format a sample value (integers without a trailing .0)."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Histogram of observations, one series per algorithm."""
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        # algorithm id -> [count per bucket (+Inf last), sum]
+        self._series: dict[str, list] = {}
+
+    def observe(self, algorithm_id: str, value: float):
+        """Record one observation (the caller holds the metrics lock)."""
+        series = self._series.get(algorithm_id)
+        if series is None:
+            series = self._series[algorithm_id] = [[0] * (len(self.buckets) + 1), 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for algorithm_id, (counts, total) in sorted(self._series.items()):
+            labels = f'algorithm="{_label(algorithm_id)}"'
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts, strict=True):
+                cumulative += count
+                le = bound if isinstance(bound, str) else _number(bound)
+                yield f'{self.name}_bucket{{{labels},le="{le}"}} {cumulative}'
+            yield f"{self.name}_sum{{{labels}}} {_number(total)}"
+            yield f"{self.name}_count{{{labels}}} {cumulative}"
+
+
+class Metrics:
+    """Histograms of every run, and counters of how responses were served."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.execution_seconds = Histogram(
+            "dsa_execution_seconds", "Time spent running the algorithm.", SECONDS_BUCKETS
+        )
+        self.serialization_seconds = Histogram(
+            "dsa_serialization_seconds",
+            "Time spent encoding the run's steps and response.",
+            SECONDS_BUCKETS,
+        )
+        self.steps = Histogram("dsa_steps", "Steps emitted per run.", STEPS_BUCKETS)
+        self.response_bytes = Histogram(
+            "dsa_response_bytes", "Size of the encoded response.", BYTES_BUCKETS
+        )
+        # (algorithm id, X-Cache value) -> responses
+        self._responses: defaultdict[tuple[str, str], int] = defaultdict(int)
+
+    def observe_run(
+        self,
+        algorithm_id: str,
+        execution_seconds: float,
+        serialization_seconds: float,
+        steps: int,
+        response_bytes: int,
+    ):
+        """Record one run of an algorithm."""
+        with self._lock:
+            self.execution_seconds.observe(algorithm_id, execution_seconds)
+            self.serialization_seconds.observe(algorithm_id, serialization_seconds)
+            self.steps.observe(algorithm_id, steps)
+            self.response_bytes.observe(algorithm_id, response_bytes)
+
+    def observe_response(self, algorithm_id: str, cache: str):
+        """Record where a response came from (its X-Cache value, e.g. HIT or MISS)."""
+        with self._lock:
+            self._responses[algorithm_id, cache] += 1
+
+    def render(self) -> str:
+        """All metrics in the text exposition format."""
+        with self._lock:
+            lines = [
+                *self.execution_seconds.render(),
+                *self.serialization_seconds.render(),
+                *self.steps.render(),
+                *self.response_bytes.render(),
+                "# HELP dsa_responses_total Execute responses by cache layer (X-Cache).",
+                "# TYPE dsa_responses_total counter",
+            ]
+            for (algorithm_id, cache), count in sorted(self._responses.items()):
+                lines.append(
+                    f'dsa_responses_total{{algorithm="{_label(algorithm_id)}",'
+                    f'cache="{_label(cache)}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics
+metrics = Metrics()
@@ -0,0 +1,182 @@
+"""On-demand profiling of one execution, split by where the time goes.
+
+A profiled run answers "is this exhibit slow because of the algorithm,
+because of recording its steps, or because of encoding them?". The job
+runs in a worker under cProfile, in two sessions: running the algorithm
+(the algorithm's code interleaved with emit_step) and encoding the
+response (steps to dicts to JSON). Functions of the first session are
+attributed to a phase by where they live:
+
+- "emit_step": algorithms.base (StepTracker, delta encoding, coalescing)
+  and pydantic;
+- "algorithm": everything else;
+
+and any function not in algorithms.base or pydantic (builtins, the
+standard library, state-building lambdas in an algorithm's file) takes
+the phase of the caller it spends most time under, so e.g. the copies
+made for a step's state count towards emit_step. Everything in the
+second session is "serialization".
+"""
+
+import cProfile
+import hmac
+import json
+import os
+import pstats
+import sys
+import tempfile
+import time
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from app.services.workers import encode_run, run_algorithm
+
+PHASES = ("algorithm", "emit_step", "serialization")
+
+# Frames listed per phase
+TOP_FRAMES = 10
+
+# Directory profiler output (.prof, for pstats or snakeviz) is written to
+PROFILE_DIR = os.environ.get("DSA_PROFILE_DIR") or os.path.join(
+    tempfile.gettempdir(), "dsa-profiles"
+)
+
+# Newest profiler output files kept in PROFILE_DIR; older ones are deleted
+PROFILE_KEEP = int(os.environ.get("DSA_PROFILE_KEEP", "20"))
+
+# Token an admin sends in X-Admin-Token; profiling is disabled when unset
+ADMIN_TOKEN = os.environ.get("DSA_ADMIN_TOKEN", "")
+
+
+def is_admin(token: str | None) -> bool:
+    """Whether a request's X-Admin-Token grants admin-only options."""
+    return bool(ADMIN_TOKEN) and token is not None and hmac.compare_digest(token, ADMIN_TOKEN)
+
+
+@cache
+def _step_directories() -> tuple[str, ...]:
+    """Directories of the code that records steps (algorithms.base and pydantic)."""
+    from app.services.registry import StepTracker  # puts algorithms on the path
+
+    base = os.path.dirname(sys.modules[StepTracker.__module__].__file__)
+    return base + os.sep, os.path.dirname(pydantic.__file__) + os.sep
+
+
+def _run_phases(stats: pstats.Stats) -> dict[tuple, str]:
+    """Attribute every function of the run session to "algorithm" or "emit_step"."""
+    entries = stats.stats
+    phases: dict[tuple, str] = {}
+
+    def phase(func: tuple, visiting: frozenset = frozenset()) -> str:
+        if func in phases:
+            return phases[func]
+        if func[0].startswith(_step_directories()):
+            found = "emit_step"
+        else:
+            callers = {
+                caller: timing[2]
+                for caller, timing in entries[func][4].items()
+                if caller != func and caller not in visiting and caller in entries
+            }
+            if callers:
+                found = phase(max(callers, key=callers.__getitem__), visiting | {func})
+            else:
+                found = "algorithm"
+        if not visiting:  # results reached through a cycle guard are not final
+            phases[func] = found
+        return found
+
+    for func in entries:
+        phase(func)
+    return phases
+
+
+def _frame(func: tuple, entry: tuple) -> dict[str, Any]:
+    """One profiled function, for the response."""
+    filename, line, name = func
+    primitive_calls, calls, self_seconds, cumulative_seconds, _ = entry
+    return {
+        "function": name,
+        "file": filename,
+        "line": line,
+        "calls": calls,
+        "self_seconds": self_seconds,
+        "cumulative_seconds": cumulative_seconds,
+    }
+
+
+def summarize(run_stats: pstats.Stats, encode_stats: pstats.Stats) -> dict[str, Any]:
+    """Self time and top frames (by self time) per phase."""
+    by_phase: dict[str, list[tuple[tuple, tuple]]] = {phase: [] for phase in PHASES}
+    run_phases = _run_phases(run_stats)
+    for func, entry in run_stats.stats.items():
+        by_phase[run_phases[func]].append((func, entry))
+    by_phase["serialization"] = list(encode_stats.stats.items())
+
+    summary = {}
+    for phase, functions in by_phase.items():
+        functions.sort(key=lambda item: item[1][2], reverse=True)
+        summary[phase] = {
+            "seconds": sum(entry[2] for _, entry in functions),
+            "top": [_frame(func, entry) for func, entry in functions[:TOP_FRAMES]],
+        }
+    return summary
+
+
+def _prune_profiles(directory: Path):
+    """Delete all but the PROFILE_KEEP newest profiler output files."""
+    files = []
+    for path in directory.glob("*.prof"):
+        try:
+            files.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:  # pruned by another worker
+            pass
+    files.sort(reverse=True)
+    for _, path in files[PROFILE_KEEP:]:
+        path.unlink(missing_ok=True)
+
+
+def profile_job(
+    algorithm_id: str,
+    input_data: Any,
+    mode: str = "trace",
+    encoding: str = "full",
+    keyframe_interval: int | None = None,
+    max_steps: int | None = None,
+    level: int | None = None,
+) -> dict[str, Any]:
+    """Run one algorithm under the profiler (in a worker process).
+
+    Args:
+        algorithm_id: ID of the algorithm to execute
+        input_data: Input data for the algorithm
+        mode, encoding, keyframe_interval, max_steps, level: As for execute_job
+
+    Returns:
+        The response fields, as execute_job returns them, plus "profile":
+        the seconds and top frames of each phase and the path of the
+        profiler output file (one of the PROFILE_KEEP newest kept)
+    """
+    run_profiler = cProfile.Profile()
+    run = run_profiler.runcall(
+        run_algorithm, algorithm_id, input_data, mode, encoding, keyframe_interval, max_steps
+    )
+    encode_profiler = cProfile.Profile()
+    body = encode_profiler.runcall(
+        lambda: json.dumps(encode_run(run, mode, encoding, level), default=str)
+    )
+
+    run_stats = pstats.Stats(run_profiler)
+    encode_stats = pstats.Stats(encode_profiler)
+    path = Path(PROFILE_DIR) / f"{algorithm_id}-{time.time_ns()}.prof"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pstats.Stats(run_profiler).add(encode_profiler).dump_stats(path)
+    _prune_profiles(path.parent)
+
+    return {
+        **json.loads(body),
+        "profile": {"phases": summarize(run_stats, encode_stats), "file": str(path)},
+    }
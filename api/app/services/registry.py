@@ -1,554 +1,249 @@
 """Algorithm registry service for discovering and managing algorithms."""
 
+import hashlib
+import math
+import os
 import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from copy import copy
+from functools import cache
+from itertools import pairwise
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 # Add parent directory to path to import algorithms
 algorithms_path = Path(__file__).parent.parent.parent.parent / "algorithms"
 sys.path.insert(0, str(algorithms_path.parent))
 
+from algorithms.base import Step, StepTracker  # noqa: E402
+
+from app.services.manifest import load_manifest, load_module, source_file  # noqa: E402
+
+# Debug mode: validate every emitted step against the pydantic StepModel
+VALIDATE_STEPS = os.environ.get("DSA_VALIDATE_STEPS") == "1"
+
+# Default step budget for retained runs; larger traces are coalesced. 0 (the
+# default) means no budget: coalescing only happens when a request asks for it
+DEFAULT_MAX_STEPS = int(os.environ.get("DSA_MAX_STEPS", "0"))
+
+
+@cache
+def _base_source() -> bytes:
+    """Source of algorithms.base, which every algorithm's steps depend on."""
+    return b"".join(path.read_bytes() for path in sorted((algorithms_path / "base").glob("*.py")))
+
+
+class InputError(ValueError):
+    """Raised when a request's input does not fit the algorithm's input schema."""
+
+
+def compile_entry(entry: dict[str, Any]) -> Callable[[StepTracker, Any], Iterator]:
+    """Build the function that starts a run of a manifest entry.
+
+    Called once per algorithm at registration, so a request only looks the
+    function up, checks the input's shape and calls the entry method. An
+    entry without an input schema receives the input as is; with one, the
+    input object's values (or the schema's defaults) are passed in order.
+    """
+    method = entry["entry"]
+    schema = entry.get("input")
+    if schema is None:
+        return lambda instance, input_data: getattr(instance, method)(input_data)
+
+    fields = tuple(schema.items())
+    shorthand = entry.get("shorthand")
+    expected = f"{entry['id']} expects an object with keys: {', '.join(schema)}"
+
+    def start(instance: StepTracker, input_data: Any) -> Iterator:
+        if not isinstance(input_data, dict):
+            if shorthand is None:
+                raise InputError(expected)
+            input_data = {shorthand: input_data}
+        # Defaults are copied, since algorithms may mutate their arguments
+        args = [input_data[key] if key in input_data else copy(default) for key, default in fields]
+        return getattr(instance, method)(*args)
+
+    return start
+
+
+# Encoded size of a step apart from its state (description, highlights, metadata)
+STEP_BYTES = 400
+
+
+def _log2(x: float) -> float:
+    return math.log2(x) if x > 2 else 1.0
+
+
+def _edges(graph: dict[Any, list]) -> int:
+    return sum(len(neighbors) for neighbors in graph.values())
+
+
+def _cells(grid: list[list]) -> int:
+    return sum(len(row) for row in grid)
+
+
+def _digits(x: int) -> int:
+    return len(str(abs(int(x))))
+
+
+def _sorted_run(values: list) -> int:
+    """Length of the longest stretch of values in ascending or descending order.
+
+    Inputs like this are the worst case of algorithms that degrade on
+    presorted data (BST inserts build a chain, quicksort's partitions are
+    lopsided), which their average-case expressions would miss.
+    """
+    longest = up = down = min(len(values), 1)
+    for previous, value in pairwise(values):
+        up = up + 1 if value >= previous else 1
+        down = down + 1 if value <= previous else 1
+        longest = max(longest, up, down)
+    return longest
+
+
+# Functions cost expressions can call; input keys of the same name do not shadow them
+COST_HELPERS = {
+    "abs": abs,
+    "cells": _cells,
+    "digits": _digits,
+    "edges": _edges,
+    "len": len,
+    "log2": _log2,
+    "max": max,
+    "min": min,
+    "sorted_run": _sorted_run,
+}
+
+
+class Estimate(NamedTuple):
+    """Predicted size of a run, computed from its input before it starts."""
+
+    steps: int
+    step_bytes: int
+
+    def output_bytes(self, max_steps: int | None = None) -> int:
+        """Encoded size of the run's steps in full encoding, with at most max_steps steps."""
+        steps = min(self.steps, max_steps) if max_steps else self.steps
+        return steps * self.step_bytes
+
+
+def compile_cost(entry: dict[str, Any]) -> Callable[[Any], Estimate | None] | None:
+    """Build the function that estimates a run of a manifest entry from its input.
+
+    Like compile_entry, called once per algorithm at registration: the
+    entry's cost expressions are compiled here, so an estimate only
+    evaluates them, in microseconds and without importing the algorithm.
+    The estimate is None for input the expressions cannot measure (the run
+    will most likely reject it too); None as a whole for entries without a
+    cost.
+    """
+    cost = entry.get("cost")
+    if cost is None:
+        return None
+
+    steps = compile(cost["steps"], f"<{entry['id']} steps>", "eval")
+    state_bytes = compile(cost.get("state_bytes", "0"), f"<{entry['id']} state_bytes>", "eval")
+    schema = entry.get("input") or {}
+    shorthand = entry.get("shorthand")
+    scope = {"__builtins__": {}, **COST_HELPERS}
+
+    def estimate(input_data: Any) -> Estimate | None:
+        if shorthand is not None and not isinstance(input_data, dict):
+            input_data = {shorthand: input_data}
+        names = {"input": input_data}
+        if isinstance(input_data, dict):
+            names.update(schema)
+            names.update(input_data)
+        for helper in COST_HELPERS:
+            names.pop(helper, None)
+        try:
+            return Estimate(
+                steps=max(1, math.ceil(eval(steps, scope, names))),
+                step_bytes=STEP_BYTES + math.ceil(eval(state_bytes, scope, names)),
+            )
+        except (
+            AttributeError,
+            LookupError,
+            NameError,
+            OverflowError,
+            TypeError,
+            ValueError,
+            ZeroDivisionError,
+        ):
+            return None
+
+    return estimate
+
 
 class AlgorithmRegistry:
-    """Registry for discovering and executing algorithms."""
+    """Registry for discovering and executing algorithms.
+
+    Algorithms are discovered from the generated manifest (see
+    app.services.manifest); each algorithm's module is imported the first
+    time it is run.
+    """
 
     def __init__(self):
         self._algorithms = {}
+        self._classes: dict[str, type[StepTracker]] = {}
+        self._entries: dict[str, Callable[[StepTracker, Any], Iterator]] = {}
+        self._costs: dict[str, Callable[[Any], Estimate | None] | None] = {}
+        self._source_hashes: dict[str, str] = {}
         self._discover_algorithms()
 
     def _discover_algorithms(self):
-        """Discover available algorithms."""
-        # For now, manually register algorithms
-        # TODO: Auto-discover from algorithms directory
-        import importlib.util
-
-        # algorithms/trees/ has both bst.py and a bst/ package, so a normal
-        # `from algorithms.trees.bst import BST` resolves to the package. Load
-        # the file explicitly instead. Derive its path from the installed
-        # `algorithms` package rather than counting ".parent" hops from
-        # __file__: the hop count only matched the local-dev tree layout and
-        # resolved to /algorithms in the container, crashing startup.
-        import algorithms
-
-        algorithms_dir = Path(algorithms.__file__).resolve().parent
-
-        from algorithms.graphs.bfs import BFS
-        from algorithms.graphs.dfs import DFS
-        from algorithms.graphs.dijkstra import Dijkstra
-        from algorithms.search.binary_search import BinarySearch
-        from algorithms.search.linear_search import LinearSearch
-        from algorithms.sorting.bubble_sort import BubbleSort
-        from algorithms.sorting.heap_sort import HeapSort
-        from algorithms.sorting.insertion_sort import InsertionSort
-        from algorithms.sorting.merge_sort import MergeSort
-        from algorithms.sorting.quick_sort import QuickSort
-        from algorithms.sorting.selection_sort import SelectionSort
-
-        spec = importlib.util.spec_from_file_location(
-            "bst_viz",
-            str(algorithms_dir / "trees" / "bst.py"),
-        )
-        bst_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(bst_module)
-        BSTClass = bst_module.BST
-        from algorithms.dynamic_programming.climbing_stairs_viz import ClimbingStairs
-        from algorithms.dynamic_programming.coin_change_2_viz import CoinChange2
-        from algorithms.dynamic_programming.coin_change_viz import CoinChange
-        from algorithms.dynamic_programming.edit_distance_viz import EditDistance
-        from algorithms.dynamic_programming.fibonacci import Fibonacci
-        from algorithms.dynamic_programming.house_robber_viz import HouseRobber
-
-        # Wave 1 exhibits (uniform run(input_data) generator interface)
-        from algorithms.dynamic_programming.kadane_viz import Kadane
-        from algorithms.dynamic_programming.knapsack import Knapsack
-        from algorithms.dynamic_programming.lcs import LCS
-        from algorithms.dynamic_programming.lis_viz import LongestIncreasingSubsequence
-        from algorithms.dynamic_programming.lps_viz import LongestPalindromicSubsequence
-        from algorithms.dynamic_programming.max_product_subarray_viz import MaxProductSubarray
-        from algorithms.dynamic_programming.min_path_sum_viz import MinPathSum
-        from algorithms.dynamic_programming.unique_paths_viz import UniquePaths
-        from algorithms.dynamic_programming.word_break_viz import WordBreak
-        from algorithms.graphs.astar_grid_viz import AStarGrid
-
-        # Wave 3 exhibits (uniform run(input_data) generator interface)
-        from algorithms.graphs.bellman_ford_viz import BellmanFord
-        from algorithms.graphs.connected_components_viz import ConnectedComponents
-        from algorithms.graphs.course_schedule_viz import CourseSchedule
-        from algorithms.graphs.num_islands import NumIslands
-        from algorithms.graphs.prim_mst_viz import PrimMST
-        from algorithms.graphs.topological_sort import TopologicalSort
-        from algorithms.search.exponential_search_viz import ExponentialSearch
-
-        # Wave 2 exhibits (uniform run(input_data) generator interface)
-        from algorithms.search.quickselect_viz import QuickSelect
-        from algorithms.search.rotated_array_search_viz import RotatedArraySearch
-        from algorithms.search.ternary_search_viz import TernarySearch
-        from algorithms.sorting.counting_sort import CountingSort
-        from algorithms.sorting.radix_sort import RadixSort
-        from algorithms.trees.invert_binary_tree_viz import InvertBinaryTree
-        from algorithms.trees.lca_viz import LowestCommonAncestor
-        from algorithms.trees.level_order_viz import LevelOrder
-        from algorithms.trees.max_depth_viz import MaxDepth
-        from algorithms.trees.path_sum_viz import PathSum
-        from algorithms.trees.traversals import TreeTraversals
-        from algorithms.trees.tree_diameter_viz import TreeDiameter
-        from algorithms.trees.validate_bst_viz import ValidateBST
-
-        self._algorithms["bubble_sort"] = {
-            "id": "bubble_sort",
-            "name": "Bubble Sort",
-            "category": "sorting",
-            "class": BubbleSort,
-            "visualizer_type": BubbleSort.visualizer_type.value,
-        }
-
-        self._algorithms["quick_sort"] = {
-            "id": "quick_sort",
-            "name": "Quick Sort",
-            "category": "sorting",
-            "class": QuickSort,
-            "visualizer_type": QuickSort.visualizer_type.value,
-        }
-
-        self._algorithms["merge_sort"] = {
-            "id": "merge_sort",
-            "name": "Merge Sort",
-            "category": "sorting",
-            "class": MergeSort,
-            "visualizer_type": MergeSort.visualizer_type.value,
-        }
-
-        self._algorithms["insertion_sort"] = {
-            "id": "insertion_sort",
-            "name": "Insertion Sort",
-            "category": "sorting",
-            "class": InsertionSort,
-            "visualizer_type": InsertionSort.visualizer_type.value,
-        }
-
-        self._algorithms["selection_sort"] = {
-            "id": "selection_sort",
-            "name": "Selection Sort",
-            "category": "sorting",
-            "class": SelectionSort,
-            "visualizer_type": SelectionSort.visualizer_type.value,
-        }
-
-        self._algorithms["heap_sort"] = {
-            "id": "heap_sort",
-            "name": "Heap Sort",
-            "category": "sorting",
-            "class": HeapSort,
-            "visualizer_type": HeapSort.visualizer_type.value,
-        }
-
-        self._algorithms["bfs"] = {
-            "id": "bfs",
-            "name": "Breadth-First Search",
-            "category": "graphs",
-            "class": BFS,
-            "visualizer_type": BFS.visualizer_type.value,
-        }
-
-        self._algorithms["dfs"] = {
-            "id": "dfs",
-            "name": "Depth-First Search",
-            "category": "graphs",
-            "class": DFS,
-            "visualizer_type": DFS.visualizer_type.value,
-        }
-
-        self._algorithms["dijkstra"] = {
-            "id": "dijkstra",
-            "name": "Dijkstra's Algorithm",
-            "category": "graphs",
-            "class": Dijkstra,
-            "visualizer_type": Dijkstra.visualizer_type.value,
-        }
-
-        self._algorithms["binary_search"] = {
-            "id": "binary_search",
-            "name": "Binary Search",
-            "category": "search",
-            "class": BinarySearch,
-            "visualizer_type": BinarySearch.visualizer_type.value,
-        }
-
-        self._algorithms["linear_search"] = {
-            "id": "linear_search",
-            "name": "Linear Search",
-            "category": "search",
-            "class": LinearSearch,
-            "visualizer_type": LinearSearch.visualizer_type.value,
-        }
-
-        self._algorithms["bst_insert"] = {
-            "id": "bst_insert",
-            "name": "BST Insert",
-            "category": "trees",
-            "class": BSTClass,
-            "visualizer_type": BSTClass.visualizer_type.value,
-        }
-
-        self._algorithms["bst_search"] = {
-            "id": "bst_search",
-            "name": "BST Search",
-            "category": "trees",
-            "class": BSTClass,
-            "visualizer_type": BSTClass.visualizer_type.value,
-        }
-
-        self._algorithms["fibonacci_memo"] = {
-            "id": "fibonacci_memo",
-            "name": "Fibonacci (Memoization)",
-            "category": "dynamic_programming",
-            "class": Fibonacci,
-            "visualizer_type": Fibonacci.visualizer_type.value,
-        }
-
-        self._algorithms["fibonacci_tab"] = {
-            "id": "fibonacci_tab",
-            "name": "Fibonacci (Tabulation)",
-            "category": "dynamic_programming",
-            "class": Fibonacci,
-            "visualizer_type": Fibonacci.visualizer_type.value,
-        }
-
-        self._algorithms["knapsack"] = {
-            "id": "knapsack",
-            "name": "0/1 Knapsack",
-            "category": "dynamic_programming",
-            "class": Knapsack,
-            "visualizer_type": Knapsack.visualizer_type.value,
-        }
-
-        self._algorithms["lcs"] = {
-            "id": "lcs",
-            "name": "Longest Common Subsequence",
-            "category": "dynamic_programming",
-            "class": LCS,
-            "visualizer_type": LCS.visualizer_type.value,
-        }
-
-        self._algorithms["num_islands"] = {
-            "id": "num_islands",
-            "name": "Number of Islands",
-            "category": "graphs",
-            "class": NumIslands,
-            "visualizer_type": NumIslands.visualizer_type.value,
-        }
-
-        self._algorithms["tree_inorder"] = {
-            "id": "tree_inorder",
-            "name": "Tree In-order Traversal",
-            "category": "trees",
-            "class": TreeTraversals,
-            "visualizer_type": TreeTraversals.visualizer_type.value,
-        }
-
-        self._algorithms["tree_preorder"] = {
-            "id": "tree_preorder",
-            "name": "Tree Pre-order Traversal",
-            "category": "trees",
-            "class": TreeTraversals,
-            "visualizer_type": TreeTraversals.visualizer_type.value,
-        }
-
-        self._algorithms["tree_postorder"] = {
-            "id": "tree_postorder",
-            "name": "Tree Post-order Traversal",
-            "category": "trees",
-            "class": TreeTraversals,
-            "visualizer_type": TreeTraversals.visualizer_type.value,
-        }
-
-        self._algorithms["kadane"] = {
-            "id": "kadane",
-            "name": "Kadane's Maximum Subarray",
-            "category": "dynamic_programming",
-            "class": Kadane,
-            "visualizer_type": Kadane.visualizer_type.value,
-        }
-
-        self._algorithms["coin_change"] = {
-            "id": "coin_change",
-            "name": "Coin Change",
-            "category": "dynamic_programming",
-            "class": CoinChange,
-            "visualizer_type": CoinChange.visualizer_type.value,
-        }
-
-        self._algorithms["climbing_stairs"] = {
-            "id": "climbing_stairs",
-            "name": "Climbing Stairs",
-            "category": "dynamic_programming",
-            "class": ClimbingStairs,
-            "visualizer_type": ClimbingStairs.visualizer_type.value,
-        }
-
-        self._algorithms["house_robber"] = {
-            "id": "house_robber",
-            "name": "House Robber",
-            "category": "dynamic_programming",
-            "class": HouseRobber,
-            "visualizer_type": HouseRobber.visualizer_type.value,
-        }
-
-        self._algorithms["edit_distance"] = {
-            "id": "edit_distance",
-            "name": "Edit Distance (Levenshtein)",
-            "category": "dynamic_programming",
-            "class": EditDistance,
-            "visualizer_type": EditDistance.visualizer_type.value,
-        }
-
-        self._algorithms["unique_paths"] = {
-            "id": "unique_paths",
-            "name": "Unique Paths",
-            "category": "dynamic_programming",
-            "class": UniquePaths,
-            "visualizer_type": UniquePaths.visualizer_type.value,
-        }
-
-        self._algorithms["counting_sort"] = {
-            "id": "counting_sort",
-            "name": "Counting Sort",
-            "category": "sorting",
-            "class": CountingSort,
-            "visualizer_type": CountingSort.visualizer_type.value,
-        }
-
-        self._algorithms["radix_sort"] = {
-            "id": "radix_sort",
-            "name": "Radix Sort",
-            "category": "sorting",
-            "class": RadixSort,
-            "visualizer_type": RadixSort.visualizer_type.value,
-        }
-
-        self._algorithms["validate_bst"] = {
-            "id": "validate_bst",
-            "name": "Validate BST",
-            "category": "trees",
-            "class": ValidateBST,
-            "visualizer_type": ValidateBST.visualizer_type.value,
-        }
-
-        self._algorithms["invert_binary_tree"] = {
-            "id": "invert_binary_tree",
-            "name": "Invert Binary Tree",
-            "category": "trees",
-            "class": InvertBinaryTree,
-            "visualizer_type": InvertBinaryTree.visualizer_type.value,
-        }
-
-        self._algorithms["topological_sort"] = {
-            "id": "topological_sort",
-            "name": "Topological Sort (Kahn's)",
-            "category": "graphs",
-            "class": TopologicalSort,
-            "visualizer_type": TopologicalSort.visualizer_type.value,
-        }
-
-        self._algorithms["quickselect"] = {
-            "id": "quickselect",
-            "name": "Quickselect (Kth Smallest)",
-            "category": "searching",
-            "class": QuickSelect,
-            "visualizer_type": QuickSelect.visualizer_type.value,
-        }
-
-        self._algorithms["rotated_search"] = {
-            "id": "rotated_search",
-            "name": "Search in Rotated Sorted Array",
-            "category": "searching",
-            "class": RotatedArraySearch,
-            "visualizer_type": RotatedArraySearch.visualizer_type.value,
-        }
-
-        self._algorithms["lis"] = {
-            "id": "lis",
-            "name": "Longest Increasing Subsequence",
-            "category": "dynamic_programming",
-            "class": LongestIncreasingSubsequence,
-            "visualizer_type": LongestIncreasingSubsequence.visualizer_type.value,
-        }
-
-        self._algorithms["word_break"] = {
-            "id": "word_break",
-            "name": "Word Break",
-            "category": "dynamic_programming",
-            "class": WordBreak,
-            "visualizer_type": WordBreak.visualizer_type.value,
-        }
-
-        self._algorithms["min_path_sum"] = {
-            "id": "min_path_sum",
-            "name": "Minimum Path Sum",
-            "category": "dynamic_programming",
-            "class": MinPathSum,
-            "visualizer_type": MinPathSum.visualizer_type.value,
-        }
-
-        self._algorithms["lca"] = {
-            "id": "lca",
-            "name": "Lowest Common Ancestor (BST)",
-            "category": "trees",
-            "class": LowestCommonAncestor,
-            "visualizer_type": LowestCommonAncestor.visualizer_type.value,
-        }
-
-        self._algorithms["tree_max_depth"] = {
-            "id": "tree_max_depth",
-            "name": "Maximum Depth of Binary Tree",
-            "category": "trees",
-            "class": MaxDepth,
-            "visualizer_type": MaxDepth.visualizer_type.value,
-        }
-
-        self._algorithms["level_order"] = {
-            "id": "level_order",
-            "name": "Binary Tree Level-Order Traversal (BFS)",
-            "category": "trees",
-            "class": LevelOrder,
-            "visualizer_type": LevelOrder.visualizer_type.value,
-        }
-
-        self._algorithms["course_schedule"] = {
-            "id": "course_schedule",
-            "name": "Course Schedule (Cycle Detection)",
-            "category": "graphs",
-            "class": CourseSchedule,
-            "visualizer_type": CourseSchedule.visualizer_type.value,
-        }
-
-        self._algorithms["connected_components"] = {
-            "id": "connected_components",
-            "name": "Connected Components (DFS)",
-            "category": "graphs",
-            "class": ConnectedComponents,
-            "visualizer_type": ConnectedComponents.visualizer_type.value,
-        }
-
-        self._algorithms["bellman_ford"] = {
-            "id": "bellman_ford",
-            "name": "Bellman-Ford",
-            "category": "graphs",
-            "class": BellmanFord,
-            "visualizer_type": BellmanFord.visualizer_type.value,
-        }
-
-        self._algorithms["prim_mst"] = {
-            "id": "prim_mst",
-            "name": "Prim's Minimum Spanning Tree",
-            "category": "graphs",
-            "class": PrimMST,
-            "visualizer_type": PrimMST.visualizer_type.value,
-        }
-
-        self._algorithms["astar_grid"] = {
-            "id": "astar_grid",
-            "name": "A* Pathfinding (Grid)",
-            "category": "graphs",
-            "class": AStarGrid,
-            "visualizer_type": AStarGrid.visualizer_type.value,
-        }
-
-        self._algorithms["exponential_search"] = {
-            "id": "exponential_search",
-            "name": "Exponential Search",
-            "category": "searching",
-            "class": ExponentialSearch,
-            "visualizer_type": ExponentialSearch.visualizer_type.value,
-        }
-
-        self._algorithms["ternary_search"] = {
-            "id": "ternary_search",
-            "name": "Ternary Search",
-            "category": "searching",
-            "class": TernarySearch,
-            "visualizer_type": TernarySearch.visualizer_type.value,
-        }
-
-        self._algorithms["coin_change_2"] = {
-            "id": "coin_change_2",
-            "name": "Coin Change II (Count Ways)",
-            "category": "dynamic_programming",
-            "class": CoinChange2,
-            "visualizer_type": CoinChange2.visualizer_type.value,
-        }
-
-        self._algorithms["longest_palindromic_subsequence"] = {
-            "id": "longest_palindromic_subsequence",
-            "name": "Longest Palindromic Subsequence",
-            "category": "dynamic_programming",
-            "class": LongestPalindromicSubsequence,
-            "visualizer_type": LongestPalindromicSubsequence.visualizer_type.value,
-        }
-
-        self._algorithms["max_product_subarray"] = {
-            "id": "max_product_subarray",
-            "name": "Maximum Product Subarray",
-            "category": "dynamic_programming",
-            "class": MaxProductSubarray,
-            "visualizer_type": MaxProductSubarray.visualizer_type.value,
-        }
-
-        self._algorithms["tree_diameter"] = {
-            "id": "tree_diameter",
-            "name": "Binary Tree Diameter",
-            "category": "trees",
-            "class": TreeDiameter,
-            "visualizer_type": TreeDiameter.visualizer_type.value,
-        }
-
-        self._algorithms["tree_path_sum"] = {
-            "id": "tree_path_sum",
-            "name": "Path Sum (Root-to-Leaf)",
-            "category": "trees",
-            "class": PathSum,
-            "visualizer_type": PathSum.visualizer_type.value,
-        }
-
-    # Wave 1, 2 & 3 exhibits use a uniform run(input_data) generator interface
-    _RUN_BASED = {
-        "kadane",
-        "coin_change",
-        "climbing_stairs",
-        "house_robber",
-        "edit_distance",
-        "unique_paths",
-        "counting_sort",
-        "radix_sort",
-        "validate_bst",
-        "invert_binary_tree",
-        "topological_sort",
-        "quickselect",
-        "rotated_search",
-        "lis",
-        "word_break",
-        "min_path_sum",
-        "lca",
-        "tree_max_depth",
-        "level_order",
-        "course_schedule",
-        "connected_components",
-        "bellman_ford",
-        "prim_mst",
-        "astar_grid",
-        "exponential_search",
-        "ternary_search",
-        "coin_change_2",
-        "longest_palindromic_subsequence",
-        "max_product_subarray",
-        "tree_diameter",
-        "tree_path_sum",
-    }
+        """Register the algorithms listed in the manifest (nothing is imported yet)."""
+        for entry in load_manifest():
+            self._algorithms[entry["id"]] = entry
+            self._entries[entry["id"]] = compile_entry(entry)
+            self._costs[entry["id"]] = compile_cost(entry)
 
     def get_algorithm(self, algorithm_id: str) -> dict[str, Any] | None:
-        """Get algorithm metadata by ID."""
+        """Get algorithm metadata by ID (from the manifest; imports nothing)."""
         return self._algorithms.get(algorithm_id)
 
+    def get_class(self, algorithm_id: str) -> type[StepTracker]:
+        """Get an algorithm's class, importing its module on first use."""
+        algo_info = self.get_algorithm(algorithm_id)
+        if not algo_info:
+            raise ValueError(f"Algorithm not found: {algorithm_id}")
+        cls = self._classes.get(algorithm_id)
+        if cls is None:
+            module = load_module(algo_info["module"], algo_info.get("path"))
+            cls = self._classes[algorithm_id] = getattr(module, algo_info["class"])
+        return cls
+
+    def source_hash(self, algorithm_id: str) -> str:
+        """Hash of the code a run depends on: the algorithm's file and algorithms.base.
+
+        Read from disk once per process, without importing the algorithm.
+        """
+        digest = self._source_hashes.get(algorithm_id)
+        if digest is None:
+            algo_info = self.get_algorithm(algorithm_id)
+            if not algo_info:
+                raise ValueError(f"Algorithm not found: {algorithm_id}")
+            sha = hashlib.sha256(_base_source())
+            sha.update(source_file(algo_info).read_bytes())
+            digest = self._source_hashes[algorithm_id] = sha.hexdigest()
+        return digest
+
+    def estimate(self, algorithm_id: str, input_data: Any) -> Estimate | None:
+        """Estimate a run's step count and size from its input, without running it.
+
+        Returns:
+            The estimate, or None if the algorithm has no cost expressions or
+            they cannot measure this input
+
+        Raises:
+            ValueError: If the algorithm is not registered
+        """
+        if algorithm_id not in self._costs:
+            raise ValueError(f"Algorithm not found: {algorithm_id}")
+        estimate = self._costs[algorithm_id]
+        return estimate(input_data) if estimate is not None else None
+
     def list_algorithms(self) -> list[dict[str, Any]]:
         """List all available algorithms."""
         return [
@@ -561,102 +256,102 @@ class AlgorithmRegistry:
             for algo in self._algorithms.values()
         ]
 
-    def execute_algorithm(self, algorithm_id: str, input_data: Any) -> list[dict[str, Any]]:
+    def execute_algorithm(
+        self, algorithm_id: str, input_data: Any, encoding: str = "full"
+    ) -> list[dict[str, Any]]:
         """Execute an algorithm and return all steps.
 
         Args:
             algorithm_id: ID of the algorithm to execute
             input_data: Input data for the algorithm
+            encoding: "full" for a state snapshot per step, "delta" for
+                keyframes followed by per-step state patches
 
         Returns:
             List of step dictionaries
         """
-        algo_info = self.get_algorithm(algorithm_id)
-        if not algo_info:
-            raise ValueError(f"Algorithm not found: {algorithm_id}")
+        return self.run_algorithm(algorithm_id, input_data, encoding).get_encoded_steps()
+
+    def run_algorithm(
+        self,
+        algorithm_id: str,
+        input_data: Any,
+        encoding: str = "full",
+        keyframe_interval: int | None = None,
+        max_steps: int | None = None,
+    ) -> StepTracker:
+        """Execute an algorithm and return the instance holding its steps.
+
+        Args:
+            algorithm_id: ID of the algorithm to execute
+            input_data: Input data for the algorithm
+            encoding: "full" or "delta" (see execute_algorithm)
+            keyframe_interval: Steps between keyframes in delta encoding
+            max_steps: Step budget; longer runs are coalesced into summary
+                steps (defaults to DSA_MAX_STEPS, normally no budget)
+
+        Returns:
+            The StepTracker instance that retained the run
+        """
+        instance = self._instantiate(algorithm_id).configure(
+            encoding=encoding,
+            keyframe_interval=keyframe_interval,
+            validate=VALIDATE_STEPS,
+            max_steps=DEFAULT_MAX_STEPS if max_steps is None else max_steps,
+        )
+
+        # Drain the generator; the instance retains the steps in the chosen encoding
+        deque(self._start(instance, algorithm_id, input_data), maxlen=0)
+        return instance
+
+    def stream_steps(
+        self, algorithm_id: str, input_data: Any
+    ) -> tuple[StepTracker, Iterator[Step]]:
+        """Start an algorithm whose steps are only yielded, not retained.
+
+        Unknown algorithms and input that does not fit the input schema are
+        rejected here, before the first step is produced.
+
+        Args:
+            algorithm_id: ID of the algorithm to execute
+            input_data: Input data for the algorithm
+
+        Returns:
+            The instance (for its references) and its step generator
+        """
+        instance = self._instantiate(algorithm_id).configure(retain=False, validate=VALIDATE_STEPS)
+        return instance, self._start(instance, algorithm_id, input_data)
+
+    def execute_headless(self, algorithm_id: str, input_data: Any) -> dict[str, Any]:
+        """Execute an algorithm without building any steps.
+
+        Args:
+            algorithm_id: ID of the algorithm to execute
+            input_data: Input data for the algorithm
+
+        Returns:
+            The run summary (see StepTracker.get_summary) plus the algorithm's
+            return value as "result" (None for algorithms that return nothing)
+        """
+        instance = self._instantiate(algorithm_id).configure(headless=True)
+        steps = self._start(instance, algorithm_id, input_data)
+
+        result = None
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            result = stop.value
+
+        return {"result": result, **instance.get_summary()}
+
+    def _instantiate(self, algorithm_id: str) -> StepTracker:
+        """Create a fresh instance of an algorithm's class."""
+        return self.get_class(algorithm_id)()
 
-        # Instantiate and execute
-        algo_class = algo_info["class"]
-        instance = algo_class()
-
-        # Execute based on algorithm type
-        if algorithm_id in self._RUN_BASED:
-            # Uniform interface: each class parses input_data itself
-            steps = list(instance.run(input_data))
-        elif algorithm_id in [
-            "bubble_sort",
-            "quick_sort",
-            "merge_sort",
-            "insertion_sort",
-            "selection_sort",
-            "heap_sort",
-        ]:
-            steps = list(instance.sort(input_data))
-        elif algorithm_id in ["bfs", "dfs"]:
-            # Graph algorithms expect: {"graph": {}, "start": int, "target": int}
-            graph = input_data.get("graph", {})
-            start = input_data.get("start", 0)
-            target = input_data.get("target")
-            steps = list(instance.search(graph, start, target))
-        elif algorithm_id == "dijkstra":
-            # Dijkstra expects: {"graph": {node: [(neighbor, weight), ...]}, "start": int, "target": int}
-            graph = input_data.get("graph", {})
-            start = input_data.get("start", 0)
-            target = input_data.get("target")
-            steps = list(instance.shortest_path(graph, start, target))
-        elif algorithm_id in ["binary_search", "linear_search"]:
-            # Search algorithms expect: {"array": [], "target": int}
-            arr = input_data.get("array", input_data if isinstance(input_data, dict) else [])
-            target = input_data.get("target", 0) if isinstance(input_data, dict) else 0
-            steps = list(instance.search(arr, target))
-        elif algorithm_id == "bst_insert":
-            # BST insert expects: list of values
-            values = input_data if isinstance(input_data, list) else input_data.get("values", [])
-            steps = list(instance.insert(values))
-        elif algorithm_id == "bst_search":
-            # BST search expects: {"values": [], "target": int}
-            values = input_data.get("values", [])
-            target = input_data.get("target", 0)
-            steps = list(instance.search(values, target))
-        elif algorithm_id == "fibonacci_memo":
-            # Fibonacci memoization expects: int or {"n": int}
-            n = input_data if isinstance(input_data, int) else input_data.get("n", 10)
-            steps = list(instance.compute_memoization(n))
-        elif algorithm_id == "fibonacci_tab":
-            # Fibonacci tabulation expects: int or {"n": int}
-            n = input_data if isinstance(input_data, int) else input_data.get("n", 10)
-            steps = list(instance.compute_tabulation(n))
-        elif algorithm_id == "knapsack":
-            # Knapsack expects: {"items": [(weight, value), ...], "capacity": int}
-            items = input_data.get("items", [])
-            capacity = input_data.get("capacity", 10)
-            steps = list(instance.solve(items, capacity))
-        elif algorithm_id == "lcs":
-            # LCS expects: {"str1": str, "str2": str}
-            str1 = input_data.get("str1", "")
-            str2 = input_data.get("str2", "")
-            steps = list(instance.compute(str1, str2))
-        elif algorithm_id == "num_islands":
-            # Number of Islands expects: {"grid": [["1", "0", ...], ...]}
-            grid = input_data.get("grid", [])
-            steps = list(instance.count_islands(grid))
-        elif algorithm_id == "tree_inorder":
-            # Tree In-order expects: list of values (level-order)
-            values = input_data if isinstance(input_data, list) else input_data.get("values", [])
-            steps = list(instance.inorder(values))
-        elif algorithm_id == "tree_preorder":
-            # Tree Pre-order expects: list of values (level-order)
-            values = input_data if isinstance(input_data, list) else input_data.get("values", [])
-            steps = list(instance.preorder(values))
-        elif algorithm_id == "tree_postorder":
-            # Tree Post-order expects: list of values (level-order)
-            values = input_data if isinstance(input_data, list) else input_data.get("values", [])
-            steps = list(instance.postorder(values))
-        else:
-            raise ValueError(f"Unknown execution method for algorithm: {algorithm_id}")
-
-        # Convert Step objects to dictionaries
-        return [step.model_dump() for step in steps]
+    def _start(self, instance: StepTracker, algorithm_id: str, input_data: Any) -> Iterator:
+        """Call the algorithm's entry point and return its step generator."""
+        return self._entries[algorithm_id](instance, input_data)
 
 
 # Global registry instance
@@ -0,0 +1,158 @@
+"""Store of recent algorithm runs for random-access step lookup."""
+
+import gzip
+import json
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+
+from algorithms.base import StepTracker
+
+
+class RunStore:
+    """Bounded LRU store of executed runs, keyed by run id.
+
+    Runs are kept in delta encoding (keyframes + patches), so a stored run
+    costs roughly its changed state rather than a snapshot per step, and a
+    client can still seek to any step (``StepTracker.step_at``) in
+    O(keyframe interval) without downloading the trace. The store is bounded
+    by the runs' encoded size as well as their number; a run larger than the
+    whole budget is not stored.
+
+    With a ``directory``, every run is also written there (gzipped JSON), so
+    other worker processes on the host can load runs they did not execute.
+    The directory is pruned to the same byte budget, oldest runs first.
+    """
+
+    def __init__(
+        self,
+        max_runs: int = 32,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: str | Path | None = None,
+    ):
+        self.max_runs = max_runs
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory else None
+        self._runs: OrderedDict[str, tuple[str, StepTracker, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    def save(self, algorithm_id: str, tracker: StepTracker) -> str | None:
+        """Store a finished run and return its id (None if it is over budget).
+
+        Full-encoding runs are converted to delta encoding first, so the
+        tracker's retained steps should already have been read.
+        """
+        tracker.convert_to_delta()
+        payload = json.dumps(
+            {
+                "algorithm_id": algorithm_id,
+                "records": tracker.get_encoded_steps(),
+                "references": tracker.get_references(),
+            },
+            default=str,
+        ).encode()
+        if len(payload) > self.max_bytes:
+            return None
+
+        run_id = uuid.uuid4().hex
+        if self.directory is not None:
+            self._write(run_id, payload)
+        with self._lock:
+            self._remember(run_id, algorithm_id, tracker, len(payload))
+        return run_id
+
+    def get(self, algorithm_id: str, run_id: str) -> StepTracker | None:
+        """Get the tracker for a run, or None if unknown or evicted."""
+        with self._lock:
+            entry = self._runs.get(run_id)
+            if entry is not None:
+                if entry[0] != algorithm_id:
+                    return None
+                self._runs.move_to_end(run_id)
+                return entry[1]
+
+        loaded = self._read(run_id)
+        if loaded is None or loaded[0] != algorithm_id:
+            return None
+        with self._lock:
+            self._remember(run_id, *loaded)
+        return loaded[1]
+
+    def has(self, algorithm_id: str, run_id: str) -> bool:
+        """Whether a run can still be loaded, without loading it."""
+        with self._lock:
+            entry = self._runs.get(run_id)
+            if entry is not None:
+                return entry[0] == algorithm_id
+        # Telling a stored run's algorithm would mean reading it; callers check
+        # run ids they saved themselves
+        return self.directory is not None and run_id.isalnum() and self._path(run_id).exists()
+
+    def _remember(self, run_id: str, algorithm_id: str, tracker: StepTracker, size: int):
+        """Add a run to the in-memory LRU and evict down to the budgets."""
+        if run_id in self._runs:
+            return
+        self._runs[run_id] = (algorithm_id, tracker, size)
+        self._bytes += size
+        while len(self._runs) > self.max_runs or self._bytes > self.max_bytes:
+            _, (_, _, evicted) = self._runs.popitem(last=False)
+            self._bytes -= evicted
+
+    def _path(self, run_id: str) -> Path:
+        return self.directory / f"{run_id}.json.gz"
+
+    def _write(self, run_id: str, payload: bytes):
+        """Write a run for other workers, then prune the directory to the budget."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.compress(payload, compresslevel=1))
+        os.replace(tmp, self._path(run_id))
+        self._prune()
+
+    def _prune(self):
+        """Delete the oldest stored runs beyond max_runs / max_bytes (compressed)."""
+        files = []
+        for path in self.directory.glob("*.json.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pruned by another worker
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort(reverse=True)
+
+        total = 0
+        for kept, (_, size, path) in enumerate(files):
+            total += size
+            if kept >= self.max_runs or total > self.max_bytes:
+                path.unlink(missing_ok=True)
+
+    def _read(self, run_id: str) -> tuple[str, StepTracker, int] | None:
+        """Load a run another worker stored, or None if there is none."""
+        if self.directory is None or not run_id.isalnum():
+            return None
+        try:
+            payload = gzip.decompress(self._path(run_id).read_bytes())
+        except OSError:  # missing (evicted or never stored) or unreadable
+            return None
+        run = json.loads(payload)
+        tracker = StepTracker.from_records(run["records"], run["references"])
+        return run["algorithm_id"], tracker, len(payload)
+
+
+def _default_directory() -> str | None:
+    """Runs directory shared by the workers on this host ("" disables it)."""
+    return os.environ.get("DSA_RUN_DIR", os.path.join(tempfile.gettempdir(), "dsa-runs")) or None
+
+
+# Global run store instance
+runs = RunStore(
+    max_runs=int(os.environ.get("DSA_MAX_STORED_RUNS", "32")),
+    max_bytes=int(os.environ.get("DSA_RUN_STORE_BYTES", str(64 * 1024 * 1024))),
+    directory=_default_directory(),
+)
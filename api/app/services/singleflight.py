@@ -0,0 +1,76 @@
+"""Single-flight de-duplication of identical concurrent computations."""
+
+from collections.abc import Callable
+from threading import Event, Lock
+from typing import Any
+
+
+class _Call:
+    """A computation in flight, awaited by every caller with the same key."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run each keyed computation once, however many callers ask at the same time.
+
+    The first caller for a key runs the function; callers that arrive while it
+    is running wait for it and get the same result (or exception). Once it
+    finishes the key is forgotten, so later callers run it again (or, in the
+    execute route, find its result in the cache).
+    """
+
+    def __init__(self):
+        self._calls: dict[str, _Call] = {}
+        self._lock = Lock()
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """Run fn, or wait for the identical call already running.
+
+        Args:
+            key: Identity of the computation (e.g. a cache_key)
+            fn: The computation
+
+        Returns:
+            fn's result, and whether this caller ran it (False if it waited
+            for another caller's run)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, False
+
+        try:
+            call.result = fn()
+            return call.result, True
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of computations currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+# Global single-flight group for /execute
+flights = SingleFlight()
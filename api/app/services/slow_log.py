@@ -0,0 +1,162 @@
+"""Structured log of slow executions, for finding the input shapes that blow up.
+
+Every /execute run slower than a threshold is logged as one JSON line with
+the algorithm, the input's size features and hash (plus the input itself
+when it is small, so the run can be replayed offline), its step count,
+phase timings and peak memory.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import sys
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# Inputs up to this size (JSON-encoded) are logged whole, so the run can be replayed
+MAX_LOGGED_INPUT_BYTES = 4096
+
+
+def _features(value: Any) -> dict[str, int | float]:
+    """Size features of one value: its length, a grid's dims, a graph's node/edge counts."""
+    if isinstance(value, bool) or value is None:
+        return {}
+    if isinstance(value, int | float):
+        return {"value": value}
+    if isinstance(value, str):
+        return {"length": len(value)}
+    if isinstance(value, list):
+        if value and all(isinstance(row, list) for row in value):
+            return {"rows": len(value), "cols": max(map(len, value))}
+        return {"length": len(value)}
+    if isinstance(value, dict):
+        if value and all(isinstance(adjacent, list) for adjacent in value.values()):
+            return {"nodes": len(value), "edges": sum(map(len, value.values()))}
+        return {"keys": len(value)}
+    return {}
+
+
+def input_features(input_data: Any) -> dict[str, int | float]:
+    """Size features of an input, by field for object inputs (e.g. "graph.edges").
+
+    A field's number (e.g. fibonacci's "n", knapsack's "capacity") is its own feature.
+    """
+    if not isinstance(input_data, dict):
+        return _features(input_data)
+    return {
+        key if feature == "value" else f"{key}.{feature}": size
+        for key, value in input_data.items()
+        for feature, size in _features(value).items()
+    }
+
+
+def input_hash(input_data: Any) -> str:
+    """Hash of the canonical JSON of an input (sorted keys, no whitespace)."""
+    canonical = json.dumps(input_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SlowLog:
+    """JSON-lines log of executions slower than a threshold.
+
+    The request thread only compares its timing with the threshold and, if
+    it is over, queues the raw values; a background thread extracts the
+    features, hashes the input and writes the record, so logging never
+    holds up a response.
+
+    Args:
+        threshold_seconds: Runs taking at least this long are logged (None: none are)
+        path: File to append records to (None for stderr)
+    """
+
+    def __init__(self, threshold_seconds: float | None = 1.0, path: str | Path | None = None):
+        self.threshold_seconds = threshold_seconds
+        self.path = Path(path) if path else None
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        algorithm_id: str,
+        input_data: Any,
+        seconds: dict[str, float],
+        steps: int,
+        peak_memory: int,
+        **options: Any,
+    ) -> bool:
+        """Queue a record of a run if it was slow.
+
+        Args:
+            algorithm_id: ID of the algorithm that ran
+            input_data: Its input (not modified afterwards)
+            seconds: Phase timings; "total" is compared with the threshold
+            steps: Steps emitted
+            peak_memory: The run's peak memory in bytes
+            **options: The request's options (mode, encoding, ...)
+
+        Returns:
+            Whether the run was slow enough to log
+        """
+        if not self.threshold_seconds or seconds["total"] < self.threshold_seconds:
+            return False
+        if self._writer is None:
+            self._start()
+        self._queue.put(
+            (datetime.now(UTC), algorithm_id, input_data, seconds, steps, peak_memory, options)
+        )
+        return True
+
+    def flush(self):
+        """Wait until every queued record has been written."""
+        self._queue.join()
+
+    def _start(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_records, daemon=True)
+                self._writer.start()
+
+    def _write_records(self):
+        """Background thread: encode and append queued records."""
+        while True:
+            logged_at, algorithm_id, input_data, seconds, steps, peak_memory, options = (
+                self._queue.get()
+            )
+            try:
+                encoded_input = json.dumps(input_data, default=str)
+                record = {
+                    "time": logged_at.isoformat(),
+                    "algorithm_id": algorithm_id,
+                    "input_hash": input_hash(input_data),
+                    "input_features": input_features(input_data),
+                    "input_bytes": len(encoded_input),
+                    "steps": steps,
+                    "seconds": seconds,
+                    "peak_memory_bytes": peak_memory,
+                    "options": {k: v for k, v in options.items() if v is not None},
+                }
+                if len(encoded_input) <= MAX_LOGGED_INPUT_BYTES:
+                    record["input"] = input_data
+                line = json.dumps(record, default=str) + "\n"
+                if self.path is None:
+                    sys.stderr.write(line)
+                    sys.stderr.flush()
+                else:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    with self.path.open("a") as log:
+                        log.write(line)
+            except Exception as e:  # a bad record or an unwritable log must not stop the writer
+                print(f"Could not write slow-execution record: {e}", file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+
+# Global slow-execution log (DSA_SLOW_SECONDS, default 1; 0 disables it)
+slow_log = SlowLog(
+    threshold_seconds=float(os.environ.get("DSA_SLOW_SECONDS", "1")) or None,
+    path=os.environ.get("DSA_SLOW_LOG") or None,
+)
@@ -0,0 +1,236 @@
+"""Inputs of any size for every registered algorithm, for benchmark sweeps.
+
+SWEEPS gives each algorithm a builder for an input of size ``n``: n values
+for array algorithms, n nodes for graphs and trees, about n cells for
+grids, strings of length n, or n itself for numeric inputs (fibonacci's
+"n", coin change's "amount"). Inputs whose values' order matters (sorts,
+array scans, BST insertion) can be built from each of DISTRIBUTIONS;
+others are built from random values only. Searches look for a target
+larger than every value, so they take their worst case.
+
+Inputs are built as Python objects (graph keys stay ints) and are
+deterministic: the same algorithm, size, distribution and seed always
+give the same input.
+"""
+
+import random
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique")
+
+
+def values(n: int, distribution: str, rng: random.Random, low: int = 0, high: int | None = None):
+    """n values from [low, high] (default [0, 4n]) in the given distribution.
+
+    "few_unique" draws from four values only; "sorted" and "reversed" are
+    the random values in ascending and descending order.
+    """
+    high = 4 * n if high is None else high
+    if distribution == "few_unique":
+        choices = [low + (high - low) * i // 3 for i in range(4)]
+        return [rng.choice(choices) for _ in range(n)]
+    drawn = [rng.randint(low, high) for _ in range(n)]
+    if distribution == "sorted":
+        drawn.sort()
+    elif distribution == "reversed":
+        drawn.sort(reverse=True)
+    elif distribution != "random":
+        raise ValueError(f"Unknown distribution: {distribution}")
+    return drawn
+
+
+def _side(n: int) -> int:
+    """Side of the square grid with about n cells."""
+    return max(1, round(n**0.5))
+
+
+def _word(n: int, rng: random.Random, alphabet: str = "ab") -> str:
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def _graph(n: int, rng: random.Random, weighted: bool = False, undirected: bool = False):
+    """Random graph on n nodes with up to 3 edges out of each."""
+    graph: dict[int, list] = {node: [] for node in range(n)}
+    for node in range(n):
+        for neighbor in rng.sample(range(n), min(n, 3)):
+            if neighbor == node:
+                continue
+            weight = rng.randint(1, 9)
+            graph[node].append([neighbor, weight] if weighted else neighbor)
+            if undirected:
+                graph[neighbor].append([node, weight] if weighted else node)
+    return graph
+
+
+def _dag(n: int) -> dict[int, list[int]]:
+    """Layered DAG on n nodes: every node points at the next two."""
+    return {node: list(range(node + 1, min(n, node + 3))) for node in range(n)}
+
+
+def _bst(sorted_values: list[int]) -> list[int]:
+    """Level-order list of the complete BST holding sorted_values."""
+    tree = [0] * len(sorted_values)
+    remaining = iter(sorted_values)
+
+    def fill(index: int):  # in-order over the heap-shaped positions
+        if index < len(tree):
+            fill(2 * index + 1)
+            tree[index] = next(remaining)
+            fill(2 * index + 2)
+
+    fill(0)
+    return tree
+
+
+def _tree(n: int, rng: random.Random) -> list[int]:
+    """Complete binary tree of n nodes, level order."""
+    return _bst(sorted(rng.sample(range(4 * n + 1), n)))
+
+
+class Sweep(NamedTuple):
+    """How to build an algorithm's inputs."""
+
+    # (n, distribution, rng) -> input of size n
+    build: Callable[[int, str, random.Random], Any]
+    # Distributions the input can be built from
+    distributions: tuple[str, ...] = ("random",)
+    # Largest n the algorithm can run at (e.g. bounded by recursion depth)
+    max_size: int | None = None
+
+
+def _array(low: int = 0, high: int | None = None) -> Sweep:
+    """Sweep of a plain array input."""
+    return Sweep(lambda n, d, rng: values(n, d, rng, low, high), DISTRIBUTIONS)
+
+
+def _absent(n: int) -> int:
+    """A search target larger than any of values(n, ...)."""
+    return 4 * n + 1
+
+
+def _search(sort: bool = True) -> Sweep:
+    """Sweep of {"array": ..., "target": absent} (sorted for the binary searches)."""
+
+    def build(n: int, distribution: str, rng: random.Random):
+        array = values(n, distribution, rng)
+        return {"array": sorted(array) if sort else array, "target": _absent(n)}
+
+    return Sweep(build, ("random", "few_unique") if sort else DISTRIBUTIONS)
+
+
+def _rotated(n: int, distribution: str, rng: random.Random):
+    array = sorted(set(values(n, distribution, rng)))
+    pivot = len(array) // 3
+    return {"array": array[pivot:] + array[:pivot], "target": _absent(n)}
+
+
+def _lca(n: int, distribution: str, rng: random.Random):
+    tree = _tree(n, rng)
+    return {"values": tree, "p": tree[-1], "q": tree[len(tree) // 2]}
+
+
+def _astar(n: int, distribution: str, rng: random.Random):
+    side = _side(n)
+    grid = [[int(rng.random() < 0.2) for _ in range(side)] for _ in range(side)]
+    # Keep the top row and right column open, so the goal is always reachable
+    for i in range(side):
+        grid[0][i] = grid[i][-1] = 0
+    return {"grid": grid, "start": [0, 0], "goal": [side - 1, side - 1]}
+
+
+SWEEPS: dict[str, Sweep] = {
+    # Sorting
+    "bubble_sort": _array(),
+    "selection_sort": _array(),
+    "insertion_sort": _array(),
+    "merge_sort": _array(),
+    "quick_sort": _array(),
+    "heap_sort": _array(),
+    "counting_sort": _array(),
+    "radix_sort": _array(),
+    # Searching
+    "binary_search": _search(),
+    "exponential_search": _search(),
+    "ternary_search": _search(),
+    "linear_search": _search(sort=False),
+    "rotated_search": Sweep(_rotated, ("random",)),
+    "quickselect": Sweep(
+        lambda n, d, rng: {"array": values(n, d, rng), "k": max(1, n // 2)}, DISTRIBUTIONS
+    ),
+    # Graphs
+    "bfs": Sweep(lambda n, d, rng: {"graph": _graph(n, rng), "start": 0, "target": None}),
+    "dfs": Sweep(lambda n, d, rng: {"graph": _graph(n, rng), "start": 0, "target": None}),
+    "dijkstra": Sweep(
+        lambda n, d, rng: {"graph": _graph(n, rng, weighted=True), "start": 0, "target": None}
+    ),
+    "bellman_ford": Sweep(lambda n, d, rng: {"graph": _graph(n, rng, weighted=True)}),
+    "prim_mst": Sweep(lambda n, d, rng: {"graph": _graph(n, rng, weighted=True, undirected=True)}),
+    "connected_components": Sweep(lambda n, d, rng: {"graph": _graph(n, rng, undirected=True)}),
+    "topological_sort": Sweep(lambda n, d, rng: {"graph": _dag(n)}),
+    "course_schedule": Sweep(lambda n, d, rng: {"graph": _dag(n)}),
+    "num_islands": Sweep(
+        lambda n, d, rng: {
+            "grid": [[rng.choice("01") for _ in range(_side(n))] for _ in range(_side(n))]
+        }
+    ),
+    "astar_grid": Sweep(_astar),
+    # Dynamic programming
+    "fibonacci_memo": Sweep(lambda n, d, rng: {"n": n}, max_size=256),
+    "fibonacci_tab": Sweep(lambda n, d, rng: {"n": n}),
+    "climbing_stairs": Sweep(lambda n, d, rng: n),
+    "coin_change": Sweep(lambda n, d, rng: {"coins": [1, 2, 5], "amount": n}),
+    "coin_change_2": Sweep(lambda n, d, rng: {"coins": [1, 2, 5], "amount": n}),
+    "knapsack": Sweep(
+        lambda n, d, rng: {
+            "items": [[rng.randint(1, 10), rng.randint(1, 50)] for _ in range(n)],
+            "capacity": n,
+        }
+    ),
+    "lcs": Sweep(lambda n, d, rng: {"str1": _word(n, rng), "str2": _word(n, rng)}),
+    "edit_distance": Sweep(lambda n, d, rng: {"word1": _word(n, rng), "word2": _word(n, rng)}),
+    "longest_palindromic_subsequence": Sweep(lambda n, d, rng: {"s": _word(n, rng)}),
+    "word_break": Sweep(
+        lambda n, d, rng: {"s": _word(n, rng) + "c", "words": ["a", "b", "ab", "ba"]}
+    ),
+    "unique_paths": Sweep(  # the grid is capped at 20x20
+        lambda n, d, rng: {"rows": _side(n), "cols": _side(n)}, max_size=400
+    ),
+    "min_path_sum": Sweep(
+        lambda n, d, rng: {
+            "grid": [[rng.randint(1, 9) for _ in range(_side(n))] for _ in range(_side(n))]
+        }
+    ),
+    "house_robber": _array(),
+    "kadane": _array(-9, 9),
+    "max_product_subarray": _array(-3, 3),
+    "lis": _array(),
+    # Trees
+    "bst_insert": _array(),
+    "bst_search": Sweep(
+        lambda n, d, rng: {"values": values(n, d, rng), "target": _absent(n)}, DISTRIBUTIONS
+    ),
+    "tree_inorder": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "tree_preorder": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "tree_postorder": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "invert_binary_tree": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "validate_bst": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "tree_max_depth": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "level_order": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "tree_diameter": Sweep(lambda n, d, rng: _tree(n, rng)),
+    "tree_path_sum": Sweep(lambda n, d, rng: {"values": _tree(n, rng), "target": -1}),
+    "lca": Sweep(_lca),
+}
+
+
+def sized_input(algorithm_id: str, n: int, distribution: str = "random", seed: int = 0) -> Any:
+    """Build an algorithm's input of size n.
+
+    Raises:
+        KeyError: If the algorithm has no sweep
+        ValueError: If its input cannot be built from the distribution
+    """
+    sweep = SWEEPS[algorithm_id]
+    if distribution not in sweep.distributions:
+        raise ValueError(f"{algorithm_id} inputs are not built from {distribution} values")
+    return sweep.build(n, distribution, random.Random(f"{algorithm_id}:{n}:{distribution}:{seed}"))
@@ -0,0 +1,520 @@
+"""Pre-forked worker processes that run algorithms outside the web worker.
+
+A pathological input (a huge ``n`` for fibonacci_memo, a giant knapsack
+capacity) must not tie up the web worker or take the process down with it,
+so every run happens in a separate process under per-job limits:
+
+- CPU time: RLIMIT_CPU is set to the job's budget, so the kernel sends
+  SIGXCPU when the job has used it up.
+- Wall clock: an interval timer sends SIGALRM when the job has run too long.
+- Memory: RLIMIT_AS caps the worker's address space (Linux does not enforce
+  an RSS limit), so allocations beyond it raise MemoryError.
+
+Each of these surfaces as LimitExceeded in the caller, and the worker stays
+up for the next job. A job that does not get back to the interpreter (stuck
+in one C call) is killed by the parent once its wall-clock budget and a
+grace period have passed, and its process is replaced.
+"""
+
+import json
+import math
+import multiprocessing
+import os
+import queue
+import resource
+import signal
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, as_completed
+from typing import Any
+
+from app.services.frames import DEFAULT_FRAME_MS, DEFAULT_FRAME_STEPS, iter_frames
+
+# Time the parent allows beyond the wall-clock limit before killing a worker
+KILL_GRACE_SECONDS = 1.0
+
+
+class LimitExceeded(RuntimeError):
+    """A job went over its CPU-time, wall-clock or memory limit."""
+
+
+class WorkerDied(RuntimeError):
+    """The worker process running a job exited without answering."""
+
+
+def execute_job(
+    algorithm_id: str,
+    input_data: Any,
+    mode: str = "trace",
+    encoding: str = "full",
+    keyframe_interval: int | None = None,
+    max_steps: int | None = None,
+    level: int | None = None,
+    keep_run: bool = False,
+) -> dict[str, Any]:
+    """Run one algorithm (in a worker process) and return its response fields.
+
+    Args:
+        algorithm_id: ID of the algorithm to execute
+        input_data: Input data for the algorithm
+        mode: "trace" (steps) or "headless" (run summary only)
+        encoding, keyframe_interval, max_steps, level: As for the execute route
+        keep_run: Also return the run's delta-encoded records under "records",
+            so the caller can store it for seeks (see StepTracker.from_records)
+
+    Returns:
+        The run summary (headless), or the steps, their count and encoding,
+        the total step count and the references (trace); plus, under
+        "usage", the seconds spent running and encoding steps and the job's
+        peak memory in bytes (for metrics and the slow-execution log)
+    """
+    _reset_peak_memory()
+    start = time.perf_counter()
+    run = run_algorithm(algorithm_id, input_data, mode, encoding, keyframe_interval, max_steps)
+    ran = time.perf_counter()
+    response = encode_run(run, mode, encoding, level, keep_run)
+    response["usage"] = {
+        "execution": ran - start,
+        "serialization": time.perf_counter() - ran,
+        "peak_memory": _peak_memory(),
+    }
+    return response
+
+
+def _reset_peak_memory():
+    """Reset the process's peak RSS, so _peak_memory measures from here (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+def _peak_memory() -> int:
+    """Peak RSS in bytes since _reset_peak_memory (where unsupported, since the process started)."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_algorithm(
+    algorithm_id: str,
+    input_data: Any,
+    mode: str = "trace",
+    encoding: str = "full",
+    keyframe_interval: int | None = None,
+    max_steps: int | None = None,
+) -> Any:
+    """First half of execute_job: the run's instance (trace) or its summary (headless)."""
+    from app.services.registry import registry
+
+    if mode == "headless":
+        return registry.execute_headless(algorithm_id, input_data)
+    return registry.run_algorithm(
+        algorithm_id,
+        input_data,
+        encoding=encoding,
+        keyframe_interval=keyframe_interval,
+        max_steps=max_steps,
+    )
+
+
+def encode_run(
+    run: Any,
+    mode: str = "trace",
+    encoding: str = "full",
+    level: int | None = None,
+    keep_run: bool = False,
+) -> dict[str, Any]:
+    """Second half of execute_job: the response fields for a run_algorithm result."""
+    if mode == "headless":
+        return {"mode": mode, **run}
+
+    if level is not None:
+        # Outline steps are not consecutive, so they always carry full state
+        steps = [step.model_dump() for step in run.get_outline(level)]
+        encoding = "full"
+    else:
+        steps = run.get_encoded_steps()
+    response = {
+        "steps": steps,
+        "count": len(steps),
+        "total_steps": run.get_summary()["step_count"],
+        "coalesced": run.coalesced,
+        "encoding": encoding,
+        "references": run.get_references(),
+    }
+    if keep_run:
+        run.convert_to_delta()
+        response["records"] = run.get_encoded_steps()
+    return response
+
+
+def run_job(algorithm_id: str, input_data: Any, **options: Any) -> str:
+    """execute_job, JSON-encoded in the worker.
+
+    Only a string crosses the process boundary, so the parent never builds
+    the steps as Python objects (see WorkerPool.map_unordered).
+    """
+    response = execute_job(algorithm_id, input_data, **options)
+    del response["usage"]
+    return json.dumps(response, default=str)
+
+
+def stream_job(
+    algorithm_id: str,
+    input_data: Any,
+    encoding: str = "full",
+    keyframe_interval: int | None = None,
+    frame_steps: int = DEFAULT_FRAME_STEPS,
+    frame_ms: float = DEFAULT_FRAME_MS,
+) -> Iterator[tuple[str | None, str]]:
+    """Run one algorithm (in a worker process), yielding its stream's events.
+
+    Steps are not retained, so memory does not grow with the length of the
+    run. Run through WorkerPool.stream, which hands the events over one at
+    a time.
+
+    Yields:
+        (event type, JSON data) pairs: ("references", update) before a frame
+        that needs references added or grown since the previous one (see the
+        stream route), (None, frame) per frame of steps and finally
+        ("done", {"count": steps sent})
+    """
+    from algorithms.base.delta import DEFAULT_KEYFRAME_INTERVAL, DeltaEncoder
+
+    from app.services.registry import registry
+
+    instance, steps = registry.stream_steps(algorithm_id, input_data)
+    encoder = None
+    if encoding == "delta":
+        encoder = DeltaEncoder(keyframe_interval or DEFAULT_KEYFRAME_INTERVAL)
+    records = (
+        encoder.encode(step.model_dump()) if encoder else step.model_dump() for step in steps
+    )
+
+    sizes = {}
+    sent = 0
+    # One json.dumps per frame rather than per step
+    for frame in iter_frames(records, frame_steps, frame_ms):
+        update = {"set": {}, "extend": {}}
+        for name, value in instance.get_references().items():
+            if name not in sizes:
+                update["set"][name] = value
+            elif isinstance(value, list) and len(value) > sizes[name]:
+                update["extend"][name] = value[sizes[name] :]
+            else:
+                continue
+            sizes[name] = len(value) if isinstance(value, list) else 0
+        if update["set"] or update["extend"]:
+            yield "references", json.dumps(update, default=str)
+        sent += len(frame)
+        yield None, json.dumps(frame, default=str)
+    yield "done", json.dumps({"count": sent})
+
+
+def _raise_cpu_limit(signum, frame):
+    raise LimitExceeded("Execution exceeded the CPU time limit")
+
+
+def _raise_wall_limit(signum, frame):
+    raise LimitExceeded("Execution exceeded the time limit")
+
+
+def _send_items(connection, items: Iterator[Any]):
+    """Send a streaming job's items to the parent, one per request for more.
+
+    The wall-clock timer is paused and SIGXCPU held back while an item is
+    handed over, so a slow consumer does not count against the job and a
+    limit never interrupts a message halfway through the pipe.
+    """
+    try:
+        for item in items:
+            remaining, _ = signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGXCPU})
+            try:
+                connection.send((None, item))
+                wanted = connection.recv()
+            finally:
+                if remaining:
+                    signal.setitimer(signal.ITIMER_REAL, remaining)
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGXCPU})
+            if not wanted:
+                return
+    finally:
+        items.close()
+
+
+def _serve(
+    connection,
+    cpu_seconds: float | None,
+    wall_seconds: float | None,
+    memory_bytes: int | None,
+):
+    """Worker process main loop: run jobs from the pipe under the limits."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent shuts workers down
+    signal.signal(signal.SIGXCPU, _raise_cpu_limit)
+    signal.signal(signal.SIGALRM, _raise_wall_limit)
+    if memory_bytes:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, hard))
+    _, cpu_hard = resource.getrlimit(resource.RLIMIT_CPU)
+
+    while True:
+        try:
+            fn, args, kwargs, streaming = connection.recv()
+        except EOFError:  # the parent went away
+            return
+
+        try:
+            if cpu_seconds:
+                usage = resource.getrusage(resource.RUSAGE_SELF)
+                used = usage.ru_utime + usage.ru_stime
+                resource.setrlimit(resource.RLIMIT_CPU, (math.ceil(used + cpu_seconds), cpu_hard))
+            if wall_seconds:
+                signal.setitimer(signal.ITIMER_REAL, wall_seconds)
+            try:
+                result = fn(*args, **kwargs)
+                if streaming:
+                    result = _send_items(connection, result)
+                reply = (True, result)
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                if cpu_seconds:
+                    resource.setrlimit(resource.RLIMIT_CPU, (cpu_hard, cpu_hard))
+        except MemoryError:
+            reply = (False, LimitExceeded("Execution exceeded the memory limit"))
+        except Exception as e:
+            reply = (False, e)
+
+        try:
+            connection.send(reply)
+        except Exception as e:  # e.g. a result that does not pickle
+            connection.send((False, RuntimeError(f"Could not return the result: {e}")))
+
+
+class _Stream:
+    """Future stand-in for a streaming job: its items are handed over one by one.
+
+    The driver thread puts (None, item) replies for WorkerPool.stream and
+    waits for it to ask for the next item (True) or stop the job (False);
+    the job's outcome follows as (True, None) or (False, exception).
+    """
+
+    def __init__(self):
+        self.replies: queue.SimpleQueue = queue.SimpleQueue()
+        self.requests: queue.SimpleQueue = queue.SimpleQueue()
+        self.cancelled = False
+
+    def set_running_or_notify_cancel(self) -> bool:
+        return not self.cancelled
+
+    def set_result(self, value: Any):
+        self.replies.put((True, value))
+
+    def set_exception(self, exception: BaseException):
+        self.replies.put((False, exception))
+
+    def hand_over(self, item: Any) -> bool:
+        """Pass an item to the consumer; returns whether it wants another."""
+        self.replies.put((None, item))
+        return self.requests.get()
+
+    def cancel(self):
+        self.cancelled = True
+        self.requests.put(False)
+
+
+class WorkerPool:
+    """Pool of pre-forked worker processes running jobs under limits.
+
+    Every worker process is driven by a thread in this process that feeds it
+    one job at a time over a pipe, so a worker that has to be killed only
+    fails its own job. Workers are started with forkserver (spawn where it
+    is unavailable) rather than forked from the multi-threaded web process,
+    from a server that has already imported the registry.
+
+    Args:
+        max_workers: Number of worker processes (default: one per core)
+        cpu_seconds: CPU time per job (None for no limit)
+        wall_seconds: Wall-clock time per job (None for no limit)
+        memory_bytes: Address space per worker process (None for no limit)
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cpu_seconds: float | None = None,
+        wall_seconds: float | None = None,
+        memory_bytes: int | None = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.memory_bytes = memory_bytes
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the worker processes now rather than on the first job."""
+        with self._lock:
+            if self._threads:
+                return
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(["app.services.registry"])
+            else:
+                context = multiprocessing.get_context("spawn")
+            for _ in range(self.max_workers):
+                thread = threading.Thread(target=self._drive, args=(context,), daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _spawn(self, context):
+        """Start a worker process; returns it and the parent end of its pipe."""
+        parent, child = context.Pipe()
+        process = context.Process(
+            target=_serve,
+            args=(child, self.cpu_seconds, self.wall_seconds, self.memory_bytes),
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        return process, parent
+
+    def _drive(self, context):
+        """Feed jobs to one worker process, replacing it when it dies or hangs."""
+        process, connection = self._spawn(context)
+        deadline = self.wall_seconds + KILL_GRACE_SECONDS if self.wall_seconds else None
+        while True:
+            future, fn, args, kwargs = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if not process.is_alive():
+                connection.close()
+                process, connection = self._spawn(context)
+
+            try:
+                connection.send((fn, args, kwargs, isinstance(future, _Stream)))
+                ok, value = self._reply(process, connection, future, deadline)
+            except (EOFError, OSError):
+                process.join()
+                future.set_exception(
+                    WorkerDied(f"Worker process died (exit code {process.exitcode})")
+                )
+                continue
+            except Exception as e:  # arguments that do not pickle
+                future.set_exception(e)
+                continue
+
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    @staticmethod
+    def _reply(process, connection, future, deadline: float | None) -> tuple[bool, Any]:
+        """Wait for a job's outcome, handing a streaming job's items over on the way.
+
+        A worker that does not answer within the deadline is killed and the
+        job fails with LimitExceeded.
+        """
+        while True:
+            if not connection.poll(deadline):
+                process.kill()
+                process.join()
+                return False, LimitExceeded("Execution exceeded the time limit")
+            ok, value = connection.recv()
+            if ok is not None:
+                return ok, value
+            connection.send(future.hand_over(value))
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue fn(*args, **kwargs) for a worker process.
+
+        fn must be a module-level function, and its arguments and result
+        must pickle.
+        """
+        self.start()
+        future: Future = Future()
+        self._jobs.put((future, fn, args, kwargs))
+        return future
+
+    def stream(self, fn: Callable[..., Iterator[Any]], *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """Run generator function fn(*args, **kwargs) in a worker process, yielding its items.
+
+        The job is queued when the first item is requested. The worker
+        produces each item only once the previous one has been taken, under
+        the same limits as submit (minus the time spent waiting for the
+        consumer); closing the iterator stops the job. As for submit, fn
+        must be a module-level function, and its arguments and items must
+        pickle.
+
+        Raises:
+            The job's exception (LimitExceeded, WorkerDied, ...), in place of
+            the items that would have followed
+        """
+        self.start()
+        job = _Stream()
+        self._jobs.put((job, fn, args, kwargs))
+        finished = False
+        try:
+            while True:
+                ok, value = job.replies.get()
+                if ok is None:
+                    yield value
+                    job.requests.put(True)
+                    continue
+                finished = True
+                if not ok:
+                    raise value
+                return
+        finally:
+            if not finished:
+                job.cancel()
+
+    def map_unordered(
+        self, algorithm_id: str, inputs: dict[int, Any], **options: Any
+    ) -> Iterator[tuple[int, str | None, str | None]]:
+        """Run an algorithm on every input across the pool, in completion order.
+
+        Args:
+            algorithm_id: ID of the algorithm to execute
+            inputs: One input per job, by the index to report it under
+            **options: Passed to run_job (mode, encoding, ...)
+
+        Yields:
+            (index of the input, JSON result or None, error message or None)
+        """
+        futures: dict[Future, int] = {
+            self.submit(run_job, algorithm_id, input_data, **options): index
+            for index, input_data in inputs.items()
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], None, str(e) or type(e).__name__
+        finally:
+            # The client went away (or we are done): drop jobs not yet started
+            for future in futures:
+                future.cancel()
+
+
+# Global worker pool (DSA_WORKERS processes, default one per core); a limit of 0 disables it
+workers = WorkerPool(
+    int(os.environ.get("DSA_WORKERS", "0")) or None,
+    cpu_seconds=float(os.environ.get("DSA_JOB_CPU_SECONDS", "10")) or None,
+    wall_seconds=float(os.environ.get("DSA_JOB_WALL_SECONDS", "30")) or None,
+    memory_bytes=int(os.environ.get("DSA_JOB_MEMORY_BYTES", str(1024 * 1024 * 1024))) or None,
+)
@@ -0,0 +1,33 @@
+"""Shared pytest fixtures for API tests."""
+
+import os
+
+import pytest
+
+from app import create_app
+from app.services.examples import EXAMPLES
+
+# Keep runs and cached responses in memory and run everything live; the shared
+# runs directory, the on-disk cache and bundles have tests of their own
+os.environ.setdefault("DSA_RUN_DIR", "")
+os.environ.setdefault("DSA_DISK_CACHE", "")
+os.environ.setdefault("DSA_BUNDLE_DIR", "")
+# Batch tests need a couple of worker processes, not one per core
+os.environ.setdefault("DSA_WORKERS", "2")
+
+# A small valid input for every registered algorithm, keyed by algorithm id
+SAMPLE_INPUTS = {algorithm_id: examples[0] for algorithm_id, examples in EXAMPLES.items()}
+
+
+@pytest.fixture
+def app():
+    """Flask application configured for testing."""
+    app = create_app()
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Flask test client."""
+    return app.test_client()
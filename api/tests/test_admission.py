@@ -0,0 +1,165 @@
+"""Tests for admission control by estimated cost."""
+
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from app.routes import algorithms as routes
+from app.services.admission import AdmissionControl, OverBudget, QueueFull
+from app.services.registry import Estimate, registry
+
+
+class TestAdmit:
+    def test_small_run_is_admitted_as_is(self):
+        admitted = AdmissionControl().admit(Estimate(100, 500), max_steps=50)
+        assert admitted == (50, False, False)
+
+    def test_run_over_step_limit_is_rejected(self):
+        control = AdmissionControl(max_steps=1000)
+
+        with pytest.raises(OverBudget, match="1,001 steps"):
+            control.admit(Estimate(1001, 500))
+
+    def test_large_trace_is_downgraded_to_fit(self):
+        control = AdmissionControl(max_bytes=100_000)
+
+        admitted = control.admit(Estimate(10_000, 1000), max_steps=5000)
+
+        assert admitted.downgraded
+        assert admitted.max_steps == 100
+
+    def test_headless_run_is_not_downgraded(self):
+        control = AdmissionControl(max_bytes=100_000)
+        assert not control.admit(Estimate(10_000, 1000), mode="headless").downgraded
+
+    def test_heavy_run(self):
+        control = AdmissionControl(heavy_steps=1000)
+
+        assert control.admit(Estimate(1001, 500)).heavy
+        assert not control.admit(Estimate(1000, 500)).heavy
+
+    def test_run_without_estimate_is_admitted(self):
+        control = AdmissionControl(max_steps=1, max_bytes=1, heavy_steps=1)
+        assert control.admit(None, max_steps=10) == (10, False, False)
+
+    def test_zero_disables_a_budget(self):
+        control = AdmissionControl(max_steps=0, max_bytes=0, heavy_steps=0)
+        assert control.admit(Estimate(10**12, 10**6)) == (None, False, False)
+
+    def test_decisions_take_microseconds(self):
+        control = AdmissionControl()
+        input_data = list(range(1000))
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            control.admit(registry.estimate("merge_sort", input_data))
+        elapsed = (time.perf_counter() - start) / 1000
+
+        assert elapsed < 0.001
+
+
+class TestSlot:
+    def test_light_runs_do_not_queue(self):
+        control = AdmissionControl(heavy_slots=1, queue_seconds=0)
+        with control.slot(True), control.slot(False):
+            pass
+
+    def test_heavy_runs_queue_for_a_slot(self):
+        control = AdmissionControl(heavy_slots=1, queue_seconds=5)
+        release = threading.Event()
+
+        def hold():
+            with control.slot(True):
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        time.sleep(0.05)
+        threading.Timer(0.05, release.set).start()
+        with control.slot(True):  # waits for the holder
+            assert release.is_set()
+        holder.join()
+
+    def test_queue_timeout(self):
+        control = AdmissionControl(heavy_slots=1, queue_seconds=0.01)
+
+        with control.slot(True), pytest.raises(QueueFull), control.slot(True):
+            pass
+
+
+class TestRoutes:
+    def test_execute_rejects_over_budget(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "admission", AdmissionControl(max_steps=1000))
+
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute", json={"input": list(range(100))}
+        )
+
+        assert response.status_code == 422
+        assert "steps estimated" in response.get_json()["error"]
+
+    def test_execute_downgrades_large_trace(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "admission", AdmissionControl(max_bytes=20_000))
+
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute", json={"input": list(range(40, 0, -1))}
+        )
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert response.headers["X-Admission"] == "DOWNGRADED"
+        assert data["count"] <= 20_000 // registry.estimate("bubble_sort", [0] * 40).step_bytes
+        assert data["total_steps"] > data["count"]
+
+    def test_execute_answers_503_when_queue_is_full(self, client, monkeypatch):
+        control = AdmissionControl(heavy_steps=10, heavy_slots=1, queue_seconds=0.01)
+        monkeypatch.setattr(routes, "admission", control)
+
+        with control.slot(True):
+            response = client.post(
+                "/api/algorithms/bubble_sort/execute", json={"input": [5, 4, 3, 2, 1]}
+            )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"]
+
+    def test_execute_rejects_sorted_bst_insert(self, client, monkeypatch):
+        # Sorted values build a chain: about 4.5M steps rather than n log n
+        monkeypatch.setattr(routes, "admission", AdmissionControl(max_steps=1_000_000))
+        values = list(range(3000))
+
+        response = client.post("/api/algorithms/bst_insert/execute", json={"input": values})
+        assert response.status_code == 422
+
+        random.Random(0).shuffle(values)
+        response = client.post(
+            "/api/algorithms/bst_insert/execute?mode=headless", json={"input": values}
+        )
+        assert response.status_code == 200
+
+    def test_stream_rejects_over_budget(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "admission", AdmissionControl(max_steps=1000))
+
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/stream", json={"input": list(range(100))}
+        )
+
+        assert response.status_code == 422
+
+    def test_batch_rejects_only_inputs_over_budget(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "admission", AdmissionControl(max_steps=1000))
+
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/batch?mode=headless",
+            json={"inputs": [list(range(100)), [2, 1]]},
+        )
+
+        lines = {
+            line["index"]: line
+            for line in map(json.loads, response.get_data(as_text=True).splitlines())
+        }
+        assert "steps estimated" in lines[0]["error"]
+        assert lines[1]["result"]["result"] == [1, 2]
@@ -0,0 +1,162 @@
+"""Tests for the benchmark harness."""
+
+import json
+
+from app.services import benchmark
+from app.services.benchmark import compare, main, measure, run_benchmarks
+
+CASE = {"algorithm": "bubble_sort", "mode": "trace", "distribution": "random", "size": 64}
+RESULT = {
+    **CASE,
+    "seconds": 0.01,
+    "steps": 100,
+    "steps_per_second": 10_000,
+    "bytes": 20_000,
+    "bytes_per_step": 200,
+    "peak_memory_bytes": 100_000,
+}
+
+
+def test_measure():
+    result = measure("bubble_sort", [5, 2, 8, 1], repeat=1)
+
+    assert result["seconds"] > 0
+    assert result["steps"] > 0
+    assert result["steps_per_second"] == result["steps"] / result["seconds"]
+    assert result["bytes_per_step"] > 0
+    assert result["peak_memory_bytes"] > 0
+
+
+def test_measure_runs_on_a_copy():
+    # bubble_sort sorts in place; later repeats must not get the sorted array
+    input_data = [5, 4, 3, 2, 1]
+    first = measure("bubble_sort", [5, 4, 3, 2, 1], mode="headless", repeat=1)
+
+    repeated = measure("bubble_sort", input_data, mode="headless", repeat=3)
+
+    assert input_data == [5, 4, 3, 2, 1]
+    assert repeated["steps"] == first["steps"]
+
+
+def test_measure_headless():
+    result = measure("bubble_sort", [5, 2, 8, 1], mode="headless", repeat=1)
+
+    assert result["steps"] > 0
+    assert result["bytes_per_step"] is None
+
+
+class TestRunBenchmarks:
+    def test_sweeps_sizes_modes_and_distributions(self):
+        results = run_benchmarks(
+            ["bubble_sort"], sizes=[16, 8], distributions=["random", "sorted"], repeat=1
+        )
+
+        cases = [tuple(result[field] for field in benchmark.KEY) for result in results]
+        assert cases == [
+            ("bubble_sort", mode, distribution, size)
+            for distribution in ("random", "sorted")
+            for mode in ("trace", "headless")
+            for size in (8, 16)
+        ]
+        assert all("error" not in result for result in results)
+
+    def test_skips_unsupported_distributions(self):
+        results = run_benchmarks(["bfs"], sizes=[8], modes=["headless"], repeat=1)
+        assert [result["distribution"] for result in results] == ["random"]
+
+    def test_step_budget_stops_the_sweep(self):
+        # bubble_sort is estimated at about n²/2 steps
+        results = run_benchmarks(
+            ["bubble_sort"],
+            sizes=[8, 16, 256],
+            modes=["headless"],
+            distributions=["random"],
+            repeat=1,
+            step_budget=1000,
+        )
+        assert [result["size"] for result in results] == [8, 16]
+
+    def test_max_size_stops_the_sweep(self):
+        results = run_benchmarks(["fibonacci_memo"], sizes=[8, 512], modes=["headless"], repeat=1)
+        assert [result["size"] for result in results] == [8]
+
+    def test_errors_are_recorded_and_stop_the_sweep(self, monkeypatch):
+        def fail(*args):
+            raise RecursionError("maximum recursion depth exceeded")
+
+        monkeypatch.setattr(benchmark, "measure", fail)
+        reported = []
+
+        results = run_benchmarks(
+            ["bubble_sort"],
+            sizes=[8, 16],
+            modes=["trace"],
+            distributions=["random"],
+            progress=reported.append,
+        )
+
+        assert results == [
+            {**CASE, "size": 8, "error": "RecursionError: maximum recursion depth exceeded"}
+        ]
+        assert reported == results
+
+
+class TestCompare:
+    def test_unchanged(self):
+        assert compare([RESULT], [RESULT]) == []
+
+    def test_within_threshold(self):
+        assert compare([RESULT], [{**RESULT, "seconds": 0.012}], threshold=0.25) == []
+
+    def test_slower_and_bigger(self):
+        current = {**RESULT, "seconds": 0.02, "bytes_per_step": 300}
+
+        regressions = compare([RESULT], [current])
+
+        assert regressions == [
+            {**CASE, "metric": "seconds", "baseline": 0.01, "current": 0.02},
+            {**CASE, "metric": "bytes_per_step", "baseline": 200, "current": 300},
+        ]
+
+    def test_tiny_timings_are_not_compared(self):
+        baseline = {**RESULT, "seconds": 0.0001}
+        assert compare([baseline], [{**baseline, "seconds": 0.0004}]) == []
+
+    def test_new_errors(self):
+        failed = {**CASE, "error": "RecursionError: boom"}
+
+        assert compare([RESULT], [failed]) == [
+            {**CASE, "metric": "error", "baseline": None, "current": "RecursionError: boom"}
+        ]
+        assert compare([failed], [failed]) == []
+        assert compare([failed], [RESULT]) == []
+
+    def test_unmatched_cases_are_skipped(self):
+        assert compare([RESULT], [{**RESULT, "size": 128, "seconds": 1.0}]) == []
+
+
+class TestMain:
+    ARGS = ["--algorithms", "bubble_sort", "--sizes", "8", "--modes", "headless"]
+    ARGS += ["--distributions", "random", "--repeat", "1"]
+
+    def test_output(self, tmp_path):
+        output = tmp_path / "baseline.json"
+
+        assert main([*self.ARGS, "--output", str(output)]) == 0
+
+        report = json.loads(output.read_text())
+        assert report["python"] and report["machine"] and report["created"]
+        assert [result["algorithm"] for result in report["results"]] == ["bubble_sort"]
+
+    def test_compare(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        main([*self.ARGS, "--output", str(baseline)])
+        report = json.loads(baseline.read_text())
+
+        assert main([*self.ARGS, "--compare", str(baseline), "--threshold", "1000"]) == 0
+
+        report["results"][0]["steps"] = 1
+        baseline.write_text(json.dumps(report))
+
+        assert main([*self.ARGS, "--compare", str(baseline)]) == 1
+        assert "REGRESSION bubble_sort headless random n=8 steps" in capsys.readouterr().out
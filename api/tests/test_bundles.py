@@ -0,0 +1,90 @@
+"""Tests for precomputed example bundles."""
+
+import gzip
+import json
+
+import pytest
+
+from app.routes import algorithms as routes
+from app.services.bundles import BundleStore, build_bundles
+from app.services.examples import EXAMPLES
+
+
+@pytest.fixture(scope="module")
+def bundle_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("bundles")
+    assert build_bundles(directory) == sum(len(examples) for examples in EXAMPLES.values())
+    return directory
+
+
+@pytest.fixture
+def served(bundle_dir, monkeypatch):
+    monkeypatch.setattr(routes, "bundles", BundleStore(bundle_dir))
+
+
+def _example(algorithm_id):
+    return json.loads(json.dumps(EXAMPLES[algorithm_id][0]))
+
+
+@pytest.mark.usefixtures("served")
+def test_example_input_served_from_bundle(client):
+    live = client.post(
+        "/api/algorithms/dfs/execute?max_steps=10000", json={"input": _example("dfs")}
+    )
+    response = client.post("/api/algorithms/dfs/execute", json={"input": _example("dfs")})
+
+    assert response.headers["X-Cache"] == "BUNDLE"
+    assert response.headers["ETag"]
+    assert response.get_json() == {**live.get_json(), "run_id": None}
+
+
+@pytest.mark.usefixtures("served")
+def test_gzip_bundle_sent_as_stored(client, bundle_dir):
+    response = client.post(
+        "/api/algorithms/merge_sort/execute",
+        json={"input": _example("merge_sort")},
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.get_data()))["steps"]
+
+
+@pytest.mark.usefixtures("served")
+def test_custom_input_runs_live(client):
+    response = client.post("/api/algorithms/merge_sort/execute", json={"input": [7, 3, 9]})
+    assert response.headers["X-Cache"] == "MISS"
+
+    response = client.post(
+        "/api/algorithms/merge_sort/execute?encoding=delta", json={"input": _example("merge_sort")}
+    )
+    assert response.headers["X-Cache"] != "BUNDLE"
+
+
+@pytest.mark.usefixtures("served")
+def test_example_route_revalidates(client):
+    first = client.get("/api/algorithms/bfs/examples/0")
+    again = client.get(
+        "/api/algorithms/bfs/examples/0", headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "BUNDLE"
+    assert again.status_code == 304
+
+
+def test_example_route_falls_back_to_live_run(client):
+    response = client.get("/api/algorithms/bfs/examples/0")
+
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] in ("MISS", "HIT")
+    assert client.get("/api/algorithms/bfs/examples/5").status_code == 404
+    assert client.get("/api/algorithms/nope/examples/0").status_code == 404
+
+
+def test_stale_bundles_never_match(bundle_dir, client, monkeypatch):
+    monkeypatch.setattr(routes, "bundles", BundleStore(bundle_dir))
+    monkeypatch.setitem(routes.registry._source_hashes, "dfs", "edited")
+
+    response = client.post("/api/algorithms/dfs/execute", json={"input": _example("dfs")})
+    assert response.headers["X-Cache"] != "BUNDLE"
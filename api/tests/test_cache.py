@@ -0,0 +1,57 @@
+"""Tests for the result cache."""
+
+from app.services.cache import ResultCache, cache_key
+
+
+def test_key_ignores_json_formatting():
+    assert cache_key("bfs", "abc", {"start": 0, "graph": {}}) == cache_key(
+        "bfs", "abc", {"graph": {}, "start": 0}
+    )
+
+
+def test_key_covers_source_input_and_options():
+    key = cache_key("bubble_sort", "abc", [3, 1, 2], encoding="full")
+
+    assert key != cache_key("bubble_sort", "abd", [3, 1, 2], encoding="full")
+    assert key != cache_key("bubble_sort", "abc", [3, 2, 1], encoding="full")
+    assert key != cache_key("bubble_sort", "abc", [3, 1, 2], encoding="delta")
+    assert key != cache_key("merge_sort", "abc", [3, 1, 2], encoding="full")
+    assert key == cache_key("bubble_sort", "abc", [3, 1, 2], encoding="full", level=None)
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = ResultCache(max_bytes=30)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 10, "run")
+    cache.get("a")  # touch, so "b" is now the oldest
+    cache.put("c", b"x" * 15)
+
+    assert cache.get("a") == (b"x" * 10, None)
+    assert cache.get("b") is None
+    assert cache.stats()["bytes"] == 25
+    assert cache.stats()["evictions"] == 1
+
+
+def test_oversized_body_not_stored():
+    cache = ResultCache(max_bytes=4)
+    cache.put("a", b"too large")
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_stats_count_hits_and_misses():
+    cache = ResultCache()
+    cache.get("a")
+    cache.put("a", b"{}")
+    cache.get("a")
+    cache.discard("a")
+
+    assert cache.stats() | {"max_bytes": 0} == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 0,
+        "bytes": 0,
+        "max_bytes": 0,
+    }
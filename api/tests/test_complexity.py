@@ -0,0 +1,174 @@
+"""Tests for fitting measured growth against documented complexity."""
+
+import json
+import math
+
+import pytest
+
+from app.services.complexity import (
+    LOG,
+    SQRT,
+    Growth,
+    N,
+    check,
+    documented_complexity,
+    expected_growth,
+    fit,
+    main,
+    parse_growth,
+)
+from app.services.registry import registry
+
+SIZES = [64, 256, 1024, 4096]
+
+
+def _results(algorithm_id: str, steps, seconds=None, mode: str = "headless") -> list[dict]:
+    """Benchmark results with the given step counts and times (functions of n)."""
+    return [
+        {
+            "algorithm": algorithm_id,
+            "mode": mode,
+            "distribution": "random",
+            "size": n,
+            "steps": steps(n),
+            "seconds": (seconds or steps)(n) / 1e6,
+        }
+        for n in SIZES
+    ]
+
+
+class TestParseGrowth:
+    @pytest.mark.parametrize(
+        "expression, growth",
+        [
+            ("1", Growth()),
+            ("n", N),
+            ("log n", LOG),
+            ("log_3 n", LOG),
+            ("n log n", Growth(1, 1)),
+            ("n²", Growth(2)),
+            ("n^2 * k", Growth(2)),
+            ("V + E", N),
+            ("(V + E) log V", Growth(1, 1)),
+            ("V * E", Growth(2)),
+            ("d * (n + k)", Growth(1, 1)),
+            ("amount * len(coins)", N),
+            ("rows * cols", N),
+            ("2^n", Growth(exponential=True)),
+        ],
+    )
+    def test_expressions(self, expression, growth):
+        assert parse_growth(expression) == growth
+
+    def test_variables(self):
+        assert parse_growth("m × n", {"m": SQRT, "n": SQRT}) == N
+
+    @pytest.mark.parametrize("expression", ["n +", "(n", "x * n", "n)"])
+    def test_invalid(self, expression):
+        with pytest.raises(ValueError):
+            parse_growth(expression)
+
+    def test_labels(self):
+        assert [g.label for g in (Growth(), LOG, Growth(1, 1), Growth(2), SQRT)] == [
+            "1",
+            "log n",
+            "n log n",
+            "n^2",
+            "n^0.5",
+        ]
+
+
+class TestDocumentedComplexity:
+    @pytest.mark.parametrize(
+        "algorithm_id, bound",
+        [
+            ("bubble_sort", "n²"),  # the Average line
+            ("quick_sort", "n log n"),
+            ("fibonacci_memo", "n"),  # the line naming the entry
+            ("dijkstra", "(V + E) log V"),  # a single bound
+            ("bst_search", "log n"),
+        ],
+    )
+    def test_bound(self, algorithm_id, bound):
+        assert documented_complexity(algorithm_id) == bound
+
+    @pytest.mark.parametrize("algorithm", registry.list_algorithms(), ids=lambda a: a["id"])
+    def test_every_algorithm_documents_a_growth(self, algorithm):
+        assert isinstance(expected_growth(algorithm["id"]), Growth)
+
+    def test_grid_dimensions(self):
+        assert expected_growth("num_islands") == N
+        assert expected_growth("edit_distance") == Growth(2)
+
+
+class TestFit:
+    def test_matching_growth(self):
+        result = fit(SIZES, [n * n for n in SIZES], Growth(2), tolerance=0.05)
+
+        assert result["slope"] == pytest.approx(2)
+        assert result["expected_slope"] == pytest.approx(2)
+        assert result["growth"] == "n^2"
+        assert result["deviation"] is None
+
+    def test_faster_than_documented(self):
+        result = fit(SIZES, [n**3 for n in SIZES], Growth(2), tolerance=0.3)
+
+        assert result["growth"] == "n^3"
+        assert result["deviation"] == "above"
+
+    def test_slower_than_documented(self):
+        assert fit(SIZES, [10 * n for n in SIZES], Growth(1, 1), 0.05)["deviation"] == "below"
+
+    def test_log_factors_are_told_apart(self):
+        result = fit(SIZES, [n * math.log2(n) for n in SIZES], N, tolerance=0.05)
+
+        assert result["growth"] == "n log n"
+        assert result["deviation"] == "above"
+
+
+class TestCheck:
+    def test_reports_deviations_per_metric(self):
+        results = _results("bubble_sort", lambda n: n * n // 2) + _results(
+            "bubble_sort", lambda n: n * n // 2, seconds=lambda n: n**3, mode="trace"
+        )
+
+        [report] = check(results)
+
+        assert report["documented"] == "O(n²)"
+        assert report["expected"] == "n^2"
+        assert report["fits"]["steps"]["sizes"] == SIZES[-3:]
+        assert report["fits"]["steps"]["deviation"] is None
+        assert report["fits"]["headless_seconds"]["deviation"] is None
+        assert report["fits"]["trace_seconds"]["deviation"] == "above"
+
+    def test_skips_errors_and_other_distributions(self):
+        results = _results("linear_search", lambda n: n + 2)
+        results[-1] = {**results[-1], "error": "RecursionError: boom"}
+        results.append({**results[0], "distribution": "sorted", "size": 16384})
+
+        [report] = check(results)
+
+        assert report["fits"]["steps"]["sizes"] == SIZES[:3]
+
+
+def test_main(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    results = _results("linear_search", lambda n: n + 2)
+    baseline.write_text(json.dumps({"results": results}))
+
+    assert main(["--results", str(baseline), "--output", str(tmp_path / "report.json")]) == 0
+    assert "0 algorithms grow faster than documented" in capsys.readouterr().out
+    [report] = json.loads((tmp_path / "report.json").read_text())
+    assert report["algorithm"] == "linear_search"
+
+    baseline.write_text(json.dumps({"results": _results("linear_search", lambda n: n * n)}))
+
+    assert main(["--results", str(baseline)]) == 1
+    assert "1 algorithms grow faster than documented: linear_search" in capsys.readouterr().out
+
+
+def test_main_runs_the_sweeps(capsys):
+    args = ["--algorithms", "linear_search", "--sizes", "64,256,1024", "--modes", "headless"]
+
+    main([*args, "--repeat", "1"])  # timings of tiny inputs are too noisy to assert on
+    assert "linear_search O(n) ~ n: steps n" in capsys.readouterr().out
@@ -0,0 +1,78 @@
+"""Tests for the on-disk response cache."""
+
+import gzip
+
+from app.routes import algorithms as routes
+from app.services.cache import ResultCache
+from app.services.disk_cache import DiskCache
+
+
+def _read(entry):
+    return b"".join(entry.chunks())
+
+
+def test_round_trip(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    cache.put("key", b'{"steps": []}' * 100, "run")
+
+    entry = cache.open("key")
+    assert entry.run_id == "run"
+    assert entry.size == 1300 and entry.stored_size < entry.size
+    assert _read(entry) == b'{"steps": []}' * 100
+    assert cache.open("other") is None
+
+
+def test_gzip_chunks_are_stored_bytes(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    body = bytes(range(256)) * 1000  # larger than one chunk
+    cache.put("key", body)
+
+    assert gzip.decompress(b"".join(cache.open("key").gzip_chunks())) == body
+
+
+def test_shared_between_instances(tmp_path):
+    DiskCache(tmp_path / "cache.sqlite3").put("key", b"{}")
+    other_worker = DiskCache(tmp_path / "cache.sqlite3")
+
+    assert _read(other_worker.open("key")) == b"{}"
+
+
+def test_open_entry_survives_eviction(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    cache.put("key", b"[1, 2, 3]")
+    entry = cache.open("key")
+
+    DiskCache(tmp_path / "cache.sqlite3").discard("key")
+
+    assert _read(entry) == b"[1, 2, 3]"
+    assert cache.open("key") is None
+
+
+def test_pruned_least_recently_read_first(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    cache.put("a", b"a" * 100)
+    size = cache.stats()["bytes"]
+
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=2 * size)
+    cache.put("b", b"b" * 100)
+    cache.open("a").close()  # read, so "b" is now the oldest
+    cache.put("c", b"c" * 100)
+
+    assert cache.open("b") is None
+    assert _read(cache.open("a")) == b"a" * 100
+    assert cache.stats()["entries"] == 2
+
+
+def test_route_serves_from_disk(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(routes, "disk_results", DiskCache(tmp_path / "cache.sqlite3"))
+    url = "/api/algorithms/insertion_sort/execute?mode=headless"
+    first = client.post(url, json={"input": [4, 1, 3]})
+    monkeypatch.setattr(routes, "results", ResultCache())  # another worker's memory
+
+    plain = client.post(url, json={"input": [4, 1, 3]})
+    gzipped = client.post(url, json={"input": [4, 1, 3]}, headers={"Accept-Encoding": "gzip"})
+
+    assert plain.headers["X-Cache"] == gzipped.headers["X-Cache"] == "DISK"
+    assert plain.get_data() == first.get_data()
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(gzipped.get_data()) == first.get_data()
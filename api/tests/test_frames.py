@@ -0,0 +1,30 @@
+"""Tests for grouping streamed steps into frames."""
+
+from app.services import frames
+from app.services.frames import iter_frames
+
+
+def test_frames_double_up_to_max_steps():
+    sizes = [len(frame) for frame in iter_frames(range(20), max_steps=4, max_ms=60_000)]
+
+    assert sizes == [1, 2, 4, 4, 4, 4, 1]
+
+
+def test_frames_keep_order():
+    assert [item for frame in iter_frames(range(100), max_steps=8) for item in frame] == list(
+        range(100)
+    )
+
+
+def test_frame_flushed_after_max_ms(monkeypatch):
+    clock = iter(range(0, 1000, 10))  # 10ms per call
+    monkeypatch.setattr(frames.time, "monotonic", lambda: next(clock) / 1000)
+
+    sizes = [len(frame) for frame in iter_frames(range(12), max_steps=100, max_ms=25)]
+
+    # Without the time limit the frames would be 1, 2, 4, 5
+    assert sizes == [1, 2, 3, 3, 3]
+
+
+def test_empty_input():
+    assert list(iter_frames([])) == []
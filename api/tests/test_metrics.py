@@ -0,0 +1,119 @@
+"""Tests for the per-algorithm metrics and the /metrics endpoint."""
+
+import re
+
+import pytest
+
+from app.routes import algorithms as routes
+from app.services.metrics import CONTENT_TYPE, Metrics
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    """The value of one sample in exposition text."""
+    for line in text.splitlines():
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})? (\S+)", line)
+        if match and match[1] == name:
+            found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match[2] or ""))
+            if found == labels:
+                return float(match[3])
+    raise AssertionError(f"No sample {name} {labels}")
+
+
+class TestMetrics:
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = Metrics()
+        for steps in (5, 50, 50, 5000):
+            metrics.observe_run("bubble_sort", 0.01, 0.002, steps, 2048)
+
+        text = metrics.render()
+
+        assert _sample(text, "dsa_steps_bucket", algorithm="bubble_sort", le="10") == 1
+        assert _sample(text, "dsa_steps_bucket", algorithm="bubble_sort", le="100") == 3
+        assert _sample(text, "dsa_steps_bucket", algorithm="bubble_sort", le="1000") == 3
+        assert _sample(text, "dsa_steps_bucket", algorithm="bubble_sort", le="+Inf") == 4
+        assert _sample(text, "dsa_steps_sum", algorithm="bubble_sort") == 5105
+        assert _sample(text, "dsa_steps_count", algorithm="bubble_sort") == 4
+
+    def test_bucket_bounds_are_inclusive(self):
+        metrics = Metrics()
+        metrics.observe_run("bubble_sort", 0.01, 0.01, 100, 1024)
+
+        text = metrics.render()
+
+        assert _sample(text, "dsa_steps_bucket", algorithm="bubble_sort", le="100") == 1
+        assert _sample(text, "dsa_response_bytes_bucket", algorithm="bubble_sort", le="1024") == 1
+
+    def test_series_per_algorithm(self):
+        metrics = Metrics()
+        metrics.observe_run("bubble_sort", 0.5, 0.1, 10, 100)
+        metrics.observe_run("merge_sort", 0.25, 0.1, 10, 100)
+
+        text = metrics.render()
+
+        assert _sample(text, "dsa_execution_seconds_sum", algorithm="bubble_sort") == 0.5
+        assert _sample(text, "dsa_execution_seconds_sum", algorithm="merge_sort") == 0.25
+
+    def test_responses_by_cache_layer(self):
+        metrics = Metrics()
+        for cache in ("MISS", "HIT", "HIT"):
+            metrics.observe_response("bubble_sort", cache)
+
+        text = metrics.render()
+
+        assert _sample(text, "dsa_responses_total", algorithm="bubble_sort", cache="HIT") == 2
+        assert _sample(text, "dsa_responses_total", algorithm="bubble_sort", cache="MISS") == 1
+
+    def test_every_metric_is_declared(self):
+        text = Metrics().render()
+
+        for name, kind in (
+            ("dsa_execution_seconds", "histogram"),
+            ("dsa_serialization_seconds", "histogram"),
+            ("dsa_steps", "histogram"),
+            ("dsa_response_bytes", "histogram"),
+            ("dsa_responses_total", "counter"),
+        ):
+            assert f"# TYPE {name} {kind}" in text
+
+    def test_label_values_are_escaped(self):
+        metrics = Metrics()
+        metrics.observe_response('a"b\\c', "HIT")
+
+        assert 'algorithm="a\\"b\\\\c"' in metrics.render()
+
+
+class TestEndpoint:
+    @pytest.fixture(autouse=True)
+    def fresh_metrics(self, monkeypatch):
+        monkeypatch.setattr(routes, "metrics", Metrics())
+        monkeypatch.setattr("app.services.metrics.metrics", routes.metrics)
+
+    def test_runs_and_cache_hits_are_reported(self, client):
+        for _ in range(2):
+            client.post("/api/algorithms/bubble_sort/execute", json={"input": [9, 3, 7, 1]})
+
+        response = client.get("/metrics")
+        text = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert _sample(text, "dsa_execution_seconds_count", algorithm="bubble_sort") == 1
+        assert _sample(text, "dsa_serialization_seconds_count", algorithm="bubble_sort") == 1
+        assert _sample(text, "dsa_steps_sum", algorithm="bubble_sort") > 4
+        assert _sample(text, "dsa_response_bytes_sum", algorithm="bubble_sort") > 0
+        assert _sample(text, "dsa_responses_total", algorithm="bubble_sort", cache="MISS") == 1
+        assert _sample(text, "dsa_responses_total", algorithm="bubble_sort", cache="HIT") == 1
+
+    def test_headless_steps_are_reported(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?mode=headless", json={"input": [2, 1]}
+        )
+        text = client.get("/metrics").get_data(as_text=True)
+
+        steps = response.get_json()["step_count"]
+        assert _sample(text, "dsa_steps_sum", algorithm="bubble_sort") == steps
+
+    def test_errors_are_not_reported(self, client):
+        client.post("/api/algorithms/nonexistent/execute", json={"input": [1]})
+
+        assert "nonexistent" not in client.get("/metrics").get_data(as_text=True)
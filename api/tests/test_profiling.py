@@ -0,0 +1,125 @@
+"""Tests for profiled executions."""
+
+import cProfile
+import os
+import pstats
+
+import pytest
+
+from app.services import profiling
+from app.services.profiling import PHASES, is_admin, profile_job
+from app.services.workers import run_algorithm
+
+INPUT = list(range(60, 0, -1))
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _functions(phase: dict) -> set[str]:
+    return {frame["function"] for frame in phase["top"]}
+
+
+class TestProfileJob:
+    def test_time_is_split_by_phase(self, profile_dir):
+        phases = profile_job("bubble_sort", INPUT)["profile"]["phases"]
+
+        assert set(phases) == set(PHASES)
+        assert "sort" in _functions(phases["algorithm"])
+        assert "emit_step" in _functions(phases["emit_step"])
+        assert "iterencode" in _functions(phases["serialization"])
+        assert all(phase["seconds"] > 0 for phase in phases.values())
+
+    def test_state_building_counts_towards_emit_step(self):
+        profiler = cProfile.Profile()
+        profiler.runcall(run_algorithm, "bubble_sort", INPUT)
+
+        phases = profiling._run_phases(pstats.Stats(profiler))
+
+        # bubble_sort's state lambdas live in its file but only emit_step calls them
+        lambdas = [
+            phase
+            for (filename, _, name), phase in phases.items()
+            if name == "<lambda>" and filename.endswith("bubble_sort.py")
+        ]
+        assert lambdas
+        assert set(lambdas) == {"emit_step"}
+        sorts = [phase for (_, _, name), phase in phases.items() if name == "sort"]
+        assert sorts == ["algorithm"]
+
+    def test_top_frames_are_ordered_by_self_time(self, profile_dir):
+        top = profile_job("bubble_sort", INPUT)["profile"]["phases"]["emit_step"]["top"]
+
+        assert len(top) <= profiling.TOP_FRAMES
+        assert top == sorted(top, key=lambda frame: frame["self_seconds"], reverse=True)
+
+    def test_writes_profiler_output(self, profile_dir):
+        path = profile_job("bubble_sort", INPUT)["profile"]["file"]
+
+        assert os.path.dirname(path) == str(profile_dir)
+        functions = {name for _, _, name in pstats.Stats(path).stats}
+        assert {"sort", "emit_step", "iterencode"} <= functions
+
+    def test_keeps_the_newest_files(self, profile_dir, monkeypatch):
+        monkeypatch.setattr(profiling, "PROFILE_KEEP", 2)
+
+        paths = [profile_job("bubble_sort", [2, 1])["profile"]["file"] for _ in range(4)]
+
+        assert sorted(map(str, profile_dir.iterdir())) == sorted(paths[2:])
+
+    def test_returns_the_response(self, profile_dir):
+        response = profile_job("bubble_sort", [3, 1, 2])
+
+        assert response["steps"][-1]["state"]["values"] == [1, 2, 3]
+        assert response["total_steps"] == response["count"]
+
+    def test_headless(self, profile_dir):
+        response = profile_job("bubble_sort", [3, 1, 2], mode="headless")
+
+        assert response["result"] == [1, 2, 3]
+        assert "sort" in _functions(response["profile"]["phases"]["algorithm"])
+
+
+class TestAdmin:
+    def test_no_token_configured(self, monkeypatch):
+        monkeypatch.setattr(profiling, "ADMIN_TOKEN", "")
+        assert not is_admin("")
+
+    def test_token(self, monkeypatch):
+        monkeypatch.setattr(profiling, "ADMIN_TOKEN", "secret")
+
+        assert is_admin("secret")
+        assert not is_admin("wrong")
+        assert not is_admin(None)
+
+
+class TestRoute:
+    def test_requires_admin_token(self, client, monkeypatch):
+        monkeypatch.setattr(profiling, "ADMIN_TOKEN", "secret")
+
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?profile=1",
+            json={"input": [2, 1]},
+            headers={"X-Admin-Token": "wrong"},
+        )
+
+        assert response.status_code == 403
+
+    def test_profiles_for_admin(self, client, monkeypatch):
+        monkeypatch.setattr(profiling, "ADMIN_TOKEN", "secret")
+
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?profile=1",
+            json={"input": [2, 1]},
+            headers={"X-Admin-Token": "secret"},
+        )
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert "X-Cache" not in response.headers
+        assert data["steps"][-1]["state"]["values"] == [1, 2]
+        assert set(data["profile"]["phases"]) == set(PHASES)
+        os.remove(data["profile"]["file"])
@@ -0,0 +1,155 @@
+"""Tests for the algorithm registry service."""
+
+import copy
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from algorithms.base import decode_steps
+
+from app.services.manifest import build_manifest, load_manifest
+from app.services.registry import STEP_BYTES, Estimate, InputError, registry
+from tests.conftest import SAMPLE_INPUTS
+
+
+def test_sample_inputs_cover_registry():
+    assert {algo["id"] for algo in registry.list_algorithms()} == set(SAMPLE_INPUTS)
+
+
+def test_manifest_is_up_to_date():
+    """The committed manifest matches the algorithms' registrations.
+
+    Regenerate it with ``python -m app.services.manifest``.
+    """
+    assert load_manifest() == build_manifest()
+
+
+def test_listing_imports_no_algorithms():
+    """Listing algorithms reads the manifest without importing algorithm modules."""
+    script = (
+        "import sys\n"
+        "from app import create_app\n"
+        "assert create_app().test_client().get('/api/algorithms').status_code == 200\n"
+        "print(sorted(m for m in sys.modules if m.startswith('algorithms.')))\n"
+    )
+    api_dir = Path(__file__).resolve().parent.parent
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(api_dir), str(api_dir.parent)])}
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=api_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported = eval(result.stdout)
+    assert imported and all(name.startswith("algorithms.base") for name in imported)
+
+
+def test_classes_load_on_first_use():
+    bst = registry.get_class("bst_insert")
+
+    assert registry.get_class("bst_search") is bst
+    assert bst.registrations.keys() == {"bst_insert", "bst_search"}
+
+
+class TestEntryPoints:
+    """Inputs are bound to entry methods by each algorithm's compiled schema."""
+
+    def test_shorthand_input(self):
+        bare = registry.execute_headless("fibonacci_tab", 7)
+        keyed = registry.execute_headless("fibonacci_tab", {"n": 7})
+
+        assert bare["counters"]["result"] == keyed["counters"]["result"] == 13
+
+    def test_defaults_fill_missing_keys(self):
+        summary = registry.execute_headless("fibonacci_memo", {})
+
+        assert summary["counters"]["result"] == 55
+
+    def test_defaults_are_not_shared(self):
+        registry.execute_headless("bst_insert", {})
+        assert registry.get_algorithm("bst_insert")["input"] == {"values": []}
+
+    def test_object_input_required(self):
+        with pytest.raises(InputError, match="graph, start, target"):
+            registry.execute_headless("bfs", [1, 2, 3])
+
+
+class TestEstimates:
+    """Runs are estimated from their input by each algorithm's compiled cost expressions."""
+
+    @pytest.mark.parametrize("algorithm_id", sorted(SAMPLE_INPUTS))
+    def test_estimate_is_close_to_the_run(self, algorithm_id):
+        input_data = json.loads(json.dumps(SAMPLE_INPUTS[algorithm_id]))  # as a client sends it
+        steps = registry.execute_headless(algorithm_id, copy.deepcopy(input_data))["step_count"]
+
+        estimate = registry.estimate(algorithm_id, input_data)
+
+        assert steps / 4 <= estimate.steps <= steps * 8
+        assert estimate.step_bytes > STEP_BYTES
+
+    def test_estimate_grows_with_the_input(self):
+        small = registry.estimate("bubble_sort", list(range(10)))
+        large = registry.estimate("bubble_sort", list(range(1000)))
+
+        assert large.steps == 10_000 * small.steps
+        assert large.output_bytes() > large.output_bytes(max_steps=100)
+
+    @pytest.mark.parametrize("algorithm_id", ["bst_insert", "quick_sort"])
+    @pytest.mark.parametrize("order", ["ascending", "descending", "random"])
+    def test_presorted_worst_case(self, algorithm_id, order):
+        values = list(range(300))
+        if order == "descending":
+            values.reverse()
+        elif order == "random":
+            random.Random(0).shuffle(values)
+        steps = registry.execute_headless(algorithm_id, list(values))["step_count"]
+
+        estimate = registry.estimate(algorithm_id, values)
+
+        assert steps / 4 <= estimate.steps <= steps * 8
+
+    def test_schema_defaults_and_shorthand(self):
+        bare = registry.estimate("fibonacci_tab", 20)
+        assert bare == registry.estimate("fibonacci_tab", {"n": 20})
+        assert registry.estimate("fibonacci_memo", {}) == Estimate(30, STEP_BYTES + 50)
+
+    def test_unmeasurable_input(self):
+        assert registry.estimate("knapsack", {"items": [[1, 1]], "capacity": "x"}) is None
+        assert registry.estimate("bubble_sort", 5) is None
+        assert registry.estimate("bfs", [1, 2]) is None  # not the object its schema expects
+
+    def test_input_keys_cannot_shadow_helpers(self):
+        estimate = registry.estimate("coin_change", {"coins": [1, 2], "amount": 10, "len": 0})
+        assert estimate.steps == 40
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError, match="not found"):
+            registry.estimate("nope", [])
+
+
+@pytest.mark.parametrize("algorithm_id", sorted(SAMPLE_INPUTS))
+def test_delta_encoding_decodes_to_full(algorithm_id):
+    """Every algorithm's delta stream reconstructs its full stream."""
+    input_data = SAMPLE_INPUTS[algorithm_id]
+    full = registry.execute_algorithm(algorithm_id, copy.deepcopy(input_data))
+    delta = registry.execute_algorithm(algorithm_id, copy.deepcopy(input_data), encoding="delta")
+
+    assert "state" in delta[0]
+    assert list(decode_steps(delta)) == full
+
+
+@pytest.mark.parametrize("algorithm_id", sorted(SAMPLE_INPUTS))
+def test_headless_matches_traced_run(algorithm_id):
+    """Headless runs report the same outcome as traced runs."""
+    input_data = SAMPLE_INPUTS[algorithm_id]
+    traced = registry.run_algorithm(algorithm_id, copy.deepcopy(input_data)).get_summary()
+    headless = registry.execute_headless(algorithm_id, copy.deepcopy(input_data))
+
+    assert {k: v for k, v in headless.items() if k != "result"} == traced
@@ -0,0 +1,419 @@
+"""Tests for the algorithm execution routes."""
+
+import copy
+import json
+from collections import OrderedDict
+
+import pytest
+from algorithms.base import decode_steps
+
+from app.routes.algorithms import MAX_BATCH_INPUTS
+from app.services.registry import registry
+from app.services.runs import runs
+from tests.conftest import SAMPLE_INPUTS
+
+
+class TestExecute:
+    """Test POST /api/algorithms/<id>/execute."""
+
+    def test_full_encoding_by_default(self, client):
+        response = client.post("/api/algorithms/bubble_sort/execute", json={"input": [3, 1, 2]})
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["encoding"] == "full"
+        assert data["count"] == len(data["steps"])
+        assert all("state" in step for step in data["steps"])
+        assert data["steps"][-1]["state"]["values"] == [1, 2, 3]
+
+    def test_missing_input(self, client):
+        response = client.post("/api/algorithms/bubble_sort/execute", json={})
+        assert response.status_code == 400
+
+    def test_unknown_algorithm(self, client):
+        response = client.post("/api/algorithms/nope/execute", json={"input": []})
+        assert response.status_code == 404
+
+    def test_input_not_matching_schema(self, client):
+        response = client.post("/api/algorithms/dijkstra/execute", json={"input": [3, 1, 2]})
+
+        assert response.status_code == 400
+        assert "graph" in response.get_json()["error"]
+
+    def test_unknown_encoding(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?encoding=zip", json={"input": [3, 1, 2]}
+        )
+        assert response.status_code == 400
+
+    def test_delta_encoding(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?encoding=delta", json={"input": [3, 1, 2]}
+        )
+
+        data = response.get_json()
+        assert data["encoding"] == "delta"
+        assert "state" in data["steps"][0]
+        assert all("delta" in step for step in data["steps"][1:])
+        assert list(decode_steps(data["steps"]))[-1]["state"]["values"] == [1, 2, 3]
+
+    def test_graph_state_referenced(self, client):
+        graph = {"0": [["1", 2]], "1": []}
+        response = client.post(
+            "/api/algorithms/dijkstra/execute", json={"input": {"graph": graph, "start": "0"}}
+        )
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data["references"] == {"graph": graph}
+        assert all(step["state"]["graph"] == {"$ref": "graph"} for step in data["steps"])
+
+    def test_max_steps_coalesces(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?max_steps=16", json={"input": [5, 4, 3, 2, 1]}
+        )
+
+        data = response.get_json()
+        assert data["coalesced"]
+        assert data["count"] <= 16
+        assert data["total_steps"] > data["count"]
+        assert data["steps"][-1]["state"]["values"] == [1, 2, 3, 4, 5]
+
+    def test_every_step_returned_by_default(self, client):
+        # Far more steps than the old implicit budget of 10000
+        values = list(range(120, 0, -1))
+        response = client.post("/api/algorithms/bubble_sort/execute", json={"input": values})
+
+        data = response.get_json()
+        assert not data["coalesced"]
+        assert data["count"] == data["total_steps"] > 10_000
+
+    def test_invalid_max_steps(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?max_steps=1", json={"input": [3, 1, 2]}
+        )
+        assert response.status_code == 400
+
+
+class TestResultCache:
+    """Identical /execute requests are answered from the result cache."""
+
+    def _post(self, client, input_data, query=""):
+        return client.post(f"/api/algorithms/heap_sort/execute{query}", json={"input": input_data})
+
+    def test_repeated_request_hits(self, client):
+        first = self._post(client, [9, 4, 7, 1, 8])
+        second = self._post(client, [9, 4, 7, 1, 8])
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.get_data() == first.get_data()
+        assert self._post(client, [9, 4, 7, 1, 8], "?encoding=delta").headers["X-Cache"] == "MISS"
+
+    def test_source_change_invalidates(self, client, monkeypatch):
+        self._post(client, [6, 2, 5])
+        monkeypatch.setitem(registry._source_hashes, "heap_sort", "edited")
+
+        assert self._post(client, [6, 2, 5]).headers["X-Cache"] == "MISS"
+
+    def test_evicted_run_not_served(self, client, monkeypatch):
+        run_id = self._post(client, [3, 8, 1]).get_json()["run_id"]
+        monkeypatch.setattr(runs, "_runs", OrderedDict())
+
+        response = self._post(client, [3, 8, 1])
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.get_json()["run_id"] != run_id
+
+    def test_stats(self, client):
+        before = client.get("/api/algorithms/cache").get_json()
+        self._post(client, [1, 2, 4, 3])
+        self._post(client, [1, 2, 4, 3])
+        after = client.get("/api/algorithms/cache").get_json()
+
+        assert after["hits"] == before["hits"] + 1
+        assert after["misses"] == before["misses"] + 1
+
+
+class TestExecuteStream:
+    """Test POST /api/algorithms/<id>/execute/stream."""
+
+    @staticmethod
+    def _events(response):
+        """Parse an SSE body into (event type, data) pairs."""
+        import json
+
+        events = []
+        for block in response.get_data(as_text=True).split("\n\n"):
+            if not block:
+                continue
+            fields = dict(line.split(": ", 1) for line in block.split("\n"))
+            events.append((fields.get("event", "message"), json.loads(fields["data"])))
+        return events
+
+    def _steps(self, response):
+        return [
+            step for kind, frame in self._events(response) if kind == "message" for step in frame
+        ]
+
+    def test_streams_every_step(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/stream", json={"input": [3, 1, 2]}
+        )
+
+        steps = self._steps(response)
+        assert response.mimetype == "text/event-stream"
+        assert steps[0]["operation"] == "init"
+        assert steps[-1]["state"]["values"] == [1, 2, 3]
+        assert self._events(response)[-1] == ("done", {"count": len(steps)})
+
+    @pytest.mark.parametrize("algorithm_id", sorted(SAMPLE_INPUTS))
+    def test_streams_every_algorithm(self, client, algorithm_id):
+        """Streamed steps and references match the execute route's."""
+        input_data = SAMPLE_INPUTS[algorithm_id]
+        executed = client.post(
+            f"/api/algorithms/{algorithm_id}/execute", json={"input": copy.deepcopy(input_data)}
+        ).get_json()
+        response = client.post(
+            f"/api/algorithms/{algorithm_id}/execute/stream?frame_steps=4",
+            json={"input": copy.deepcopy(input_data)},
+        )
+
+        references = {}
+        for kind, data in self._events(response):
+            if kind == "references":
+                references.update(data["set"])
+                for name, items in data["extend"].items():
+                    references[name] = references[name] + items
+        assert self._steps(response) == executed["steps"]
+        assert references == executed["references"]
+
+    def test_frames_grow_to_frame_steps(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/stream?frame_steps=4&frame_ms=60000",
+            json={"input": [5, 4, 3, 2, 1]},
+        )
+
+        sizes = [len(frame) for kind, frame in self._events(response) if kind == "message"]
+        assert sizes[:4] == [1, 2, 4, 4]
+
+    def test_unknown_algorithm(self, client):
+        response = client.post("/api/algorithms/nope/execute/stream", json={"input": []})
+        assert response.status_code == 404
+
+    def test_input_not_matching_schema(self, client):
+        response = client.post("/api/algorithms/bfs/execute/stream", json={"input": [1]})
+        assert response.status_code == 400
+
+    def test_delta_stream(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/stream?encoding=delta", json={"input": [3, 1, 2]}
+        )
+
+        steps = self._steps(response)
+        assert "state" in steps[0]
+        assert all("delta" in step for step in steps[1:])
+        assert list(decode_steps(steps))[-1]["state"]["values"] == [1, 2, 3]
+
+    def test_delta_stream_keyframe_interval(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/stream?encoding=delta&keyframe_interval=2",
+            json={"input": [3, 1, 2]},
+        )
+
+        steps = self._steps(response)
+        assert ["state" in step for step in steps[:4]] == [True, False, True, False]
+
+    @pytest.mark.parametrize(
+        "query", ["encoding=delta&keyframe_interval=0", "frame_steps=0", "frame_ms=-1"]
+    )
+    def test_invalid_parameters(self, client, query):
+        response = client.post(
+            f"/api/algorithms/bubble_sort/execute/stream?{query}", json={"input": [3, 1, 2]}
+        )
+        assert response.status_code == 400
+
+
+class TestRunSteps:
+    """Test GET /api/algorithms/<id>/runs/<run_id>/steps."""
+
+    def _execute(self, client, query=""):
+        return client.post(
+            f"/api/algorithms/merge_sort/execute{query}", json={"input": [8, 3, 5, 1, 9, 2, 7]}
+        ).get_json()
+
+    def test_seek_delta_run(self, client):
+        full = self._execute(client)
+        run = self._execute(client, "?encoding=delta&keyframe_interval=8")
+
+        for n in (1, 9, 10, run["count"]):
+            response = client.get(f"/api/algorithms/merge_sort/runs/{run['run_id']}/steps?at={n}")
+            assert response.status_code == 200
+            assert response.get_json()["step"] == full["steps"][n - 1]
+
+    def test_seek_out_of_range(self, client):
+        run = self._execute(client)
+        url = f"/api/algorithms/merge_sort/runs/{run['run_id']}/steps"
+
+        assert client.get(f"{url}?at=0").status_code == 400
+        assert client.get(f"{url}?at={run['count'] + 1}").status_code == 400
+        assert client.get(url).status_code == 400
+
+    def test_outline_then_refine(self, client):
+        full = self._execute(client)
+        outline = self._execute(client, "?encoding=delta&level=0")
+        url = f"/api/algorithms/merge_sort/runs/{outline['run_id']}/steps"
+
+        assert outline["encoding"] == "full"
+        assert outline["count"] < outline["total_steps"]
+        assert all(step["level"] == 0 for step in outline["steps"])
+
+        first, second = outline["steps"][:2]
+        response = client.get(
+            f"{url}?from={first['step_number'] + 1}&to={second['step_number'] - 1}"
+        )
+        assert response.status_code == 200
+        assert (
+            response.get_json()["steps"]
+            == full["steps"][first["step_number"] : second["step_number"] - 1]
+        )
+
+    def test_unknown_run(self, client):
+        run = self._execute(client)
+
+        assert client.get("/api/algorithms/merge_sort/runs/missing/steps?at=1").status_code == 404
+        assert (
+            client.get(f"/api/algorithms/bubble_sort/runs/{run['run_id']}/steps?at=1").status_code
+            == 404
+        )
+
+    def test_invalid_keyframe_interval(self, client):
+        response = client.post(
+            "/api/algorithms/merge_sort/execute?keyframe_interval=0", json={"input": [2, 1]}
+        )
+        assert response.status_code == 400
+
+
+class TestHeadlessExecute:
+    """Test POST /api/algorithms/<id>/execute?mode=headless."""
+
+    def test_returns_result_and_counters(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute?mode=headless", json={"input": [3, 2, 1]}
+        )
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert "steps" not in data
+        assert data["result"] == [1, 2, 3]
+        assert data["counters"]["swaps"] == 3
+        assert data["step_count"] > 0
+
+    def test_unknown_mode(self, client):
+        response = client.post("/api/algorithms/bubble_sort/execute?mode=x", json={"input": [1]})
+        assert response.status_code == 400
+
+
+class TestExecuteBatch:
+    """Test POST /api/algorithms/<id>/execute/batch."""
+
+    @staticmethod
+    def _lines(response):
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_streams_one_line_per_input(self, client):
+        inputs = [[3, 2, 1], [5, 4], [1]]
+        response = client.post("/api/algorithms/bubble_sort/execute/batch", json={"inputs": inputs})
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = self._lines(response)
+        assert sorted(line["index"] for line in lines) == [0, 1, 2]
+        for line in lines:
+            expected = registry.execute_algorithm("bubble_sort", inputs[line["index"]])
+            result = line["result"]
+            assert result["count"] == len(expected)
+            # source_file may be spelled differently by the worker's import path
+            assert [(s["operation"], s["state"]) for s in result["steps"]] == [
+                (s["operation"], s["state"]) for s in expected
+            ]
+
+    def test_headless(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/batch?mode=headless",
+            json={"inputs": [[2, 1], [4, 3, 5]]},
+        )
+
+        results = {line["index"]: line["result"] for line in self._lines(response)}
+        assert results[0]["result"] == [1, 2]
+        assert results[1]["result"] == [3, 4, 5]
+        assert "steps" not in results[0]
+
+    def test_errors_are_per_input(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/batch?mode=headless",
+            json={"inputs": [[2, 1], [1, "a"]]},  # ints and strings do not compare
+        )
+
+        lines = {line["index"]: line for line in self._lines(response)}
+        assert lines[0]["result"]["result"] == [1, 2]
+        assert "error" in lines[1] and "result" not in lines[1]
+
+    def test_unknown_algorithm(self, client):
+        response = client.post("/api/algorithms/nope/execute/batch", json={"inputs": [[1]]})
+        assert response.status_code == 404
+
+    def test_missing_inputs(self, client):
+        response = client.post("/api/algorithms/bubble_sort/execute/batch", json={"input": [1]})
+        assert response.status_code == 400
+
+    def test_too_many_inputs(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/batch",
+            json={"inputs": [[1]] * (MAX_BATCH_INPUTS + 1)},
+        )
+        assert response.status_code == 400
+
+
+class TestQueryOptions:
+    """The execute, stream and batch routes validate their shared options alike."""
+
+    ROUTES = {
+        "execute": {"input": [3, 1, 2]},
+        "execute/stream": {"input": [3, 1, 2]},
+        "execute/batch": {"inputs": [[3, 1, 2]]},
+    }
+
+    @pytest.mark.parametrize("route", ROUTES)
+    @pytest.mark.parametrize(
+        "query, error",
+        [
+            ("encoding=zip", "Unknown encoding: zip"),
+            ("keyframe_interval=0", "keyframe_interval must be a positive integer"),
+            ("keyframe_interval=two", "keyframe_interval must be a positive integer"),
+        ],
+    )
+    def test_invalid(self, client, route, query, error):
+        response = client.post(
+            f"/api/algorithms/bubble_sort/{route}?{query}", json=self.ROUTES[route]
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": error}
+
+    @pytest.mark.parametrize("route", ["execute", "execute/batch"])
+    @pytest.mark.parametrize("query", ["mode=x", "max_steps=1", "max_steps=1.5"])
+    def test_invalid_run_options(self, client, route, query):
+        response = client.post(
+            f"/api/algorithms/bubble_sort/{route}?{query}", json=self.ROUTES[route]
+        )
+        assert response.status_code == 400
+
+    def test_valid_options_are_passed_on(self, client):
+        response = client.post(
+            "/api/algorithms/bubble_sort/execute/batch?encoding=delta&keyframe_interval=2",
+            json=self.ROUTES["execute/batch"],
+        )
+
+        [line] = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert line["result"]["encoding"] == "delta"
+        assert ["state" in step for step in line["result"]["steps"][:3]] == [True, False, True]
@@ -0,0 +1,69 @@
+"""Tests for the run store."""
+
+from algorithms.sorting.bubble_sort import BubbleSort
+
+from app.services.runs import RunStore
+
+
+def _run(values=(3, 1, 2), **config):
+    sorter = BubbleSort().configure(**config)
+    list(sorter.sort(list(values)))
+    return sorter
+
+
+def test_evicts_least_recently_used():
+    store = RunStore(max_runs=2)
+    first = store.save("bubble_sort", _run())
+    second = store.save("bubble_sort", _run())
+    store.get("bubble_sort", first)  # touch, so `second` is now the oldest
+    store.save("bubble_sort", _run())
+
+    assert store.get("bubble_sort", first) is not None
+    assert store.get("bubble_sort", second) is None
+
+
+def test_run_is_scoped_to_algorithm():
+    store = RunStore()
+    run_id = store.save("bubble_sort", _run())
+
+    assert store.get("merge_sort", run_id) is None
+
+
+def test_full_runs_are_stored_as_deltas():
+    full = [step.model_dump() for step in _run().get_all_steps()]
+    store = RunStore()
+    tracker = store.get("bubble_sort", store.save("bubble_sort", _run()))
+
+    assert tracker.get_encoded_steps()[1].keys() >= {"delta"}
+    assert [tracker.step_at(n).model_dump() for n in range(1, len(full) + 1)] == full
+
+
+def test_bounded_by_bytes():
+    store = RunStore()
+    store.save("bubble_sort", _run())
+    size = store._bytes
+
+    store = RunStore(max_bytes=3 * size)
+    run_ids = [store.save("bubble_sort", _run()) for _ in range(8)]
+
+    assert store._bytes <= 3 * size
+    assert store.get("bubble_sort", run_ids[-1]) is not None
+    assert store.get("bubble_sort", run_ids[0]) is None
+    assert RunStore(max_bytes=100).save("bubble_sort", _run()) is None
+
+
+def test_runs_shared_through_directory(tmp_path):
+    run_id = RunStore(directory=tmp_path).save("bubble_sort", _run())
+    other_worker = RunStore(directory=tmp_path)
+
+    tracker = other_worker.get("bubble_sort", run_id)
+    assert tracker.step_at(tracker.count_steps()).state["values"] == [1, 2, 3]
+    assert other_worker.get("merge_sort", run_id) is None
+
+
+def test_directory_pruned_to_budget(tmp_path):
+    store = RunStore(max_runs=2, directory=tmp_path)
+    for _ in range(4):
+        store.save("bubble_sort", _run())
+
+    assert len(list(tmp_path.glob("*.json.gz"))) == 2
@@ -0,0 +1,78 @@
+"""Tests for single-flight request coalescing."""
+
+import threading
+
+import pytest
+
+from app.services.singleflight import SingleFlight
+
+
+def _concurrent(group, key, fn, callers=8):
+    """Call group.do from several threads at once; return their outcomes."""
+    outcomes = [None] * callers
+
+    def call(n):
+        try:
+            outcomes[n] = group.do(key, fn)
+        except Exception as e:
+            outcomes[n] = e
+
+    threads = [threading.Thread(target=call, args=(n,)) for n in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_concurrent_calls_share_one_run():
+    group = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def compute():
+        runs.append(1)
+        release.wait(5)
+        return "result"
+
+    threads, outcomes = _concurrent(group, "key", compute)
+    while group.coalesced < len(threads) - 1:  # everyone else is waiting on the leader
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(runs) == 1
+    assert sorted(outcomes, key=lambda outcome: outcome[1]) == [("result", False)] * 7 + [
+        ("result", True)
+    ]
+    assert group.in_flight() == 0
+
+
+def test_error_reaches_every_caller():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def compute():
+        release.wait(5)
+        raise ValueError("bad input")
+
+    threads, outcomes = _concurrent(group, "key", compute, callers=3)
+    while group.coalesced < 2:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+
+def test_finished_calls_run_again():
+    group = SingleFlight()
+    assert group.do("key", lambda: 1) == (1, True)
+    assert group.do("key", lambda: 2) == (2, True)
+
+
+def test_keys_do_not_share():
+    group = SingleFlight()
+    with pytest.raises(KeyError):
+        group.do("a", lambda: {}["missing"])
+    assert group.do("b", lambda: "b") == ("b", True)
@@ -0,0 +1,115 @@
+"""Tests for the slow-execution log."""
+
+import json
+
+import pytest
+
+from app.routes import algorithms as routes
+from app.services.slow_log import MAX_LOGGED_INPUT_BYTES, SlowLog, input_features, input_hash
+
+SECONDS = {"execution": 1.5, "serialization": 0.25, "total": 2.0}
+
+
+def _records(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestInputFeatures:
+    @pytest.mark.parametrize(
+        "input_data, features",
+        [
+            ([5, 2, 8], {"length": 3}),
+            (5, {"value": 5}),
+            ({"n": 30}, {"n": 30}),
+            ({"str1": "ABC", "str2": "AB"}, {"str1.length": 3, "str2.length": 2}),
+            ({"grid": [[1, 0, 1], [0, 1, 0]]}, {"grid.rows": 2, "grid.cols": 3}),
+            (
+                {"graph": {"0": [1, 2], "1": [2], "2": []}, "start": 0},
+                {"graph.nodes": 3, "graph.edges": 3, "start": 0},
+            ),
+            (
+                {"items": [[2, 10], [3, 15]], "capacity": 7},
+                {"items.rows": 2, "items.cols": 2, "capacity": 7},
+            ),
+            ({"flag": True, "missing": None}, {}),
+        ],
+    )
+    def test_features(self, input_data, features):
+        assert input_features(input_data) == features
+
+    def test_hash_ignores_key_order(self):
+        assert input_hash({"a": 1, "b": [2]}) == input_hash({"b": [2], "a": 1})
+        assert input_hash({"a": 1}) != input_hash({"a": 2})
+
+
+class TestSlowLog:
+    def test_fast_runs_are_not_logged(self, tmp_path):
+        log = SlowLog(threshold_seconds=5, path=tmp_path / "slow.jsonl")
+
+        assert not log.record("bubble_sort", [2, 1], SECONDS, 3, 1024)
+        log.flush()
+
+        assert not (tmp_path / "slow.jsonl").exists()
+
+    def test_slow_runs_are_logged(self, tmp_path):
+        log = SlowLog(threshold_seconds=1, path=tmp_path / "slow.jsonl")
+
+        assert log.record("bubble_sort", [2, 1], SECONDS, 3, 1024, mode="trace", max_steps=None)
+        log.flush()
+
+        [record] = _records(tmp_path / "slow.jsonl")
+        assert record["algorithm_id"] == "bubble_sort"
+        assert record["input_hash"] == input_hash([2, 1])
+        assert record["input_features"] == {"length": 2}
+        assert record["input"] == [2, 1]
+        assert record["steps"] == 3
+        assert record["seconds"] == SECONDS
+        assert record["peak_memory_bytes"] == 1024
+        assert record["options"] == {"mode": "trace"}
+        assert record["time"]
+
+    def test_large_inputs_are_logged_by_hash(self, tmp_path):
+        log = SlowLog(threshold_seconds=1, path=tmp_path / "slow.jsonl")
+        input_data = list(range(MAX_LOGGED_INPUT_BYTES))
+
+        log.record("bubble_sort", input_data, SECONDS, 3, 1024)
+        log.flush()
+
+        [record] = _records(tmp_path / "slow.jsonl")
+        assert "input" not in record
+        assert record["input_hash"] == input_hash(input_data)
+        assert record["input_features"] == {"length": MAX_LOGGED_INPUT_BYTES}
+
+    def test_disabled(self, tmp_path):
+        log = SlowLog(threshold_seconds=None, path=tmp_path / "slow.jsonl")
+        assert not log.record("bubble_sort", [2, 1], SECONDS, 3, 1024)
+
+    def test_write_errors_do_not_stop_the_writer(self, tmp_path, capsys):
+        (tmp_path / "slow.jsonl").mkdir()  # not writable as a file
+        log = SlowLog(threshold_seconds=1, path=tmp_path / "slow.jsonl")
+
+        log.record("bubble_sort", [2, 1], SECONDS, 3, 1024)
+        log.flush()
+        log.path = tmp_path / "other.jsonl"
+        log.record("bubble_sort", [2, 1], SECONDS, 3, 1024)
+        log.flush()
+
+        assert "Could not write" in capsys.readouterr().err
+        assert len(_records(tmp_path / "other.jsonl")) == 1
+
+
+def test_route_logs_slow_runs(client, monkeypatch, tmp_path):
+    log = SlowLog(threshold_seconds=1e-9, path=tmp_path / "slow.jsonl")
+    monkeypatch.setattr(routes, "slow_log", log)
+
+    client.post("/api/algorithms/lcs/execute", json={"input": {"str1": "ABCBD", "str2": "BDCA"}})
+    log.flush()
+
+    [record] = _records(tmp_path / "slow.jsonl")
+    assert record["algorithm_id"] == "lcs"
+    assert record["input_features"] == {"str1.length": 5, "str2.length": 4}
+    assert record["steps"] > 0
+    assert set(record["seconds"]) == {"execution", "serialization", "total"}
+    assert record["seconds"]["total"] >= record["seconds"]["execution"]
+    assert record["peak_memory_bytes"] > 0
+    assert record["options"] == {"mode": "trace", "encoding": "full"}
@@ -0,0 +1,47 @@
+"""Tests for the benchmark input sweeps."""
+
+import random
+
+import pytest
+
+from app.services.registry import registry
+from app.services.sweeps import DISTRIBUTIONS, SWEEPS, sized_input, values
+from app.services.workers import run_algorithm
+
+ALGORITHM_IDS = [algorithm["id"] for algorithm in registry.list_algorithms()]
+
+
+def test_every_algorithm_has_a_sweep():
+    assert set(SWEEPS) == set(ALGORITHM_IDS)
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHM_IDS)
+def test_small_inputs_run(algorithm_id):
+    for distribution in SWEEPS[algorithm_id].distributions:
+        input_data = sized_input(algorithm_id, 16, distribution)
+        assert run_algorithm(algorithm_id, input_data, mode="headless")["step_count"] > 0
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_values(distribution):
+    drawn = values(64, distribution, random.Random(0))
+
+    assert len(drawn) == 64
+    assert all(0 <= value <= 256 for value in drawn)
+    if distribution == "sorted":
+        assert drawn == sorted(drawn)
+    elif distribution == "reversed":
+        assert drawn == sorted(drawn, reverse=True)
+    elif distribution == "few_unique":
+        assert len(set(drawn)) <= 4
+
+
+def test_inputs_are_deterministic():
+    assert sized_input("bfs", 64) == sized_input("bfs", 64)
+    assert sized_input("bfs", 64) != sized_input("bfs", 64, seed=1)
+    assert sized_input("bubble_sort", 64, "sorted") != sized_input("bubble_sort", 64)
+
+
+def test_unsupported_distribution():
+    with pytest.raises(ValueError, match="sorted"):
+        sized_input("bfs", 16, "sorted")
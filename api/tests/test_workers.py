@@ -0,0 +1,200 @@
+"""Tests for the worker process pool."""
+
+import json
+import os
+import signal
+import time
+
+import pytest
+
+from app.routes import algorithms as routes
+from app.services.workers import (
+    LimitExceeded,
+    WorkerDied,
+    WorkerPool,
+    _peak_memory,
+    _reset_peak_memory,
+    execute_job,
+    run_job,
+)
+
+
+# Jobs for the limit tests; module-level so the workers can import them
+def _spin():
+    while True:
+        pass
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _sleep_ignoring_alarms(seconds):
+    signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    time.sleep(seconds)
+
+
+def _allocate(size):
+    return len(bytearray(size))
+
+
+def _exit():
+    os._exit(1)
+
+
+def _count(n, seconds=0):
+    for i in range(n):
+        time.sleep(seconds)
+        yield i
+
+
+def _count_then_spin(n):
+    yield from range(n)
+    _spin()
+
+
+def test_run_job_encodes_the_result():
+    body = json.loads(run_job("bubble_sort", [2, 1], mode="headless"))
+    assert body["mode"] == "headless"
+    assert body["result"] == [1, 2]
+
+
+def test_execute_job_reports_usage():
+    usage = execute_job("bubble_sort", [3, 1, 2])["usage"]
+
+    assert usage["execution"] > 0
+    assert usage["serialization"] > 0
+    assert usage["peak_memory"] > 0
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="Linux only")
+def test_peak_memory_is_per_job():
+    _reset_peak_memory()
+    _allocate(256 * 1024 * 1024)
+    large = _peak_memory()
+    _reset_peak_memory()
+
+    assert _peak_memory() < large - 128 * 1024 * 1024
+
+
+def test_map_unordered_covers_every_input():
+    pool = WorkerPool(max_workers=2)
+    inputs = [[n, n - 1] for n in range(6)]
+
+    outcomes = list(pool.map_unordered("bubble_sort", dict(enumerate(inputs)), mode="headless"))
+
+    assert sorted(index for index, _, _ in outcomes) == list(range(6))
+    for index, body, error in outcomes:
+        assert error is None
+        assert json.loads(body)["result"] == sorted(inputs[index])
+
+
+def test_failed_input_reports_an_error():
+    pool = WorkerPool(max_workers=1)
+
+    outcomes = {
+        index: (body, error)
+        for index, body, error in pool.map_unordered("nope", {0: [1]}, mode="headless")
+    }
+
+    body, error = outcomes[0]
+    assert body is None
+    assert "not found" in error
+
+
+class TestStream:
+    """Generator jobs hand their items over one at a time."""
+
+    def test_yields_every_item(self):
+        pool = WorkerPool(max_workers=1)
+        assert list(pool.stream(_count, 5)) == [0, 1, 2, 3, 4]
+
+    def test_closing_stops_the_job(self):
+        pool = WorkerPool(max_workers=1)
+
+        items = pool.stream(_count, 1000)
+        assert next(items) == 0
+        items.close()
+        assert pool.submit(_sleep, 0).result(timeout=10) == 0
+
+    def test_waiting_for_the_consumer_is_not_timed(self):
+        pool = WorkerPool(max_workers=1, wall_seconds=0.2)
+
+        items = pool.stream(_count, 3)
+        for expected in range(3):
+            time.sleep(0.15)
+            assert next(items) == expected
+
+    def test_limit_ends_the_stream(self):
+        pool = WorkerPool(max_workers=1, wall_seconds=0.2)
+
+        items = pool.stream(_count_then_spin, 2)
+        assert [next(items), next(items)] == [0, 1]
+        with pytest.raises(LimitExceeded, match="time limit"):
+            next(items)
+        assert pool.submit(_sleep, 0).result(timeout=10) == 0
+
+
+class TestLimits:
+    """Jobs over a limit fail cleanly and the pool keeps serving."""
+
+    def test_cpu_time(self):
+        pool = WorkerPool(max_workers=1, cpu_seconds=0.5)
+
+        with pytest.raises(LimitExceeded, match="CPU time"):
+            pool.submit(_spin).result(timeout=10)
+        assert pool.submit(_sleep, 0).result(timeout=10) == 0
+
+    def test_wall_clock(self):
+        pool = WorkerPool(max_workers=1, wall_seconds=0.2)
+
+        with pytest.raises(LimitExceeded, match="time limit"):
+            pool.submit(_sleep, 10).result(timeout=10)
+        assert pool.submit(_sleep, 0).result(timeout=10) == 0
+
+    def test_hung_worker_is_replaced(self):
+        pool = WorkerPool(max_workers=1, wall_seconds=0.1)
+
+        with pytest.raises(LimitExceeded, match="time limit"):
+            pool.submit(_sleep_ignoring_alarms, 10).result(timeout=10)
+        assert pool.submit(_sleep, 0).result(timeout=10) == 0
+
+    def test_memory(self):
+        pool = WorkerPool(max_workers=1, memory_bytes=512 * 1024 * 1024)
+
+        with pytest.raises(LimitExceeded, match="memory"):
+            pool.submit(_allocate, 1024 * 1024 * 1024).result(timeout=10)
+        assert pool.submit(_allocate, 1024).result(timeout=10) == 1024
+
+    def test_dead_worker_is_replaced(self):
+        pool = WorkerPool(max_workers=1)
+
+        with pytest.raises(WorkerDied):
+            pool.submit(_exit).result(timeout=10)
+        assert pool.submit(_sleep, 0).result(timeout=10) == 0
+
+
+def test_route_reports_exceeded_limit(client, monkeypatch):
+    monkeypatch.setattr(routes, "workers", WorkerPool(max_workers=1, wall_seconds=0.05))
+
+    response = client.post(
+        "/api/algorithms/bubble_sort/execute?max_steps=2",
+        json={"input": list(range(3000, 0, -1))},
+    )
+
+    assert response.status_code == 422
+    assert "time limit" in response.get_json()["error"]
+
+
+def test_stream_route_reports_exceeded_limit(client, monkeypatch):
+    monkeypatch.setattr(routes, "workers", WorkerPool(max_workers=1, wall_seconds=0.05))
+
+    response = client.post(
+        "/api/algorithms/bubble_sort/execute/stream",
+        json={"input": list(range(3000, 0, -1))},
+    )
+
+    assert response.status_code == 200
+    *_, last = response.get_data(as_text=True).strip().split("\n\n")
+    assert "time limit" in json.loads(last.removeprefix("data: "))["error"]
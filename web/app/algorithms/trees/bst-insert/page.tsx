@@ -3,12 +3,13 @@
 import { useEffect, useState } from "react";
 import { CodeViewer } from "@/components/visualizers/CodeViewer";
 import { PlaybackControls } from "@/components/visualizers/PlaybackControls";
-import type { TreeNode } from "@/components/visualizers/TreeVisualizer";
 import { TreeVisualizer } from "@/components/visualizers/TreeVisualizer";
+import { pathHighlight, treeFromState } from "@/lib/treeState";
 import type { AlgorithmStep } from "@/lib/types";
 
 export default function BSTInsertPage() {
 	const [steps, setSteps] = useState<AlgorithmStep[]>([]);
+	const [references, setReferences] = useState<Record<string, unknown>>({});
 	const [currentStep, setCurrentStep] = useState(0);
 	const [isLoading, setIsLoading] = useState(false);
 	const [inputValues, setInputValues] = useState("50, 30, 70, 20, 40, 60, 80");
@@ -42,6 +43,7 @@ export default function BSTInsertPage() {
 			});
 
 			const data = await response.json();
+			setReferences(data.references ?? {});
 			setSteps(data.steps);
 			setCurrentStep(0);
 		} catch (error) {
@@ -146,8 +148,11 @@ export default function BSTInsertPage() {
 							<div className="p-6 border border-border rounded-lg">
 								<div className="flex justify-center">
 									<TreeVisualizer
-										tree={currentStepData?.state?.tree as TreeNode | null}
-										highlights={currentStepData?.highlights ?? []}
+										tree={treeFromState(currentStepData?.state, references)}
+										highlights={[
+											...(currentStepData?.highlights ?? []),
+											...pathHighlight(currentStepData?.state, references),
+										]}
 									/>
 								</div>
 
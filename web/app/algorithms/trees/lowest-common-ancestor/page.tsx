@@ -3,12 +3,13 @@
 import { useEffect, useState } from "react";
 import { CodeViewer } from "@/components/visualizers/CodeViewer";
 import { PlaybackControls } from "@/components/visualizers/PlaybackControls";
-import type { TreeNode } from "@/components/visualizers/TreeVisualizer";
 import { TreeVisualizer } from "@/components/visualizers/TreeVisualizer";
+import { treeFromState } from "@/lib/treeState";
 import type { AlgorithmStep } from "@/lib/types";
 
 export default function LowestCommonAncestorPage() {
 	const [steps, setSteps] = useState<AlgorithmStep[]>([]);
+	const [references, setReferences] = useState<Record<string, unknown>>({});
 	const [currentStep, setCurrentStep] = useState(0);
 	const [isLoading, setIsLoading] = useState(false);
 	const [treeInput, setTreeInput] = useState("6, 2, 8, 0, 4, 7, 9, null, null, 3, 5");
@@ -58,6 +59,7 @@ export default function LowestCommonAncestorPage() {
 			});
 
 			const data = await response.json();
+			setReferences(data.references ?? {});
 			setSteps(data.steps);
 			setCurrentStep(0);
 		} catch (error) {
@@ -191,7 +193,7 @@ export default function LowestCommonAncestorPage() {
 							{/* Tree Visualization */}
 							<div className="p-6 border border-border rounded-lg">
 								<TreeVisualizer
-									tree={currentStepData?.state?.tree as TreeNode | null}
+									tree={treeFromState(currentStepData?.state, references)}
 									highlights={currentStepData?.highlights ?? []}
 								/>
 
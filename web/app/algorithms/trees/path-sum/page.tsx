@@ -3,12 +3,13 @@
 import { useEffect, useState } from "react";
 import { CodeViewer } from "@/components/visualizers/CodeViewer";
 import { PlaybackControls } from "@/components/visualizers/PlaybackControls";
-import type { TreeNode } from "@/components/visualizers/TreeVisualizer";
 import { TreeVisualizer } from "@/components/visualizers/TreeVisualizer";
+import { treeFromState } from "@/lib/treeState";
 import type { AlgorithmStep } from "@/lib/types";
 
 export default function PathSumPage() {
 	const [steps, setSteps] = useState<AlgorithmStep[]>([]);
+	const [references, setReferences] = useState<Record<string, unknown>>({});
 	const [currentStep, setCurrentStep] = useState(0);
 	const [isLoading, setIsLoading] = useState(false);
 	const [treeInput, setTreeInput] = useState("5, 4, 8, 11, null, 13, 4, 7, 2, null, null, null, 1");
@@ -56,6 +57,7 @@ export default function PathSumPage() {
 			});
 
 			const data = await response.json();
+			setReferences(data.references ?? {});
 			setSteps(data.steps);
 			setCurrentStep(0);
 		} catch (error) {
@@ -182,7 +184,7 @@ export default function PathSumPage() {
 							{/* Tree Visualization */}
 							<div className="p-6 border border-border rounded-lg">
 								<TreeVisualizer
-									tree={currentStepData?.state?.tree as TreeNode | null}
+									tree={treeFromState(currentStepData?.state, references)}
 									highlights={currentStepData?.highlights ?? []}
 								/>
 
@@ -3,14 +3,15 @@
 import { useEffect, useState } from "react";
 import { CodeViewer } from "@/components/visualizers/CodeViewer";
 import { PlaybackControls } from "@/components/visualizers/PlaybackControls";
-import type { TreeNode } from "@/components/visualizers/TreeVisualizer";
 import { TreeVisualizer } from "@/components/visualizers/TreeVisualizer";
+import { treeFromState } from "@/lib/treeState";
 import type { AlgorithmStep } from "@/lib/types";
 
 type TraversalType = "inorder" | "preorder" | "postorder";
 
 export default function TreeTraversalsPage() {
 	const [steps, setSteps] = useState<AlgorithmStep[]>([]);
+	const [references, setReferences] = useState<Record<string, unknown>>({});
 	const [currentStep, setCurrentStep] = useState(0);
 	const [isLoading, setIsLoading] = useState(false);
 	const [traversalType, setTraversalType] = useState<TraversalType>("inorder");
@@ -47,6 +48,7 @@ export default function TreeTraversalsPage() {
 			});
 
 			const data = await response.json();
+			setReferences(data.references ?? {});
 			setSteps(data.steps);
 			setCurrentStep(0);
 		} catch (error) {
@@ -201,7 +203,7 @@ export default function TreeTraversalsPage() {
 							{/* Tree Visualization */}
 							<div className="p-6 border border-border rounded-lg">
 								<TreeVisualizer
-									tree={currentStepData?.state?.tree as TreeNode | null}
+									tree={treeFromState(currentStepData?.state, references)}
 									highlights={currentStepData?.highlights ?? []}
 								/>
 
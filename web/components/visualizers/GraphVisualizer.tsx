@@ -1,6 +1,7 @@
 "use client";
 
 import { useId } from "react";
+import type { Highlight } from "@/lib/types";
 
 interface GraphNode {
 	id: number;
@@ -16,11 +17,8 @@ interface GraphEdge {
 interface GraphVisualizerProps {
 	nodes: GraphNode[];
 	edges: GraphEdge[];
-	highlights?: Array<{
-		type: "node" | "edge";
-		id: number | string;
-		color: string;
-	}>;
+	// { nodes: [id], edges: [[from, to]], color }; legacy ones are { type, id, color }
+	highlights?: Array<Highlight & { type?: "node" | "edge"; id?: number | string }>;
 	width?: number;
 	height?: number;
 }
@@ -92,7 +90,11 @@ export function GraphVisualizer({
 					if (!from || !to) return null;
 
 					const edgeId = `${edge.from}-${edge.to}`;
-					const highlight = highlights.find((h) => h.type === "edge" && h.id === edgeId);
+					const highlight = highlights.find((h) =>
+						h.edges
+							? h.edges.some(([a, b]) => a === edge.from && b === edge.to)
+							: h.type === "edge" && h.id === edgeId,
+					);
 					const color = highlight?.color || "default";
 
 					// Offset the weight label slightly off the midpoint so it doesn't
@@ -136,7 +138,9 @@ export function GraphVisualizer({
 					const pos = nodePositions[node.id];
 					if (!pos) return null;
 
-					const highlight = highlights.find((h) => h.type === "node" && h.id === node.id);
+					const highlight = highlights.find((h) =>
+						h.nodes ? h.nodes.includes(node.id) : h.type === "node" && h.id === node.id,
+					);
 					const color = highlight?.color || "default";
 
 					return (
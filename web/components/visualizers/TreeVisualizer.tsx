@@ -4,6 +4,8 @@ import type React from "react";
 import { useId } from "react";
 
 export interface TreeNode {
+	// Node id from the run's node table (see lib/treeState.ts), when known
+	id?: number;
 	val: number;
 	left?: TreeNode | null;
 	right?: TreeNode | null;
@@ -11,16 +13,19 @@ export interface TreeNode {
 
 interface TreeVisualizerProps {
 	tree: TreeNode | null;
+	// Node-id highlights ({ nodes: [id], color }); legacy ones name a node by value
 	highlights?: Array<{
-		type: "node";
-		id: number;
-		color: string;
+		nodes?: (string | number)[];
+		type?: "node";
+		id?: number;
+		color?: string;
 	}>;
 	width?: number;
 	height?: number;
 }
 
 interface PositionedNode {
+	id?: number;
 	val: number;
 	x: number;
 	y: number;
@@ -67,6 +72,7 @@ export function TreeVisualizer({
 		const verticalSpacing = height / (maxLevel + 1);
 
 		const positioned: PositionedNode = {
+			id: node.id,
 			val: node.val,
 			x,
 			y: y + verticalSpacing,
@@ -140,11 +146,15 @@ export function TreeVisualizer({
 
 		const nodes: React.ReactElement[] = [];
 
-		const highlight = highlights.find((h) => h.type === "node" && h.id === node.val);
+		const highlight = highlights.find((h) =>
+			node.id !== undefined
+				? h.nodes?.includes(node.id)
+				: h.type === "node" && h.id === node.val,
+		);
 		const color = highlight?.color || "default";
 
 		nodes.push(
-			<g key={node.val}>
+			<g key={node.id ?? node.val}>
 				<circle
 					cx={node.x}
 					cy={node.y}
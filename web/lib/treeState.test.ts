@@ -0,0 +1,42 @@
+import { describe, expect, it } from "vitest";
+import { buildTree, type NodeRow, pathTo, treeFromState } from "./treeState";
+
+// 5 with children 3 (left) and 8 (right); 4 is the right child of 3
+const ROWS: NodeRow[] = [
+	[5, null, null],
+	[3, 0, 0],
+	[8, 0, 1],
+	[4, 1, 1],
+];
+
+describe("buildTree", () => {
+	it("rebuilds the first `size` rows", () => {
+		const tree = buildTree(ROWS, 2);
+		expect(tree?.left?.val).toBe(3);
+		expect(tree?.right).toBeNull();
+		expect(buildTree(ROWS)?.left?.right).toEqual({ id: 3, val: 4, left: null, right: null });
+	});
+
+	it("returns null for an empty tree", () => {
+		expect(buildTree(ROWS, 0)).toBeNull();
+	});
+});
+
+describe("pathTo", () => {
+	it("follows parent ids up to the root", () => {
+		expect(pathTo(ROWS, 3)).toEqual([0, 1, 3]);
+		expect(pathTo(ROWS, null)).toEqual([]);
+	});
+});
+
+describe("treeFromState", () => {
+	it("resolves the node table reference", () => {
+		const state = { type: "tree", nodes: { $ref: "nodes" }, size: 3 };
+		expect(treeFromState(state, { nodes: ROWS })?.right?.val).toBe(8);
+	});
+
+	it("passes nested trees through", () => {
+		const tree = { val: 1, left: null, right: null };
+		expect(treeFromState({ type: "tree", tree }, {})).toBe(tree);
+	});
+});
@@ -0,0 +1,63 @@
+// Node-id based tree state (see algorithms/base/tree_state.py).
+//
+// Tree steps do not carry the whole tree. A run sends one append-only node
+// table under `references`, and each step's state points at it:
+//
+//   { type: "tree", nodes: { $ref: "nodes" }, size: 3, path: 2 }
+//
+// Each row is [value, parentId, side] and a node's id is its row index, so
+// the tree at a step is its first `size` rows. `path` is the id of the last
+// node on the current root path; the rest of the path is its ancestors.
+
+import type { TreeNode } from "@/components/visualizers/TreeVisualizer";
+
+export type NodeRow = [number, number | null, number | null];
+
+const LEFT = 0;
+
+/** Rebuild the nested tree from the first `size` rows (iterative). */
+export function buildTree(rows: NodeRow[], size: number = rows.length): TreeNode | null {
+	if (size === 0) return null;
+
+	const nodes: TreeNode[] = [];
+	for (let i = 0; i < size; i++) {
+		nodes.push({ id: i, val: rows[i][0], left: null, right: null });
+	}
+	for (let i = 1; i < size; i++) {
+		const [, parent, side] = rows[i];
+		if (parent === null) continue;
+		if (side === LEFT) nodes[parent].left = nodes[i];
+		else nodes[parent].right = nodes[i];
+	}
+	return nodes[0];
+}
+
+/** Ids of the nodes from the root down to `node` (inclusive). */
+export function pathTo(rows: NodeRow[], node: number | null | undefined): number[] {
+	const path: number[] = [];
+	let current = node ?? null;
+	while (current !== null) {
+		path.push(current);
+		current = rows[current][1];
+	}
+	return path.reverse();
+}
+
+// biome-ignore lint/suspicious/noExplicitAny: algorithm step state is heterogeneous
+type State = Record<string, any> | undefined;
+
+/** The tree shown by a step, from its state and the run's references. */
+export function treeFromState(state: State, references: Record<string, unknown>): TreeNode | null {
+	if (!state) return null;
+	if (state.tree !== undefined) return state.tree as TreeNode | null;
+
+	const rows = references[state.nodes?.$ref] as NodeRow[] | undefined;
+	return rows ? buildTree(rows, state.size) : null;
+}
+
+/** Highlight for the current root path of a step (nodes drawn as visited). */
+export function pathHighlight(state: State, references: Record<string, unknown>) {
+	const rows = references[state?.nodes?.$ref] as NodeRow[] | undefined;
+	if (!rows || state?.path === undefined || state.path === null) return [];
+	return [{ nodes: pathTo(rows, state.path), color: "visited" }];
+}
@@ -20,6 +20,8 @@ export interface AlgorithmStep {
 	highlights?: any[];
 	// biome-ignore lint/suspicious/noExplicitAny: metadata is algorithm-specific
 	metadata?: Record<string, any>;
+	// 0 = pass (outline), 1 = phase, 2 = micro-op
+	level?: number;
 }
 
 export type Category =